@@ -0,0 +1,138 @@
+"""
+SportradarCache - Persistent on-disk cache for Sportradar API responses
+
+Responses are stored zlib-compressed in a SQLite file, keyed by a hash of
+scope (transport mode + base URL) + endpoint + params:
+- Final payloads (game status closed, or a schedule whose games are all
+  closed) never change again and are kept indefinitely
+- Everything else (live games, depth charts, injuries, ...) expires after a TTL,
+  including 'complete' games: the game is over but Sportradar has not yet
+  validated the stats, which can still change until the status is 'closed'
+
+Configuration (environment):
+    SPORTRADAR_CACHE       'off' disables the cache (default on)
+    SPORTRADAR_CACHE_PATH  SQLite file (default /tmp/sportradar_cache.sqlite3)
+    SPORTRADAR_CACHE_TTL   seconds a non-final response stays fresh (default 600)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+DEFAULT_CACHE_PATH = '/tmp/sportradar_cache.sqlite3'
+DEFAULT_TTL_SECONDS = 600
+
+FINAL_STATUSES = {'closed'}   # 'complete' stats are unverified - TTL like live data
+
+
+def is_final_payload(payload: Dict[str, Any]) -> bool:
+    """
+    True when a response can never change again:
+    a game payload whose status is closed, or a weekly schedule whose
+    games are all closed.
+    """
+    if not isinstance(payload, dict):
+        return False
+    if payload.get('status') in FINAL_STATUSES:
+        return True
+
+    games = (payload.get('week') or {}).get('games')
+    if games:
+        return all(g.get('status') in FINAL_STATUSES for g in games)
+    return False
+
+
+class ResponseCache:
+    """SQLite-backed response cache (safe to share between threads)"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Args:
+            path: SQLite file; parent directories are created if missing
+            ttl_seconds: Freshness window for non-final responses
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key        TEXT PRIMARY KEY,
+                endpoint   TEXT NOT NULL,
+                body       BLOB NOT NULL,
+                final      INTEGER NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+        logger.info(f"Sportradar response cache: {path} (ttl={ttl_seconds}s)")
+
+    @classmethod
+    def from_env(cls) -> Optional['ResponseCache']:
+        """Build the cache from SPORTRADAR_CACHE* env vars (None when disabled)"""
+        if os.environ.get('SPORTRADAR_CACHE', 'on').strip().lower() in ('off', 'false', '0'):
+            return None
+        path = os.environ.get('SPORTRADAR_CACHE_PATH', DEFAULT_CACHE_PATH).strip()
+        ttl = int(os.environ.get('SPORTRADAR_CACHE_TTL', DEFAULT_TTL_SECONDS))
+        try:
+            return cls(path, ttl)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Sportradar cache unavailable ({e}) - continuing without it")
+            return None
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None, scope: str = '') -> str:
+        """
+        Content address for a request: sha256 of scope + endpoint + sorted params.
+        The scope (transport mode + base URL) keeps replayed fixtures and other
+        API hosts from ever answering a live request for the same endpoint.
+        """
+        raw = json.dumps([scope, endpoint, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+            scope: str = '') -> Optional[Dict[str, Any]]:
+        """Cached payload, or None if missing or expired"""
+        key = self.make_key(endpoint, params, scope)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, final, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        body, final, fetched_at = row
+        if not final and time.time() - fetched_at > self.ttl_seconds:
+            return None
+        return json.loads(zlib.decompress(body))
+
+    def put(self, endpoint: str, params: Optional[Dict[str, Any]], payload: Dict[str, Any],
+            scope: str = ''):
+        """Store a payload; final payloads never expire"""
+        key = self.make_key(endpoint, params, scope)
+        body = zlib.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, body, final, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, endpoint, body, int(is_final_payload(payload)), time.time())
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
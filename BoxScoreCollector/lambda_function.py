@@ -17,6 +17,7 @@ Event formats:
     {"season": 2024, "week": 10}    -- one week
     {"season": 2024, "limit": 5}    -- limited batch
     {"force": true, "season": 2024} -- re-collect already processed games
+    {"season": 2024, "week": 10, "incremental": false} -- skip the status check below
     {                               -- single game test
         "game_id": "2024_10_BUF_KC",
         "sportradar_id": "uuid-here",
@@ -24,6 +25,10 @@ Event formats:
         "home_team": "KC", "away_team": "BUF"
     }
 
+With a season (and optional week) and no force, batch mode is incremental:
+one fresh schedule call gives each game's status, and only games that became
+closed/complete or whose marker changed are fetched (GameStatusTracker).
+
 SQS trigger format (Records wrapper parsed automatically):
     {"Records": [{"body": "{\"season\": 2023, \"week\": 1}"}]}
 """
@@ -31,7 +36,6 @@ import json
 import logging
 import os
 import sys
-import time
 from typing import Any, Dict, List
 
 sys.path.insert(0, '/var/task')
@@ -40,6 +44,7 @@ from SportradarClient import SportradarClient
 from BoxScoreParser import parse_game_statistics
 from GameImpactCalculator import calc_team_impacts, calc_performance_surprise
 from DatabaseUtils import DatabaseUtils
+from GameStatusTracker import GameStatusTracker
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -52,11 +57,8 @@ def lambda_handler(event: Dict, context: Any) -> Dict:
     logger.info(f"Event: {json.dumps(event)}")
 
     try:
-        api_key = os.environ.get('SPORTRADAR_API_KEY')
-        if not api_key:
-            raise ValueError("SPORTRADAR_API_KEY not set")
-
-        sportradar = SportradarClient(api_key)
+        # SPORTRADAR_API_KEY (not needed with SPORTRADAR_MODE=replay)
+        sportradar = SportradarClient(os.environ.get('SPORTRADAR_API_KEY'))
         db = DatabaseUtils()
 
         # ── SQS trigger — unwrap Records[0].body ──────────────────────────
@@ -87,7 +89,13 @@ def lambda_handler(event: Dict, context: Any) -> Dict:
         limit  = event.get('limit')
         force  = event.get('force', False)
 
-        games = db.fetch_games_to_process(season=season, week=week, limit=limit, force=force)
+        tracker = None
+        if season is not None and not force and event.get('incremental', True):
+            tracker = GameStatusTracker(db, consumer='box_score')
+            games, markers, _ = tracker.plan(sportradar, season, week)
+            games = games[:limit] if limit else games
+        else:
+            games = db.fetch_games_to_process(season=season, week=week, limit=limit, force=force)
         if not games:
             logger.info("No games to process")
             return {'statusCode': 200, 'body': json.dumps({'success': True, 'games_processed': 0})}
@@ -107,9 +115,8 @@ def lambda_handler(event: Dict, context: Any) -> Dict:
                 logger.error(f"Failed {game['game_id']}: {e}", exc_info=True)
                 results.append({'game_id': game['game_id'], 'success': False, 'error': str(e)})
 
-            # Sportradar trial: 1 req/sec — 1 call per game (statistics only)
-            if i < len(games):
-                time.sleep(1.1)
+        if tracker:
+            tracker.save_processed(games, results, markers)
 
         logger.info(f"Done: {success_count}/{len(games)} successful")
         return {
@@ -135,7 +142,7 @@ def _process_game(game: Dict, sportradar: SportradarClient, db: DatabaseUtils) -
     away = game['away_team']
 
     # 1. Fetch player stats (1 API call — statistics.json contains final scores too)
-    stats_resp = sportradar.get_game_statistics(sid)
+    stats_resp = sportradar.get_game_statistics(sid, fresh=game.get('fresh', False))
     players    = parse_game_statistics(stats_resp, gid, game['season'], game['week'])
 
     if not players:
@@ -2,24 +2,49 @@
 NflverseDataFetcher
 ===================
 Pulls per-game advanced metrics from nflverse (via nflreadpy), transforms them,
-and upserts into Supabase tables:
+and loads them into Supabase tables (COPY into staging + one merge per table
+per season, in one transaction — see _load_frame):
   - nflverse_qb_stats
   - nflverse_rb_stats
   - nflverse_wr_stats
   - nflverse_def_stats
 
+and keeps team_week_cumulative (season-to-date team totals per week) in step
+with the QB/RB tables.
+
+Rolling baselines for every player of a (season, week) come from one window
+query (get_rolling_baselines); the per-player get_*_rolling_baseline helpers
+read from it. player_rolling_baselines optionally materialises them per week.
+
+nflverse player stats are loaded once per season set (load_player_stats_frame)
+and cached locally as Parquet, one file per season keyed by the release
+asset's timestamp — a refresh only downloads seasons nflverse has republished.
+Every position transform runs from that one frame (store_positions, optionally
+on a thread pool).
+
 Connection uses pg8000 (same pattern as playerimpact Lambda).
 
 Environment variables required:
   SUPABASE_DB_HOST, SUPABASE_DB_NAME, SUPABASE_DB_USER,
   SUPABASE_DB_PASSWORD, SUPABASE_DB_PORT
+Optional:
+  NFLVERSE_CACHE_DIR   Parquet cache directory (default /tmp/nflverse_cache)
 """
 
+import glob
+import io
+import json
 import os
 import logging
+import re
+import threading
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import pg8000
+import polars as pl
 import nflreadpy as nfl
 
 logger = logging.getLogger(__name__)
@@ -40,126 +65,528 @@ def _get_conn():
     )
 
 
-_BATCH_SIZE = 100   # rows per commit+reconnect — keeps each socket session well under timeout
+def _load_frame(frame, table: str, conflict_cols: tuple, weeks: Optional[list] = None) -> int:
+    """
+    Replace `table`'s rows for each season in `frame` (a polars DataFrame from
+    one of the _*_rows transforms; column names = table columns), restricted
+    to `weeks` when given.
+
+    One connection for the whole frame; per season, one transaction:
+      COPY the season's rows into a temp staging table (ON COMMIT DROP),
+      DELETE the season's rows that are no longer in the frame,
+      INSERT ... SELECT ... ON CONFLICT (conflict_cols) DO UPDATE,
+      COMMIT.
+    A failure rolls back that season, so readers see either the old season or
+    the new one, never a mix. Duplicate keys keep the last row.
+    Returns total rows written.
+    """
+    if frame.is_empty():
+        return 0
 
+    frame   = frame.unique(subset=list(conflict_cols), keep="last", maintain_order=True)
+    cols    = frame.columns
+    col_list = ", ".join(cols)
+    updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in cols if c not in conflict_cols)
+    match   = " AND ".join(f"s.{c} = t.{c}" for c in conflict_cols)
+    stage   = f"_stage_{table}"
+    scope   = "t.season = %s" + (" AND t.week = ANY(%s)" if weeks else "")
 
-def _write_in_batches(rows: list, table: str, conflict_cols: tuple) -> int:
+    written = 0
+    conn = _get_conn()
+    cur  = conn.cursor()
+    try:
+        cur.execute("SET statement_timeout = 0")  # override Supabase default
+        conn.commit()
+        for season in sorted(frame["season"].unique().drop_nulls().to_list()):
+            rows = frame.filter(pl.col("season") == season)
+            try:
+                cur.execute(
+                    f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+                    f"SELECT {col_list} FROM {table} WITH NO DATA"
+                )
+                cur.execute(
+                    f"COPY {stage} ({col_list}) FROM STDIN WITH (FORMAT csv)",
+                    stream=io.BytesIO(rows.write_csv(include_header=False, quote_style="non_numeric").encode()),
+                )
+                cur.execute(
+                    f"DELETE FROM {table} t WHERE {scope} "
+                    f"AND NOT EXISTS (SELECT 1 FROM {stage} s WHERE {match})",
+                    [season, list(weeks)] if weeks else [season],
+                )
+                cur.execute(
+                    f"INSERT INTO {table} ({col_list}) SELECT {col_list} FROM {stage} "
+                    f"ON CONFLICT ({', '.join(conflict_cols)}) DO UPDATE SET {updates}"
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            written += rows.height
+            logger.info("%s: season %s replaced (%d rows)", table, season, rows.height)
+    finally:
+        cur.close()
+        conn.close()
+    return written
+
+
+class _Cols:
     """
-    Upsert `rows` (list of dicts, all same keys) into `table`.
-    Reconnects every _BATCH_SIZE rows so no single connection stays open too long.
-    Returns total rows upserted.
+    Column expressions with the old per-cell _safe() semantics: NaN -> NULL,
+    float -> int truncates, a column missing from the frame reads as NULL.
     """
-    if not rows:
-        return 0
 
-    cols        = list(rows[0].keys())
-    placeholders = ", ".join(["%s"] * len(cols))
-    col_names    = ", ".join(cols)
-    updates      = ", ".join(f"{c} = EXCLUDED.{c}" for c in cols
-                             if c not in conflict_cols)
-    conflict     = ", ".join(conflict_cols)
-    sql = (
-        f"INSERT INTO {table} ({col_names}) VALUES ({placeholders}) "
-        f"ON CONFLICT ({conflict}) DO UPDATE SET {updates}"
+    def __init__(self, df):
+        self._names = set(df.columns)
+
+    def raw(self, name: str) -> pl.Expr:
+        return pl.col(name) if name in self._names else pl.lit(None)
+
+    def int(self, name: str) -> pl.Expr:
+        return self.raw(name).cast(pl.Float64, strict=False).fill_nan(None).cast(pl.Int64, strict=False)
+
+    def float(self, name: str) -> pl.Expr:
+        return self.raw(name).cast(pl.Float64, strict=False).fill_nan(None)
+
+
+def _ratio(num: pl.Expr, den: pl.Expr) -> pl.Expr:
+    """num / den where den > 0, else NULL (rounded later by _round_columns)"""
+    return pl.when(den > 0).then(num / den).otherwise(None)
+
+
+def _round_columns(frame, digits: dict):
+    """
+    Round columns like Python's round(): polars rounds the decimal value, Python
+    the exact binary one, so the rare near-half values (2.675 -> 2.67) are
+    re-rounded in Python to keep the stored numbers unchanged.
+    """
+    fixed = []
+    for col, d in digits.items():
+        values  = frame[col]
+        rounded = values.round(d)
+        scaled  = values * 10 ** d
+        ties    = (((scaled - scaled.floor()) - 0.5).abs() < 1e-6).arg_true()
+        if len(ties):
+            rounded = rounded.scatter(ties, [round(v, d) for v in values.gather(ties).to_list()])
+        fixed.append(rounded)
+    return frame.with_columns(fixed)
+
+
+# =============================================================================
+# Shared nflverse load — one frame per season set, Parquet cache per season
+# =============================================================================
+
+_CACHE_DIR   = os.environ.get("NFLVERSE_CACHE_DIR", "/tmp/nflverse_cache")
+_RELEASE_API = "https://api.github.com/repos/nflverse/nflverse-data/releases/tags/stats_player"
+_ASSET_NAME  = "stats_player_week_{season}.parquet"
+
+
+def _release_stamps(seasons: list) -> dict:
+    """
+    {season: updated_at} of each season's asset in the nflverse stats_player
+    release (one GitHub API call). Returns {} when the API is unreachable.
+    """
+    try:
+        req = urllib.request.Request(_RELEASE_API, headers={"Accept": "application/vnd.github+json"})
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            assets = json.load(resp).get("assets", [])
+    except Exception as e:
+        logger.warning("nflverse release lookup failed (%s) — using cached seasons as-is", e)
+        return {}
+    updated = {a.get("name"): a.get("updated_at") for a in assets}
+    return {s: updated.get(_ASSET_NAME.format(season=s)) for s in seasons}
+
+
+def _cache_path(cache_dir: str, season: int, stamp: str) -> str:
+    return os.path.join(cache_dir, f"player_stats_{season}_{re.sub(r'[^0-9A-Za-z]', '', stamp)}.parquet")
+
+
+def _cached_season(cache_dir: str, season: int, stamp: Optional[str]) -> Optional[str]:
+    """Cache file for season at stamp; newest file for season when stamp is unknown."""
+    if stamp:
+        path = _cache_path(cache_dir, season, stamp)
+        return path if os.path.exists(path) else None
+    files = glob.glob(os.path.join(cache_dir, f"player_stats_{season}_*.parquet"))
+    return max(files, key=os.path.getmtime) if files else None
+
+
+def _store_season(cache_dir: str, season: int, stamp: str, frame) -> None:
+    """Write one season's frame and drop that season's older releases."""
+    path = _cache_path(cache_dir, season, stamp)
+    tmp  = f"{path}.{os.getpid()}.tmp"
+    frame.write_parquet(tmp)
+    os.replace(tmp, path)
+    for old in glob.glob(os.path.join(cache_dir, f"player_stats_{season}_*.parquet")):
+        if old != path:
+            os.remove(old)
+
+
+def load_player_stats_frame(seasons: list, cache_dir: Optional[str] = _CACHE_DIR):
+    """
+    nflverse weekly player stats for `seasons` as one polars frame.
+    Seasons whose release timestamp matches a cached Parquet file are read from
+    disk; the rest come from a single nfl.load_player_stats call and are cached.
+    If the release timestamps can't be fetched, any cached file is used.
+    cache_dir=None bypasses the cache.
+    """
+    seasons = sorted(set(seasons))
+    if cache_dir is None:
+        return nfl.load_player_stats(seasons)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    stamps = _release_stamps(seasons)
+    frames, missing = [], []
+    for season in seasons:
+        path = _cached_season(cache_dir, season, stamps.get(season))
+        if path:
+            frames.append(pl.read_parquet(path))
+        else:
+            missing.append(season)
+
+    if missing:
+        fresh = nfl.load_player_stats(missing)
+        for season in missing:
+            if stamps.get(season):
+                _store_season(cache_dir, season, stamps[season], fresh.filter(pl.col("season") == season))
+        frames.append(fresh)
+
+    logger.info("nflverse player stats: seasons=%s cached=%d downloaded=%s",
+                seasons, len(seasons) - len(missing), missing)
+    return frames[0] if len(frames) == 1 else pl.concat(frames, how="diagonal_relaxed")
+
+
+def _select(df, seasons: list, weeks: Optional[list], positions) -> "pl.DataFrame":
+    """Regular-season rows of `positions` for seasons (and weeks) from a shared frame."""
+    out = df.filter(
+        pl.col("position").is_in(list(positions))
+        & pl.col("season").is_in(list(seasons))
+        & (pl.col("week") <= 18)
+    )
+    if weeks:
+        out = out.filter(pl.col("week").is_in(list(weeks)))
+    return out
+
+
+# =============================================================================
+# team_week_cumulative — season-to-date team totals per week
+# =============================================================================
+
+_CUMULATIVE_SQL = """
+    WITH weekly AS (
+        SELECT team, week,
+               SUM(attempts) AS attempts, SUM(sacks_suffered) AS sacks,
+               0 AS carries, 0 AS rushing_yards, 0 AS rushing_epa
+        FROM nflverse_qb_stats
+        WHERE season = %s AND week >= %s AND team IS NOT NULL
+        GROUP BY team, week
+        UNION ALL
+        SELECT team, week,
+               0, 0, SUM(carries), SUM(rushing_yards), SUM(rushing_epa)
+        FROM nflverse_rb_stats
+        WHERE season = %s AND week >= %s AND team IS NOT NULL
+        GROUP BY team, week
+    ),
+    per_week AS (
+        SELECT team, week,
+               COALESCE(SUM(attempts), 0)      AS attempts,
+               COALESCE(SUM(sacks), 0)         AS sacks,
+               COALESCE(SUM(carries), 0)       AS carries,
+               COALESCE(SUM(rushing_yards), 0) AS rushing_yards,
+               COALESCE(SUM(rushing_epa), 0)   AS rushing_epa
+        FROM weekly
+        GROUP BY team, week
+    ),
+    base AS (
+        SELECT DISTINCT ON (team) team, attempts, sacks, carries, rushing_yards, rushing_epa
+        FROM team_week_cumulative
+        WHERE season = %s AND week < %s
+        ORDER BY team, week DESC
     )
+    INSERT INTO team_week_cumulative
+        (season, team, week, attempts, sacks, carries, rushing_yards, rushing_epa, updated_at)
+    SELECT %s, p.team, p.week,
+           COALESCE(b.attempts, 0)      + SUM(p.attempts)      OVER w,
+           COALESCE(b.sacks, 0)         + SUM(p.sacks)         OVER w,
+           COALESCE(b.carries, 0)       + SUM(p.carries)       OVER w,
+           COALESCE(b.rushing_yards, 0) + SUM(p.rushing_yards) OVER w,
+           COALESCE(b.rushing_epa, 0)   + SUM(p.rushing_epa)   OVER w,
+           NOW()
+    FROM per_week p
+    LEFT JOIN base b ON b.team = p.team
+    WINDOW w AS (PARTITION BY p.team ORDER BY p.week)
+"""
 
-    upserted = 0
-    conn = cur = None
 
-    for i, row in enumerate(rows):
-        if i % _BATCH_SIZE == 0:
-            if conn is not None:
-                conn.commit(); cur.close(); conn.close()
-            conn = _get_conn()
-            cur  = conn.cursor()
-            cur.execute("SET statement_timeout = 0")  # override Supabase default
+def refresh_team_week_cumulative(seasons: list, from_week: int = 1) -> int:
+    """
+    Rebuild team_week_cumulative rows for weeks >= from_week of each season.
+    Earlier weeks are untouched: the last stored row before from_week is the
+    base, and only the changed weeks' nflverse rows are aggregated.
+    Returns rows written.
+    """
+    written = 0
+    conn = _get_conn()
+    cur  = conn.cursor()
+    try:
+        for season in seasons:
+            cur.execute(
+                "DELETE FROM team_week_cumulative WHERE season = %s AND week >= %s",
+                [season, from_week],
+            )
+            cur.execute(_CUMULATIVE_SQL, [season, from_week] * 3 + [season])
+            written += cur.rowcount
+            conn.commit()
+            logger.info("team_week_cumulative: season %s weeks >= %s -> %d rows",
+                        season, from_week, cur.rowcount)
+    finally:
+        cur.close()
+        conn.close()
+    return written
 
-        cur.execute(sql, [row[c] for c in cols])
-        upserted += 1
 
-    if conn is not None:
-        conn.commit(); cur.close(); conn.close()
+# =============================================================================
+# Rolling baselines — every player's trailing window for a (season, week)
+# =============================================================================
 
-    return upserted
+# kind -> (table, {output key: aggregate}); keys match the per-player helpers
+_BASELINE_SPECS = {
+    "qb": ("nflverse_qb_stats", {
+        "cpoe":                   "AVG(passing_cpoe)",
+        "passing_epa":            "SUM(passing_epa)",
+        "passing_air_yards":      "SUM(passing_air_yards)",
+        "attempts":               "SUM(attempts)",
+        "rushing_yards":          "AVG(rushing_yards)",
+        "sacks":                  "AVG(sacks_suffered)",
+    }),
+    "rb": ("nflverse_rb_stats", {
+        "carries":                "SUM(carries)",
+        "rushing_yards":          "SUM(rushing_yards)",
+        "rushing_epa":            "SUM(rushing_epa)",
+        "rushing_first_downs":    "SUM(rushing_first_downs)",
+        "avg_receiving_yards":    "AVG(receiving_yards)",
+        "receiving_epa":          "SUM(receiving_epa)",
+        "rushing_fumbles_lost":   "SUM(rushing_fumbles_lost)",
+        "receiving_fumbles_lost": "SUM(receiving_fumbles_lost)",
+    }),
+    "wr": ("nflverse_wr_stats", {
+        "targets":                "SUM(targets)",
+        "receptions":             "SUM(receptions)",
+        "receiving_yards":        "SUM(receiving_yards)",
+        "receiving_epa":          "SUM(receiving_epa)",
+        "receiving_first_downs":  "SUM(receiving_first_downs)",
+        "wopr":                   "AVG(wopr)",
+        "target_share":           "AVG(target_share)",
+        "receiving_fumbles_lost": "SUM(receiving_fumbles_lost)",
+    }),
+    "front7": ("nflverse_front7_stats", {
+        "tackles_solo":           "SUM(def_tackles_solo)",
+        "sacks":                  "SUM(def_sacks)",
+        "tfl":                    "SUM(def_tackles_for_loss)",
+        "qb_hits":                "SUM(def_qb_hits)",
+        "fumbles_forced":         "SUM(def_fumbles_forced)",
+    }),
+    "secondary": ("nflverse_secondary_stats", {
+        "interceptions":          "SUM(def_interceptions)",
+        "pass_defended":          "SUM(def_pass_defended)",
+        "tackles_solo":           "SUM(def_tackles_solo)",
+        "int_yards":              "SUM(def_interception_yards)",
+        "fumbles_forced":         "SUM(def_fumbles_forced)",
+    }),
+}
+
+
+def _baselines_sql(week_expr: str) -> str:
+    """
+    One statement for all kinds: per table, ROW_NUMBER() over each player's
+    games before week_expr (newest first) keeps the last `window` of them,
+    then one GROUP BY. Parameters per kind: season, window.
+    Rows: (kind, player_name, player_id, games, stats JSONB).
+    """
+    parts = []
+    for kind, (table, aggs) in _BASELINE_SPECS.items():
+        stats = ", ".join(f"'{key}', {agg}" for key, agg in aggs.items())
+        parts.append(f"""
+        SELECT '{kind}' AS kind, player_name, MAX(player_id) AS player_id,
+               COUNT(*) AS games, jsonb_build_object({stats}) AS stats
+        FROM (
+            SELECT *, ROW_NUMBER() OVER (PARTITION BY player_name ORDER BY week DESC) AS recent
+            FROM {table}
+            WHERE season = %s AND week < {week_expr} AND player_name IS NOT NULL
+        ) ranked
+        WHERE recent <= %s
+        GROUP BY player_name""")
+    return "\n        UNION ALL".join(parts)
 
 
-def _safe(val, cast=None):
-    """Return None if val is NaN/None, otherwise cast and return."""
-    if val is None:
-        return None
+_BASELINE_MEMO: "OrderedDict[tuple, dict]" = OrderedDict()
+_BASELINE_MEMO_WEEKS = 4
+_BASELINE_LOCK = threading.Lock()
+
+
+def get_rolling_baselines(season: int, week: int, window: int = 5,
+                          materialized: bool = False) -> dict:
+    """
+    Every player's baseline over their last `window` games before `week`,
+    in one query: {kind: {player_name: {stat: value, ..., "player_id", "games"}}}
+    for kind in qb, rb, wr, front7, secondary. Players without a prior game
+    in the season are absent.
+    materialized=True reads player_rolling_baselines instead (see
+    refresh_player_rolling_baselines).
+    """
+    result = {kind: {} for kind in _BASELINE_SPECS}
+    conn = _get_conn()
+    cur  = conn.cursor()
     try:
-        import math
-        if isinstance(val, float) and math.isnan(val):
-            return None
+        if materialized:
+            cur.execute(
+                "SELECT kind, player_name, player_id, games, stats FROM player_rolling_baselines "
+                "WHERE season = %s AND week = %s AND window_size = %s",
+                [season, week, window],
+            )
+        else:
+            cur.execute(_baselines_sql("%s"), [season, week, window] * len(_BASELINE_SPECS))
+        rows = cur.fetchall()
+    finally:
+        cur.close()
+        conn.close()
+
+    for kind, name, player_id, games, stats in rows:
+        stats = stats if isinstance(stats, dict) else json.loads(stats)
+        result[kind][name] = {**stats, "player_id": player_id, "games": games}
+    logger.info("Rolling baselines season=%s week<%s window=%s: %d players",
+                season, week, window, len(rows))
+    return result
+
+
+def _baseline(kind: str, player_name: str, season: int, week: int, window: int) -> dict:
+    """One player's baseline, from a memo of whole weeks (one query per week)."""
+    key = (season, week, window)
+    with _BASELINE_LOCK:
+        week_baselines = _BASELINE_MEMO.get(key)
+        if week_baselines is not None:
+            _BASELINE_MEMO.move_to_end(key)
+    if week_baselines is None:
+        week_baselines = get_rolling_baselines(season, week, window)
+        with _BASELINE_LOCK:
+            _BASELINE_MEMO[key] = week_baselines
+            while len(_BASELINE_MEMO) > _BASELINE_MEMO_WEEKS:
+                _BASELINE_MEMO.popitem(last=False)
+    found = week_baselines[kind].get(player_name)
+    return {k: (found or {}).get(k) for k in _BASELINE_SPECS[kind][1]}
+
+
+def refresh_player_rolling_baselines(seasons: list, from_week: int = 1, window: int = 5) -> int:
+    """
+    Rebuild player_rolling_baselines for weeks >= from_week of each season, up
+    to the week after the latest loaded one, in one transaction per season.
+    A load of week k changes the baselines of weeks k+1 .. k+window, so after
+    a weekly load pass from_week = k + 1. Returns rows written.
+    """
+    last_week = " UNION ALL ".join(
+        f"SELECT MAX(week) AS week FROM {table} WHERE season = %s"
+        for table, _ in _BASELINE_SPECS.values()
+    )
+    written = 0
+    conn = _get_conn()
+    cur  = conn.cursor()
+    try:
+        for season in seasons:
+            cur.execute(f"SELECT MAX(week) FROM ({last_week}) w", [season] * len(_BASELINE_SPECS))
+            latest = cur.fetchone()[0]
+            if latest is None:
+                continue
+            cur.execute(
+                "DELETE FROM player_rolling_baselines "
+                "WHERE season = %s AND window_size = %s AND week >= %s",
+                [season, window, from_week],
+            )
+            cur.execute(
+                f"""
+                INSERT INTO player_rolling_baselines
+                    (season, week, kind, player_name, window_size, player_id, games, stats, updated_at)
+                SELECT %s, w.week, b.kind, b.player_name, %s, b.player_id, b.games, b.stats, NOW()
+                FROM generate_series(%s::int, %s::int) AS w(week)
+                CROSS JOIN LATERAL ({_baselines_sql("w.week")}
+                ) b
+                """,
+                [season, window, max(from_week, 2), latest + 1]
+                + [season, window] * len(_BASELINE_SPECS),
+            )
+            written += cur.rowcount
+            conn.commit()
+            logger.info("player_rolling_baselines: season %s weeks %s-%s -> %d rows",
+                        season, from_week, latest + 1, cur.rowcount)
     except Exception:
-        pass
-    return cast(val) if cast else val
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+        conn.close()
+    with _BASELINE_LOCK:
+        _BASELINE_MEMO.clear()
+    return written
 
 
 # =============================================================================
 # QB — fetch, transform, store, query
 # =============================================================================
 
-def fetch_and_store_qb_stats(seasons: list, weeks: list = None) -> int:
+def _qb_rows(qb_df):
+    """nflverse QB player-weeks -> nflverse_qb_stats rows"""
+    c     = _Cols(qb_df)
+    atts  = c.int("attempts").fill_null(0)
+    sacks = c.int("sacks_suffered").fill_null(0)
+    py    = c.float("passing_yards").fill_null(0.0)
+    pay   = c.float("passing_air_yards").fill_null(0.0)
+    epa   = c.float("passing_epa").fill_null(0.0)
+
+    rows = qb_df.select(
+        c.raw("player_id").alias("player_id"),
+        c.raw("player_display_name").alias("player_name"),
+        c.raw("recent_team").alias("team"),
+        c.int("season").alias("season"),
+        c.int("week").alias("week"),
+        c.int("completions").alias("completions"),
+        atts.alias("attempts"),
+        c.int("passing_yards").alias("passing_yards"),
+        c.int("passing_tds").alias("passing_tds"),
+        c.int("passing_interceptions").alias("passing_interceptions"),
+        sacks.alias("sacks_suffered"),
+        c.int("sack_yards_lost").alias("sack_yards_lost"),
+        c.int("passing_air_yards").alias("passing_air_yards"),
+        c.int("passing_yards_after_catch").alias("passing_yards_after_catch"),
+        c.int("passing_first_downs").alias("passing_first_downs"),
+        c.float("passing_epa").alias("passing_epa"),
+        c.float("passing_cpoe").alias("passing_cpoe"),
+        c.float("pacr").alias("pacr"),
+        c.int("carries").alias("carries"),
+        c.int("rushing_yards").alias("rushing_yards"),
+        c.int("rushing_tds").alias("rushing_tds"),
+        c.float("rushing_epa").alias("rushing_epa"),
+        c.int("rushing_first_downs").alias("rushing_first_downs"),
+        c.float("passing_cpoe").alias("cpoe"),
+        _ratio(py, atts).alias("ypa"),
+        _ratio(pay, atts).alias("adot"),
+        _ratio(epa, atts + sacks).alias("epa_per_dropback"),
+        c.raw("opponent_team").alias("opponent"),
+        c.raw("game_id").alias("game_id"),
+    )
+    return _round_columns(rows, {"ypa": 2, "adot": 2, "epa_per_dropback": 4})
+
+
+def fetch_and_store_qb_stats(seasons: list, weeks: list = None, df=None) -> int:
     """
     Pull QB stats from nflverse for the given seasons (and optional week filter),
     transform to our schema, and upsert into nflverse_qb_stats.
-    Returns total rows upserted.
+    df: a frame from load_player_stats_frame to reuse instead of loading.
+    Returns total rows written.
     """
-    df = nfl.load_player_stats(seasons)
-    qb_df = df.filter((df["position"] == "QB") & (df["week"] <= 18))
+    if df is None:
+        df = load_player_stats_frame(seasons)
+    qb_df = _select(df, seasons, weeks, ["QB"])
 
-    if weeks:
-        qb_df = qb_df.filter(qb_df["week"].is_in(weeks))
-
-    rows_to_write = []
-    for g in qb_df.iter_rows(named=True):
-        atts     = _safe(g.get("attempts"), int)        or 0
-        sacks    = _safe(g.get("sacks_suffered"), int)  or 0
-        py       = _safe(g.get("passing_yards"), float) or 0.0
-        pay      = _safe(g.get("passing_air_yards"), float) or 0.0
-        epa      = _safe(g.get("passing_epa"), float)   or 0.0
-        dropbacks = atts + sacks
-
-        ypa  = round(py  / atts,     2) if atts > 0     else None
-        adot = round(pay / atts,     2) if atts > 0     else None
-        epd  = round(epa / dropbacks, 4) if dropbacks > 0 else None
-
-        rows_to_write.append({
-            "player_id":                 _safe(g.get("player_id")),
-            "player_name":               _safe(g.get("player_display_name")),
-            "team":                      _safe(g.get("recent_team")),
-            "season":                    _safe(g.get("season"), int),
-            "week":                      _safe(g.get("week"), int),
-            "completions":               _safe(g.get("completions"), int),
-            "attempts":                  atts,
-            "passing_yards":             _safe(g.get("passing_yards"), int),
-            "passing_tds":               _safe(g.get("passing_tds"), int),
-            "passing_interceptions":     _safe(g.get("passing_interceptions"), int),
-            "sacks_suffered":            sacks,
-            "sack_yards_lost":           _safe(g.get("sack_yards_lost"), int),
-            "passing_air_yards":         _safe(g.get("passing_air_yards"), int),
-            "passing_yards_after_catch": _safe(g.get("passing_yards_after_catch"), int),
-            "passing_first_downs":       _safe(g.get("passing_first_downs"), int),
-            "passing_epa":               _safe(g.get("passing_epa"), float),
-            "passing_cpoe":              _safe(g.get("passing_cpoe"), float),
-            "pacr":                      _safe(g.get("pacr"), float),
-            "carries":                   _safe(g.get("carries"), int),
-            "rushing_yards":             _safe(g.get("rushing_yards"), int),
-            "rushing_tds":               _safe(g.get("rushing_tds"), int),
-            "rushing_epa":               _safe(g.get("rushing_epa"), float),
-            "rushing_first_downs":       _safe(g.get("rushing_first_downs"), int),
-            "cpoe":                      _safe(g.get("passing_cpoe"), float),
-            "ypa":                       ypa,
-            "adot":                      adot,
-            "epa_per_dropback":          epd,
-            "opponent":                  _safe(g.get("opponent_team")),
-            "game_id":                   _safe(g.get("game_id")),
-        })
-
-    upserted = _write_in_batches(rows_to_write, "nflverse_qb_stats",
-                                 conflict_cols=("player_id", "season", "week"))
-    logger.info("nflverse_qb_stats: upserted %d rows", upserted)
+    upserted = _load_frame(_qb_rows(qb_df), "nflverse_qb_stats",
+                           conflict_cols=("player_id", "season", "week"), weeks=weeks)
+    logger.info("nflverse_qb_stats: loaded %d rows", upserted)
     return upserted
 
 
@@ -185,103 +612,77 @@ def get_qb_game_stats(player_name: str, team: str, season: int, week: int) -> Op
 def get_qb_rolling_baseline(
     player_name: str, team: str, season: int, current_week: int, window: int = 5
 ) -> Optional[dict]:
-    """Aggregate nflverse QB stats from the last `window` weeks before current_week."""
-    conn = _get_conn()
-    cur  = conn.cursor()
-    cur.execute(
-        """
-        SELECT
-            AVG(passing_cpoe)       AS cpoe,
-            SUM(passing_epa)        AS passing_epa,
-            SUM(passing_air_yards)  AS passing_air_yards,
-            SUM(attempts)           AS attempts,
-            AVG(rushing_yards)      AS rushing_yards,
-            AVG(sacks_suffered)     AS sacks
-        FROM nflverse_qb_stats
-        WHERE player_name = %s AND season = %s AND week < %s
-        ORDER BY week DESC
-        LIMIT %s
-        """,
-        [player_name, season, current_week, window],
-    )
-    row  = cur.fetchone()
-    cols = [d[0] for d in cur.description]
-    cur.close()
-    conn.close()
-    return dict(zip(cols, row)) if row else None
+    """Aggregate nflverse QB stats from the last `window` games before current_week
+    (served from get_rolling_baselines — one query per week for all players)."""
+    return _baseline("qb", player_name, season, current_week, window)
 
 
 # =============================================================================
 # RB — fetch, transform, store, query
 # =============================================================================
 
-def fetch_and_store_rb_stats(seasons: list, weeks: list = None) -> int:
+def _rb_rows(rb_df):
+    """nflverse RB player-weeks -> nflverse_rb_stats rows"""
+    c        = _Cols(rb_df)
+    carries  = c.int("carries").fill_null(0)
+    rush_yds = c.float("rushing_yards").fill_null(0.0)
+    rush_epa = c.float("rushing_epa").fill_null(0.0)
+    rush_fds = c.int("rushing_first_downs").fill_null(0)
+    recv_epa = c.float("receiving_epa").fill_null(0.0)
+    recv_yds = c.int("receiving_yards").fill_null(0)
+    rush_tds = c.int("rushing_tds").fill_null(0)
+    recv_tds = c.int("receiving_tds").fill_null(0)
+
+    rows = rb_df.select(
+        c.raw("player_id").alias("player_id"),
+        c.raw("player_display_name").alias("player_name"),
+        c.raw("recent_team").alias("team"),
+        c.int("season").alias("season"),
+        c.int("week").alias("week"),
+        carries.alias("carries"),
+        c.int("rushing_yards").alias("rushing_yards"),
+        rush_tds.alias("rushing_tds"),
+        c.int("rushing_fumbles").alias("rushing_fumbles"),
+        c.int("rushing_fumbles_lost").alias("rushing_fumbles_lost"),
+        rush_fds.alias("rushing_first_downs"),
+        rush_epa.alias("rushing_epa"),
+        c.int("receptions").alias("receptions"),
+        c.int("targets").alias("targets"),
+        recv_yds.alias("receiving_yards"),
+        recv_tds.alias("receiving_tds"),
+        c.int("receiving_air_yards").alias("receiving_air_yards"),
+        c.int("receiving_yards_after_catch").alias("receiving_yards_after_catch"),
+        c.int("receiving_first_downs").alias("receiving_first_downs"),
+        recv_epa.alias("receiving_epa"),
+        c.int("receiving_fumbles_lost").alias("receiving_fumbles_lost"),
+        c.float("target_share").alias("target_share"),
+        c.float("wopr").alias("wopr"),
+        _ratio(rush_yds, carries).alias("ypc"),
+        _ratio(rush_epa, carries).alias("epa_per_carry"),
+        _ratio(rush_fds, carries).alias("fd_rate"),
+        (rush_epa + recv_epa).alias("total_epa"),
+        (rush_yds.cast(pl.Int64) + recv_yds).alias("total_yards"),
+        (rush_tds + recv_tds).alias("total_tds"),
+        c.raw("opponent_team").alias("opponent"),
+        c.raw("game_id").alias("game_id"),
+    )
+    return _round_columns(rows, {"ypc": 2, "epa_per_carry": 4, "fd_rate": 4, "total_epa": 3})
+
+
+def fetch_and_store_rb_stats(seasons: list, weeks: list = None, df=None) -> int:
     """
     Pull RB stats from nflverse for the given seasons (and optional week filter),
     transform to our schema, and upsert into nflverse_rb_stats.
-    Returns total rows upserted.
+    df: a frame from load_player_stats_frame to reuse instead of loading.
+    Returns total rows written.
     """
-    df = nfl.load_player_stats(seasons)
-    rb_df = df.filter((df["position"] == "RB") & (df["week"] <= 18))
+    if df is None:
+        df = load_player_stats_frame(seasons)
+    rb_df = _select(df, seasons, weeks, ["RB"])
 
-    if weeks:
-        rb_df = rb_df.filter(rb_df["week"].is_in(weeks))
-
-    rows_to_write = []
-    for g in rb_df.iter_rows(named=True):
-        carries   = _safe(g.get("carries"),              int)   or 0
-        rush_yds  = _safe(g.get("rushing_yards"),        float) or 0.0
-        rush_epa  = _safe(g.get("rushing_epa"),          float) or 0.0
-        rush_fds  = _safe(g.get("rushing_first_downs"),  int)   or 0
-        recv_epa  = _safe(g.get("receiving_epa"),        float) or 0.0
-        recv_yds  = _safe(g.get("receiving_yards"),      int)   or 0
-        rush_tds  = _safe(g.get("rushing_tds"),          int)   or 0
-        recv_tds  = _safe(g.get("receiving_tds"),        int)   or 0
-
-        ypc           = round(rush_yds / carries, 2)          if carries > 0 else None
-        epa_per_carry = round(rush_epa / carries, 4)          if carries > 0 else None
-        fd_rate       = round(rush_fds / carries, 4)          if carries > 0 else None
-        total_epa     = round((rush_epa or 0) + (recv_epa or 0), 3)
-        total_yards   = (int(rush_yds) if rush_yds else 0) + (recv_yds or 0)
-        total_tds     = (rush_tds or 0) + (recv_tds or 0)
-
-        rows_to_write.append({
-            "player_id":                    _safe(g.get("player_id")),
-            "player_name":                  _safe(g.get("player_display_name")),
-            "team":                         _safe(g.get("recent_team")),
-            "season":                       _safe(g.get("season"), int),
-            "week":                         _safe(g.get("week"), int),
-            "carries":                      carries,
-            "rushing_yards":                _safe(g.get("rushing_yards"), int),
-            "rushing_tds":                  rush_tds,
-            "rushing_fumbles":              _safe(g.get("rushing_fumbles"), int),
-            "rushing_fumbles_lost":         _safe(g.get("rushing_fumbles_lost"), int),
-            "rushing_first_downs":          rush_fds,
-            "rushing_epa":                  rush_epa,
-            "receptions":                   _safe(g.get("receptions"), int),
-            "targets":                      _safe(g.get("targets"), int),
-            "receiving_yards":              recv_yds,
-            "receiving_tds":                recv_tds,
-            "receiving_air_yards":          _safe(g.get("receiving_air_yards"), int),
-            "receiving_yards_after_catch":  _safe(g.get("receiving_yards_after_catch"), int),
-            "receiving_first_downs":        _safe(g.get("receiving_first_downs"), int),
-            "receiving_epa":                recv_epa,
-            "receiving_fumbles_lost":       _safe(g.get("receiving_fumbles_lost"), int),
-            "target_share":                 _safe(g.get("target_share"), float),
-            "wopr":                         _safe(g.get("wopr"), float),
-            "ypc":                          ypc,
-            "epa_per_carry":                epa_per_carry,
-            "fd_rate":                      fd_rate,
-            "total_epa":                    total_epa,
-            "total_yards":                  total_yards,
-            "total_tds":                    total_tds,
-            "opponent":                     _safe(g.get("opponent_team")),
-            "game_id":                      _safe(g.get("game_id")),
-        })
-
-    upserted = _write_in_batches(rows_to_write, "nflverse_rb_stats",
-                                 conflict_cols=("player_id", "season", "week"))
-    logger.info("nflverse_rb_stats: upserted %d rows", upserted)
+    upserted = _load_frame(_rb_rows(rb_df), "nflverse_rb_stats",
+                           conflict_cols=("player_id", "season", "week"), weeks=weeks)
+    logger.info("nflverse_rb_stats: loaded %d rows", upserted)
     return upserted
 
 
@@ -310,102 +711,71 @@ def get_rb_rolling_baseline(
     """
     Aggregate nflverse RB stats from up to the last `window` weeks before current_week.
     Returns sums/avgs in the same shape as nv_base expected by calc_rb_multiplier_enhanced.
+    Served from get_rolling_baselines (one query per week for all players).
     """
-    conn = _get_conn()
-    cur  = conn.cursor()
-    cur.execute(
-        """
-        SELECT
-            SUM(carries)                AS carries,
-            SUM(rushing_yards)          AS rushing_yards,
-            SUM(rushing_epa)            AS rushing_epa,
-            SUM(rushing_first_downs)    AS rushing_first_downs,
-            AVG(receiving_yards)        AS avg_receiving_yards,
-            SUM(receiving_epa)          AS receiving_epa,
-            SUM(rushing_fumbles_lost)   AS rushing_fumbles_lost,
-            SUM(receiving_fumbles_lost) AS receiving_fumbles_lost
-        FROM (
-            SELECT * FROM nflverse_rb_stats
-            WHERE player_name = %s AND season = %s AND week < %s
-            ORDER BY week DESC
-            LIMIT %s
-        ) recent
-        """,
-        [player_name, season, current_week, window],
-    )
-    row  = cur.fetchone()
-    cols = [d[0] for d in cur.description]
-    cur.close()
-    conn.close()
-    return dict(zip(cols, row)) if row else None
+    return _baseline("rb", player_name, season, current_week, window)
 
 
 # =============================================================================
 # WR/TE — fetch, transform, store, query
 # =============================================================================
 
-def fetch_and_store_wr_stats(seasons: list, weeks: list = None) -> int:
+def _wr_rows(wr_df):
+    """nflverse WR/TE player-weeks -> nflverse_wr_stats rows"""
+    c        = _Cols(wr_df)
+    tgts     = c.int("targets").fill_null(0)
+    recs     = c.int("receptions").fill_null(0)
+    recv_yds = c.int("receiving_yards").fill_null(0)
+    recv_epa = c.float("receiving_epa").fill_null(0.0)
+    recv_fds = c.int("receiving_first_downs").fill_null(0)
+    recv_tds = c.int("receiving_tds").fill_null(0)
+
+    rows = wr_df.select(
+        c.raw("player_id").alias("player_id"),
+        c.raw("player_display_name").alias("player_name"),
+        c.raw("position").alias("position"),
+        c.raw("recent_team").alias("team"),
+        c.int("season").alias("season"),
+        c.int("week").alias("week"),
+        recs.alias("receptions"),
+        tgts.alias("targets"),
+        recv_yds.alias("receiving_yards"),
+        recv_tds.alias("receiving_tds"),
+        c.int("receiving_air_yards").alias("receiving_air_yards"),
+        c.int("receiving_yards_after_catch").alias("receiving_yards_after_catch"),
+        recv_fds.alias("receiving_first_downs"),
+        recv_epa.alias("receiving_epa"),
+        c.int("receiving_fumbles").alias("receiving_fumbles"),
+        c.int("receiving_fumbles_lost").alias("receiving_fumbles_lost"),
+        c.int("receiving_2pt_conversions").alias("receiving_2pt_conversions"),
+        c.float("target_share").alias("target_share"),
+        c.float("air_yards_share").alias("air_yards_share"),
+        c.float("wopr").alias("wopr"),
+        c.float("racr").alias("racr"),
+        _ratio(recs, tgts).alias("catch_rate"),
+        _ratio(recv_yds, recs).alias("ypr"),
+        _ratio(recv_epa, tgts).alias("epa_per_target"),
+        _ratio(recv_fds, recs).alias("fd_rate"),
+        c.raw("opponent_team").alias("opponent"),
+        c.raw("game_id").alias("game_id"),
+    )
+    return _round_columns(rows, {"catch_rate": 4, "ypr": 2, "epa_per_target": 4, "fd_rate": 4})
+
+
+def fetch_and_store_wr_stats(seasons: list, weeks: list = None, df=None) -> int:
     """
     Pull WR and TE stats from nflverse for the given seasons (and optional week
     filter), transform to our schema, and upsert into nflverse_wr_stats.
-    Returns total rows upserted.
+    df: a frame from load_player_stats_frame to reuse instead of loading.
+    Returns total rows written.
     """
-    df = nfl.load_player_stats(seasons)
-    wr_df = df.filter(df["position"].is_in(["WR", "TE"]) & (df["week"] <= 18))
+    if df is None:
+        df = load_player_stats_frame(seasons)
+    wr_df = _select(df, seasons, weeks, ["WR", "TE"])
 
-    if weeks:
-        wr_df = wr_df.filter(wr_df["week"].is_in(weeks))
-
-    rows_to_write = []
-
-    for g in wr_df.iter_rows(named=True):
-        tgts     = _safe(g.get("targets"),               int)   or 0
-        recs     = _safe(g.get("receptions"),            int)   or 0
-        recv_yds = _safe(g.get("receiving_yards"),       int)   or 0
-        recv_epa = _safe(g.get("receiving_epa"),         float) or 0.0
-        recv_fds = _safe(g.get("receiving_first_downs"), int)   or 0
-        recv_tds = _safe(g.get("receiving_tds"),         int)   or 0
-
-        catch_rate    = round(recs     / tgts,     4) if tgts > 0 else None
-        ypr           = round(recv_yds / recs,     2) if recs  > 0 else None
-        epa_per_tgt   = round(recv_epa / tgts,     4) if tgts > 0 else None
-        fd_rate       = round(recv_fds / recs,     4) if recs  > 0 else None
-
-        row = {
-            "player_id":                  _safe(g.get("player_id")),
-            "player_name":                _safe(g.get("player_display_name")),
-            "position":                   _safe(g.get("position")),
-            "team":                       _safe(g.get("recent_team")),
-            "season":                     _safe(g.get("season"), int),
-            "week":                       _safe(g.get("week"),   int),
-            "receptions":                 recs,
-            "targets":                    tgts,
-            "receiving_yards":            recv_yds,
-            "receiving_tds":              recv_tds,
-            "receiving_air_yards":        _safe(g.get("receiving_air_yards"),         int),
-            "receiving_yards_after_catch":_safe(g.get("receiving_yards_after_catch"), int),
-            "receiving_first_downs":      recv_fds,
-            "receiving_epa":              recv_epa,
-            "receiving_fumbles":          _safe(g.get("receiving_fumbles"),      int),
-            "receiving_fumbles_lost":     _safe(g.get("receiving_fumbles_lost"), int),
-            "receiving_2pt_conversions":  _safe(g.get("receiving_2pt_conversions"), int),
-            "target_share":               _safe(g.get("target_share"),    float),
-            "air_yards_share":            _safe(g.get("air_yards_share"), float),
-            "wopr":                       _safe(g.get("wopr"),            float),
-            "racr":                       _safe(g.get("racr"),            float),
-            "catch_rate":                 catch_rate,
-            "ypr":                        ypr,
-            "epa_per_target":             epa_per_tgt,
-            "fd_rate":                    fd_rate,
-            "opponent":                   _safe(g.get("opponent_team")),
-            "game_id":                    _safe(g.get("game_id")),
-        }
-
-        rows_to_write.append(row)
-
-    upserted = _write_in_batches(rows_to_write, "nflverse_wr_stats",
-                                 conflict_cols=("player_id", "season", "week"))
-    logger.info("nflverse_wr_stats: upserted %d rows", upserted)
+    upserted = _load_frame(_wr_rows(wr_df), "nflverse_wr_stats",
+                           conflict_cols=("player_id", "season", "week"), weeks=weeks)
+    logger.info("nflverse_wr_stats: loaded %d rows", upserted)
     return upserted
 
 
@@ -434,39 +804,13 @@ def get_wr_rolling_baseline(
     """
     Aggregate nflverse WR/TE stats from up to the last `window` weeks before
     current_week. Returns sums/avgs in the shape expected by
-    calc_wr_te_multiplier_enhanced.
+    calc_wr_te_multiplier_enhanced. Served from get_rolling_baselines.
     """
-    conn = _get_conn()
-    cur  = conn.cursor()
-    cur.execute(
-        """
-        SELECT
-            SUM(targets)                AS targets,
-            SUM(receptions)             AS receptions,
-            SUM(receiving_yards)        AS receiving_yards,
-            SUM(receiving_epa)          AS receiving_epa,
-            SUM(receiving_first_downs)  AS receiving_first_downs,
-            AVG(wopr)                   AS wopr,
-            AVG(target_share)           AS target_share,
-            SUM(receiving_fumbles_lost) AS receiving_fumbles_lost
-        FROM (
-            SELECT * FROM nflverse_wr_stats
-            WHERE player_name = %s AND season = %s AND week < %s
-            ORDER BY week DESC
-            LIMIT %s
-        ) recent
-        """,
-        [player_name, season, current_week, window],
-    )
-    row  = cur.fetchone()
-    cols = [d[0] for d in cur.description]
-    cur.close()
-    conn.close()
-    return dict(zip(cols, row)) if row else None
+    return _baseline("wr", player_name, season, current_week, window)
 
 
 # =============================================================================
-# DEF � fetch, transform, store
+# DEF — fetch, transform, store
 # =============================================================================
 
 _FRONT7_POSITIONS    = {"DE", "DT", "NT", "LB", "ILB", "OLB", "MLB", "EDGE", "DL"}
@@ -475,72 +819,70 @@ _ALL_DEF_POSITIONS   = _FRONT7_POSITIONS | _SECONDARY_POSITIONS
 _DEF_SEASONS_MAX     = 2024   # 2025 defensive data not yet included
 
 
-def _build_def_row(g: dict) -> dict:
-    """Transform one nflverse defensive player-game row into our DB schema dict."""
-    return {
-        "player_id":                    _safe(g.get("player_id")),
-        "player_name":                  _safe(g.get("player_display_name")),
-        "position":                     _safe(g.get("position")),
-        "team":                         _safe(g.get("recent_team")),
-        "season":                       _safe(g.get("season"),                      int),
-        "week":                         _safe(g.get("week"),                        int),
-        "def_tackles_solo":             _safe(g.get("def_tackles_solo"),            int),
-        "def_tackles_with_assist":      _safe(g.get("def_tackles_with_assist"),     int),
-        "def_tackle_assists":           _safe(g.get("def_tackle_assists"),          int),
-        "def_tackles_for_loss":         _safe(g.get("def_tackles_for_loss"),        float),
-        "def_tackles_for_loss_yards":   _safe(g.get("def_tackles_for_loss_yards"),  float),
-        "def_sacks":                    _safe(g.get("def_sacks"),                   float),
-        "def_sack_yards":               _safe(g.get("def_sack_yards"),              float),
-        "def_qb_hits":                  _safe(g.get("def_qb_hits"),                 int),
-        "def_interceptions":            _safe(g.get("def_interceptions"),           int),
-        "def_interception_yards":       _safe(g.get("def_interception_yards"),      int),
-        "def_pass_defended":            _safe(g.get("def_pass_defended"),           int),
-        "def_fumbles_forced":           _safe(g.get("def_fumbles_forced"),          int),
-        "def_fumbles":                  _safe(g.get("def_fumbles"),                 int),
-        "def_tds":                      _safe(g.get("def_tds"),                     int),
-        "def_safeties":                 _safe(g.get("def_safeties"),                int),
-        "opponent":                     _safe(g.get("opponent_team")),
-        "game_id":                      _safe(g.get("game_id")),
-    }
-
-
-def fetch_and_store_def_stats(seasons: list, weeks: list = None) -> int:
+_DEF_INT_COLS = (
+    "def_tackles_solo", "def_tackles_with_assist", "def_tackle_assists", "def_qb_hits",
+    "def_interceptions", "def_interception_yards", "def_pass_defended",
+    "def_fumbles_forced", "def_fumbles", "def_tds", "def_safeties",
+)
+_DEF_FLOAT_COLS = (
+    "def_tackles_for_loss", "def_tackles_for_loss_yards", "def_sacks", "def_sack_yards",
+)
+_DEF_COLUMN_ORDER = (
+    "def_tackles_solo", "def_tackles_with_assist", "def_tackle_assists",
+    "def_tackles_for_loss", "def_tackles_for_loss_yards", "def_sacks", "def_sack_yards",
+    "def_qb_hits", "def_interceptions", "def_interception_yards", "def_pass_defended",
+    "def_fumbles_forced", "def_fumbles", "def_tds", "def_safeties",
+)
+
+
+def _def_rows(def_df):
+    """nflverse defensive player-weeks -> (front7 rows, secondary rows)"""
+    c    = _Cols(def_df)
+    stat = {name: c.int(name) for name in _DEF_INT_COLS}
+    stat.update({name: c.float(name) for name in _DEF_FLOAT_COLS})
+    rows = def_df.select(
+        c.raw("position").fill_null("").str.to_uppercase().alias("_group"),
+        c.raw("player_id").alias("player_id"),
+        c.raw("player_display_name").alias("player_name"),
+        c.raw("position").alias("position"),
+        c.raw("recent_team").alias("team"),
+        c.int("season").alias("season"),
+        c.int("week").alias("week"),
+        *[stat[name].alias(name) for name in _DEF_COLUMN_ORDER],
+        c.raw("opponent_team").alias("opponent"),
+        c.raw("game_id").alias("game_id"),
+    )
+    front7    = rows.filter(pl.col("_group").is_in(list(_FRONT7_POSITIONS))).drop("_group")
+    secondary = rows.filter(pl.col("_group").is_in(list(_SECONDARY_POSITIONS))).drop("_group")
+    return front7, secondary
+
+
+def fetch_and_store_def_stats(seasons: list, weeks: list = None, df=None) -> int:
     """
     Pull defensive player stats from nflverse and upsert into two tables:
       - nflverse_front7_stats    (DE, DT, NT, LB, ILB, OLB, MLB, EDGE, DL)
       - nflverse_secondary_stats (CB, S, FS, SS, DB)
     Only includes regular season (week <= 18) and seasons up to 2024.
-    Returns total rows upserted across both tables.
+    df: a frame from load_player_stats_frame to reuse instead of loading.
+    Returns total rows written across both tables.
     """
     seasons = [s for s in seasons if s <= _DEF_SEASONS_MAX]
     if not seasons:
         logger.info("No eligible seasons for DEF backfill (max %d)", _DEF_SEASONS_MAX)
         return 0
 
-    df = nfl.load_player_stats(seasons)
-    def_df = df.filter(
-        df["position"].is_in(list(_ALL_DEF_POSITIONS)) & (df["week"] <= 18)
-    )
-    if weeks:
-        def_df = def_df.filter(def_df["week"].is_in(weeks))
-
-    front7_rows    = []
-    secondary_rows = []
+    if df is None:
+        df = load_player_stats_frame(seasons)
+    def_df = _select(df, seasons, weeks, _ALL_DEF_POSITIONS)
 
-    for g in def_df.iter_rows(named=True):
-        pos = (g.get("position") or "").upper()
-        row = _build_def_row(g)
-        if pos in _FRONT7_POSITIONS:
-            front7_rows.append(row)
-        elif pos in _SECONDARY_POSITIONS:
-            secondary_rows.append(row)
+    front7_rows, secondary_rows = _def_rows(def_df)
 
     conflict = ("player_id", "season", "week")
-    f7  = _write_in_batches(front7_rows,    "nflverse_front7_stats",    conflict)
-    sec = _write_in_batches(secondary_rows, "nflverse_secondary_stats", conflict)
+    f7  = _load_frame(front7_rows,    "nflverse_front7_stats",    conflict, weeks)
+    sec = _load_frame(secondary_rows, "nflverse_secondary_stats", conflict, weeks)
 
-    logger.info("nflverse_front7_stats: upserted %d rows",    f7)
-    logger.info("nflverse_secondary_stats: upserted %d rows", sec)
+    logger.info("nflverse_front7_stats: loaded %d rows",    f7)
+    logger.info("nflverse_secondary_stats: loaded %d rows", sec)
     return f7 + sec
 
 
@@ -580,53 +922,52 @@ def get_front7_rolling_baseline(
     player_name: str, team: str, season: int, current_week: int, window: int = 5
 ) -> Optional[dict]:
     """Aggregate front-7 nflverse stats from the last `window` weeks before current_week."""
-    conn = _get_conn()
-    cur  = conn.cursor()
-    cur.execute(
-        """
-        SELECT
-            SUM(def_tackles_solo)       AS tackles_solo,
-            SUM(def_sacks)              AS sacks,
-            SUM(def_tackles_for_loss)   AS tfl,
-            SUM(def_qb_hits)            AS qb_hits,
-            SUM(def_fumbles_forced)     AS fumbles_forced
-        FROM (
-            SELECT * FROM nflverse_front7_stats
-            WHERE player_name = %s AND season = %s AND week < %s
-            ORDER BY week DESC LIMIT %s
-        ) recent
-        """,
-        [player_name, season, current_week, window],
-    )
-    row  = cur.fetchone()
-    cols = [d[0] for d in cur.description]
-    cur.close(); conn.close()
-    return dict(zip(cols, row)) if row else None
+    return _baseline("front7", player_name, season, current_week, window)
 
 
 def get_secondary_rolling_baseline(
     player_name: str, team: str, season: int, current_week: int, window: int = 5
 ) -> Optional[dict]:
     """Aggregate secondary nflverse stats from the last `window` weeks before current_week."""
-    conn = _get_conn()
-    cur  = conn.cursor()
-    cur.execute(
-        """
-        SELECT
-            SUM(def_interceptions)      AS interceptions,
-            SUM(def_pass_defended)      AS pass_defended,
-            SUM(def_tackles_solo)       AS tackles_solo,
-            SUM(def_interception_yards) AS int_yards,
-            SUM(def_fumbles_forced)     AS fumbles_forced
-        FROM (
-            SELECT * FROM nflverse_secondary_stats
-            WHERE player_name = %s AND season = %s AND week < %s
-            ORDER BY week DESC LIMIT %s
-        ) recent
-        """,
-        [player_name, season, current_week, window],
-    )
-    row  = cur.fetchone()
-    cols = [d[0] for d in cur.description]
-    cur.close(); conn.close()
-    return dict(zip(cols, row)) if row else None
+    return _baseline("secondary", player_name, season, current_week, window)
+
+
+# =============================================================================
+# All positions from one shared frame
+# =============================================================================
+
+POSITION_WRITERS = {
+    "qb":  fetch_and_store_qb_stats,
+    "rb":  fetch_and_store_rb_stats,
+    "wr":  fetch_and_store_wr_stats,
+    "def": fetch_and_store_def_stats,
+}
+
+
+def store_positions(seasons: list, positions, weeks: list = None,
+                    df=None, concurrency: int = 1) -> dict:
+    """
+    Run the writers for `positions` (keys of POSITION_WRITERS) from one
+    player stats frame, loaded once if df is None. concurrency > 1 runs the
+    positions on a thread pool (each writer opens its own connections).
+    Returns {position: {"status": "ok", "rows": n} | {"status": "error", "message": ...}}.
+    """
+    positions = [p for p in POSITION_WRITERS if p in set(positions)]
+    if not positions:
+        return {}
+    if df is None:
+        df = load_player_stats_frame(seasons)
+
+    def run(position: str) -> dict:
+        try:
+            n = POSITION_WRITERS[position](seasons, weeks=weeks, df=df)
+            logger.info("%s backfill complete: %d rows", position.upper(), n)
+            return {"status": "ok", "rows": n}
+        except Exception as e:
+            logger.error("%s backfill failed: %s", position.upper(), e)
+            return {"status": "error", "message": str(e)}
+
+    if concurrency <= 1 or len(positions) == 1:
+        return {p: run(p) for p in positions}
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(positions))) as pool:
+        return dict(zip(positions, pool.map(run, positions)))
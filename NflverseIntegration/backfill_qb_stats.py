@@ -21,6 +21,7 @@ import logging
 import sys
 
 from NflverseDataFetcher import (
+    load_player_stats_frame,
     fetch_and_store_qb_stats,
     fetch_and_store_rb_stats,
     fetch_and_store_wr_stats,
@@ -56,13 +57,14 @@ def main():
     do_all     = "all" in positions
 
     logger.info("Starting nflverse backfill  seasons=%s  positions=%s", seasons, positions)
+    frame = load_player_stats_frame(seasons)   # one load (Parquet-cached) for every position
 
     # ── QB ────────────────────────────────────────────────────────────────────
     if do_all or "qb" in positions:
         logger.info("--- Backfilling QB stats ---")
         for season in seasons:
             try:
-                n = fetch_and_store_qb_stats([season])
+                n = fetch_and_store_qb_stats([season], df=frame)
                 logger.info("  QB  season=%d  rows=%d", season, n)
             except Exception as exc:
                 logger.error("  QB  season=%d  ERROR: %s", season, exc)
@@ -72,7 +74,7 @@ def main():
         logger.info("--- Backfilling RB stats ---")
         for season in seasons:
             try:
-                n = fetch_and_store_rb_stats([season])
+                n = fetch_and_store_rb_stats([season], df=frame)
                 logger.info("  RB  season=%d  rows=%d", season, n)
             except Exception as exc:
                 logger.error("  RB  season=%d  ERROR: %s", season, exc)
@@ -82,7 +84,7 @@ def main():
         logger.info("--- Backfilling WR/TE stats ---")
         for season in seasons:
             try:
-                n = fetch_and_store_wr_stats([season])
+                n = fetch_and_store_wr_stats([season], df=frame)
                 logger.info("  WR/TE  season=%d  rows=%d", season, n)
             except Exception as exc:
                 logger.error("  WR/TE  season=%d  ERROR: %s", season, exc)
@@ -0,0 +1,175 @@
+"""
+Benchmark: 4-season nflverse refresh — per-position loads vs one shared frame
+Runs the QB, RB, WR/TE and DEF writers for the given seasons four ways:
+  - per-position   each writer loads nflverse itself (the old behaviour: the
+                   same seasons downloaded and parsed four times)
+  - shared cold    one load_player_stats_frame call, empty Parquet cache
+  - shared warm    same, every season served from the Parquet cache
+  - shared warm xN same, positions run on N threads (store_positions)
+and prints wall time for each.
+
+By default nflverse is simulated: a synthetic player-stats frame per season
+(~19k player-weeks) that costs --download-cost seconds per season loaded, and
+DB writes cost --write-cost seconds per row instead of touching Supabase.
+--source nflverse downloads the real data; --write upserts for real
+(SUPABASE_DB_* env vars required).
+
+Usage:
+    python benchmark_nflverse_refresh.py
+    python benchmark_nflverse_refresh.py --seasons 2022 2023 2024 2025 --concurrency 4
+    python benchmark_nflverse_refresh.py --source nflverse --download-cost 0
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+import polars as pl
+
+import NflverseDataFetcher as fetcher
+
+POSITIONS = {'QB': 2, 'RB': 3, 'WR': 5, 'TE': 3, 'DE': 3, 'DT': 2, 'LB': 4, 'OLB': 2,
+             'CB': 4, 'S': 3, 'FS': 1, 'SS': 1}
+TEAMS = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB',
+         'HOU', 'IND', 'JAX', 'KC', 'LAC', 'LAR', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG',
+         'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS']
+INT_COLS = [
+    'completions', 'attempts', 'passing_yards', 'passing_tds', 'passing_interceptions',
+    'sacks_suffered', 'sack_yards_lost', 'passing_air_yards', 'passing_yards_after_catch',
+    'passing_first_downs', 'carries', 'rushing_yards', 'rushing_tds', 'rushing_fumbles',
+    'rushing_fumbles_lost', 'rushing_first_downs', 'receptions', 'targets', 'receiving_yards',
+    'receiving_tds', 'receiving_air_yards', 'receiving_yards_after_catch',
+    'receiving_first_downs', 'receiving_fumbles', 'receiving_fumbles_lost',
+    'receiving_2pt_conversions', 'def_tackles_solo', 'def_tackles_with_assist',
+    'def_tackle_assists', 'def_qb_hits', 'def_interceptions', 'def_interception_yards',
+    'def_pass_defended', 'def_fumbles_forced', 'def_fumbles', 'def_tds', 'def_safeties',
+]
+FLOAT_COLS = [
+    'passing_epa', 'passing_cpoe', 'pacr', 'rushing_epa', 'receiving_epa', 'target_share',
+    'air_yards_share', 'wopr', 'racr', 'def_tackles_for_loss', 'def_tackles_for_loss_yards',
+    'def_sacks', 'def_sack_yards',
+]
+
+
+# ---------------------------------------------------------------------------
+# Simulated nflverse + DB
+# ---------------------------------------------------------------------------
+
+def synthetic_season(season: int) -> pl.DataFrame:
+    """One season of player-weeks (weeks 1-22, some NULL stats)"""
+    rng  = random.Random(season)
+    rows = {c: [] for c in ['player_id', 'player_display_name', 'position', 'recent_team',
+                            'opponent_team', 'season', 'week', 'game_id'] + INT_COLS + FLOAT_COLS}
+    for t, team in enumerate(TEAMS):
+        for week in range(1, 23 if t < 14 else 19):
+            opp = TEAMS[(t + week) % len(TEAMS)]
+            for pos, n in POSITIONS.items():
+                for i in range(n):
+                    rows['player_id'].append(f"00-{season % 100:02d}{t:02d}{pos}{i}")
+                    rows['player_display_name'].append(f"{team} {pos} {i}")
+                    rows['position'].append(pos)
+                    rows['recent_team'].append(team)
+                    rows['opponent_team'].append(opp)
+                    rows['season'].append(season)
+                    rows['week'].append(week)
+                    rows['game_id'].append(f"{season}_{week:02d}_{team}_{opp}")
+                    for c in INT_COLS:
+                        rows[c].append(None if rng.random() < 0.05 else rng.randint(0, 40))
+                    for c in FLOAT_COLS:
+                        rows[c].append(None if rng.random() < 0.1 else rng.uniform(-5, 5))
+    return pl.DataFrame(rows)
+
+
+class SimulatedSource:
+    """Stands in for nfl.load_player_stats: --download-cost seconds per season"""
+
+    def __init__(self, download_cost: float):
+        self.download_cost = download_cost
+        self.seasons_loaded = 0
+        self._frames = {}
+
+    def load_player_stats(self, seasons):
+        frames = []
+        for season in seasons:
+            time.sleep(self.download_cost)
+            self.seasons_loaded += 1
+            if season not in self._frames:
+                self._frames[season] = synthetic_season(season)
+            frames.append(self._frames[season].clone())
+        return frames[0] if len(frames) == 1 else pl.concat(frames, how="diagonal_relaxed")
+
+
+def simulated_writer(write_cost: float):
+    def write(frame, table, conflict_cols, weeks=None):
+        time.sleep(write_cost * frame.height)
+        return frame.height
+    return write
+
+
+# ---------------------------------------------------------------------------
+# Runs
+# ---------------------------------------------------------------------------
+
+def run_per_position(seasons, load) -> int:
+    rows = 0
+    for writer in fetcher.POSITION_WRITERS.values():
+        rows += writer(seasons, df=load(seasons))
+    return rows
+
+
+def run_shared(seasons, cache_dir, concurrency) -> int:
+    frame   = fetcher.load_player_stats_frame(seasons, cache_dir=cache_dir)
+    results = fetcher.store_positions(seasons, fetcher.POSITION_WRITERS, df=frame,
+                                      concurrency=concurrency)
+    failed = {p: r['message'] for p, r in results.items() if r['status'] != 'ok'}
+    if failed:
+        raise RuntimeError(f"writers failed: {failed}")
+    return sum(r['rows'] for r in results.values())
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument('--seasons', nargs='+', type=int, default=[2022, 2023, 2024, 2025])
+    p.add_argument('--concurrency', type=int, default=4)
+    p.add_argument('--source', choices=['synthetic', 'nflverse'], default='synthetic')
+    p.add_argument('--download-cost', type=float, default=1.5, help='seconds per season download (synthetic)')
+    p.add_argument('--write', action='store_true', help='upsert into Supabase instead of simulating writes')
+    p.add_argument('--write-cost', type=float, default=0.0001, help='seconds per simulated row write')
+    args = p.parse_args()
+
+    if args.source == 'synthetic':
+        source = SimulatedSource(args.download_cost)
+        fetcher.nfl = source
+        fetcher._release_stamps = lambda seasons: {s: '2025-01-01T00:00:00Z' for s in seasons}
+        load = source.load_player_stats
+    else:
+        load = fetcher.nfl.load_player_stats
+    if not args.write:
+        fetcher._load_frame = simulated_writer(args.write_cost)
+
+    cache_dir = tempfile.mkdtemp(prefix='nflverse_bench_')
+    try:
+        runs = [
+            ('per-position', lambda: run_per_position(args.seasons, load)),
+            ('shared cold', lambda: run_shared(args.seasons, cache_dir, 1)),
+            ('shared warm', lambda: run_shared(args.seasons, cache_dir, 1)),
+            (f'shared warm x{args.concurrency}', lambda: run_shared(args.seasons, cache_dir, args.concurrency)),
+        ]
+        print(f"{len(args.seasons)} seasons {args.seasons}, source={args.source}, "
+              f"{'real writes' if args.write else f'{args.write_cost * 1e6:.0f}us/row writes'}")
+        print(f"{'mode':>18}  {'seconds':>8}  {'rows':>7}")
+        baseline = None
+        for name, run in runs:
+            start = time.perf_counter()
+            rows  = run()
+            secs  = time.perf_counter() - start
+            baseline = baseline or secs
+            print(f"{name:>18}  {secs:8.2f}  {rows:7d}   {baseline / secs:4.1f}x")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
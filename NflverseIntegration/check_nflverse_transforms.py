@@ -0,0 +1,352 @@
+"""
+Parity + throughput check for NflverseDataFetcher's polars transforms
+The position transforms (_qb_rows, _rb_rows, _wr_rows, _def_rows) build
+the rows to write as polars expressions. This script keeps the previous
+row-at-a-time versions (iter_rows(named=True) + _safe per cell) below as the
+reference and fails if any row, column, value or Python type differs.
+
+The input is the benchmark's synthetic player-stats seasons, made harder:
+int stats stored as floats with NaN and fractions, near-half ratios
+(107 yards / 40 attempts -> 2.675), a missing column, and unknown positions.
+--source nflverse checks real seasons through load_player_stats_frame.
+Prints rows/sec for both versions (the polars time includes materialising
+the row tuples the writer consumes).
+
+Usage:
+    python check_nflverse_transforms.py
+    python check_nflverse_transforms.py --seasons 2023 2024 --repeat 5
+    python check_nflverse_transforms.py --source nflverse
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from typing import List
+
+import polars as pl
+
+import NflverseDataFetcher as fetcher
+from benchmark_nflverse_refresh import synthetic_season
+from NflverseDataFetcher import _ALL_DEF_POSITIONS, _FRONT7_POSITIONS, _SECONDARY_POSITIONS, _select
+
+FLOATED_INT_COLS = ['passing_yards', 'attempts', 'rushing_yards', 'carries', 'receiving_yards',
+                    'targets', 'def_tackles_solo', 'def_interceptions']
+
+
+# ---------------------------------------------------------------------------
+# Reference: the previous row-at-a-time transforms
+# ---------------------------------------------------------------------------
+
+def _safe(val, cast=None):
+    """Return None if val is NaN/None, otherwise cast and return."""
+    if val is None:
+        return None
+    if isinstance(val, float) and math.isnan(val):
+        return None
+    return cast(val) if cast else val
+
+
+def legacy_qb_rows(df) -> List[dict]:
+    rows_to_write = []
+    for g in df.iter_rows(named=True):
+        atts     = _safe(g.get("attempts"), int)        or 0
+        sacks    = _safe(g.get("sacks_suffered"), int)  or 0
+        py       = _safe(g.get("passing_yards"), float) or 0.0
+        pay      = _safe(g.get("passing_air_yards"), float) or 0.0
+        epa      = _safe(g.get("passing_epa"), float)   or 0.0
+        dropbacks = atts + sacks
+
+        ypa  = round(py  / atts,     2) if atts > 0     else None
+        adot = round(pay / atts,     2) if atts > 0     else None
+        epd  = round(epa / dropbacks, 4) if dropbacks > 0 else None
+
+        rows_to_write.append({
+            "player_id":                 _safe(g.get("player_id")),
+            "player_name":               _safe(g.get("player_display_name")),
+            "team":                      _safe(g.get("recent_team")),
+            "season":                    _safe(g.get("season"), int),
+            "week":                      _safe(g.get("week"), int),
+            "completions":               _safe(g.get("completions"), int),
+            "attempts":                  atts,
+            "passing_yards":             _safe(g.get("passing_yards"), int),
+            "passing_tds":               _safe(g.get("passing_tds"), int),
+            "passing_interceptions":     _safe(g.get("passing_interceptions"), int),
+            "sacks_suffered":            sacks,
+            "sack_yards_lost":           _safe(g.get("sack_yards_lost"), int),
+            "passing_air_yards":         _safe(g.get("passing_air_yards"), int),
+            "passing_yards_after_catch": _safe(g.get("passing_yards_after_catch"), int),
+            "passing_first_downs":       _safe(g.get("passing_first_downs"), int),
+            "passing_epa":               _safe(g.get("passing_epa"), float),
+            "passing_cpoe":              _safe(g.get("passing_cpoe"), float),
+            "pacr":                      _safe(g.get("pacr"), float),
+            "carries":                   _safe(g.get("carries"), int),
+            "rushing_yards":             _safe(g.get("rushing_yards"), int),
+            "rushing_tds":               _safe(g.get("rushing_tds"), int),
+            "rushing_epa":               _safe(g.get("rushing_epa"), float),
+            "rushing_first_downs":       _safe(g.get("rushing_first_downs"), int),
+            "cpoe":                      _safe(g.get("passing_cpoe"), float),
+            "ypa":                       ypa,
+            "adot":                      adot,
+            "epa_per_dropback":          epd,
+            "opponent":                  _safe(g.get("opponent_team")),
+            "game_id":                   _safe(g.get("game_id")),
+        })
+    return rows_to_write
+
+
+def legacy_rb_rows(df) -> List[dict]:
+    rows_to_write = []
+    for g in df.iter_rows(named=True):
+        carries   = _safe(g.get("carries"),              int)   or 0
+        rush_yds  = _safe(g.get("rushing_yards"),        float) or 0.0
+        rush_epa  = _safe(g.get("rushing_epa"),          float) or 0.0
+        rush_fds  = _safe(g.get("rushing_first_downs"),  int)   or 0
+        recv_epa  = _safe(g.get("receiving_epa"),        float) or 0.0
+        recv_yds  = _safe(g.get("receiving_yards"),      int)   or 0
+        rush_tds  = _safe(g.get("rushing_tds"),          int)   or 0
+        recv_tds  = _safe(g.get("receiving_tds"),        int)   or 0
+
+        ypc           = round(rush_yds / carries, 2)          if carries > 0 else None
+        epa_per_carry = round(rush_epa / carries, 4)          if carries > 0 else None
+        fd_rate       = round(rush_fds / carries, 4)          if carries > 0 else None
+        total_epa     = round((rush_epa or 0) + (recv_epa or 0), 3)
+        total_yards   = (int(rush_yds) if rush_yds else 0) + (recv_yds or 0)
+        total_tds     = (rush_tds or 0) + (recv_tds or 0)
+
+        rows_to_write.append({
+            "player_id":                    _safe(g.get("player_id")),
+            "player_name":                  _safe(g.get("player_display_name")),
+            "team":                         _safe(g.get("recent_team")),
+            "season":                       _safe(g.get("season"), int),
+            "week":                         _safe(g.get("week"), int),
+            "carries":                      carries,
+            "rushing_yards":                _safe(g.get("rushing_yards"), int),
+            "rushing_tds":                  rush_tds,
+            "rushing_fumbles":              _safe(g.get("rushing_fumbles"), int),
+            "rushing_fumbles_lost":         _safe(g.get("rushing_fumbles_lost"), int),
+            "rushing_first_downs":          rush_fds,
+            "rushing_epa":                  rush_epa,
+            "receptions":                   _safe(g.get("receptions"), int),
+            "targets":                      _safe(g.get("targets"), int),
+            "receiving_yards":              recv_yds,
+            "receiving_tds":                recv_tds,
+            "receiving_air_yards":          _safe(g.get("receiving_air_yards"), int),
+            "receiving_yards_after_catch":  _safe(g.get("receiving_yards_after_catch"), int),
+            "receiving_first_downs":        _safe(g.get("receiving_first_downs"), int),
+            "receiving_epa":                recv_epa,
+            "receiving_fumbles_lost":       _safe(g.get("receiving_fumbles_lost"), int),
+            "target_share":                 _safe(g.get("target_share"), float),
+            "wopr":                         _safe(g.get("wopr"), float),
+            "ypc":                          ypc,
+            "epa_per_carry":                epa_per_carry,
+            "fd_rate":                      fd_rate,
+            "total_epa":                    total_epa,
+            "total_yards":                  total_yards,
+            "total_tds":                    total_tds,
+            "opponent":                     _safe(g.get("opponent_team")),
+            "game_id":                      _safe(g.get("game_id")),
+        })
+    return rows_to_write
+
+
+def legacy_wr_rows(df) -> List[dict]:
+    rows_to_write = []
+    for g in df.iter_rows(named=True):
+        tgts     = _safe(g.get("targets"),               int)   or 0
+        recs     = _safe(g.get("receptions"),            int)   or 0
+        recv_yds = _safe(g.get("receiving_yards"),       int)   or 0
+        recv_epa = _safe(g.get("receiving_epa"),         float) or 0.0
+        recv_fds = _safe(g.get("receiving_first_downs"), int)   or 0
+        recv_tds = _safe(g.get("receiving_tds"),         int)   or 0
+
+        catch_rate    = round(recs     / tgts,     4) if tgts > 0 else None
+        ypr           = round(recv_yds / recs,     2) if recs  > 0 else None
+        epa_per_tgt   = round(recv_epa / tgts,     4) if tgts > 0 else None
+        fd_rate       = round(recv_fds / recs,     4) if recs  > 0 else None
+
+        row = {
+            "player_id":                  _safe(g.get("player_id")),
+            "player_name":                _safe(g.get("player_display_name")),
+            "position":                   _safe(g.get("position")),
+            "team":                       _safe(g.get("recent_team")),
+            "season":                     _safe(g.get("season"), int),
+            "week":                       _safe(g.get("week"),   int),
+            "receptions":                 recs,
+            "targets":                    tgts,
+            "receiving_yards":            recv_yds,
+            "receiving_tds":              recv_tds,
+            "receiving_air_yards":        _safe(g.get("receiving_air_yards"),         int),
+            "receiving_yards_after_catch":_safe(g.get("receiving_yards_after_catch"), int),
+            "receiving_first_downs":      recv_fds,
+            "receiving_epa":              recv_epa,
+            "receiving_fumbles":          _safe(g.get("receiving_fumbles"),      int),
+            "receiving_fumbles_lost":     _safe(g.get("receiving_fumbles_lost"), int),
+            "receiving_2pt_conversions":  _safe(g.get("receiving_2pt_conversions"), int),
+            "target_share":               _safe(g.get("target_share"),    float),
+            "air_yards_share":            _safe(g.get("air_yards_share"), float),
+            "wopr":                       _safe(g.get("wopr"),            float),
+            "racr":                       _safe(g.get("racr"),            float),
+            "catch_rate":                 catch_rate,
+            "ypr":                        ypr,
+            "epa_per_target":             epa_per_tgt,
+            "fd_rate":                    fd_rate,
+            "opponent":                   _safe(g.get("opponent_team")),
+            "game_id":                    _safe(g.get("game_id")),
+        }
+
+        rows_to_write.append(row)
+    return rows_to_write
+
+
+def legacy_def_row(g: dict) -> dict:
+    return {
+        "player_id":                    _safe(g.get("player_id")),
+        "player_name":                  _safe(g.get("player_display_name")),
+        "position":                     _safe(g.get("position")),
+        "team":                         _safe(g.get("recent_team")),
+        "season":                       _safe(g.get("season"),                      int),
+        "week":                         _safe(g.get("week"),                        int),
+        "def_tackles_solo":             _safe(g.get("def_tackles_solo"),            int),
+        "def_tackles_with_assist":      _safe(g.get("def_tackles_with_assist"),     int),
+        "def_tackle_assists":           _safe(g.get("def_tackle_assists"),          int),
+        "def_tackles_for_loss":         _safe(g.get("def_tackles_for_loss"),        float),
+        "def_tackles_for_loss_yards":   _safe(g.get("def_tackles_for_loss_yards"),  float),
+        "def_sacks":                    _safe(g.get("def_sacks"),                   float),
+        "def_sack_yards":               _safe(g.get("def_sack_yards"),              float),
+        "def_qb_hits":                  _safe(g.get("def_qb_hits"),                 int),
+        "def_interceptions":            _safe(g.get("def_interceptions"),           int),
+        "def_interception_yards":       _safe(g.get("def_interception_yards"),      int),
+        "def_pass_defended":            _safe(g.get("def_pass_defended"),           int),
+        "def_fumbles_forced":           _safe(g.get("def_fumbles_forced"),          int),
+        "def_fumbles":                  _safe(g.get("def_fumbles"),                 int),
+        "def_tds":                      _safe(g.get("def_tds"),                     int),
+        "def_safeties":                 _safe(g.get("def_safeties"),                int),
+        "opponent":                     _safe(g.get("opponent_team")),
+        "game_id":                      _safe(g.get("game_id")),
+    }
+
+
+def legacy_def_rows(df):
+    front7, secondary = [], []
+    for g in df.iter_rows(named=True):
+        pos = (g.get("position") or "").upper()
+        row = legacy_def_row(g)
+        if pos in _FRONT7_POSITIONS:
+            front7.append(row)
+        elif pos in _SECONDARY_POSITIONS:
+            secondary.append(row)
+    return front7, secondary
+
+
+# ---------------------------------------------------------------------------
+# Input
+# ---------------------------------------------------------------------------
+
+def hostile(df: pl.DataFrame, seed: int) -> pl.DataFrame:
+    """Float-typed int stats with NaN/fractions, near-half ratios, a missing column"""
+    rng = random.Random(seed)
+    n   = df.height
+    cols = {}
+    for col in FLOATED_INT_COLS:
+        values = df[col].cast(pl.Float64).to_list()
+        for i in range(n):
+            r = rng.random()
+            if r < 0.03:
+                values[i] = float('nan')
+            elif r < 0.06 and values[i] is not None:
+                values[i] += rng.choice([0.4, 0.5, 0.7])
+        cols[col] = pl.Series(col, values, dtype=pl.Float64)
+    out = df.with_columns(list(cols.values())).drop('racr')
+    ties = pl.Series([i % 17 == 0 for i in range(n)])
+    return out.with_columns(
+        pl.when(ties).then(107.0).otherwise(pl.col('passing_yards')).alias('passing_yards'),
+        pl.when(ties).then(40.0).otherwise(pl.col('attempts')).alias('attempts'),
+        pl.when(ties).then(107).otherwise(pl.col('receiving_yards')).alias('receiving_yards'),
+        pl.when(ties).then(40).otherwise(pl.col('receptions')).alias('receptions'),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Compare + time
+# ---------------------------------------------------------------------------
+
+def same_type(want, got) -> bool:
+    # The old total_epa was round(0 + 0, 3) -> int 0 when both EPAs were 0;
+    # it lands in the same NUMERIC column as 0.0.
+    return type(want) is type(got) or (want == 0 and type(want) is int and type(got) is float)
+
+
+def diff(name: str, expected: List[dict], frame: pl.DataFrame) -> int:
+    actual = frame.to_dicts()
+    if len(actual) != len(expected):
+        print(f"  {name}: {len(actual)} rows, expected {len(expected)}")
+        return 1
+    bad = 0
+    for i, (want, got) in enumerate(zip(expected, actual)):
+        if list(want) != list(got):
+            print(f"  {name} row {i}: columns {list(got)} != {list(want)}")
+            return 1
+        for col, value in want.items():
+            other = got[col]
+            if value != other or not same_type(value, other):
+                if bad < 10:
+                    print(f"  {name} row {i} {col}: {other!r} != {value!r}")
+                bad += 1
+    return bad
+
+
+def timed(fn, repeat: int):
+    best, out = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out   = fn()
+        best  = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument('--seasons', nargs='+', type=int, default=[2022, 2023, 2024, 2025])
+    p.add_argument('--source', choices=['synthetic', 'nflverse'], default='synthetic')
+    p.add_argument('--repeat', type=int, default=3)
+    args = p.parse_args()
+
+    if args.source == 'synthetic':
+        df = pl.concat([hostile(synthetic_season(s), s) for s in args.seasons], how='diagonal_relaxed')
+    else:
+        df = fetcher.load_player_stats_frame(args.seasons)
+
+    cases = [
+        ('qb',  ['QB'],              legacy_qb_rows, fetcher._qb_rows),
+        ('rb',  ['RB'],              legacy_rb_rows, fetcher._rb_rows),
+        ('wr',  ['WR', 'TE'],        legacy_wr_rows, fetcher._wr_rows),
+        ('def', _ALL_DEF_POSITIONS, legacy_def_rows, fetcher._def_rows),
+    ]
+    print(f"{df.height} player-weeks, seasons {args.seasons}, source={args.source}")
+    print(f"{'position':>8}  {'rows':>7}  {'iter_rows/s':>12}  {'polars/s':>12}  speedup")
+    failures = 0
+    for name, positions, legacy, transform in cases:
+        part = _select(df, args.seasons, None, positions)
+        old_secs, expected = timed(lambda: legacy(part), args.repeat)
+        new_secs, frames   = timed(lambda: transform(part), args.repeat)
+        mat_secs, _        = timed(lambda: [f.rows() for f in (frames if isinstance(frames, tuple) else (frames,))],
+                                   args.repeat)
+        if isinstance(frames, tuple):
+            failures += diff('front7', expected[0], frames[0]) + diff('secondary', expected[1], frames[1])
+            rows = sum(f.height for f in frames)
+        else:
+            failures += diff(name, expected, frames)
+            rows = frames.height
+        new_secs += mat_secs
+        print(f"{name:>8}  {rows:7d}  {rows / old_secs:12,.0f}  {rows / new_secs:12,.0f}  {old_secs / new_secs:6.1f}x")
+
+    if failures:
+        print(f"FAIL: {failures} differing values")
+        sys.exit(1)
+    print("All transforms identical to the row-at-a-time versions")
+
+
+if __name__ == '__main__':
+    main()
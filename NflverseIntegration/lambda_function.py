@@ -10,6 +10,16 @@ Event formats:
     {"seasons": [2022, 2023, 2024]}       -- multiple seasons
     {"positions": ["qb", "rb"]}           -- specific positions
     {"season": 2024, "positions": ["wr"]} -- season + position combo
+    {"seasons": [2024], "positions": ["cumulative"]} -- only rebuild team_week_cumulative
+    {"seasons": [2022, 2023, 2024, 2025], "concurrency": 4} -- positions in parallel
+    {"season": 2024, "week": 10, "rolling_baselines": true} -- also refresh player_rolling_baselines
+    {"seasons": [2024], "positions": ["baselines"]}  -- only rebuild player_rolling_baselines
+
+nflverse is loaded once per invocation (Parquet-cached per season in
+NFLVERSE_CACHE_DIR) and every position is transformed from that frame.
+
+After QB or RB stats are written, team_week_cumulative is refreshed from the
+earliest written week onward (the whole season when no week is given).
 
 Environment variables required:
     SUPABASE_DB_HOST, SUPABASE_DB_NAME, SUPABASE_DB_USER,
@@ -21,16 +31,20 @@ import os
 from datetime import datetime
 
 from NflverseDataFetcher import (
-    fetch_and_store_qb_stats,
-    fetch_and_store_rb_stats,
-    fetch_and_store_wr_stats,
-    fetch_and_store_def_stats,
+    load_player_stats_frame,
+    store_positions,
+    refresh_team_week_cumulative,
+    refresh_player_rolling_baselines,
 )
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 CURRENT_SEASON = 2025
+# Position writers run at once (each holds its own DB connection)
+DEFAULT_CONCURRENCY = int(os.environ.get("NFLVERSE_CONCURRENCY", 1))
+# Keep player_rolling_baselines in step with each load
+REFRESH_ROLLING_BASELINES = os.environ.get("REFRESH_ROLLING_BASELINES", "").lower() in ("1", "true", "yes")
 
 
 def lambda_handler(event, context):
@@ -43,51 +57,43 @@ def lambda_handler(event, context):
     seasons_arg   = event.get("seasons") or ([event["season"]] if "season" in event else [CURRENT_SEASON])
     weeks_arg     = [event["week"]] if "week" in event else None
     positions_arg = set(p.lower() for p in event.get("positions", ["qb", "rb", "wr", "def"]))
+    concurrency   = int(event.get("concurrency", DEFAULT_CONCURRENCY))
 
-    logger.info("Running backfill | seasons=%s weeks=%s positions=%s",
-                seasons_arg, weeks_arg, positions_arg)
+    logger.info("Running backfill | seasons=%s weeks=%s positions=%s concurrency=%d",
+                seasons_arg, weeks_arg, positions_arg, concurrency)
 
     results = {}
 
-    # ── QB ─────────────────────────────────────────────────────────────────────
-    if "qb" in positions_arg:
-        try:
-            n = fetch_and_store_qb_stats(seasons_arg, weeks=weeks_arg)
-            results["qb"] = {"status": "ok", "rows": n}
-            logger.info("QB backfill complete: %d rows", n)
-        except Exception as e:
-            logger.error("QB backfill failed: %s", e)
-            results["qb"] = {"status": "error", "message": str(e)}
-
-    # ── RB ─────────────────────────────────────────────────────────────────────
-    if "rb" in positions_arg:
+    # ── QB / RB / WR-TE / DEF from one shared nflverse frame ────────────────────
+    writers = [p for p in ("qb", "rb", "wr", "def") if p in positions_arg]
+    if writers:
         try:
-            n = fetch_and_store_rb_stats(seasons_arg, weeks=weeks_arg)
-            results["rb"] = {"status": "ok", "rows": n}
-            logger.info("RB backfill complete: %d rows", n)
+            frame = load_player_stats_frame(seasons_arg)
         except Exception as e:
-            logger.error("RB backfill failed: %s", e)
-            results["rb"] = {"status": "error", "message": str(e)}
-
-    # ── WR/TE ──────────────────────────────────────────────────────────────────
-    if "wr" in positions_arg:
+            logger.error("nflverse load failed: %s", e)
+            frame = None
+            results.update({p: {"status": "error", "message": str(e)} for p in writers})
+        if frame is not None:
+            results.update(store_positions(seasons_arg, writers, weeks=weeks_arg,
+                                           df=frame, concurrency=concurrency))
+
+    # ── Team season-to-date totals (read by PlayerImpactProcessor) ─────────────
+    if positions_arg & {"qb", "rb", "cumulative"}:
         try:
-            n = fetch_and_store_wr_stats(seasons_arg, weeks=weeks_arg)
-            results["wr"] = {"status": "ok", "rows": n}
-            logger.info("WR/TE backfill complete: %d rows", n)
+            n = refresh_team_week_cumulative(seasons_arg, from_week=min(weeks_arg) if weeks_arg else 1)
+            results["cumulative"] = {"status": "ok", "rows": n}
         except Exception as e:
-            logger.error("WR/TE backfill failed: %s", e)
-            results["wr"] = {"status": "error", "message": str(e)}
+            logger.error("team_week_cumulative refresh failed: %s", e)
+            results["cumulative"] = {"status": "error", "message": str(e)}
 
-    # ── DEF ────────────────────────────────────────────────────────────────────
-    if "def" in positions_arg:
+    # ── Materialised trailing-window baselines (optional) ──────────────────────
+    if "baselines" in positions_arg or (writers and event.get("rolling_baselines", REFRESH_ROLLING_BASELINES)):
         try:
-            n = fetch_and_store_def_stats(seasons_arg, weeks=weeks_arg)
-            results["def"] = {"status": "ok", "rows": n}
-            logger.info("DEF backfill complete: %d rows", n)
+            n = refresh_player_rolling_baselines(seasons_arg, from_week=min(weeks_arg) + 1 if weeks_arg else 1)
+            results["rolling_baselines"] = {"status": "ok", "rows": n}
         except Exception as e:
-            logger.error("DEF backfill failed: %s", e)
-            results["def"] = {"status": "error", "message": str(e)}
+            logger.error("player_rolling_baselines refresh failed: %s", e)
+            results["rolling_baselines"] = {"status": "error", "message": str(e)}
 
     any_error = any(v.get("status") == "error" for v in results.values())
 
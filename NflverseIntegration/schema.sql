@@ -172,3 +172,157 @@ CREATE INDEX IF NOT EXISTS idx_nflverse_wr_player_season ON nflverse_wr_stats(pl
 CREATE INDEX IF NOT EXISTS idx_nflverse_wr_game          ON nflverse_wr_stats(game_id);
 CREATE INDEX IF NOT EXISTS idx_nflverse_wr_week          ON nflverse_wr_stats(season, week);
 CREATE INDEX IF NOT EXISTS idx_nflverse_wr_position      ON nflverse_wr_stats(position, season);
+
+
+-- =============================================================================
+-- nflverse_front7_stats
+-- Per-game front-seven defensive box score from nflverse
+-- (DE, DT, NT, LB, ILB, OLB, MLB, EDGE, DL).
+-- Written by NflverseDataFetcher.fetch_and_store_def_stats, read by the
+-- front7 rolling baselines.
+-- =============================================================================
+CREATE TABLE IF NOT EXISTS nflverse_front7_stats (
+    id SERIAL PRIMARY KEY,
+
+    -- Identifiers
+    player_id       VARCHAR(50),
+    player_name     VARCHAR(100),
+    position        VARCHAR(5),
+    team            VARCHAR(5),
+    season          INTEGER NOT NULL,
+    week            INTEGER NOT NULL,
+
+    -- Tackling
+    def_tackles_solo            INTEGER,
+    def_tackles_with_assist     INTEGER,
+    def_tackle_assists          INTEGER,
+    def_tackles_for_loss        DECIMAL(5,1),
+    def_tackles_for_loss_yards  DECIMAL(6,1),
+
+    -- Pass rush
+    def_sacks                   DECIMAL(4,1),
+    def_sack_yards              DECIMAL(6,1),
+    def_qb_hits                 INTEGER,
+
+    -- Coverage / takeaways
+    def_interceptions           INTEGER,
+    def_interception_yards      INTEGER,
+    def_pass_defended           INTEGER,
+    def_fumbles_forced          INTEGER,
+    def_fumbles                 INTEGER,
+    def_tds                     INTEGER,
+    def_safeties                INTEGER,
+
+    -- Metadata
+    opponent        VARCHAR(5),
+    game_id         VARCHAR(50),
+    created_at      TIMESTAMP DEFAULT NOW(),
+    updated_at      TIMESTAMP DEFAULT NOW(),
+
+    UNIQUE(player_id, season, week)
+);
+
+CREATE INDEX IF NOT EXISTS idx_nflverse_front7_team_season   ON nflverse_front7_stats(team, season);
+CREATE INDEX IF NOT EXISTS idx_nflverse_front7_player_season ON nflverse_front7_stats(player_id, season);
+CREATE INDEX IF NOT EXISTS idx_nflverse_front7_week          ON nflverse_front7_stats(season, week);
+
+
+-- =============================================================================
+-- nflverse_secondary_stats
+-- Per-game secondary defensive box score from nflverse (CB, S, FS, SS, DB).
+-- Written by NflverseDataFetcher.fetch_and_store_def_stats, read by the
+-- secondary rolling baselines.
+-- =============================================================================
+CREATE TABLE IF NOT EXISTS nflverse_secondary_stats (
+    id SERIAL PRIMARY KEY,
+
+    -- Identifiers
+    player_id       VARCHAR(50),
+    player_name     VARCHAR(100),
+    position        VARCHAR(5),
+    team            VARCHAR(5),
+    season          INTEGER NOT NULL,
+    week            INTEGER NOT NULL,
+
+    -- Tackling
+    def_tackles_solo            INTEGER,
+    def_tackles_with_assist     INTEGER,
+    def_tackle_assists          INTEGER,
+    def_tackles_for_loss        DECIMAL(5,1),
+    def_tackles_for_loss_yards  DECIMAL(6,1),
+
+    -- Pass rush
+    def_sacks                   DECIMAL(4,1),
+    def_sack_yards              DECIMAL(6,1),
+    def_qb_hits                 INTEGER,
+
+    -- Coverage / takeaways
+    def_interceptions           INTEGER,
+    def_interception_yards      INTEGER,
+    def_pass_defended           INTEGER,
+    def_fumbles_forced          INTEGER,
+    def_fumbles                 INTEGER,
+    def_tds                     INTEGER,
+    def_safeties                INTEGER,
+
+    -- Metadata
+    opponent        VARCHAR(5),
+    game_id         VARCHAR(50),
+    created_at      TIMESTAMP DEFAULT NOW(),
+    updated_at      TIMESTAMP DEFAULT NOW(),
+
+    UNIQUE(player_id, season, week)
+);
+
+CREATE INDEX IF NOT EXISTS idx_nflverse_secondary_team_season   ON nflverse_secondary_stats(team, season);
+CREATE INDEX IF NOT EXISTS idx_nflverse_secondary_player_season ON nflverse_secondary_stats(player_id, season);
+CREATE INDEX IF NOT EXISTS idx_nflverse_secondary_week          ON nflverse_secondary_stats(season, week);
+
+
+-- =============================================================================
+-- team_week_cumulative
+-- Season-to-date team totals as of each week (inclusive), maintained by
+-- NflverseDataFetcher.refresh_team_week_cumulative after QB/RB writes.
+-- PlayerImpactProcessor reads the OL-proxy averages (sack rate, YPC, rush
+-- EPA/carry) from the latest row before the game's week — one PK lookup.
+-- =============================================================================
+CREATE TABLE IF NOT EXISTS team_week_cumulative (
+    season          INTEGER NOT NULL,
+    team            VARCHAR(5) NOT NULL,
+    week            INTEGER NOT NULL,
+
+    -- nflverse_qb_stats, weeks <= week
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    sacks           INTEGER NOT NULL DEFAULT 0,
+
+    -- nflverse_rb_stats, weeks <= week
+    carries         INTEGER NOT NULL DEFAULT 0,
+    rushing_yards   INTEGER NOT NULL DEFAULT 0,
+    rushing_epa     DECIMAL(12,3) NOT NULL DEFAULT 0,
+
+    updated_at      TIMESTAMP DEFAULT NOW(),
+
+    PRIMARY KEY (season, team, week)
+);
+
+-- =============================================================================
+-- player_rolling_baselines (optional)
+-- Each player's trailing-window nflverse baseline as of each week: aggregates
+-- over the player's last window_size games with week < week, per position
+-- kind (qb, rb, wr, front7, secondary). Refreshed by
+-- NflverseDataFetcher.refresh_player_rolling_baselines after a weekly load
+-- and read by get_rolling_baselines(..., materialized=True).
+-- =============================================================================
+CREATE TABLE IF NOT EXISTS player_rolling_baselines (
+    season          INTEGER NOT NULL,
+    week            INTEGER NOT NULL,
+    kind            VARCHAR(10) NOT NULL,
+    player_name     VARCHAR(100) NOT NULL,
+    window_size     INTEGER NOT NULL,
+    player_id       VARCHAR(50),
+    games           INTEGER NOT NULL,
+    stats           JSONB NOT NULL,
+    updated_at      TIMESTAMP DEFAULT NOW(),
+
+    PRIMARY KEY (season, week, window_size, kind, player_name)
+);
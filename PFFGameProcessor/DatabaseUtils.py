@@ -7,7 +7,8 @@ import os
 import logging
 import pg8000
 from typing import Optional, List, Tuple, Any, Dict
-from decimal import Decimal
+
+from PFFGradeIndex import PFFGradeIndex
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -34,6 +35,7 @@ class DatabaseUtils:
             raise ValueError("Missing required database environment variables")
         
         self.connection: Optional[pg8000.Connection] = None
+        self.pff_indexes: Dict[int, PFFGradeIndex] = {}  # season -> grade index
         logger.info("DatabaseUtils initialized")
     
     def connect(self) -> pg8000.Connection:
@@ -79,8 +81,9 @@ class DatabaseUtils:
     
     def fetch_pff_grade(self, player_name: str, team: str, position: str, season: int) -> Optional[float]:
         """
-        Fetch PFF grade for a player from the appropriate PFF table.
+        Fetch PFF grade for a player from the season's in-memory PFFGradeIndex.
         Uses fuzzy name matching to handle variations (apostrophes, hyphens, initials).
+        The index is loaded with one query the first time a season is looked up.
         
         Args:
             player_name: Player's full name (from Sportradar)
@@ -91,55 +94,30 @@ class DatabaseUtils:
         Returns:
             PFF grade (0-100) or None if not found
         """
-        conn = self.connect()
-        cursor = conn.cursor()
+        index = self.pff_grade_index(season)
+        if index is None:
+            return None
         
         try:
-            # Determine which table and grade column to query
-            table_name, grade_column = self._get_table_and_grade_column(position)
-            
-            if table_name is None:
-                logger.warning(f"No PFF table mapping for position: {position}")
-                return None
-            
             # Normalize team abbreviation (handle BLT→BAL, etc.)
             normalized_team = self._normalize_team_abbr(team)
-            
-            logger.info(f"Looking up: {player_name} | {position} → {table_name} | team={team}→{normalized_team} | season={season}")
-            
-            # Try 1: Exact match
-            grade = self._try_exact_match(cursor, table_name, grade_column, player_name, normalized_team, season)
-            if grade is not None:
-                return grade
-            
-            # Try 2: Case-insensitive match
-            grade = self._try_case_insensitive_match(cursor, table_name, grade_column, player_name, normalized_team, season)
-            if grade is not None:
-                logger.debug(f"✓ Case-insensitive match: '{player_name}'")
-                return grade
-            
-            # Try 3: Fuzzy match (remove special chars from BOTH sides using Python)
-            normalized_name = self._normalize_name(player_name)
-            grade = self._try_fuzzy_match_python(cursor, table_name, grade_column, normalized_name, normalized_team, season)
-            if grade is not None:
-                logger.debug(f"✓ Fuzzy match: '{player_name}' → '{normalized_name}'")
-                return grade
-            
-            # Try 4: Last name only (if unique)
-            last_name = player_name.split()[-1] if ' ' in player_name else player_name
-            grade = self._try_last_name_match(cursor, table_name, grade_column, last_name, normalized_team, season)
-            if grade is not None:
-                logger.debug(f"✓ Last name match: '{player_name}' → '{last_name}'")
-                return grade
-            
-            logger.debug(f"✗ No PFF match: {player_name} ({position}, {team}, {season})")
-            return None
-            
+            return index.lookup(player_name, normalized_team, position)
         except Exception as e:
             logger.warning(f"Error fetching PFF grade for {player_name}: {e}")
             return None
-        finally:
-            cursor.close()
+    
+    def pff_grade_index(self, season: int) -> Optional[PFFGradeIndex]:
+        """
+        The season's PFFGradeIndex, loaded on first use and kept for the
+        lifetime of this instance. A failed load is not cached.
+        """
+        if season not in self.pff_indexes:
+            try:
+                self.pff_indexes[season] = PFFGradeIndex.load(self, season)
+            except Exception as e:
+                logger.warning(f"Failed to load PFF grade index for {season}: {e}")
+                return None
+        return self.pff_indexes[season]
     
     def _normalize_team_abbr(self, team: str) -> str:
         """Normalize team abbreviations (BLT→BAL, etc.)"""
@@ -151,138 +129,6 @@ class DatabaseUtils:
         }
         return mapping.get(team, team)
     
-    def _normalize_name(self, name: str) -> str:
-        """
-        Normalize player name: remove apostrophes, hyphens, periods, extra spaces.
-        
-        Examples:
-            "De'Marcus Lawrence" → "demarcus lawrence"
-            "T.J. Watt" → "tj watt"
-            "Jalyn Armour-Davis" → "jalyn armourdavis"
-        """
-        import re
-        normalized = re.sub(r"['\-\.]", '', name)
-        normalized = ' '.join(normalized.split())
-        return normalized.lower()
-    
-    def _try_exact_match(self, cursor, table_name, grade_column, player_name, team, season):
-        """Try exact name match"""
-        query = f"""
-            SELECT {grade_column}
-            FROM {table_name}
-            WHERE player = %s 
-              AND team_name = %s 
-              AND season = %s
-            LIMIT 1
-        """
-        logger.debug(f"Exact match query: table={table_name}, player={player_name}, team={team}, season={season}")
-        cursor.execute(query, (player_name, team, season))
-        result = cursor.fetchone()
-        
-        if result and result[0] is not None:
-            logger.info(f"✓ FOUND: {player_name} ({team}) = {result[0]}")
-            return float(result[0]) if isinstance(result[0], Decimal) else result[0]
-        return None
-    
-    def _try_case_insensitive_match(self, cursor, table_name, grade_column, player_name, team, season):
-        """Try case-insensitive exact match"""
-        query = f"""
-            SELECT {grade_column}
-            FROM {table_name}
-            WHERE LOWER(player) = LOWER(%s)
-              AND team_name = %s 
-              AND season = %s
-            LIMIT 1
-        """
-        cursor.execute(query, (player_name, team, season))
-        result = cursor.fetchone()
-        
-        if result and result[0] is not None:
-            return float(result[0]) if isinstance(result[0], Decimal) else result[0]
-        return None
-    
-    def _try_fuzzy_match_python(self, cursor, table_name, grade_column, normalized_name, team, season):
-        """
-        Fuzzy match by normalizing in Python (more reliable than SQL regex).
-        Fetches all players for team/season, then matches in Python.
-        """
-        import re
-        
-        query = f"""
-            SELECT player, {grade_column}
-            FROM {table_name}
-            WHERE team_name = %s 
-              AND season = %s
-        """
-        cursor.execute(query, (team, season))
-        results = cursor.fetchall()
-        
-        for row in results:
-            db_player_name = row[0]
-            grade = row[1]
-            
-            # Normalize database name
-            db_normalized = re.sub(r"['\-\.]", '', db_player_name).lower()
-            db_normalized = ' '.join(db_normalized.split())
-            
-            # Compare normalized names
-            if db_normalized == normalized_name:
-                logger.debug(f"Python fuzzy match: '{db_player_name}' (DB) = '{normalized_name}' (query)")
-                return float(grade) if isinstance(grade, Decimal) else grade
-        
-        return None
-    
-    def _try_last_name_match(self, cursor, table_name, grade_column, last_name, team, season):
-        """Try match by last name only (only if exactly 1 match to avoid ambiguity)"""
-        query = f"""
-            SELECT {grade_column}
-            FROM {table_name}
-            WHERE player LIKE %s
-              AND team_name = %s 
-              AND season = %s
-        """
-        cursor.execute(query, (f'%{last_name}%', team, season))
-        results = cursor.fetchall()
-        
-        # Only return if exactly 1 match (avoid ambiguous matches)
-        if len(results) == 1 and results[0][0] is not None:
-            return float(results[0][0]) if isinstance(results[0][0], Decimal) else results[0][0]
-        return None
-    
-    def _get_table_and_grade_column(self, position: str) -> Tuple[Optional[str], Optional[str]]:
-        """
-        Map position to the appropriate PFF table and grade column.
-        
-        Returns:
-            Tuple of (table_name, grade_column) or (None, None) if no mapping
-        """
-        position = position.upper()
-        
-        # QB positions
-        if position in ['QB']:
-            return ('qb_pff_ratings', 'grades_offense')
-        
-        # RB positions
-        elif position in ['RB', 'HB', 'FB']:
-            return ('rb_pff_ratings', 'grades_offense')
-        
-        # WR/TE positions
-        elif position in ['WR']:
-            return ('wr_pff_ratings', 'grades_offense')
-        elif position in ['TE']:
-            return ('wr_pff_ratings', 'grades_offense')  # TEs often in WR table
-        
-        # OL positions - special handling needed for averaging
-        elif position in ['LT', 'RT', 'LG', 'RG', 'C', 'T', 'G', 'OL']:
-            return ('oline_pff_ratings', '(grades_pass_block + grades_run_block) / 2.0')
-        
-        # Defensive positions
-        elif position in ['DE', 'DT', 'NT', 'EDGE', 'LB', 'CB', 'S', 'FS', 'SS']:
-            return ('defense_pff_ratings', 'grades_defense')
-        
-        else:
-            return (None, None)
-    
     def fetch_games_to_process(self, season: Optional[int] = None, 
                                week: Optional[int] = None,
                                limit: Optional[int] = None,
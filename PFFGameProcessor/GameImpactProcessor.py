@@ -51,7 +51,8 @@ class GameImpactProcessor:
         logger.info("GameImpactProcessor initialized")
     
     def process_game(self, internal_game_id: str, sportradar_id: str, 
-                    season: int, week: int, home_team: str, away_team: str) -> Dict[str, Any]:
+                    season: int, week: int, home_team: str, away_team: str,
+                    fresh: bool = False) -> Dict[str, Any]:
         """
         Process a single game and calculate player impact for both teams.
         
@@ -62,6 +63,7 @@ class GameImpactProcessor:
             week: Week number
             home_team: Home team abbreviation
             away_team: Away team abbreviation
+            fresh: Skip the Sportradar response cache (stat correction re-run)
         
         Returns:
             Dictionary with impact results for both teams
@@ -71,7 +73,7 @@ class GameImpactProcessor:
         
         try:
             # Step 1: Fetch game statistics (shows who actually played) from Sportradar
-            stats_data = self.sportradar.get_game_statistics(sportradar_id)
+            stats_data = self.sportradar.get_game_statistics(sportradar_id, fresh=fresh)
             logger.info(f"Fetched statistics data structure: {list(stats_data.keys())}")
             
             # Step 2: Extract players who actually played from statistics
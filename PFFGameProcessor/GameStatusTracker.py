@@ -0,0 +1,182 @@
+"""
+GameStatusTracker - Status-driven incremental game selection
+
+One schedule call tells us every game's Sportradar status. Per-game detail
+endpoints are only called when a game:
+  - has become closed/complete since this Lambda last saw it, or
+  - is final but its marker (status + score + scheduled time) changed
+    (stat/score corrections), or
+  - is final and this Lambda has not collected it yet.
+Games still scheduled/in progress/postponed only get their marker stored.
+A final game that is already collected but has no stored marker (collected
+before markers existed) is treated as unchanged and its marker is seeded.
+Final games selected because a stored marker differs are tagged fresh=True
+so their detail payloads bypass the response cache and pick up the correction.
+
+Markers live in sportradar_game_markers, one row per (sportradar_id, consumer),
+so BoxScoreCollector, PlayerImpactProcessor and PFFGameProcessor each track
+their own progress. On an idle week a run costs one schedule call and a
+couple of indexed SELECTs.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+FINAL_STATUSES = {'closed', 'complete'}
+
+
+def schedule_games(sportradar: Any, season: int, week: Optional[int] = None,
+                   season_type: str = 'REG') -> List[Dict[str, Any]]:
+    """
+    Games from one fresh (uncached) schedule call: the weekly schedule when a
+    week is given, otherwise the full season schedule.
+    """
+    if week is not None:
+        schedule = sportradar.get_weekly_schedule(season, week, season_type, fresh=True)
+        return (schedule.get('week') or {}).get('games', [])
+
+    schedule = sportradar.get_season_schedule(season, season_type, fresh=True)
+    return [game for wk in schedule.get('weeks', []) for game in wk.get('games', [])]
+
+
+def schedule_marker(game: Dict[str, Any]) -> Tuple[str, str]:
+    """(status, marker) for a schedule entry; the marker changes with status, score or kickoff"""
+    status = game.get('status') or 'unknown'
+    scoring = game.get('scoring') or {}
+    raw = json.dumps([status, scoring.get('home_points'), scoring.get('away_points'),
+                      game.get('scheduled'), game.get('updated')], default=str)
+    return status, hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+class GameStatusTracker:
+    """Reads/writes sportradar_game_markers for one consuming Lambda"""
+
+    def __init__(self, db_utils: Any, consumer: str):
+        """
+        Args:
+            db_utils: DatabaseUtils instance (pg8000 connection in autocommit mode)
+            consumer: Name of the Lambda whose progress is tracked
+        """
+        self.db_utils = db_utils
+        self.consumer = consumer
+
+    def load_markers(self, sportradar_ids: List[str]) -> Dict[str, Tuple[str, str]]:
+        """{sportradar_id: (status, marker)} last recorded by this consumer"""
+        if not sportradar_ids:
+            return {}
+        cursor = self.db_utils.connect().cursor()
+        try:
+            cursor.execute(
+                "SELECT sportradar_id, status, marker FROM sportradar_game_markers "
+                "WHERE consumer = %s AND sportradar_id = ANY(%s)",
+                (self.consumer, list(sportradar_ids)),
+            )
+            return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+    def save_markers(self, markers: Dict[str, Tuple[str, str]]):
+        """Upsert (status, marker) for each sportradar_id"""
+        if not markers:
+            return
+        cursor = self.db_utils.connect().cursor()
+        try:
+            for sportradar_id, (status, marker) in markers.items():
+                cursor.execute(
+                    """
+                    INSERT INTO sportradar_game_markers (sportradar_id, consumer, status, marker, checked_at)
+                    VALUES (%s, %s, %s, %s, NOW())
+                    ON CONFLICT (sportradar_id, consumer)
+                    DO UPDATE SET status = EXCLUDED.status, marker = EXCLUDED.marker, checked_at = NOW()
+                    """,
+                    (sportradar_id, self.consumer, status, marker),
+                )
+        finally:
+            cursor.close()
+        logger.info("Saved %d Sportradar game markers (%s)", len(markers), self.consumer)
+
+    def select_games(
+        self,
+        games: List[Dict[str, Any]],
+        schedule: List[Dict[str, Any]],
+        collected_ids: set,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Tuple[str, str]], Dict[str, int]]:
+        """
+        Pick the games whose detail endpoints need fetching.
+
+        Args:
+            games: game_id_mapping rows for the season/week (collected or not)
+            schedule: Schedule entries from schedule_games()
+            collected_ids: game_ids this Lambda has already processed
+
+        Returns:
+            (games_to_process, markers_to_save_after_success, counts)
+            Games whose stored marker differs carry fresh=True: their detail
+            endpoints must skip the response cache. Markers of games that are
+            skipped but changed (e.g. now in progress), or collected but never
+            marked, are saved immediately.
+        """
+        current = {g['id']: schedule_marker(g) for g in schedule if g.get('id')}
+        stored = self.load_markers([g['sportradar_id'] for g in games if g['sportradar_id'] in current])
+
+        to_process: List[Dict[str, Any]] = []
+        pending: Dict[str, Tuple[str, str]] = {}
+        skipped_changed: Dict[str, Tuple[str, str]] = {}
+        counts = {'final_changed': 0, 'unchanged': 0, 'not_final': 0, 'not_in_schedule': 0}
+
+        for game in games:
+            sid = game['sportradar_id']
+            if sid not in current:
+                # No status information: fall back to the collected flag
+                counts['not_in_schedule'] += 1
+                if game['game_id'] not in collected_ids:
+                    to_process.append(game)
+                continue
+
+            status, marker = current[sid]
+            previous = stored.get(sid)
+            if status not in FINAL_STATUSES:
+                counts['not_final'] += 1
+                if previous != (status, marker):
+                    skipped_changed[sid] = (status, marker)
+            elif game['game_id'] in collected_ids and previous in (None, (status, marker)):
+                counts['unchanged'] += 1
+                if previous is None:
+                    skipped_changed[sid] = (status, marker)   # seed; nothing to compare against
+            else:
+                counts['final_changed'] += 1
+                changed = previous is not None and previous != (status, marker)
+                to_process.append({**game, 'fresh': True} if changed else game)
+                pending[sid] = (status, marker)
+
+        self.save_markers(skipped_changed)
+        logger.info("Incremental selection (%s): %d to process, %s", self.consumer, len(to_process), counts)
+        return to_process, pending, counts
+
+    def plan(self, sportradar: Any, season: int, week: Optional[int] = None
+             ) -> Tuple[List[Dict[str, Any]], Dict[str, Tuple[str, str]], Dict[str, int]]:
+        """
+        One schedule call + game_id_mapping reads -> select_games().
+        Uses the Lambda's own DatabaseUtils.fetch_games_to_process() for both the
+        full game list (force=True) and the not-yet-collected list.
+        """
+        schedule = schedule_games(sportradar, season, week)
+        games = self.db_utils.fetch_games_to_process(season=season, week=week, force=True)
+        uncollected = {g['game_id'] for g in self.db_utils.fetch_games_to_process(season=season, week=week)}
+        collected_ids = {g['game_id'] for g in games} - uncollected
+        return self.select_games(games, schedule, collected_ids)
+
+    def save_processed(self, games: List[Dict[str, Any]], results: List[Dict[str, Any]],
+                       pending: Dict[str, Tuple[str, str]]):
+        """Record markers for the games whose processing succeeded"""
+        sportradar_ids = {g['game_id']: g['sportradar_id'] for g in games}
+        self.save_markers({
+            sportradar_ids[r['game_id']]: pending[sportradar_ids[r['game_id']]]
+            for r in results
+            if r.get('success') and sportradar_ids.get(r.get('game_id')) in pending
+        })
@@ -2,7 +2,8 @@
 PFFDataFetcher - Fetches PFF grades from database for player impact calculations
 
 Handles position-specific grade lookups and provides a unified interface
-for the PlayerWeightAssigner to get player quality ratings.
+for the PlayerWeightAssigner to get player quality ratings. Lookups are
+served from DatabaseUtils' per-season PFFGradeIndex.
 """
 
 import logging
@@ -24,7 +25,7 @@ class PFFDataFetcher:
             db_utils: Database utilities instance for querying PFF tables
         """
         self.db_utils = db_utils
-        self.grade_cache = {}  # Cache grades to avoid repeated queries
+        self.grade_cache = {}  # Cache grades to avoid repeated lookups
         logger.info("PFFDataFetcher initialized")
     
     def get_player_grade(self, player_id: str, player_name: str, team: str, 
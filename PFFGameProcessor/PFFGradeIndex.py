@@ -0,0 +1,187 @@
+"""
+PFFGradeIndex - Season-level in-memory index of PFF grades
+
+Loads every PFF ratings table for a season with one query and resolves
+player lookups from memory, replacing the up-to-four queries per player
+that DatabaseUtils.fetch_pff_grade used to issue.
+
+Matching cascade (same order and rules as the per-player SQL lookups),
+all scoped to one table (by position) + team + season:
+    1. Exact name                     player = name
+    2. Case-insensitive name          LOWER(player) = LOWER(name)
+    3. Normalized name                apostrophes/hyphens/periods removed,
+                                      whitespace collapsed, lowercased
+    4. Last name, only if unique      player LIKE '%last%' matches one row
+A step that finds a row with a NULL grade falls through to the next step.
+"""
+
+import logging
+import re
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# (table, team column, grade expression) - one entry per PFF ratings table
+PFF_GRADE_SOURCES: List[Tuple[str, str, str]] = [
+    ('qb_pff_ratings',      'team',      'grades_offense'),
+    ('rb_pff_ratings',      'team_name', 'grades_offense'),
+    ('wr_pff_ratings',      'team_name', 'grades_offense'),
+    ('oline_pff_ratings',   'team_name', '(grades_pass_block + grades_run_block) / 2.0'),
+    ('defense_pff_ratings', 'team_name', 'grades_defense'),
+]
+
+_POSITION_TABLES = {
+    'QB': 'qb_pff_ratings',
+    'RB': 'rb_pff_ratings', 'HB': 'rb_pff_ratings', 'FB': 'rb_pff_ratings',
+    'WR': 'wr_pff_ratings',
+    'TE': 'wr_pff_ratings',   # TEs often in WR table
+    **{p: 'oline_pff_ratings' for p in ['LT', 'RT', 'LG', 'RG', 'C', 'T', 'G', 'OL']},
+    **{p: 'defense_pff_ratings' for p in ['DE', 'DT', 'NT', 'EDGE', 'LB', 'CB', 'S', 'FS', 'SS']},
+}
+
+_STRIP_CHARS = re.compile(r"['\-\.]")
+
+
+def table_for_position(position: str) -> Optional[str]:
+    """PFF ratings table for a position, or None if the position has no table"""
+    return _POSITION_TABLES.get((position or '').upper())
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize player name: remove apostrophes, hyphens, periods, extra spaces.
+
+    Examples:
+        "De'Marcus Lawrence" → "demarcus lawrence"
+        "T.J. Watt" → "tj watt"
+        "Jalyn Armour-Davis" → "jalyn armourdavis"
+    """
+    return ' '.join(_STRIP_CHARS.sub('', name).split()).lower()
+
+
+def _season_sql() -> str:
+    parts = [
+        f"SELECT {i} AS src, player, {team_col} AS team, {grade_expr} AS grade "
+        f"FROM {table} WHERE season = %s"
+        for i, (table, team_col, grade_expr) in enumerate(PFF_GRADE_SOURCES)
+    ]
+    return "\nUNION ALL\n".join(parts)
+
+
+class _TeamBucket:
+    """One team's rows from one table, with the lookups the cascade needs"""
+
+    def __init__(self):
+        self.rows: List[Tuple[str, Optional[float]]] = []
+        self.exact: Dict[str, Optional[float]] = {}
+        self.lower: Dict[str, Optional[float]] = {}
+        self.normalized: Dict[str, Optional[float]] = {}
+        self.last_name: Dict[str, Optional[float]] = {}   # memoized step 4 results
+
+    def add(self, player: str, grade: Optional[float]):
+        self.rows.append((player, grade))
+        # First row wins, like LIMIT 1 / first match in the old queries
+        self.exact.setdefault(player, grade)
+        self.lower.setdefault(player.lower(), grade)
+        self.normalized.setdefault(normalize_name(player), grade)
+
+    def match_last_name(self, last_name: str) -> Optional[float]:
+        """Grade of the single row whose name contains last_name (case-sensitive)"""
+        if last_name not in self.last_name:
+            hits = [grade for player, grade in self.rows if last_name in player]
+            self.last_name[last_name] = hits[0] if len(hits) == 1 else None
+        return self.last_name[last_name]
+
+
+class PFFGradeIndex:
+    """All PFF grades for one season, bucketed by table (position) and team"""
+
+    def __init__(self, season: int, rows: List[Tuple[str, str, Optional[str], Any]]):
+        """
+        Args:
+            season: Season year
+            rows: (table, player, team, grade) tuples
+        """
+        self.season = season
+        self.row_count = 0
+        self._buckets: Dict[Tuple[str, str], _TeamBucket] = {}
+
+        for table, player, team, grade in rows:
+            if player is None or team is None:
+                continue
+            bucket = self._buckets.get((table, team))
+            if bucket is None:
+                bucket = self._buckets[(table, team)] = _TeamBucket()
+            bucket.add(player, float(grade) if isinstance(grade, Decimal) else grade)
+            self.row_count += 1
+
+    @classmethod
+    def load(cls, db_utils: Any, season: int) -> 'PFFGradeIndex':
+        """
+        Load a season's grades from all PFF ratings tables with one query.
+
+        Args:
+            db_utils: DatabaseUtils instance
+            season: Season year
+
+        Returns:
+            PFFGradeIndex for the season
+        """
+        cursor = db_utils.connect().cursor()
+        try:
+            cursor.execute(_season_sql(), (season,) * len(PFF_GRADE_SOURCES))
+            tables = [source[0] for source in PFF_GRADE_SOURCES]
+            index = cls(season, [(tables[r[0]], r[1], r[2], r[3]) for r in cursor.fetchall()])
+        finally:
+            cursor.close()
+
+        logger.info(f"PFF grade index for {season}: {index.row_count} rows, {len(index._buckets)} table/team buckets")
+        return index
+
+    def lookup(self, player_name: str, team: str, position: str) -> Optional[float]:
+        """
+        Resolve a player's grade with the matching cascade.
+
+        Args:
+            player_name: Player's full name (from Sportradar)
+            team: Normalized team abbreviation
+            position: Player position
+
+        Returns:
+            PFF grade (0-100) or None if not found
+        """
+        table = table_for_position(position)
+        if table is None:
+            logger.warning(f"No PFF table mapping for position: {position}")
+            return None
+
+        bucket = self._buckets.get((table, team))
+        if bucket is None:
+            logger.debug(f"✗ No PFF rows for {team} in {table} ({self.season})")
+            return None
+
+        grade = bucket.exact.get(player_name)
+        if grade is not None:
+            return grade
+
+        grade = bucket.lower.get(player_name.lower())
+        if grade is not None:
+            logger.debug(f"✓ Case-insensitive match: '{player_name}'")
+            return grade
+
+        normalized = normalize_name(player_name)
+        grade = bucket.normalized.get(normalized)
+        if grade is not None:
+            logger.debug(f"✓ Fuzzy match: '{player_name}' → '{normalized}'")
+            return grade
+
+        last_name = player_name.split()[-1] if ' ' in player_name else player_name
+        grade = bucket.match_last_name(last_name)
+        if grade is not None:
+            logger.debug(f"✓ Last name match: '{player_name}' → '{last_name}'")
+            return grade
+
+        logger.debug(f"✗ No PFF match: {player_name} ({position}, {team}, {self.season})")
+        return None
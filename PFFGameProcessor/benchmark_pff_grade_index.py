@@ -0,0 +1,450 @@
+"""
+Benchmark + parity: per-player PFF grade queries vs the season PFFGradeIndex
+Resolves every player of a synthetic 16-game week through
+  - the old DatabaseUtils.fetch_pff_grade, copied verbatim (health check + up
+    to four queries per player: exact, case-insensitive, normalized, unique
+    last name)
+  - DatabaseUtils.fetch_pff_grade on PFFGradeIndex (one query per season,
+    then in-memory matching)
+Both go through PFFDataFetcher, as GameImpactProcessor does. The PFF tables
+live in an in-memory SQLite database (case-sensitive LIKE) so the old
+queries run as real SQL; every statement also costs --latency seconds.
+Roster names include case and punctuation variants, last-name-only matches,
+ambiguous last names, NULL grades, unknown players and Sportradar team codes
+(BLT, CLV, ARZ, HST). Fails if any player's grade differs between the paths,
+except QBs: the old queries filter qb_pff_ratings on team_name, which does
+not exist there (the column is team), so the old path defaults every QB.
+
+Usage:
+    python benchmark_pff_grade_index.py
+    python benchmark_pff_grade_index.py --games 16 --latency 0.02
+"""
+
+import argparse
+import logging
+import os
+import random
+import re
+import sqlite3
+import time
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from PFFGradeIndex import PFF_GRADE_SOURCES, table_for_position
+
+logger = logging.getLogger()
+
+TEAMS = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB',
+         'HOU', 'IND', 'JAX', 'KC', 'LAC', 'LAR', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG',
+         'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS']
+DEFAULT_GRADE = 70.0     # PFFDataFetcher's grade for unmatched players
+SPORTRADAR_TEAMS = {'BAL': 'BLT', 'CLE': 'CLV', 'ARI': 'ARZ', 'HOU': 'HST'}
+ROSTER = {'QB': 2, 'RB': 3, 'FB': 1, 'WR': 5, 'TE': 3, 'LT': 1, 'LG': 1, 'C': 1, 'RG': 1, 'RT': 1,
+          'OL': 2, 'DE': 3, 'DT': 3, 'LB': 4, 'CB': 4, 'S': 2, 'FS': 1, 'SS': 1}
+FIRST = ['James', "De'Andre", 'T.J.', 'Mike', 'Jalen', 'Chris', 'A.J.', 'Marcus', "Ja'Marr",
+         'Josh', 'Kyle', 'D.K.', 'Tre', 'Jordan', 'Brandon', 'Derrick']
+LAST = ['Smith', 'Johnson', 'Williams', 'Armour-Davis', "O'Neal", 'St. Brown', 'Jackson',
+        'Brown', 'Allen', 'Moore', 'Hill', 'Thomas', 'Wright', 'Harris', 'Watt', 'Lawrence']
+
+
+# ---------------------------------------------------------------------------
+# Synthetic season
+# ---------------------------------------------------------------------------
+
+def _grade(rng: random.Random):
+    return None if rng.random() < 0.05 else round(rng.uniform(35, 95), 1)
+
+
+def synthetic_players(rng: random.Random) -> List[Tuple[str, str, str]]:
+    """(pff name, team, position) for every rostered player"""
+    players = []
+    for team in TEAMS:
+        used = set()
+        for position, n in ROSTER.items():
+            for _ in range(n):
+                name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+                while name in used:
+                    name = f"{rng.choice(FIRST)} {rng.choice(LAST)}{rng.randint(2, 99)}"
+                used.add(name)
+                players.append((name, team, position))
+    return players
+
+
+def build_database(players, rng: random.Random, season: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(':memory:', check_same_thread=False)
+    conn.execute("PRAGMA case_sensitive_like = ON")
+    for table, team_col, _ in PFF_GRADE_SOURCES:
+        conn.execute(f"CREATE TABLE {table} (player TEXT, {team_col} TEXT, season INT, "
+                     "grades_offense REAL, grades_defense REAL, "
+                     "grades_pass_block REAL, grades_run_block REAL)")
+    for name, team, position in players:
+        table = table_for_position(position)
+        team_col = next(col for t, col, _ in PFF_GRADE_SOURCES if t == table)
+        conn.execute(f"INSERT INTO {table} (player, {team_col}, season, grades_offense, grades_defense, "
+                     "grades_pass_block, grades_run_block) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                     (name, team, season, _grade(rng), _grade(rng), _grade(rng), _grade(rng)))
+    return conn
+
+
+def roster_name(name: str, rng: random.Random) -> str:
+    """How Sportradar might spell a PFF name"""
+    roll = rng.random()
+    if roll < 0.70:
+        return name
+    if roll < 0.78:
+        return name.upper() if rng.random() < 0.5 else name.lower()
+    if roll < 0.86:
+        return re.sub(r"['\-.]", '', name)                       # TJ Watt, ONeal
+    if roll < 0.94:
+        return f"{rng.choice(['Bob', 'Rob', 'Tony'])} {name.split()[-1]}"   # last name only
+    return f"Unknown Player{rng.randint(0, 999)}"
+
+
+def week_games(players, games: int, rng: random.Random) -> List[List[Tuple[str, str, str]]]:
+    """[[(roster name, sportradar team, position), ...] per game]"""
+    by_team: Dict[str, List[Tuple[str, str]]] = {}
+    for name, team, position in players:
+        by_team.setdefault(team, []).append((name, position))
+    teams = rng.sample(TEAMS, games * 2)
+    result = []
+    for g in range(games):
+        roster = []
+        for team in teams[2 * g:2 * g + 2]:
+            sr_team = SPORTRADAR_TEAMS.get(team, team)
+            roster += [(roster_name(name, rng), sr_team, position) for name, position in by_team[team]]
+        result.append(roster)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Simulated pg8000 connection over SQLite
+# ---------------------------------------------------------------------------
+
+class SimCursor:
+    def __init__(self, conn: 'SimConnection'):
+        self.conn = conn
+        self.rows: List[Tuple] = []
+
+    def execute(self, sql, params=()):
+        self.conn.queries += 1
+        time.sleep(self.conn.latency)
+        self.rows = self.conn.db.execute(sql.replace('%s', '?'), params).fetchall()
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class SimConnection:
+    def __init__(self, db: sqlite3.Connection, latency: float):
+        self.db, self.latency = db, latency
+        self.queries = 0
+
+    def cursor(self):
+        return SimCursor(self)
+
+
+def checked_connect(conn: SimConnection):
+    """DatabaseUtils.connect(): a SELECT 1 health check on every call"""
+    def connect():
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.close()
+        return conn
+    return connect
+
+
+# ---------------------------------------------------------------------------
+# The per-player lookup as it was before PFFGradeIndex
+# ---------------------------------------------------------------------------
+
+class LegacyGradeLookup:
+    """
+    fetch_pff_grade and its helpers copied verbatim from DatabaseUtils before
+    PFFGradeIndex replaced them. They query team_name on every table, which
+    qb_pff_ratings does not have (its column is team), so every QB lookup
+    errors and is logged and skipped there; PFFGradeIndex reads team for QBs.
+    """
+
+    def __init__(self, conn: SimConnection):
+        self.connect = checked_connect(conn)
+
+    def fetch_pff_grade(self, player_name: str, team: str, position: str, season: int) -> Optional[float]:
+        """
+        Fetch PFF grade for a player from the appropriate PFF table.
+        Uses fuzzy name matching to handle variations (apostrophes, hyphens, initials).
+        
+        Args:
+            player_name: Player's full name (from Sportradar)
+            team: Team abbreviation (from Sportradar)
+            position: Player position (QB, RB, WR, TE, OL positions, DEF positions)
+            season: Season year
+        
+        Returns:
+            PFF grade (0-100) or None if not found
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            # Determine which table and grade column to query
+            table_name, grade_column = self._get_table_and_grade_column(position)
+            
+            if table_name is None:
+                logger.warning(f"No PFF table mapping for position: {position}")
+                return None
+            
+            # Normalize team abbreviation (handle BLT→BAL, etc.)
+            normalized_team = self._normalize_team_abbr(team)
+            
+            logger.info(f"Looking up: {player_name} | {position} → {table_name} | team={team}→{normalized_team} | season={season}")
+            
+            # Try 1: Exact match
+            grade = self._try_exact_match(cursor, table_name, grade_column, player_name, normalized_team, season)
+            if grade is not None:
+                return grade
+            
+            # Try 2: Case-insensitive match
+            grade = self._try_case_insensitive_match(cursor, table_name, grade_column, player_name, normalized_team, season)
+            if grade is not None:
+                logger.debug(f"✓ Case-insensitive match: '{player_name}'")
+                return grade
+            
+            # Try 3: Fuzzy match (remove special chars from BOTH sides using Python)
+            normalized_name = self._normalize_name(player_name)
+            grade = self._try_fuzzy_match_python(cursor, table_name, grade_column, normalized_name, normalized_team, season)
+            if grade is not None:
+                logger.debug(f"✓ Fuzzy match: '{player_name}' → '{normalized_name}'")
+                return grade
+            
+            # Try 4: Last name only (if unique)
+            last_name = player_name.split()[-1] if ' ' in player_name else player_name
+            grade = self._try_last_name_match(cursor, table_name, grade_column, last_name, normalized_team, season)
+            if grade is not None:
+                logger.debug(f"✓ Last name match: '{player_name}' → '{last_name}'")
+                return grade
+            
+            logger.debug(f"✗ No PFF match: {player_name} ({position}, {team}, {season})")
+            return None
+            
+        except Exception as e:
+            logger.warning(f"Error fetching PFF grade for {player_name}: {e}")
+            return None
+        finally:
+            cursor.close()
+    
+    def _normalize_team_abbr(self, team: str) -> str:
+        """Normalize team abbreviations (BLT→BAL, etc.)"""
+        mapping = {
+            'BLT': 'BAL',
+            'CLV': 'CLE',
+            'ARZ': 'ARI',
+            'HST': 'HOU'
+        }
+        return mapping.get(team, team)
+    
+    def _normalize_name(self, name: str) -> str:
+        """
+        Normalize player name: remove apostrophes, hyphens, periods, extra spaces.
+        
+        Examples:
+            "De'Marcus Lawrence" → "demarcus lawrence"
+            "T.J. Watt" → "tj watt"
+            "Jalyn Armour-Davis" → "jalyn armourdavis"
+        """
+        import re
+        normalized = re.sub(r"['\-\.]", '', name)
+        normalized = ' '.join(normalized.split())
+        return normalized.lower()
+    
+    def _try_exact_match(self, cursor, table_name, grade_column, player_name, team, season):
+        """Try exact name match"""
+        query = f"""
+            SELECT {grade_column}
+            FROM {table_name}
+            WHERE player = %s 
+              AND team_name = %s 
+              AND season = %s
+            LIMIT 1
+        """
+        logger.debug(f"Exact match query: table={table_name}, player={player_name}, team={team}, season={season}")
+        cursor.execute(query, (player_name, team, season))
+        result = cursor.fetchone()
+        
+        if result and result[0] is not None:
+            logger.info(f"✓ FOUND: {player_name} ({team}) = {result[0]}")
+            return float(result[0]) if isinstance(result[0], Decimal) else result[0]
+        return None
+    
+    def _try_case_insensitive_match(self, cursor, table_name, grade_column, player_name, team, season):
+        """Try case-insensitive exact match"""
+        query = f"""
+            SELECT {grade_column}
+            FROM {table_name}
+            WHERE LOWER(player) = LOWER(%s)
+              AND team_name = %s 
+              AND season = %s
+            LIMIT 1
+        """
+        cursor.execute(query, (player_name, team, season))
+        result = cursor.fetchone()
+        
+        if result and result[0] is not None:
+            return float(result[0]) if isinstance(result[0], Decimal) else result[0]
+        return None
+    
+    def _try_fuzzy_match_python(self, cursor, table_name, grade_column, normalized_name, team, season):
+        """
+        Fuzzy match by normalizing in Python (more reliable than SQL regex).
+        Fetches all players for team/season, then matches in Python.
+        """
+        import re
+        
+        query = f"""
+            SELECT player, {grade_column}
+            FROM {table_name}
+            WHERE team_name = %s 
+              AND season = %s
+        """
+        cursor.execute(query, (team, season))
+        results = cursor.fetchall()
+        
+        for row in results:
+            db_player_name = row[0]
+            grade = row[1]
+            
+            # Normalize database name
+            db_normalized = re.sub(r"['\-\.]", '', db_player_name).lower()
+            db_normalized = ' '.join(db_normalized.split())
+            
+            # Compare normalized names
+            if db_normalized == normalized_name:
+                logger.debug(f"Python fuzzy match: '{db_player_name}' (DB) = '{normalized_name}' (query)")
+                return float(grade) if isinstance(grade, Decimal) else grade
+        
+        return None
+    
+    def _try_last_name_match(self, cursor, table_name, grade_column, last_name, team, season):
+        """Try match by last name only (only if exactly 1 match to avoid ambiguity)"""
+        query = f"""
+            SELECT {grade_column}
+            FROM {table_name}
+            WHERE player LIKE %s
+              AND team_name = %s 
+              AND season = %s
+        """
+        cursor.execute(query, (f'%{last_name}%', team, season))
+        results = cursor.fetchall()
+        
+        # Only return if exactly 1 match (avoid ambiguous matches)
+        if len(results) == 1 and results[0][0] is not None:
+            return float(results[0][0]) if isinstance(results[0][0], Decimal) else results[0][0]
+        return None
+    
+    def _get_table_and_grade_column(self, position: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Map position to the appropriate PFF table and grade column.
+        
+        Returns:
+            Tuple of (table_name, grade_column) or (None, None) if no mapping
+        """
+        position = position.upper()
+        
+        # QB positions
+        if position in ['QB']:
+            return ('qb_pff_ratings', 'grades_offense')
+        
+        # RB positions
+        elif position in ['RB', 'HB', 'FB']:
+            return ('rb_pff_ratings', 'grades_offense')
+        
+        # WR/TE positions
+        elif position in ['WR']:
+            return ('wr_pff_ratings', 'grades_offense')
+        elif position in ['TE']:
+            return ('wr_pff_ratings', 'grades_offense')  # TEs often in WR table
+        
+        # OL positions - special handling needed for averaging
+        elif position in ['LT', 'RT', 'LG', 'RG', 'C', 'T', 'G', 'OL']:
+            return ('oline_pff_ratings', '(grades_pass_block + grades_run_block) / 2.0')
+        
+        # Defensive positions
+        elif position in ['DE', 'DT', 'NT', 'EDGE', 'LB', 'CB', 'S', 'FS', 'SS']:
+            return ('defense_pff_ratings', 'grades_defense')
+        
+        else:
+            return (None, None)
+
+
+def resolve_week(fetcher, games, season: int) -> List[List[float]]:
+    return [[fetcher.get_player_grade('', name, team, position, season) for name, team, position in roster]
+            for roster in games]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=16)
+    parser.add_argument('--latency', type=float, default=0.02, help='seconds per statement round trip')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    for var in ('DB_HOST', 'DB_NAME', 'DB_USER', 'DB_PASSWORD'):
+        os.environ.setdefault(var, 'benchmark')
+    from DatabaseUtils import DatabaseUtils
+    from PFFDataFetcher import PFFDataFetcher
+    logger.setLevel(logging.ERROR)   # the legacy path logs every failed QB query
+
+    season  = 2024
+    rng     = random.Random(args.seed)
+    players = synthetic_players(rng)
+    db      = build_database(players, rng, season)
+    games   = week_games(players, args.games, rng)
+    lookups = sum(len(roster) for roster in games)
+    print(f"{args.games} games, {lookups} player lookups, {len(players)} PFF rows, {args.latency}s/statement")
+
+    index_db = DatabaseUtils()
+    legacy_conn = SimConnection(db, args.latency)
+    legacy = LegacyGradeLookup(legacy_conn)
+    start = time.perf_counter()
+    legacy_grades = resolve_week(PFFDataFetcher(legacy), games, season)
+    legacy_s = time.perf_counter() - start
+
+    index_conn = SimConnection(db, args.latency)
+    index_db.connect = checked_connect(index_conn)
+    start = time.perf_counter()
+    index_grades = resolve_week(PFFDataFetcher(index_db), games, season)
+    index_s = time.perf_counter() - start
+
+    # The one expected difference: the legacy QB queries fail on team_name
+    diffs, qb_recovered = [], 0
+    for g, (a, b) in enumerate(zip(legacy_grades, index_grades)):
+        for i, (x, y) in enumerate(zip(a, b)):
+            if table_for_position(games[g][i][2]) == 'qb_pff_ratings':
+                if x != DEFAULT_GRADE:
+                    diffs.append((g, i))
+                elif y != DEFAULT_GRADE:
+                    qb_recovered += 1
+            elif x != y:
+                diffs.append((g, i))
+    matched = sum(1 for roster in legacy_grades for grade in roster if grade != DEFAULT_GRADE)
+
+    print(f"{'path':>8} {'queries':>8} {'seconds':>8} {'lookups/s':>10}")
+    print(f"{'legacy':>8} {legacy_conn.queries:>8} {legacy_s:>8.2f} {lookups / legacy_s:>10.0f}")
+    print(f"{'index':>8} {index_conn.queries:>8} {index_s:>8.2f} {lookups / index_s:>10.0f}")
+    print(f"speedup {legacy_s / index_s:.1f}x, {matched}/{lookups} players graded by the legacy path")
+    print(f"QBs: legacy queries team_name on qb_pff_ratings (no such column) and defaults every QB; "
+          f"the index grades {qb_recovered} of them")
+    if diffs:
+        g, i = diffs[0]
+        raise SystemExit(f"PARITY FAILED for {len(diffs)} players, first: {games[g][i]} "
+                         f"legacy={legacy_grades[g][i]} index={index_grades[g][i]}")
+    print("parity: identical grades for every non-QB player")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,18 @@
+-- =============================================================================
+-- sportradar_game_markers
+-- =============================================================================
+-- Last Sportradar status + change marker each game-processing Lambda saw per
+-- game (written by GameStatusTracker). Detail endpoints are only re-fetched
+-- when a game becomes closed/complete or its marker changes.
+--
+-- consumer: 'player_impact' | 'box_score' | 'pff_game_impact'
+-- Safe to run multiple times.
+-- =============================================================================
+CREATE TABLE IF NOT EXISTS sportradar_game_markers (
+    sportradar_id   VARCHAR(64)  NOT NULL,
+    consumer        VARCHAR(32)  NOT NULL,
+    status          VARCHAR(32)  NOT NULL,
+    marker          VARCHAR(32)  NOT NULL,
+    checked_at      TIMESTAMP    NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (sportradar_id, consumer)
+);
@@ -30,7 +30,13 @@ Event Formats:
            "limit": 50
        }
     
-    5. Single game by internal ID (testing):
+    5. Re-process already processed games / skip the status check:
+       {
+           "season": 2024,
+           "force": true            (or "incremental": false)
+       }
+    
+    6. Single game by internal ID (testing):
        {
            "game_id": "2024_10_BUF_KC",
            "sportradar_id": "abc-123-def",
@@ -39,16 +45,20 @@ Event Formats:
            "home_team": "KC",
            "away_team": "BUF"
        }
+
+With a season (and optional week) and no force, batch mode is incremental:
+one fresh schedule call gives each game's status, and only games that became
+closed/complete or whose marker changed are fetched (GameStatusTracker).
 """
 
 import json
 import logging
 import os
-import time
 from typing import List, Dict, Any
 from SportradarClient import SportradarClient
 from DatabaseUtils import DatabaseUtils
 from GameImpactProcessor import GameImpactProcessor
+from GameStatusTracker import GameStatusTracker
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -77,11 +87,8 @@ def lambda_handler(event, context):
     
     try:
         # Initialize components
-        api_key = os.environ.get('SPORTRADAR_API_KEY')
-        if not api_key:
-            raise ValueError("SPORTRADAR_API_KEY not found in environment")
-        
-        sportradar = SportradarClient(api_key)
+        # SPORTRADAR_API_KEY (not needed with SPORTRADAR_MODE=replay)
+        sportradar = SportradarClient(os.environ.get('SPORTRADAR_API_KEY'))
         db_utils = DatabaseUtils()
         processor = GameImpactProcessor(sportradar, db_utils)
         
@@ -113,7 +120,13 @@ def lambda_handler(event, context):
         force = event.get('force', False)
         
         logger.info(f"Batch mode: Fetching games (season={season}, week={week}, limit={limit}, force={force})")
-        games = db_utils.fetch_games_to_process(season=season, week=week, limit=limit, force=force)
+        tracker = None
+        if season is not None and not force and event.get('incremental', True):
+            tracker = GameStatusTracker(db_utils, consumer='pff_game_impact')
+            games, markers, _ = tracker.plan(sportradar, season, week)
+            games = games[:limit] if limit else games
+        else:
+            games = db_utils.fetch_games_to_process(season=season, week=week, limit=limit, force=force)
         
         if not games:
             logger.info("No games found to process")
@@ -142,7 +155,8 @@ def lambda_handler(event, context):
                     season=game['season'],
                     week=game['week'],
                     home_team=game['home_team'],
-                    away_team=game['away_team']
+                    away_team=game['away_team'],
+                    fresh=game.get('fresh', False)
                 )
                 
                 if result['success']:
@@ -156,10 +170,6 @@ def lambda_handler(event, context):
                     'away_impact': result.get('away_impact')
                 })
                 
-                # Rate limit protection (Sportradar API: 1 call/sec)
-                if i < len(games):
-                    time.sleep(1.1)
-                
             except Exception as e:
                 logger.error(f"Failed to process game {game['game_id']}: {e}", exc_info=True)
                 results.append({
@@ -168,6 +178,9 @@ def lambda_handler(event, context):
                     'error': str(e)
                 })
         
+        if tracker:
+            tracker.save_processed(games, results, markers)
+        
         logger.info("=" * 60)
         logger.info(f"Batch processing complete: {success_count}/{len(games)} games successful")
         logger.info("=" * 60)
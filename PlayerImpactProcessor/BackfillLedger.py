@@ -0,0 +1,157 @@
+"""
+BackfillLedger.py — PlayerImpactProcessor
+==========================================
+Durable progress ledger for one backfill run (create_backfill_runs.sql).
+
+  backfill_runs       run parameters, status, counters, cursor
+  backfill_run_games  one row per attempted game: success / error
+
+Each game is checkpointed when it finishes, from whichever worker thread or
+process ran it (through that worker's own DatabaseUtils). A resumed run
+re-reads its parameters, skips every game with success = TRUE and retries
+the rest, so nothing finished is processed twice.
+"""
+import json
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class BackfillLedger:
+    """Reads/writes backfill_runs + backfill_run_games for one run_id"""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+
+    @staticmethod
+    def new_run_id() -> str:
+        return f"backfill-{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:6]}"
+
+    # ── Run lifecycle ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def start(cls, db: Any, params: Dict[str, Any], total_games: int) -> 'BackfillLedger':
+        """Register a new run"""
+        ledger = cls(cls.new_run_id())
+        cursor = db.connect().cursor()
+        try:
+            cursor.execute(
+                "INSERT INTO backfill_runs (run_id, params, status, total_games) "
+                "VALUES (%s, %s, 'running', %s)",
+                (ledger.run_id, json.dumps(params), total_games),
+            )
+        finally:
+            cursor.close()
+        logger.info("Backfill run %s started: %d games, %s", ledger.run_id, total_games, params)
+        return ledger
+
+    def resume(self, db: Any) -> Dict[str, Any]:
+        """Mark the run running again; returns its stored parameters"""
+        cursor = db.connect().cursor()
+        try:
+            cursor.execute(
+                "UPDATE backfill_runs SET status = 'running', invocations = invocations + 1, "
+                "updated_at = NOW() WHERE run_id = %s RETURNING params, invocations, status",
+                (self.run_id,),
+            )
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+        if row is None:
+            raise ValueError(f"Unknown backfill run {self.run_id}")
+        params = row[0] if isinstance(row[0], dict) else json.loads(row[0])
+        logger.info("Backfill run %s resumed (invocation %d)", self.run_id, row[1])
+        return params
+
+    def completed_ids(self, db: Any) -> Set[str]:
+        """game_ids already finished successfully in this run"""
+        cursor = db.connect().cursor()
+        try:
+            cursor.execute(
+                "SELECT game_id FROM backfill_run_games WHERE run_id = %s AND success",
+                (self.run_id,),
+            )
+            return {row[0] for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+    def finish(self, db: Any, status: str) -> Dict[str, Any]:
+        """Set the run status; returns {'completed', 'total', 'errors': [{game_id, error}]}"""
+        cursor = db.connect().cursor()
+        try:
+            cursor.execute(
+                "UPDATE backfill_runs SET status = %s, updated_at = NOW() WHERE run_id = %s "
+                "RETURNING completed_games, total_games",
+                (status, self.run_id),
+            )
+            completed, total = cursor.fetchone()
+            cursor.execute(
+                "SELECT game_id, error FROM backfill_run_games "
+                "WHERE run_id = %s AND NOT success ORDER BY finished_at",
+                (self.run_id,),
+            )
+            errors = [{'game_id': r[0], 'error': r[1]} for r in cursor.fetchall()]
+        finally:
+            cursor.close()
+        logger.info("Backfill run %s %s: %d/%d games, %d errors",
+                    self.run_id, status, completed, total, len(errors))
+        return {'completed': completed, 'total': total, 'errors': errors}
+
+    # ── Checkpoints ───────────────────────────────────────────────────────────
+
+    def record(self, db: Any, game_id: str, result: Dict[str, Any]):
+        """
+        Checkpoint one finished game (success or failure). A failed write is
+        logged, not raised — the game stays unrecorded and reruns on resume.
+        completed_games moves by the change in this game's success flag (one
+        statement, no recount), so checkpoints cost the same all run long.
+        """
+        success = bool(result.get('success'))
+        error   = None if success else str(result.get('error') or result.get('reason') or 'failed')
+        try:
+            cursor = db.connect().cursor()
+            try:
+                cursor.execute(
+                    """
+                    WITH previous AS (
+                        SELECT success FROM backfill_run_games WHERE run_id = %s AND game_id = %s
+                    ), checkpoint AS (
+                        INSERT INTO backfill_run_games (run_id, game_id, success, error, finished_at)
+                        VALUES (%s, %s, %s, %s, NOW())
+                        ON CONFLICT (run_id, game_id)
+                        DO UPDATE SET success = EXCLUDED.success, error = EXCLUDED.error, finished_at = NOW()
+                        RETURNING success
+                    )
+                    UPDATE backfill_runs SET
+                        completed_games = completed_games
+                            + (SELECT success::int FROM checkpoint)
+                            - COALESCE((SELECT success::int FROM previous), 0),
+                        cursor_game_id  = %s,
+                        updated_at      = NOW()
+                    WHERE run_id = %s
+                    """,
+                    (self.run_id, game_id, self.run_id, game_id, success, error, game_id, self.run_id),
+                )
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.warning("Backfill checkpoint failed for %s (%s): %s", game_id, self.run_id, e)
+            db._reset_connection()
+
+
+def pending_games(games: List[Dict[str, Any]], completed: Set[str]) -> List[Dict[str, Any]]:
+    """games minus the ones a run already finished, order kept"""
+    return [g for g in games if g['game_id'] not in completed]
+
+
+def deferred_result(game: Dict[str, Any]) -> Dict[str, Any]:
+    """Result for a game left for the next invocation (time budget spent)"""
+    return {'game_id': game['game_id'], 'success': False, 'deferred': True}
+
+
+def is_deferred(result: Optional[Dict[str, Any]]) -> bool:
+    return bool(result and result.get('deferred'))
@@ -3,11 +3,14 @@ DatabaseUtils.py — PlayerImpactProcessor
 =========================================
 Handles all DB operations for the PlayerImpactProcessor pipeline:
   - Fetch games to process (same as BoxScoreCollector)
-  - PFF grade lookup (same as BoxScoreCollector)
+  - PFF grade lookup (season index, see PFFGradeIndex.py)
+  - Sportradar → nflverse / PFF player ids (player_crosswalk, see PlayerCrosswalk.py)
   - Upsert player_game_stats with enriched multiplier_components + nflverse_enriched
+    (COPY into a staging table + one merge per call)
   - Update game_id_mapping with position-group impacts + player_details JSONB
   - Player-season-stats baseline lookup (same as BoxScoreCollector)
 """
+import io
 import json
 import logging
 import os
@@ -16,10 +19,104 @@ from typing import Any, Dict, List, Optional
 
 import pg8000
 
+from PFFGradeIndex import PFFGradeIndex, PFFGradeIndexCache
+from PlayerCrosswalk import (CROSSWALK_COLUMNS, CROSSWALK_ID_COLUMNS, CROSSWALK_UPDATE_COLUMNS,
+                             PlayerCrosswalk, PlayerCrosswalkCache)
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+# ── player_game_stats (enriched) staging helpers ──────────────────────────────
+
+ENRICHED_COLUMNS = [
+    'game_id', 'sportradar_game_id', 'player_id', 'player_name',
+    'team', 'position', 'season', 'week',
+    'rush_attempts', 'rush_yards', 'rush_touchdowns', 'rush_first_downs',
+    'rush_yards_after_contact', 'rush_broken_tackles', 'rush_tlost', 'scrambles',
+    'pass_attempts', 'pass_completions', 'pass_yards', 'pass_touchdowns',
+    'pass_interceptions', 'pass_air_yards', 'pass_on_target', 'pass_poorly_thrown',
+    'sacks_taken', 'sack_yards', 'avg_pocket_time', 'times_blitzed', 'times_hurried',
+    'targets', 'receptions', 'receiving_yards', 'receiving_touchdowns',
+    'yards_after_catch', 'drops',
+    'tackles', 'ast_tackles', 'missed_tackles', 'def_sacks', 'def_sack_yards',
+    'qb_hits', 'hurries', 'knockdowns', 'passes_defended',
+    'interceptions', 'int_yards', 'int_touchdowns',
+    'def_targets', 'def_completions_allowed', 'tackles_for_loss',
+    'fg_attempts', 'fg_made', 'fg_longest', 'xp_attempts', 'xp_made',
+    'kick_return_yards', 'punt_return_yards',
+    'team_points_scored', 'team_points_allowed', 'game_result',
+    'actual_impact_score', 'pff_grade', 'performance_multiplier',
+    'multiplier_components', 'nflverse_enriched',
+]
+
+# Written on insert but left alone on conflict (same as the old per-row upsert)
+_ENRICHED_INSERT_ONLY = {
+    'game_id', 'sportradar_game_id', 'player_id', 'team', 'season', 'week', 'pass_poorly_thrown',
+}
+_ENRICHED_KEY_INDEXES = (ENRICHED_COLUMNS.index('game_id'), ENRICHED_COLUMNS.index('player_id'))
+
+# Required stat keys (KeyError if the parser didn't set them); the rest are optional
+_ENRICHED_OPTIONAL = {
+    'sportradar_game_id', 'player_name', 'position', 'avg_pocket_time',
+    'team_points_scored', 'team_points_allowed', 'game_result',
+    'actual_impact_score', 'pff_grade', 'performance_multiplier',
+}
+
+
+def _enriched_row(p: Dict[str, Any]) -> tuple:
+    """One player dict → values in ENRICHED_COLUMNS order"""
+    row = []
+    for col in ENRICHED_COLUMNS:
+        if col == 'multiplier_components':
+            row.append(json.dumps(p.get('multiplier_components') or {}))
+        elif col == 'nflverse_enriched':
+            row.append(bool(p.get('nflverse_enriched', False)))
+        elif col in _ENRICHED_OPTIONAL:
+            row.append(p.get(col))
+        else:
+            row.append(p[col])
+    return tuple(row)
+
+
+def _dedupe_last(rows: List[tuple], key_indexes: tuple) -> List[tuple]:
+    """Keep the last row per key — ON CONFLICT can't touch a row twice in one statement"""
+    latest: Dict[tuple, tuple] = {}
+    for row in rows:
+        key = tuple(row[i] for i in key_indexes)
+        latest.pop(key, None)
+        latest[key] = row
+    return list(latest.values())
+
+
+def copy_text_value(value: Any) -> str:
+    """
+    Format one value for COPY's text format: NULL is \\N, booleans are t/f,
+    and backslash, tab, newline and carriage return are backslash-escaped
+    
+    Each Lambda deploys alone, so this function is copied into
+    pff-etl-lambdas/base_pff_etl.py, PredictiveDataModel/GameIdMapper/DatabaseUtils.py
+    and PlayerImpactProcessor/DatabaseUtils.py.
+    PredictiveDataModel/PFFLambda/DatabaseUtils.py holds the one to copy;
+    change it there and paste it over the others byte-for-byte.
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, str):
+        return (value.replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return str(value)
+
+
+def _rows_to_copy_text(rows: List[tuple]) -> io.StringIO:
+    buffer = io.StringIO()
+    buffer.writelines('\t'.join(map(copy_text_value, row)) + '\n' for row in rows)
+    buffer.seek(0)
+    return buffer
+
+
 class DatabaseUtils:
     def __init__(self):
         self.host     = (os.environ.get('SUPABASE_DB_HOST') or os.environ.get('DB_HOST', '')).strip()
@@ -32,6 +129,12 @@ class DatabaseUtils:
             raise ValueError("Missing required database environment variables")
 
         self.connection: Optional[pg8000.Connection] = None
+        # Season PFF grade indexes; _run_pipeline shares one cache across workers
+        self.pff_index = PFFGradeIndexCache()
+        # Season player crosswalks; shared across workers the same way
+        self.crosswalks = PlayerCrosswalkCache()
+        # {(season, limit): {pff_team: [starter, ...]}} — see get_ol_starters
+        self._ol_starters: Dict[tuple, Dict[str, List[Dict[str, Any]]]] = {}
 
     def connect(self) -> pg8000.Connection:
         if self.connection is not None:
@@ -101,44 +204,114 @@ class DatabaseUtils:
     # ── PFF grade lookup ──────────────────────────────────────────────────────
 
     def fetch_pff_grades_bulk(self, player_names: List[str], season: int) -> Dict[str, float]:
+        """
+        {player_name: grade} from the season's PFFGradeIndex — loaded once per
+        season and shared with the other workers of the run (self.pff_index).
+        """
         if not player_names:
             return {}
 
-        conn     = self.connect()
-        cursor   = conn.cursor()
-        name_set = set(player_names)
+        index = self._pff_season_index(season)
+        if index is None:
+            return {}
+
+        result = index.grades_for(player_names)
+        logger.info(
+            "PFF grade lookup: %d/%d players matched for season %d",
+            len(result), len(set(player_names)), season,
+        )
+        return result
+
+    def fetch_pff_grades_by_id(self, pff_ids: List[str], season: int) -> Dict[str, float]:
+        """{pff_player_id: grade} from the same season index (crosswalk-resolved players)"""
+        if not pff_ids:
+            return {}
+        index = self._pff_season_index(season)
+        return index.grades_for_ids(pff_ids) if index is not None else {}
 
+    def _pff_season_index(self, season: int) -> Optional[PFFGradeIndex]:
         try:
-            sql = """
-                SELECT player, grades_offense FROM qb_pff_ratings    WHERE season = %s
-                UNION ALL
-                SELECT player, grades_offense FROM rb_pff_ratings    WHERE season = %s
-                UNION ALL
-                SELECT player, grades_offense FROM wr_pff_ratings    WHERE season = %s
-                UNION ALL
-                SELECT player, grades_offense FROM oline_pff_ratings WHERE season = %s
-                UNION ALL
-                SELECT player, grades_defense FROM defense_pff_ratings WHERE season = %s
-            """
-            cursor.execute(sql, (season, season, season, season, season))
-
-            result: Dict[str, float] = {}
-            for row in cursor.fetchall():
-                name, grade = row[0], row[1]
-                if name in name_set and name not in result and grade is not None:
-                    result[name] = float(grade)
+            return self.pff_index.get(season, lambda s: PFFGradeIndex.load(self, s))
+        except Exception as e:
+            logger.warning("PFF grade index load failed: %s", e)
+            self._reset_connection()
+            return None
 
-            logger.info(
-                "PFF grade lookup: %d/%d players matched for season %d",
-                len(result), len(name_set), season,
-            )
-            return result
+    # ── Player crosswalk ──────────────────────────────────────────────────────
+
+    def resolve_player_ids(self, players: List[Dict[str, Any]], season: int) -> Optional[PlayerCrosswalk]:
+        """
+        The season's PlayerCrosswalk (loaded once per run and shared through
+        self.crosswalks), extended with any of `players` it has not seen.
+        None when player_crosswalk cannot be read — callers match on names.
+        """
+        try:
+            crosswalk = self.crosswalks.get(season, lambda s: PlayerCrosswalk.load(self, s))
+            crosswalk.extend(self, players)
+            return crosswalk
         except Exception as e:
-            logger.warning("PFF grade bulk lookup failed: %s", e)
-            return {}
+            logger.warning("Player crosswalk unavailable for season %d: %s", season, e)
+            self._reset_connection()
+            return None
+
+    def build_player_crosswalk(self, season: int) -> int:
+        """Bulk-(re)resolve every player of a season; returns crosswalk rows"""
+        crosswalk = PlayerCrosswalk.build(self, season)
+        self.crosswalks.put(crosswalk)
+        return len(crosswalk)
+
+    def upsert_player_crosswalk(self, rows: List[tuple], overwrite: bool = False) -> int:
+        """
+        Write CROSSWALK_COLUMNS rows through a staging table in one
+        transaction. overwrite=True re-resolves existing (sportradar_id,
+        season, team) rows; otherwise only their NULL ids (and methods) are
+        filled in, and ids already written are kept.
+        """
+        if not rows:
+            return 0
+
+        col_list = ', '.join(CROSSWALK_COLUMNS)
+        if overwrite:
+            on_conflict = "DO UPDATE SET " + ", ".join(
+                f"{c} = EXCLUDED.{c}" for c in CROSSWALK_UPDATE_COLUMNS
+            ) + ", updated_at = CURRENT_TIMESTAMP"
+        else:
+            on_conflict = "DO UPDATE SET " + ", ".join(
+                f"{c} = COALESCE(player_crosswalk.{c}, EXCLUDED.{c}), "
+                f"{m} = CASE WHEN player_crosswalk.{c} IS NULL THEN EXCLUDED.{m} ELSE player_crosswalk.{m} END"
+                for c, m in CROSSWALK_ID_COLUMNS
+            ) + ", updated_at = CURRENT_TIMESTAMP WHERE " + " OR ".join(
+                f"(player_crosswalk.{c} IS NULL AND EXCLUDED.{c} IS NOT NULL)"
+                for c, _ in CROSSWALK_ID_COLUMNS
+            )
+
+        conn   = self.connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN")
+            cursor.execute(
+                f"CREATE TEMP TABLE _stage_player_crosswalk ON COMMIT DROP AS "
+                f"SELECT {col_list} FROM player_crosswalk WITH NO DATA"
+            )
+            cursor.execute(
+                f"COPY _stage_player_crosswalk ({col_list}) FROM STDIN",
+                stream=_rows_to_copy_text(rows),
+            )
+            cursor.execute(f"""
+                INSERT INTO player_crosswalk ({col_list})
+                SELECT {col_list} FROM _stage_player_crosswalk
+                ON CONFLICT (sportradar_id, season, team) {on_conflict}
+            """)
+            cursor.execute("COMMIT")
+        except Exception:
+            try:
+                cursor.execute("ROLLBACK")
+            except Exception:
+                pass
+            raise
         finally:
             cursor.close()
-            self._reset_connection()
+        return len(rows)
 
     # ── player_game_stats (enriched) ──────────────────────────────────────────
 
@@ -146,146 +319,59 @@ class DatabaseUtils:
         """
         UPSERT player rows including new multiplier_components (JSONB) and
         nflverse_enriched (BOOLEAN) columns added by migrate_game_id_mapping.sql.
+
+        All rows (one game, or several games' worth) go through one staging
+        table in one transaction: COPY into a temp table shaped like
+        player_game_stats, then a single INSERT … SELECT … ON CONFLICT.
+        Duplicate (game_id, player_id) keys keep the last row, as the old
+        row-by-row upserts did.
         Returns number of rows upserted.
         """
         if not players:
             return 0
 
+        staged = _dedupe_last([_enriched_row(p) for p in players], _ENRICHED_KEY_INDEXES)
+        col_list    = ', '.join(ENRICHED_COLUMNS)
+        update_cols = ',\n                '.join(
+            f"{c} = EXCLUDED.{c}" for c in ENRICHED_COLUMNS if c not in _ENRICHED_INSERT_ONLY
+        )
+
         conn   = self.connect()
         cursor = conn.cursor()
-        count  = 0
-
-        sql = """
-            INSERT INTO player_game_stats (
-                game_id, sportradar_game_id, player_id, player_name,
-                team, position, season, week,
-                rush_attempts, rush_yards, rush_touchdowns, rush_first_downs,
-                rush_yards_after_contact, rush_broken_tackles, rush_tlost, scrambles,
-                pass_attempts, pass_completions, pass_yards, pass_touchdowns,
-                pass_interceptions, pass_air_yards, pass_on_target, pass_poorly_thrown,
-                sacks_taken, sack_yards, avg_pocket_time, times_blitzed, times_hurried,
-                targets, receptions, receiving_yards, receiving_touchdowns,
-                yards_after_catch, drops,
-                tackles, ast_tackles, missed_tackles, def_sacks, def_sack_yards,
-                qb_hits, hurries, knockdowns, passes_defended,
-                interceptions, int_yards, int_touchdowns,
-                def_targets, def_completions_allowed, tackles_for_loss,
-                fg_attempts, fg_made, fg_longest, xp_attempts, xp_made,
-                kick_return_yards, punt_return_yards,
-                team_points_scored, team_points_allowed, game_result,
-                actual_impact_score, pff_grade, performance_multiplier,
-                multiplier_components, nflverse_enriched
-            ) VALUES (
-                %s,%s,%s,%s, %s,%s,%s,%s,
-                %s,%s,%s,%s, %s,%s,%s,%s,
-                %s,%s,%s,%s, %s,%s,%s,%s,
-                %s,%s,%s,%s,%s,
-                %s,%s,%s,%s, %s,%s,
-                %s,%s,%s,%s,%s,
-                %s,%s,%s,%s,
-                %s,%s,%s,
-                %s,%s,%s,
-                %s,%s,%s,%s,%s,
-                %s,%s,
-                %s,%s,%s,
-                %s,%s,%s,
-                %s,%s
-            )
-            ON CONFLICT (game_id, player_id) DO UPDATE SET
-                player_name              = EXCLUDED.player_name,
-                position                 = EXCLUDED.position,
-                rush_attempts            = EXCLUDED.rush_attempts,
-                rush_yards               = EXCLUDED.rush_yards,
-                rush_touchdowns          = EXCLUDED.rush_touchdowns,
-                rush_first_downs         = EXCLUDED.rush_first_downs,
-                rush_yards_after_contact = EXCLUDED.rush_yards_after_contact,
-                rush_broken_tackles      = EXCLUDED.rush_broken_tackles,
-                rush_tlost               = EXCLUDED.rush_tlost,
-                scrambles                = EXCLUDED.scrambles,
-                pass_attempts            = EXCLUDED.pass_attempts,
-                pass_completions         = EXCLUDED.pass_completions,
-                pass_yards               = EXCLUDED.pass_yards,
-                pass_touchdowns          = EXCLUDED.pass_touchdowns,
-                pass_interceptions       = EXCLUDED.pass_interceptions,
-                pass_air_yards           = EXCLUDED.pass_air_yards,
-                pass_on_target           = EXCLUDED.pass_on_target,
-                sacks_taken              = EXCLUDED.sacks_taken,
-                sack_yards               = EXCLUDED.sack_yards,
-                avg_pocket_time          = EXCLUDED.avg_pocket_time,
-                times_blitzed            = EXCLUDED.times_blitzed,
-                times_hurried            = EXCLUDED.times_hurried,
-                targets                  = EXCLUDED.targets,
-                receptions               = EXCLUDED.receptions,
-                receiving_yards          = EXCLUDED.receiving_yards,
-                receiving_touchdowns     = EXCLUDED.receiving_touchdowns,
-                yards_after_catch        = EXCLUDED.yards_after_catch,
-                drops                    = EXCLUDED.drops,
-                tackles                  = EXCLUDED.tackles,
-                ast_tackles              = EXCLUDED.ast_tackles,
-                missed_tackles           = EXCLUDED.missed_tackles,
-                def_sacks                = EXCLUDED.def_sacks,
-                def_sack_yards           = EXCLUDED.def_sack_yards,
-                qb_hits                  = EXCLUDED.qb_hits,
-                hurries                  = EXCLUDED.hurries,
-                knockdowns               = EXCLUDED.knockdowns,
-                passes_defended          = EXCLUDED.passes_defended,
-                interceptions            = EXCLUDED.interceptions,
-                int_yards                = EXCLUDED.int_yards,
-                int_touchdowns           = EXCLUDED.int_touchdowns,
-                def_targets              = EXCLUDED.def_targets,
-                def_completions_allowed  = EXCLUDED.def_completions_allowed,
-                tackles_for_loss         = EXCLUDED.tackles_for_loss,
-                fg_attempts              = EXCLUDED.fg_attempts,
-                fg_made                  = EXCLUDED.fg_made,
-                fg_longest               = EXCLUDED.fg_longest,
-                xp_attempts              = EXCLUDED.xp_attempts,
-                xp_made                  = EXCLUDED.xp_made,
-                kick_return_yards        = EXCLUDED.kick_return_yards,
-                punt_return_yards        = EXCLUDED.punt_return_yards,
-                team_points_scored       = EXCLUDED.team_points_scored,
-                team_points_allowed      = EXCLUDED.team_points_allowed,
-                game_result              = EXCLUDED.game_result,
-                actual_impact_score      = EXCLUDED.actual_impact_score,
-                pff_grade                = EXCLUDED.pff_grade,
-                performance_multiplier   = EXCLUDED.performance_multiplier,
-                multiplier_components    = EXCLUDED.multiplier_components,
-                nflverse_enriched        = EXCLUDED.nflverse_enriched,
-                updated_at               = CURRENT_TIMESTAMP
-        """
-
         try:
-            for p in players:
-                mc_json = json.dumps(p.get('multiplier_components') or {})
-                cursor.execute(sql, (
-                    p['game_id'], p.get('sportradar_game_id'), p['player_id'], p.get('player_name'),
-                    p['team'], p.get('position'), p['season'], p['week'],
-                    p['rush_attempts'], p['rush_yards'], p['rush_touchdowns'], p['rush_first_downs'],
-                    p['rush_yards_after_contact'], p['rush_broken_tackles'], p['rush_tlost'], p['scrambles'],
-                    p['pass_attempts'], p['pass_completions'], p['pass_yards'], p['pass_touchdowns'],
-                    p['pass_interceptions'], p['pass_air_yards'], p['pass_on_target'], p['pass_poorly_thrown'],
-                    p['sacks_taken'], p['sack_yards'], p.get('avg_pocket_time'), p['times_blitzed'], p['times_hurried'],
-                    p['targets'], p['receptions'], p['receiving_yards'], p['receiving_touchdowns'],
-                    p['yards_after_catch'], p['drops'],
-                    p['tackles'], p['ast_tackles'], p['missed_tackles'], p['def_sacks'], p['def_sack_yards'],
-                    p['qb_hits'], p['hurries'], p['knockdowns'], p['passes_defended'],
-                    p['interceptions'], p['int_yards'], p['int_touchdowns'],
-                    p['def_targets'], p['def_completions_allowed'], p['tackles_for_loss'],
-                    p['fg_attempts'], p['fg_made'], p['fg_longest'], p['xp_attempts'], p['xp_made'],
-                    p['kick_return_yards'], p['punt_return_yards'],
-                    p.get('team_points_scored'), p.get('team_points_allowed'), p.get('game_result'),
-                    p.get('actual_impact_score'),
-                    p.get('pff_grade'),
-                    p.get('performance_multiplier'),
-                    mc_json,
-                    bool(p.get('nflverse_enriched', False)),
-                ))
-                count += 1
-
-            logger.info("Upserted %d enriched player rows for %s", count, players[0]['game_id'])
-            return count
+            cursor.execute("BEGIN")   # autocommit connection: ON COMMIT DROP needs an open transaction
+            cursor.execute(
+                f"CREATE TEMP TABLE _stage_player_game_stats ON COMMIT DROP AS "
+                f"SELECT {col_list} FROM player_game_stats WITH NO DATA"
+            )
+            cursor.execute(
+                f"COPY _stage_player_game_stats ({col_list}) FROM STDIN",
+                stream=_rows_to_copy_text(staged),
+            )
+            cursor.execute(f"""
+                INSERT INTO player_game_stats ({col_list})
+                SELECT {col_list} FROM _stage_player_game_stats
+                ON CONFLICT (game_id, player_id) DO UPDATE SET
+                {update_cols},
+                updated_at = CURRENT_TIMESTAMP
+            """)
+            cursor.execute("COMMIT")
+        except Exception:
+            try:
+                cursor.execute("ROLLBACK")
+            except Exception:
+                pass
+            raise
         finally:
             cursor.close()
 
+        game_ids = {row[0] for row in staged}
+        logger.info(
+            "Upserted %d enriched player rows for %s",
+            len(staged), players[0]['game_id'] if len(game_ids) == 1 else f"{len(game_ids)} games",
+        )
+        return len(staged)
+
     # ── game_id_mapping — enriched impact write ───────────────────────────────
 
     def update_game_with_enriched_impact(
@@ -480,8 +566,28 @@ class DatabaseUtils:
         Return top-`limit` OL starters for `team` in `season` from oline_pff_ratings,
         ordered by snap_counts_offense DESC.  Filters to position IN ('T','G','C').
         Returns [] if no data found.
+
+        The first call for a season loads every team's starters in one query;
+        later calls (every other game of the season) are dictionary hits.
         """
         pff_team = self._GIM_TO_PFF.get(team, team)
+        key      = (season, limit)
+        if key not in self._ol_starters:
+            try:
+                self._ol_starters[key] = self._load_ol_starters(season, limit)
+            except Exception as e:
+                logger.warning("get_ol_starters failed for %s %d: %s", team, season, e)
+                return []
+
+        result = self._ol_starters[key].get(pff_team, [])
+        logger.info(
+            "OL starters %s %d: %d found (queried as %s)",
+            team, season, len(result), pff_team,
+        )
+        return result
+
+    def _load_ol_starters(self, season: int, limit: int) -> Dict[str, List[Dict[str, Any]]]:
+        """{pff_team: top-`limit` starters} for one season"""
         conn   = self.connect()
         cursor = conn.cursor()
         try:
@@ -491,26 +597,25 @@ class DatabaseUtils:
                        grades_offense, grades_pass_block, grades_run_block,
                        snap_counts_offense, player_game_count,
                        sacks_allowed, hurries_allowed, pressures_allowed, penalties
-                FROM oline_pff_ratings
-                WHERE team_name = %s
-                  AND season    = %s
-                  AND position IN ('T', 'G', 'C')
-                ORDER BY snap_counts_offense DESC
-                LIMIT %s
+                FROM (
+                    SELECT *,
+                           ROW_NUMBER() OVER (PARTITION BY team_name
+                                              ORDER BY snap_counts_offense DESC) AS snap_rank
+                    FROM oline_pff_ratings
+                    WHERE season   = %s
+                      AND position IN ('T', 'G', 'C')
+                ) ranked
+                WHERE snap_rank <= %s
+                ORDER BY team_name, snap_rank
                 """,
-                [pff_team, season, limit],
+                [season, limit],
             )
             cols = [d[0] for d in cursor.description]
-            rows = cursor.fetchall()
-            result = [dict(zip(cols, r)) for r in rows]
-            logger.info(
-                "OL starters %s %d: %d found (queried as %s)",
-                team, season, len(result), pff_team,
-            )
-            return result
-        except Exception as e:
-            logger.warning("get_ol_starters failed for %s %d: %s", team, season, e)
-            return []
+            starters: Dict[str, List[Dict[str, Any]]] = {}
+            for row in cursor.fetchall():
+                d = dict(zip(cols, row))
+                starters.setdefault(d['team_name'], []).append(d)
+            return starters
         finally:
             cursor.close()
 
@@ -518,13 +623,15 @@ class DatabaseUtils:
         self, team: str, season: int, before_week: Optional[int] = None
     ) -> Dict[str, float]:
         """
-        Compute team's season-to-date averages for the OL proxy baseline:
+        Team's season-to-date averages for the OL proxy baseline:
           - avg_sack_rate          (total sacks / (atts + sacks) across all QB games)
           - avg_ypc                (total rush_yards / total carries across all RB games)
           - avg_rush_epa_per_carry (total rushing_epa / total carries from RB games)
 
-        Queries nflverse_qb_stats and nflverse_rb_stats.
-        If before_week is set, only games with week < before_week are included
+        One primary-key lookup in team_week_cumulative (season-to-date
+        nflverse_qb_stats / nflverse_rb_stats totals per team and week,
+        maintained by NflverseIntegration).
+        If before_week is set, the latest row with week < before_week is used
         (prevents data leakage for in-season processing).
         Falls back to league-average constants when no data found.
         """
@@ -541,46 +648,32 @@ class DatabaseUtils:
         week_param = [before_week] if (before_week and before_week > 1) else []
 
         try:
-            # QB sack rate
             cursor.execute(
                 f"""
-                SELECT COALESCE(SUM(attempts),         0),
-                       COALESCE(SUM(sacks_suffered),   0)
-                FROM nflverse_qb_stats
-                WHERE team = %s AND season = %s {week_sql}
+                SELECT attempts, sacks, carries, rushing_yards, rushing_epa
+                FROM team_week_cumulative
+                WHERE season = %s AND team = %s {week_sql}
+                ORDER BY week DESC
+                LIMIT 1
                 """,
-                [team, season] + week_param,
+                [season, team] + week_param,
+            )
+            row = cursor.fetchone() or (0, 0, 0, 0, 0)
+            total_atts, total_sacks, total_carries, total_rush_yds, total_rush_epa = (
+                float(v or 0) for v in row
             )
-            qb_row  = cursor.fetchone()
-            total_atts   = float(qb_row[0])
-            total_sacks  = float(qb_row[1])
-            sack_rate    = (
+
+            sack_rate   = (
                 total_sacks / (total_atts + total_sacks)
                 if (total_atts + total_sacks) > 0
                 else FALLBACK['avg_sack_rate']
             )
-
-            # RB rushing stats
-            cursor.execute(
-                f"""
-                SELECT COALESCE(SUM(carries),       0),
-                       COALESCE(SUM(rushing_yards), 0),
-                       COALESCE(SUM(rushing_epa),   0)
-                FROM nflverse_rb_stats
-                WHERE team = %s AND season = %s {week_sql}
-                """,
-                [team, season] + week_param,
-            )
-            rb_row       = cursor.fetchone()
-            total_carries    = float(rb_row[0])
-            total_rush_yds   = float(rb_row[1])
-            total_rush_epa   = float(rb_row[2])
-            ypc              = (
+            ypc         = (
                 total_rush_yds / total_carries
                 if total_carries > 0
                 else FALLBACK['avg_ypc']
             )
-            rush_epa_pc      = (
+            rush_epa_pc = (
                 total_rush_epa / total_carries
                 if total_carries > 0
                 else FALLBACK['avg_rush_epa_per_carry']
@@ -17,6 +17,8 @@ Enhancements over BoxScoreCollector:
   - Position group breakdowns: offense_impact, defense_impact, ol_impact
   - Per-player multiplier_components dict stored for JSONB enrichment
   - Returns 4-tuple: (actual, expected, position_groups, player_details)
+  - calc_game_impacts / calc_game_impacts_batch score both teams of one or
+    many games from a single split of each player list
 """
 import logging
 from typing import Dict, List, Optional, Tuple, Any
@@ -769,6 +771,69 @@ def calc_ol_team_proxy_multiplier(
     return round(team_proxy, 4), components
 
 
+# Aggregation slot per position: (position weight, group bucket). The bucket
+# indexes the offense / OL / defense sums; None = counted in totals only.
+_OFF_BUCKET, _OL_BUCKET, _DEF_BUCKET = 0, 1, 2
+
+
+def _bucket(pos: str) -> Optional[int]:
+    if pos in _QB_POS or pos in _RB_POS or pos in _SKILL_POS:
+        return _OFF_BUCKET
+    if pos in _OL_POS:
+        return _OL_BUCKET
+    if pos in _DEF_POS:
+        return _DEF_BUCKET
+    return None
+
+
+_POSITION_SLOTS: Dict[str, Tuple[float, Optional[int]]] = {
+    pos: (POSITION_WEIGHTS.get(pos, 0.5), _bucket(pos))
+    for pos in set(POSITION_WEIGHTS) | _QB_POS | _RB_POS | _SKILL_POS | _OL_POS | _DEF_POS
+}
+_UNSLOTTED = (0.5, None)
+
+# Sportradar stat fields of an injected OL entry — all zero except pocket time
+_INJECTED_OL_STATS: Dict[str, Any] = {
+    'rush_attempts': 0, 'rush_yards': 0, 'rush_touchdowns': 0,
+    'rush_first_downs': 0, 'rush_yards_after_contact': 0,
+    'rush_broken_tackles': 0, 'rush_tlost': 0, 'scrambles': 0,
+    'pass_attempts': 0, 'pass_completions': 0, 'pass_yards': 0,
+    'pass_touchdowns': 0, 'pass_interceptions': 0,
+    'pass_air_yards': 0, 'pass_on_target': 0, 'pass_poorly_thrown': 0,
+    'sacks_taken': 0, 'sack_yards': 0, 'avg_pocket_time': None,
+    'times_blitzed': 0, 'times_hurried': 0,
+    'targets': 0, 'receptions': 0, 'receiving_yards': 0,
+    'receiving_touchdowns': 0, 'yards_after_catch': 0, 'drops': 0,
+    'tackles': 0, 'ast_tackles': 0, 'missed_tackles': 0,
+    'def_sacks': 0, 'def_sack_yards': 0, 'qb_hits': 0,
+    'hurries': 0, 'knockdowns': 0, 'passes_defended': 0,
+    'interceptions': 0, 'int_yards': 0, 'int_touchdowns': 0,
+    'def_targets': 0, 'def_completions_allowed': 0, 'tackles_for_loss': 0,
+    'fg_attempts': 0, 'fg_made': 0, 'fg_longest': 0,
+    'xp_attempts': 0, 'xp_made': 0,
+    'kick_return_yards': 0, 'punt_return_yards': 0,
+}
+
+
+def _split_by_team(players: List[Dict]) -> Dict[str, List[Dict]]:
+    """{TEAM: [player, ...]} in box-score order — one pass for both teams"""
+    by_team: Dict[str, List[Dict]] = {}
+    for p in players:
+        by_team.setdefault((p.get('team') or '').upper(), []).append(p)
+    return by_team
+
+
+def _ordered_sum(values: List[float]) -> float:
+    """
+    Left-to-right float sum. builtins.sum() switched to compensated summation
+    in Python 3.12, which would move results in the last bits.
+    """
+    total = 0.0
+    for v in values:
+        total += v
+    return total
+
+
 def calc_team_impacts(
     players: List[Dict],
     team: str,
@@ -813,8 +878,72 @@ def calc_team_impacts(
         Pass 2 — compute OL multipliers for any Sportradar OL rows (rare).
         OL Injection — inject synthetic OL entries from oline_pff_ratings using
                        calc_ol_team_proxy_multiplier (same multiplier for all 5 starters).
+
+    Scoring a whole game? calc_game_impacts splits the players by team once;
+    calc_game_impacts_batch does the same for many games.
     """
     team_players = [p for p in players if (p.get('team') or '').upper() == team.upper()]
+    return _team_impacts(team, team_players, player_baselines, nflverse_data, ol_starters, team_season_avgs)
+
+
+def calc_game_impacts(
+    players: List[Dict],
+    home: str,
+    away: str,
+    player_baselines: Optional[Dict[str, Dict]] = None,
+    nflverse_data: Optional[Dict[str, Dict]] = None,
+    home_ol_starters: Optional[List[Dict]] = None,
+    away_ol_starters: Optional[List[Dict]] = None,
+    home_season_avgs: Optional[Dict] = None,
+    away_season_avgs: Optional[Dict] = None,
+) -> Tuple[Tuple, Tuple]:
+    """
+    calc_team_impacts for both teams of one game, from a single split of the
+    player list. Returns (home 4-tuple, away 4-tuple) — identical to two
+    calc_team_impacts calls, with the same side effects on the player dicts.
+    """
+    by_team = _split_by_team(players)
+    return (
+        _team_impacts(home, by_team.get(home.upper(), []), player_baselines, nflverse_data,
+                      home_ol_starters, home_season_avgs),
+        _team_impacts(away, by_team.get(away.upper(), []), player_baselines, nflverse_data,
+                      away_ol_starters, away_season_avgs),
+    )
+
+
+def calc_game_impacts_batch(games: List[Dict[str, Any]]) -> List[Dict[str, Tuple]]:
+    """
+    Team impacts for many games at once (backfills, re-scoring a week).
+
+    Each game is a dict with 'players', 'home_team', 'away_team' and
+    optionally 'player_baselines', 'nflverse_data', 'home_ol_starters',
+    'away_ol_starters', 'home_season_avgs', 'away_season_avgs' (the
+    calc_game_impacts arguments). Returns [{'home': 4-tuple, 'away': 4-tuple}]
+    in input order.
+    """
+    results: List[Dict[str, Tuple]] = []
+    for game in games:
+        home_result, away_result = calc_game_impacts(
+            game['players'], game['home_team'], game['away_team'],
+            game.get('player_baselines'), game.get('nflverse_data'),
+            game.get('home_ol_starters'), game.get('away_ol_starters'),
+            game.get('home_season_avgs'), game.get('away_season_avgs'),
+        )
+        results.append({'home': home_result, 'away': away_result})
+    return results
+
+
+def _team_impacts(
+    team: str,
+    team_players: List[Dict],
+    player_baselines: Optional[Dict[str, Dict]],
+    nflverse_data: Optional[Dict[str, Dict]],
+    ol_starters: Optional[List[Dict]],
+    team_season_avgs: Optional[Dict],
+) -> Tuple[float, float, Dict[str, float], List[Dict]]:
+    """calc_team_impacts on a team's players (already filtered, box-score order)"""
+    team_players = list(team_players)
+    positions    = [(p.get('position') or '').upper() for p in team_players]
     baselines    = player_baselines or {}
     nflverse     = nflverse_data or {}
 
@@ -824,8 +953,7 @@ def calc_team_impacts(
     team_rb_carries       = 0.0
     team_rb_rushing_epa   = 0.0
 
-    for p in team_players:
-        pos = (p.get('position') or '').upper()
+    for p, pos in zip(team_players, positions):
         if pos in _OL_POS:
             continue  # handled in pass 2
 
@@ -877,7 +1005,7 @@ def calc_team_impacts(
     )
 
     # Build base YPC from player_baselines for team RBs
-    rb_players     = [p for p in team_players if (p.get('position') or '').upper() in _RB_POS]
+    rb_players     = [p for p, pos in zip(team_players, positions) if pos in _RB_POS]
     base_rb_yards  = 0.0
     base_rb_carries = 0.0
     base_rb_rush_epa = 0.0
@@ -925,8 +1053,7 @@ def calc_team_impacts(
     ol_base_arg = ol_nv_base if team_qb_ctx else None
 
     # ── PASS 2: OL ───────────────────────────────────────────────────────────
-    for p in team_players:
-        pos = (p.get('position') or '').upper()
+    for p, pos in zip(team_players, positions):
         if pos not in _OL_POS:
             continue
 
@@ -982,27 +1109,10 @@ def calc_team_impacts(
                     'position_weight':  ol_weight,
                 },
                 'nflverse_enriched': True,
-                # Sportradar stat fields — all zero for injected OL
-                'rush_attempts': 0, 'rush_yards': 0, 'rush_touchdowns': 0,
-                'rush_first_downs': 0, 'rush_yards_after_contact': 0,
-                'rush_broken_tackles': 0, 'rush_tlost': 0, 'scrambles': 0,
-                'pass_attempts': 0, 'pass_completions': 0, 'pass_yards': 0,
-                'pass_touchdowns': 0, 'pass_interceptions': 0,
-                'pass_air_yards': 0, 'pass_on_target': 0, 'pass_poorly_thrown': 0,
-                'sacks_taken': 0, 'sack_yards': 0, 'avg_pocket_time': None,
-                'times_blitzed': 0, 'times_hurried': 0,
-                'targets': 0, 'receptions': 0, 'receiving_yards': 0,
-                'receiving_touchdowns': 0, 'yards_after_catch': 0, 'drops': 0,
-                'tackles': 0, 'ast_tackles': 0, 'missed_tackles': 0,
-                'def_sacks': 0, 'def_sack_yards': 0, 'qb_hits': 0,
-                'hurries': 0, 'knockdowns': 0, 'passes_defended': 0,
-                'interceptions': 0, 'int_yards': 0, 'int_touchdowns': 0,
-                'def_targets': 0, 'def_completions_allowed': 0, 'tackles_for_loss': 0,
-                'fg_attempts': 0, 'fg_made': 0, 'fg_longest': 0,
-                'xp_attempts': 0, 'xp_made': 0,
-                'kick_return_yards': 0, 'punt_return_yards': 0,
+                **_INJECTED_OL_STATS,
             }
             team_players.append(synthetic)
+            positions.append(ol_pos)
 
         logger.info(
             "%s OL injection: %d starters, proxy_mult=%.3f "
@@ -1015,40 +1125,41 @@ def calc_team_impacts(
         )
 
     # ── Aggregate: totals + position groups ──────────────────────────────────
-    total_actual   = 0.0
-    total_expected = 0.0
-    total_weight   = 0.0
+    # Column per quantity, one entry per player in team order. Sums run left
+    # to right in that order so results are bit-identical to a running total.
+    slots        = [_POSITION_SLOTS.get(pos, _UNSLOTTED) for pos in positions]
+    weights      = [slot[0] for slot in slots]
+    grades       = [float(p.get('pff_grade') or _DEFAULT_GRADE) for p in team_players]
+    multipliers  = [p.get('performance_multiplier', 1.0) for p in team_players]
+    expected_col = [g * w for g, w in zip(grades, weights)]
+    actual_col   = [e * m for e, m in zip(expected_col, multipliers)]
+
+    total_weight = _ordered_sum(weights)
+    if total_weight == 0:
+        logger.warning("No scorable players for %s", team)
+        return 0.0, 0.0, {}, []
 
-    off_actual = 0.0;  off_weight = 0.0
-    def_actual = 0.0;  def_weight = 0.0
-    ol_actual  = 0.0;  ol_weight  = 0.0
+    group_actual = [0.0, 0.0, 0.0]
+    group_weight = [0.0, 0.0, 0.0]
+    for (weight, bucket), actual_score in zip(slots, actual_col):
+        if bucket is not None:
+            group_actual[bucket] += actual_score
+            group_weight[bucket] += weight
 
-    player_details: List[Dict] = []
+    actual   = round(_ordered_sum(actual_col)   / total_weight, 4)
+    expected = round(_ordered_sum(expected_col) / total_weight, 4)
 
-    for p in team_players:
-        pos       = (p.get('position') or '').upper()
-        weight    = POSITION_WEIGHTS.get(pos, 0.5)
-        pff_grade = float(p.get('pff_grade') or _DEFAULT_GRADE)
-        multiplier = p.get('performance_multiplier', 1.0)
-
-        expected_score = pff_grade * weight
-        actual_score   = pff_grade * weight * multiplier
-
-        total_expected += expected_score
-        total_actual   += actual_score
-        total_weight   += weight
-
-        if pos in _QB_POS | _RB_POS | _SKILL_POS:
-            off_actual += actual_score
-            off_weight += weight
-        elif pos in _OL_POS:
-            ol_actual += actual_score
-            ol_weight += weight
-        elif pos in _DEF_POS:
-            def_actual += actual_score
-            def_weight += weight
-
-        player_details.append({
+    def _group_impact(bucket: int) -> float:
+        return round(group_actual[bucket] / group_weight[bucket], 4) if group_weight[bucket] > 0 else 0.0
+
+    position_groups = {
+        'offense_impact': _group_impact(_OFF_BUCKET),
+        'defense_impact': _group_impact(_DEF_BUCKET),
+        'ol_impact':      _group_impact(_OL_BUCKET),
+    }
+
+    player_details: List[Dict] = [
+        {
             'player_id':              p.get('player_id', ''),
             'player_name':            p.get('player_name', ''),
             'position':               pos,
@@ -1062,20 +1173,10 @@ def calc_team_impacts(
             'nflverse_enriched':      p.get('nflverse_enriched', False),
             'multiplier_components':  p.get('multiplier_components', {}),
             'source':                 p.get('source', 'sportradar'),
-        })
-
-    if total_weight == 0:
-        logger.warning("No scorable players for %s", team)
-        return 0.0, 0.0, {}, []
-
-    actual   = round(total_actual   / total_weight, 4)
-    expected = round(total_expected / total_weight, 4)
-
-    position_groups = {
-        'offense_impact': round(off_actual / off_weight, 4) if off_weight > 0 else 0.0,
-        'defense_impact': round(def_actual / def_weight, 4) if def_weight > 0 else 0.0,
-        'ol_impact':      round(ol_actual  / ol_weight,  4) if ol_weight  > 0 else 0.0,
-    }
+        }
+        for p, pos, pff_grade, weight, multiplier
+        in zip(team_players, positions, grades, weights, multipliers)
+    ]
 
     nflverse_enriched_count = sum(1 for d in player_details if d.get('nflverse_enriched'))
     logger.info(
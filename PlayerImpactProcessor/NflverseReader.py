@@ -3,7 +3,8 @@ NflverseReader.py — PlayerImpactProcessor
 ==========================================
 Reads nflverse per-game stats and rolling baselines from Supabase.
 Returns dicts keyed by normalised player display name so the orchestrator
-can match them against Sportradar player records.
+can match them against Sportradar player records. Each dict also carries the
+nflverse (gsis) id as '_player_id' for joins through player_crosswalk.
 
 Tables read (written by NflverseIntegration/NflverseDataFetcher.py):
     nflverse_qb_stats  — cpoe, passing_epa, passing_air_yards, sacks_suffered
@@ -15,10 +16,19 @@ Name normalisation
 Both nflverse and Sportradar use display names like "Patrick Mahomes".
 _norm() lowercases, strips punctuation, and drops common suffixes (Jr/Sr/II…)
 to maximise exact-match rate without needing fuzzy matching.
+
+Week memoization
+----------------
+Both reads depend only on (season, week), but games are processed one at a
+time. Readers that share a NflverseWeekCache load each week's game rows and
+baselines once (one connection each) and serve every game of that week from
+memory, so a 16-game week costs 2 connections instead of 32.
 """
 import logging
 import re
-from typing import Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -38,24 +48,80 @@ def _norm(name: str) -> str:
     return n
 
 
+# ── Week-scoped memo ──────────────────────────────────────────────────────────
+
+class NflverseWeekCache:
+    """
+    Thread-safe memo of {(kind, season, week): {norm_name: dict}} shared by
+    the NflverseReaders of one run (one per pipeline worker).
+
+    A per-key lock makes concurrent workers on the same week wait for a
+    single load instead of issuing duplicate queries. Only the most recent
+    `max_weeks` weeks are kept; games arrive grouped by week, so older weeks
+    are never asked for again.
+    """
+
+    def __init__(self, max_weeks: int = 4):
+        self.max_weeks = max_weeks
+        self._entries: 'OrderedDict[Tuple[str, int, int], Dict[str, Dict]]' = OrderedDict()
+        self._key_locks: Dict[Tuple[str, int, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.hits = 0
+
+    def get_or_load(self, kind: str, season: int, week: int,
+                    loader: Callable[[], Dict[str, Dict]]) -> Dict[str, Dict]:
+        key = (kind, season, week)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    self.hits += 1
+                    return self._entries[key]
+            value = loader()   # a failed load is not cached; the next game retries
+            with self._lock:
+                self.loads += 1
+                self._entries[key] = value
+                # kind × week entries: keep max_weeks weeks of both kinds
+                while len(self._entries) > self.max_weeks * 2:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._key_locks.pop(evicted, None)
+            return value
+
+
 # ── Reader class ──────────────────────────────────────────────────────────────
 
 class NflverseReader:
     """
     Reads nflverse stats from the three nflverse_*_stats tables.
     Accepts a DatabaseUtils instance for connection parameters.
-    Each method opens and closes its own connection to avoid state issues.
+    Each load opens and closes its own connection to avoid state issues.
+    With a shared NflverseWeekCache, each (season, week) is loaded once.
     """
 
-    def __init__(self, db: Any):
+    def __init__(self, db: Any, week_cache: Optional[NflverseWeekCache] = None):
         """
         db: DatabaseUtils instance — used for host/port/database/user/password only.
+        week_cache: optional memo shared between readers; None = query every call.
         """
         self._host     = db.host
         self._port     = db.port
         self._database = db.database
         self._user     = db.user
         self._password = db.password
+        self._week_cache = week_cache
+
+    def _memo(self, kind: str, season: int, week: int,
+              loader: Callable[[int, int], Dict[str, Dict]]) -> Dict[str, Dict]:
+        if self._week_cache is None:
+            return loader(season, week)
+        return self._week_cache.get_or_load(kind, season, week, lambda: loader(season, week))
 
     # ── Internal connection helper ────────────────────────────────────────────
 
@@ -81,8 +147,12 @@ class NflverseReader:
         in the given season + week.
 
         Keys in nv_game_dict match exactly what the enhanced multiplier
-        functions in GameImpactCalculator expect.
+        functions in GameImpactCalculator expect. The returned dict may be
+        shared with other games of the week — treat it as read-only.
         """
+        return self._memo('game', season, week, self._load_game_nflverse)
+
+    def _load_game_nflverse(self, season: int, week: int) -> Dict[str, Dict]:
         conn = self._connect()
         cur  = conn.cursor()
         result: Dict[str, Dict] = {}
@@ -91,7 +161,7 @@ class NflverseReader:
             # ── QB ─────────────────────────────────────────────────────────────
             cur.execute(
                 """
-                SELECT player_name,
+                SELECT player_name, player_id,
                     attempts, passing_air_yards, passing_epa, sacks_suffered,
                     cpoe, carries, rushing_yards, rushing_epa
                 FROM nflverse_qb_stats
@@ -104,21 +174,22 @@ class NflverseReader:
                 if not name:
                     continue
                 result[name] = {
-                    'attempts':          row[1],
-                    'passing_air_yards': row[2],
-                    'passing_epa':       float(row[3]) if row[3] is not None else 0.0,
-                    'sacks':             row[4],
-                    'cpoe':              float(row[5]) if row[5] is not None else 0.0,
-                    'carries':           row[6],
-                    'rushing_yards':     row[7],
-                    'rushing_epa':       float(row[8]) if row[8] is not None else 0.0,
+                    'attempts':          row[2],
+                    'passing_air_yards': row[3],
+                    'passing_epa':       float(row[4]) if row[4] is not None else 0.0,
+                    'sacks':             row[5],
+                    'cpoe':              float(row[6]) if row[6] is not None else 0.0,
+                    'carries':           row[7],
+                    'rushing_yards':     row[8],
+                    'rushing_epa':       float(row[9]) if row[9] is not None else 0.0,
+                    '_player_id':        row[1],
                     '_position_type':    'qb',
                 }
 
             # ── RB ─────────────────────────────────────────────────────────────
             cur.execute(
                 """
-                SELECT player_name,
+                SELECT player_name, player_id,
                     carries, rushing_epa, receiving_yards, receiving_tds,
                     rushing_first_downs, rushing_fumbles_lost, receiving_fumbles_lost
                 FROM nflverse_rb_stats
@@ -131,20 +202,21 @@ class NflverseReader:
                 if not name:
                     continue
                 result[name] = {
-                    'carries':                row[1],
-                    'rushing_epa':            float(row[2]) if row[2] is not None else 0.0,
-                    'receiving_yards':        row[3],
-                    'receiving_tds':          row[4],
-                    'rushing_first_downs':    row[5],
-                    'rushing_fumbles_lost':   row[6],
-                    'receiving_fumbles_lost': row[7],
+                    'carries':                row[2],
+                    'rushing_epa':            float(row[3]) if row[3] is not None else 0.0,
+                    'receiving_yards':        row[4],
+                    'receiving_tds':          row[5],
+                    'rushing_first_downs':    row[6],
+                    'rushing_fumbles_lost':   row[7],
+                    'receiving_fumbles_lost': row[8],
+                    '_player_id':             row[1],
                     '_position_type':         'rb',
                 }
 
             # ── WR / TE ────────────────────────────────────────────────────────
             cur.execute(
                 """
-                SELECT player_name,
+                SELECT player_name, player_id,
                     targets, receiving_epa, receiving_yards, receiving_tds,
                     receiving_first_downs, wopr, target_share,
                     receiving_fumbles_lost, receptions
@@ -158,15 +230,16 @@ class NflverseReader:
                 if not name:
                     continue
                 result[name] = {
-                    'targets':                row[1],
-                    'receiving_epa':          float(row[2]) if row[2] is not None else 0.0,
-                    'receiving_yards':        row[3],
-                    'receiving_tds':          row[4],
-                    'receiving_first_downs':  row[5],
-                    'wopr':                   float(row[6]) if row[6] is not None else 0.0,
-                    'target_share':           float(row[7]) if row[7] is not None else 0.0,
-                    'receiving_fumbles_lost': row[8],
-                    'receptions':             row[9],
+                    'targets':                row[2],
+                    'receiving_epa':          float(row[3]) if row[3] is not None else 0.0,
+                    'receiving_yards':        row[4],
+                    'receiving_tds':          row[5],
+                    'receiving_first_downs':  row[6],
+                    'wopr':                   float(row[7]) if row[7] is not None else 0.0,
+                    'target_share':           float(row[8]) if row[8] is not None else 0.0,
+                    'receiving_fumbles_lost': row[9],
+                    'receptions':             row[10],
+                    '_player_id':             row[1],
                     '_position_type':         'wr',
                 }
 
@@ -196,7 +269,9 @@ class NflverseReader:
         if week <= 1:
             logger.info("NflverseReader baselines: week=1, no prior data")
             return {}
+        return self._memo('baselines', season, week, self._load_nflverse_baselines)
 
+    def _load_nflverse_baselines(self, season: int, week: int) -> Dict[str, Dict]:
         conn = self._connect()
         cur  = conn.cursor()
         result: Dict[str, Dict] = {}
@@ -205,7 +280,7 @@ class NflverseReader:
             # ── QB baselines ───────────────────────────────────────────────────
             cur.execute(
                 """
-                SELECT player_name,
+                SELECT player_name, MAX(player_id) AS player_id,
                     AVG(cpoe::float)            AS avg_cpoe,
                     SUM(passing_air_yards)      AS total_air_yards,
                     SUM(attempts)               AS total_attempts,
@@ -222,18 +297,19 @@ class NflverseReader:
                 if not name:
                     continue
                 result[name] = {
-                    'cpoe':              float(row[1]) if row[1] is not None else 0.0,
-                    'passing_air_yards': int(row[2] or 0),
-                    'attempts':          int(row[3] or 0),
-                    'passing_epa':       float(row[4]) if row[4] is not None else 0.0,
-                    'sacks':             int(row[5] or 0),
+                    'cpoe':              float(row[2]) if row[2] is not None else 0.0,
+                    'passing_air_yards': int(row[3] or 0),
+                    'attempts':          int(row[4] or 0),
+                    'passing_epa':       float(row[5]) if row[5] is not None else 0.0,
+                    'sacks':             int(row[6] or 0),
+                    '_player_id':        row[1],
                     '_position_type':    'qb',
                 }
 
             # ── RB baselines ───────────────────────────────────────────────────
             cur.execute(
                 """
-                SELECT player_name,
+                SELECT player_name, MAX(player_id) AS player_id,
                     SUM(carries)                AS total_carries,
                     SUM(rushing_epa::float)     AS total_rushing_epa,
                     SUM(rushing_first_downs)    AS total_rushing_fds,
@@ -251,19 +327,20 @@ class NflverseReader:
                 if not name:
                     continue
                 result[name] = {
-                    'carries':               int(row[1] or 0),
-                    'rushing_epa':           float(row[2]) if row[2] is not None else 0.0,
-                    'rushing_first_downs':   int(row[3] or 0),
-                    'avg_receiving_yards':   float(row[4]) if row[4] is not None else 15.0,
-                    'rushing_fumbles_lost':  int(row[5] or 0),
-                    'receiving_fumbles_lost': int(row[6] or 0),
+                    'carries':               int(row[2] or 0),
+                    'rushing_epa':           float(row[3]) if row[3] is not None else 0.0,
+                    'rushing_first_downs':   int(row[4] or 0),
+                    'avg_receiving_yards':   float(row[5]) if row[5] is not None else 15.0,
+                    'rushing_fumbles_lost':  int(row[6] or 0),
+                    'receiving_fumbles_lost': int(row[7] or 0),
+                    '_player_id':            row[1],
                     '_position_type':        'rb',
                 }
 
             # ── WR/TE baselines ────────────────────────────────────────────────
             cur.execute(
                 """
-                SELECT player_name,
+                SELECT player_name, MAX(player_id) AS player_id,
                     SUM(receiving_epa::float)   AS total_recv_epa,
                     SUM(targets)                AS total_targets,
                     SUM(receiving_yards)        AS total_recv_yards,
@@ -283,14 +360,15 @@ class NflverseReader:
                 if not name:
                     continue
                 result[name] = {
-                    'receiving_epa':          float(row[1]) if row[1] is not None else 0.0,
-                    'targets':                int(row[2] or 0),
-                    'receiving_yards':        int(row[3] or 0),
-                    'receiving_first_downs':  int(row[4] or 0),
-                    'wopr':                   float(row[5]) if row[5] is not None else 0.0,
-                    'target_share':           float(row[6]) if row[6] is not None else 0.0,
-                    'receptions':             int(row[7] or 0),
-                    'receiving_fumbles_lost': int(row[8] or 0),
+                    'receiving_epa':          float(row[2]) if row[2] is not None else 0.0,
+                    'targets':                int(row[3] or 0),
+                    'receiving_yards':        int(row[4] or 0),
+                    'receiving_first_downs':  int(row[5] or 0),
+                    'wopr':                   float(row[6]) if row[6] is not None else 0.0,
+                    'target_share':           float(row[7]) if row[7] is not None else 0.0,
+                    'receptions':             int(row[8] or 0),
+                    'receiving_fumbles_lost': int(row[9] or 0),
+                    '_player_id':             row[1],
                     '_position_type':         'wr',
                 }
 
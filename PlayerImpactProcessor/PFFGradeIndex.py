@@ -0,0 +1,118 @@
+"""
+PFFGradeIndex.py — PlayerImpactProcessor
+=========================================
+Season-scoped, in-memory index of PFF grades from the five *_pff_ratings
+tables. Loaded with one query per season per run; every game's lookup is
+then a dictionary hit instead of a UNION ALL over all five tables.
+
+Matching rule (unchanged from the old per-game lookup)
+------------------------------------------------------
+  - exact player name
+  - tables in priority order qb → rb → wr → oline → defense
+    (offense grade for the first four, defense grade for defense)
+  - rows with a NULL grade are skipped, so a later table can still match
+
+grades_for_ids() serves players already resolved to a PFF player id
+through player_crosswalk (same priority order, no name matching).
+"""
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# (position group, table, team column, grade column) — priority order
+PFF_GRADE_SOURCES: List[Tuple[str, str, str, str]] = [
+    ('qb',      'qb_pff_ratings',      'team',      'grades_offense'),
+    ('rb',      'rb_pff_ratings',      'team_name', 'grades_offense'),
+    ('wr',      'wr_pff_ratings',      'team_name', 'grades_offense'),
+    ('oline',   'oline_pff_ratings',   'team_name', 'grades_offense'),
+    ('defense', 'defense_pff_ratings', 'team_name', 'grades_defense'),
+]
+
+# One row per (player, team) — (group, player, team, position, grade, pff player id)
+PFFRow = Tuple[str, str, Optional[str], Optional[str], Any, Optional[str]]
+
+
+def _season_sql() -> str:
+    parts = [
+        f"SELECT {i} AS src, player, {team_col} AS team, position, {grade_col} AS grade, "
+        f"player_id::text AS pff_id "
+        f"FROM {table} WHERE season = %s"
+        for i, (_, table, team_col, grade_col) in enumerate(PFF_GRADE_SOURCES)
+    ]
+    return "\nUNION ALL\n".join(parts) + "\nORDER BY src"
+
+
+class PFFGradeIndex:
+    """Grades for one season, indexed by exact name and by PFF player id"""
+
+    def __init__(self, season: int, rows: Iterable[PFFRow]):
+        """
+        rows: (group, player, team, position, grade, pff_id) in table-priority order.
+        """
+        self.season = season
+        self._by_name: Dict[str, float] = {}
+        self._by_id: Dict[str, float] = {}
+        self.rows = 0
+
+        for _group, player, _team, _position, grade, pff_id in rows:
+            self.rows += 1
+            if grade is None:
+                continue
+            grade = float(grade)
+            if pff_id is not None:
+                self._by_id.setdefault(pff_id, grade)
+            if player:
+                self._by_name.setdefault(player, grade)
+
+    @classmethod
+    def load(cls, db: Any, season: int) -> 'PFFGradeIndex':
+        """One UNION ALL over the five tables for the whole season"""
+        conn   = db.connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(_season_sql(), (season,) * len(PFF_GRADE_SOURCES))
+            groups = [src[0] for src in PFF_GRADE_SOURCES]
+            index  = cls(season, ((groups[r[0]], *r[1:]) for r in cursor.fetchall()))
+        finally:
+            cursor.close()
+        logger.info("PFF grade index season %d: %d rows, %d graded names",
+                    season, index.rows, len(index._by_name))
+        return index
+
+    def grades_for(self, player_names: List[str]) -> Dict[str, float]:
+        """{name: grade} for the names that match — same result as the per-game lookup"""
+        return {name: self._by_name[name] for name in set(player_names) if name in self._by_name}
+
+    def grades_for_ids(self, pff_ids: List[str]) -> Dict[str, float]:
+        """{pff_id: grade} for the PFF player ids that have a grade"""
+        return {i: self._by_id[i] for i in set(pff_ids) if i in self._by_id}
+
+
+class PFFGradeIndexCache:
+    """
+    {season: PFFGradeIndex} shared by the DatabaseUtils instances of one run.
+    A per-season lock makes concurrent workers wait for a single load.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[int, PFFGradeIndex] = {}
+        self._season_locks: Dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, season: int, loader: Callable[[int], PFFGradeIndex]) -> PFFGradeIndex:
+        with self._lock:
+            if season in self._indexes:
+                return self._indexes[season]
+            season_lock = self._season_locks.setdefault(season, threading.Lock())
+
+        with season_lock:
+            with self._lock:
+                if season in self._indexes:
+                    return self._indexes[season]
+            index = loader(season)   # a failed load is not cached; the next game retries
+            with self._lock:
+                self._indexes[season] = index
+            return index
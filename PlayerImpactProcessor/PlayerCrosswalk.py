@@ -0,0 +1,365 @@
+"""
+PlayerCrosswalk.py — PlayerImpactProcessor
+===========================================
+Sportradar player id → nflverse gsis id / PFF player id, persisted in
+player_crosswalk (create_player_crosswalk.sql) one row per team-season.
+
+Names are matched once, when a player is first seen, instead of on every
+game:
+  - build()  — bulk resolver: every Sportradar player of a season in
+               player_game_stats against every nflverse / PFF player of the
+               season, written in one staged upsert
+  - extend() — players a game brings that the crosswalk has not seen yet,
+               plus seen players still missing a gsis / PFF id (first seen
+               before their nflverse / PFF rows were loaded); resolved
+               against the same season candidates and upserted, filling
+               only NULL ids (ids already written are never overwritten)
+
+After that, nflverse rows and PFF grades are joined on ids. Players without
+an id for a source fall back to the name match for that source.
+
+Resolution (per source, first unambiguous tier wins)
+----------------------------------------------------
+  name_team     _norm(name) + team
+  name          _norm(name) + position group, one id in the whole season
+                (traded players whose team rows differ)
+  initial_team  first initial + last name + team + position group
+                ("P Mahomes" ↔ "Patrick Mahomes")
+
+The two fallbacks require the same position group (qb / rb / wr / oline /
+defense) so a defender never picks up an offensive namesake's id. Teams are
+compared on the nflverse/PFF abbreviations (canonical_team).
+"""
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from NflverseReader import _norm
+from PFFGradeIndex import PFF_GRADE_SOURCES
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+CROSSWALK_COLUMNS = [
+    'sportradar_id', 'season', 'team', 'player_name', 'norm_name', 'position',
+    'gsis_id', 'pff_player_id', 'gsis_method', 'pff_method',
+]
+# Re-resolved on a rebuild; the key and names stay as first written
+CROSSWALK_UPDATE_COLUMNS = ['position', 'gsis_id', 'pff_player_id', 'gsis_method', 'pff_method']
+# (id, method) pairs extend() fills in when they are still NULL
+CROSSWALK_ID_COLUMNS = [('gsis_id', 'gsis_method'), ('pff_player_id', 'pff_method')]
+
+# (position group, table)
+NFLVERSE_ID_TABLES = [
+    ('qb', 'nflverse_qb_stats'),
+    ('rb', 'nflverse_rb_stats'),
+    ('wr', 'nflverse_wr_stats'),
+]
+
+# Sportradar position → PFF_GRADE_SOURCES / NFLVERSE_ID_TABLES group
+_POSITION_GROUPS = {
+    'QB': 'qb',
+    'RB': 'rb', 'HB': 'rb', 'FB': 'rb',
+    'WR': 'wr', 'TE': 'wr',
+    **{pos: 'oline' for pos in ('LT', 'RT', 'LG', 'RG', 'C', 'OL', 'G', 'T')},
+    **{pos: 'defense' for pos in ('DE', 'DT', 'NT', 'EDGE', 'LB', 'ILB', 'OLB', 'MLB', 'DL',
+                                  'CB', 'S', 'FS', 'SS', 'DB', 'SAF')},
+}
+
+# Sportradar / game_id_mapping / legacy PFF abbreviations → nflverse/PFF
+_TEAM_ALIASES = {'JAC': 'JAX', 'LA': 'LAR', 'BLT': 'BAL', 'CLV': 'CLE', 'ARZ': 'ARI', 'HST': 'HOU'}
+
+# (source id, display name, team, position group)
+CandidateRow = Tuple[Any, Optional[str], Optional[str], str]
+
+
+def canonical_team(team: Optional[str]) -> str:
+    team = (team or '').upper()
+    return _TEAM_ALIASES.get(team, team)
+
+
+def position_group(position: Optional[str]) -> Optional[str]:
+    return _POSITION_GROUPS.get((position or '').upper())
+
+
+def _initial_key(norm: str) -> Optional[str]:
+    parts = norm.split(' ')
+    return f"{parts[0][0]} {parts[-1]}" if len(parts) > 1 and parts[0] else None
+
+
+class SourceIndex:
+    """One source's players for a season (nflverse gsis ids or PFF ids), by match tier"""
+
+    def __init__(self, rows: Iterable[CandidateRow]):
+        self._by_name_team: Dict[Tuple[str, str], Set[str]] = {}
+        self._by_name: Dict[Tuple[str, str], Set[str]] = {}
+        self._by_initial_team: Dict[Tuple[str, str, str], Set[str]] = {}
+        self.players = 0
+
+        for source_id, name, team, group in rows:
+            norm = _norm(name or '')
+            if source_id is None or not norm:
+                continue
+            source_id = str(source_id)
+            team = canonical_team(team)
+            self._by_name_team.setdefault((norm, team), set()).add(source_id)
+            self._by_name.setdefault((norm, group), set()).add(source_id)
+            initial = _initial_key(norm)
+            if initial:
+                self._by_initial_team.setdefault((initial, team, group), set()).add(source_id)
+        self.players = len({i for ids in self._by_name.values() for i in ids})
+
+    def match(self, norm: str, team: str, group: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """(source id, tier) or (None, None) when no tier has exactly one id"""
+        tiers = (
+            ('name_team',    self._by_name_team,    (norm, team)),
+            ('name',         self._by_name,         (norm, group)),
+            ('initial_team', self._by_initial_team, (_initial_key(norm), team, group)),
+        )
+        for method, index, key in tiers:
+            ids = index.get(key)
+            if ids and len(ids) == 1:
+                return next(iter(ids)), method
+        return None, None
+
+
+def resolve_players(
+    players: Iterable[Dict[str, Any]],
+    season: int,
+    nflverse: SourceIndex,
+    pff: SourceIndex,
+) -> List[tuple]:
+    """
+    Crosswalk rows (CROSSWALK_COLUMNS order) for Sportradar players —
+    dicts with player_id, player_name, team, position. One row per
+    (player_id, team); later duplicates are dropped.
+    """
+    rows: List[tuple] = []
+    seen: Set[Tuple[str, str]] = set()
+    for p in players:
+        sportradar_id = p.get('player_id')
+        team = canonical_team(p.get('team'))
+        if not sportradar_id or (sportradar_id, team) in seen:
+            continue
+        seen.add((sportradar_id, team))
+        norm  = _norm(p.get('player_name') or '')
+        group = position_group(p.get('position'))
+        gsis_id, gsis_method = nflverse.match(norm, team, group) if norm else (None, None)
+        pff_id, pff_method   = pff.match(norm, team, group) if norm else (None, None)
+        rows.append((
+            sportradar_id, season, team, p.get('player_name'), norm, p.get('position'),
+            gsis_id, pff_id, gsis_method, pff_method,
+        ))
+    return rows
+
+
+def _nflverse_sql() -> str:
+    return "\nUNION\n".join(
+        f"SELECT player_id, player_name, team, '{group}' FROM {table} "
+        f"WHERE season = %s AND player_id IS NOT NULL"
+        for group, table in NFLVERSE_ID_TABLES
+    )
+
+
+def _pff_sql() -> str:
+    return "\nUNION\n".join(
+        f"SELECT player_id::text, player, {team_col}, '{group}' FROM {table} "
+        f"WHERE season = %s AND player_id IS NOT NULL"
+        for group, table, team_col, _ in PFF_GRADE_SOURCES
+    )
+
+
+def load_sources(db: Any, season: int) -> Tuple[SourceIndex, SourceIndex]:
+    """(nflverse, PFF) candidates for a season — two queries"""
+    cursor = db.connect().cursor()
+    try:
+        cursor.execute(_nflverse_sql(), (season,) * len(NFLVERSE_ID_TABLES))
+        nflverse = SourceIndex(cursor.fetchall())
+        cursor.execute(_pff_sql(), (season,) * len(PFF_GRADE_SOURCES))
+        pff = SourceIndex(cursor.fetchall())
+    finally:
+        cursor.close()
+    logger.info("Crosswalk sources season %d: %d nflverse, %d PFF players",
+                season, nflverse.players, pff.players)
+    return nflverse, pff
+
+
+class PlayerCrosswalk:
+    """One season of player_crosswalk in memory"""
+
+    def __init__(self, season: int, rows: Iterable[tuple]):
+        """rows: CROSSWALK_COLUMNS tuples"""
+        self.season = season
+        self._rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._by_sportradar: Dict[str, Dict[str, Any]] = {}
+        self._sources: Optional[Tuple[SourceIndex, SourceIndex]] = None
+        # Keys already resolved against self._sources - not retried this run
+        self._checked: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self._add(rows)
+
+    def _add(self, rows: Iterable[tuple]):
+        for row in rows:
+            entry = dict(zip(CROSSWALK_COLUMNS, row))
+            self._rows[(entry['sportradar_id'], entry['team'])] = dict(entry)
+            previous = self._by_sportradar.get(entry['sportradar_id'])
+            # A traded player has a row per team; keep ids from any row that has them
+            if previous:
+                entry['gsis_id'] = entry['gsis_id'] or previous['gsis_id']
+                entry['pff_player_id'] = entry['pff_player_id'] or previous['pff_player_id']
+            self._by_sportradar[entry['sportradar_id']] = entry
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, sportradar_id: str) -> bool:
+        """Has a crosswalk row (its ids may still be NULL)"""
+        return sportradar_id in self._by_sportradar
+
+    @classmethod
+    def load(cls, db: Any, season: int) -> 'PlayerCrosswalk':
+        """Every player_crosswalk row of the season — one query"""
+        cursor = db.connect().cursor()
+        try:
+            cursor.execute(
+                f"SELECT {', '.join(CROSSWALK_COLUMNS)} FROM player_crosswalk "
+                f"WHERE season = %s ORDER BY updated_at",
+                (season,),
+            )
+            crosswalk = cls(season, cursor.fetchall())
+        finally:
+            cursor.close()
+        logger.info("Player crosswalk season %d: %d rows", season, len(crosswalk))
+        return crosswalk
+
+    @classmethod
+    def build(cls, db: Any, season: int) -> 'PlayerCrosswalk':
+        """
+        Bulk resolver: every Sportradar player of the season in
+        player_game_stats, resolved and upserted in one statement. Re-running
+        re-resolves existing rows (e.g. after new nflverse/PFF loads).
+        """
+        cursor = db.connect().cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT DISTINCT ON (player_id, team) player_id, player_name, team, position
+                FROM player_game_stats
+                WHERE season = %s
+                ORDER BY player_id, team, week DESC
+                """,
+                (season,),
+            )
+            players = [
+                {'player_id': r[0], 'player_name': r[1], 'team': r[2], 'position': r[3]}
+                for r in cursor.fetchall()
+            ]
+        finally:
+            cursor.close()
+
+        sources = load_sources(db, season)
+        rows = resolve_players(players, season, *sources)
+        db.upsert_player_crosswalk(rows, overwrite=True)
+
+        crosswalk = cls(season, rows)
+        crosswalk._sources = sources
+        crosswalk._checked = set(crosswalk._rows)
+        logger.info(
+            "Player crosswalk season %d built: %d rows, %d gsis ids, %d PFF ids",
+            season, len(rows), sum(1 for r in rows if r[6]), sum(1 for r in rows if r[7]),
+        )
+        return crosswalk
+
+    def missing(self, players: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Players whose (sportradar_id, team) has no crosswalk row yet"""
+        return [
+            p for p in players
+            if p.get('player_id') and (p['player_id'], canonical_team(p.get('team'))) not in self._rows
+        ]
+
+    def unresolved(self, players: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Players with a crosswalk row missing an id, not yet retried against the loaded candidates"""
+        out = []
+        for p in players:
+            key = (p.get('player_id'), canonical_team(p.get('team')))
+            row = self._rows.get(key)
+            if row and key not in self._checked and any(row[c] is None for c, _ in CROSSWALK_ID_COLUMNS):
+                out.append(p)
+        return out
+
+    def _filled(self, row: tuple) -> Optional[tuple]:
+        """The stored row with its NULL ids taken from a re-resolved row, or None if nothing new"""
+        resolved = dict(zip(CROSSWALK_COLUMNS, row))
+        entry = dict(self._rows[(resolved['sportradar_id'], resolved['team'])])
+        changed = False
+        for id_col, method_col in CROSSWALK_ID_COLUMNS:
+            if entry[id_col] is None and resolved[id_col] is not None:
+                entry[id_col], entry[method_col] = resolved[id_col], resolved[method_col]
+                changed = True
+        return tuple(entry[c] for c in CROSSWALK_COLUMNS) if changed else None
+
+    def extend(self, db: Any, players: Iterable[Dict[str, Any]]) -> int:
+        """
+        Resolve and insert the players not in the crosswalk yet, and retry
+        players whose ids are still NULL (once per loaded set of candidates,
+        so nflverse / PFF data loaded since the row was written is picked
+        up). Season candidates are loaded on the first call and kept.
+        Returns rows added or filled in.
+        """
+        with self._lock:
+            players = list(players)
+            unseen = self.missing(players)
+            retry  = self.unresolved(players)
+            if not unseen and not retry:
+                return 0
+            if self._sources is None:
+                self._sources = load_sources(db, self.season)
+            rows   = resolve_players(unseen, self.season, *self._sources)
+            filled = [r for r in map(self._filled, resolve_players(retry, self.season, *self._sources)) if r]
+            db.upsert_player_crosswalk(rows + filled, overwrite=False)
+            self._add(rows + filled)
+            self._checked.update((r[0], r[2]) for r in rows)
+            self._checked.update((p['player_id'], canonical_team(p.get('team'))) for p in retry)
+        if rows or filled:
+            logger.info("Player crosswalk season %d: added %d players, filled ids for %d",
+                        self.season, len(rows), len(filled))
+        return len(rows) + len(filled)
+
+    def gsis_id(self, sportradar_id: str) -> Optional[str]:
+        entry = self._by_sportradar.get(sportradar_id)
+        return entry['gsis_id'] if entry else None
+
+    def pff_player_id(self, sportradar_id: str) -> Optional[str]:
+        entry = self._by_sportradar.get(sportradar_id)
+        return entry['pff_player_id'] if entry else None
+
+
+class PlayerCrosswalkCache:
+    """
+    {season: PlayerCrosswalk} shared by the DatabaseUtils instances of one
+    run. A per-season lock makes concurrent workers wait for a single load.
+    """
+
+    def __init__(self):
+        self._crosswalks: Dict[int, PlayerCrosswalk] = {}
+        self._season_locks: Dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, season: int, loader: Callable[[int], PlayerCrosswalk]) -> PlayerCrosswalk:
+        with self._lock:
+            if season in self._crosswalks:
+                return self._crosswalks[season]
+            season_lock = self._season_locks.setdefault(season, threading.Lock())
+
+        with season_lock:
+            with self._lock:
+                if season in self._crosswalks:
+                    return self._crosswalks[season]
+            crosswalk = loader(season)   # a failed load is not cached; the next game retries
+            with self._lock:
+                self._crosswalks[season] = crosswalk
+            return crosswalk
+
+    def put(self, crosswalk: PlayerCrosswalk):
+        with self._lock:
+            self._crosswalks[crosswalk.season] = crosswalk
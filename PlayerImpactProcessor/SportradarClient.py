@@ -6,29 +6,224 @@ Handles:
 - Injury reports
 - Game rosters (active/inactive status)
 - Player profiles
+
+Responses are cached on disk (see SportradarCache): final game payloads are
+never requested twice. Requests share one keep-alive session and one
+token-bucket rate limiter per process (or one bucket across processes when
+SPORTRADAR_RATE_LIMIT_FILE is set). SPORTRADAR_MODE=replay serves a local
+fixture corpus instead of the network (see SportradarFixtures).
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Union
+from SportradarCache import ResponseCache
+from SportradarFixtures import REPLAY, build_session, transport_mode
+
+try:
+    import fcntl   # POSIX only; FileTokenBucket is unavailable without it
+except ImportError:
+    fcntl = None
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Plan quota (trial: 1 request/second). Override per deployment:
+#   SPORTRADAR_RATE_LIMIT_QPS    sustained requests per second
+#   SPORTRADAR_RATE_LIMIT_BURST  requests allowed back-to-back before waiting
+#   SPORTRADAR_RATE_LIMIT_FILE   state file shared by worker processes (optional)
+DEFAULT_RATE_LIMIT_QPS = 1.0
+DEFAULT_RATE_LIMIT_BURST = 1
+
+# Status codes retried with backoff (Retry-After honoured when present)
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+MAX_BACKOFF_SECONDS = 60
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter
+
+    Holds up to `capacity` tokens, refilled at `rate` tokens/second.
+    acquire() only sleeps when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Take tokens, sleeping until they are available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                wait = max(self.blocked_until - now, (tokens - self.tokens) / self.rate)
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float):
+        """Block every caller for `seconds` (server asked us to back off)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens = 0
+            self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in a small file guarded by flock, so
+    several processes on one host (e.g. a backfill process pool) share one
+    budget. Same acquire()/pause() contract as TokenBucket. Needs fcntl
+    (POSIX); get_shared_rate_limiter falls back to TokenBucket without it.
+    """
+
+    def __init__(self, path: str, rate: float, capacity: float = 1):
+        if fcntl is None:
+            raise RuntimeError("FileTokenBucket needs fcntl, which this platform does not provide")
+        super().__init__(rate, capacity)
+        self.path = path
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        os.close(fd)
+
+    def _update(self, take: float, pause: float = 0.0) -> float:
+        """Under the file lock: refill, then take tokens or return seconds to wait"""
+        with open(self.path, 'r+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                raw = f.read().split()
+                tokens, updated, blocked_until = (
+                    (float(raw[0]), float(raw[1]), float(raw[2])) if len(raw) == 3
+                    else (self.capacity, now, 0.0)
+                )
+                tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate)
+                wait = 0.0
+                if pause:
+                    tokens, blocked_until = 0.0, max(blocked_until, now + pause)
+                elif now >= blocked_until and tokens >= take:
+                    tokens -= take
+                else:
+                    wait = max(blocked_until - now, (take - tokens) / self.rate)
+                f.seek(0)
+                f.truncate()
+                f.write(f"{tokens} {now} {blocked_until}")
+                f.flush()   # before the lock is released
+                return wait
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def acquire(self, tokens: float = 1) -> float:
+        waited = 0.0
+        while True:
+            wait = self._update(tokens)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float):
+        self._update(0, pause=seconds)
+
+
+_shared_lock = threading.Lock()
+_shared_session: Optional[requests.Session] = None
+_shared_limiter: Optional[TokenBucket] = None
+
+
+def get_shared_session() -> requests.Session:
+    """Process-wide keep-alive session (connection pool reused across clients)"""
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _shared_session = session
+        return _shared_session
+
+
+def get_shared_rate_limiter() -> TokenBucket:
+    """Process-wide token bucket sized from SPORTRADAR_RATE_LIMIT_* env vars"""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            rate = float(os.environ.get('SPORTRADAR_RATE_LIMIT_QPS', DEFAULT_RATE_LIMIT_QPS))
+            burst = float(os.environ.get('SPORTRADAR_RATE_LIMIT_BURST', DEFAULT_RATE_LIMIT_BURST))
+            path = os.environ.get('SPORTRADAR_RATE_LIMIT_FILE', '').strip()
+            if path and fcntl is None:
+                logger.warning(f"SPORTRADAR_RATE_LIMIT_FILE={path} ignored: no fcntl on this platform, "
+                               "rate limiting per process instead")
+                path = ''
+            _shared_limiter = FileTokenBucket(path, rate, burst) if path else TokenBucket(rate, burst)
+            logger.info(f"Sportradar rate limit: {rate} req/s (burst {burst:g})"
+                        + (f" shared via {path}" if path else ""))
+        return _shared_limiter
+
+
+def reset_shared_state():
+    """Drop the inherited session/limiter in a forked worker process (rebuilt on next use)"""
+    global _shared_session, _shared_limiter
+    with _shared_lock:
+        _shared_session = None
+        _shared_limiter = None
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date)"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
 
 class SportradarClient:
     """Client for interacting with Sportradar NFL API"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache: Union[ResponseCache, bool, None] = None,
+                 rate_limiter: Optional[TokenBucket] = None, session: Optional[requests.Session] = None):
         """
         Initialize Sportradar API client
         
         Args:
             api_key: Sportradar API key (if None, reads from SPORTRADAR_API_KEY env var)
+            cache: Response cache (if None, built from SPORTRADAR_CACHE* env vars;
+                   False disables caching)
+            rate_limiter: Token bucket (if None, the process-wide shared one)
+            session: HTTP session (if None, the process-wide keep-alive session,
+                     or the record/replay transport selected by SPORTRADAR_MODE)
         """
         self.api_key = api_key or os.environ.get('SPORTRADAR_API_KEY')
+        if not self.api_key and transport_mode() == REPLAY:
+            self.api_key = 'replay'  # fixtures need no credentials
         self.base_url = os.environ.get(
             'SPORTRADAR_BASE_URL',
             'https://api.sportradar.com/nfl/official/trial/v7/en'
@@ -37,9 +232,14 @@ class SportradarClient:
         if not self.api_key:
             raise ValueError("SPORTRADAR_API_KEY not provided and environment variable not set")
         
-        # Rate limiting: Sportradar allows 1 request per second on trial
-        self.min_request_interval = 1.0  # seconds
-        self.last_request_time = 0
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.session = session or build_session(get_shared_session())
+        if cache is False:
+            self.cache = None
+        else:
+            self.cache = cache or ResponseCache.from_env()
+        # Replay/record fixtures and other hosts never share cache entries with live
+        self.cache_scope = f"{transport_mode()} {self.base_url}"
         
         logger.info("SportradarClient initialized")
     
@@ -75,33 +275,35 @@ class SportradarClient:
         logger.info(f"Fetching injuries: {season} {season_type} Week {week}")
         return self._make_request(endpoint)
     
-    def get_game_roster(self, game_id: str) -> Dict[str, Any]:
+    def get_game_roster(self, game_id: str, fresh: bool = False) -> Dict[str, Any]:
         """
         Fetch game roster showing who was active/inactive for a specific game
         
         Args:
             game_id: Sportradar game UUID
+            fresh: Skip the response cache (re-fetch after a stat correction)
             
         Returns:
             dict: Game roster with home/away teams and player statuses
         """
         endpoint = f"/games/{game_id}/roster.json"
         logger.info(f"Fetching game roster: {game_id}")
-        return self._make_request(endpoint)
+        return self._make_request(endpoint, fresh=fresh)
     
-    def get_game_statistics(self, game_id: str) -> Dict[str, Any]:
+    def get_game_statistics(self, game_id: str, fresh: bool = False) -> Dict[str, Any]:
         """
         Fetch game statistics showing who actually played and their stats
         
         Args:
             game_id: Sportradar game UUID
+            fresh: Skip the response cache (re-fetch after a stat correction)
             
         Returns:
             dict: Game statistics with home/away player stats by category
         """
         endpoint = f"/games/{game_id}/statistics.json"
         logger.info(f"Fetching game statistics: {game_id}")
-        return self._make_request(endpoint)
+        return self._make_request(endpoint, fresh=fresh)
     
     def get_team_roster(self, team_id: str, season: int = 2025) -> Dict[str, Any]:
         """
@@ -132,7 +334,8 @@ class SportradarClient:
         logger.info(f"Fetching player profile: {player_id}")
         return self._make_request(endpoint)
     
-    def get_weekly_schedule(self, season: int, week: int, season_type: str = 'REG') -> Dict[str, Any]:
+    def get_weekly_schedule(self, season: int, week: int, season_type: str = 'REG',
+                            fresh: bool = False) -> Dict[str, Any]:
         """
         Fetch all games scheduled for a specific week
         
@@ -142,6 +345,7 @@ class SportradarClient:
             season: Year (e.g., 2025)
             week: Week number (1-18 for REG, 1-4 for POST)
             season_type: 'REG' (regular season) or 'POST' (playoffs)
+            fresh: Skip the response cache (status polling)
             
         Returns:
             dict: Weekly schedule with all games, including game_ids, teams, scores
@@ -163,36 +367,38 @@ class SportradarClient:
         """
         endpoint = f"/seasons/{season}/{season_type}/{week}/schedule.json"
         logger.info(f"Fetching weekly schedule: {season} {season_type} Week {week}")
-        return self._make_request(endpoint)
+        return self._make_request(endpoint, fresh=fresh)
     
-    def get_season_schedule(self, season: int, season_type: str = 'REG') -> Dict[str, Any]:
+    def get_season_schedule(self, season: int, season_type: str = 'REG', fresh: bool = False) -> Dict[str, Any]:
         """
         Fetch complete season schedule
         
         Args:
             season: Year (e.g., 2025)
             season_type: 'REG' or 'POST'
+            fresh: Skip the response cache (status polling)
             
         Returns:
             dict: Full season schedule with all weeks and games
         """
         endpoint = f"/seasons/{season}/{season_type}/schedule.json"
         logger.info(f"Fetching season schedule: {season} {season_type}")
-        return self._make_request(endpoint)
+        return self._make_request(endpoint, fresh=fresh)
     
-    def get_game_summary(self, game_id: str) -> Dict[str, Any]:
+    def get_game_summary(self, game_id: str, fresh: bool = False) -> Dict[str, Any]:
         """
         Fetch game summary (boxscore, final stats)
         
         Args:
             game_id: Sportradar game UUID
+            fresh: Skip the response cache (re-fetch after a stat correction)
             
         Returns:
             dict: Game summary with final score, team stats, player stats
         """
         endpoint = f"/games/{game_id}/summary.json"
         logger.info(f"Fetching game summary: {game_id}")
-        return self._make_request(endpoint)
+        return self._make_request(endpoint, fresh=fresh)
     
     def get_standings(self, season: int, season_type: str = 'REG') -> Dict[str, Any]:
         """
@@ -209,13 +415,25 @@ class SportradarClient:
         logger.info(f"Fetching standings: {season} {season_type}")
         return self._make_request(endpoint)
     
-    def _make_request(self, endpoint: str, max_retries: int = 5) -> Dict[str, Any]:
+    def _make_request(self, endpoint: str, max_retries: int = 5,
+                      params: Optional[Dict[str, Any]] = None, fresh: bool = False) -> Dict[str, Any]:
         """
-        Make GET request to Sportradar API with rate limiting and retry on 429.
+        Make GET request to Sportradar API with rate limiting and retries.
 
-        Retries with exponential backoff: 2s, 4s, 8s, 16s, 32s.
+        Served from the response cache when possible (no request, no token used);
+        fresh=True always hits the API (the response is still cached).
+        Each attempt takes a token from the shared bucket. 429/5xx responses are
+        retried after the server's Retry-After, or exponential backoff
+        (2s, 4s, 8s, ... capped at 60s) when the header is missing; a 429 also
+        pauses the shared bucket so concurrent callers back off together.
         If all retries exhausted, raises the last exception.
         """
+        if self.cache and not fresh:
+            cached = self.cache.get(endpoint, params, self.cache_scope)
+            if cached is not None:
+                logger.info(f"Cache hit: {endpoint}")
+                return cached
+
         url = f"{self.base_url}{endpoint}"
         headers = {
             'accept': 'application/json',
@@ -223,37 +441,43 @@ class SportradarClient:
         }
 
         for attempt in range(max_retries + 1):
-            # Rate limiting: ensure minimum gap between requests
-            time_since_last = time.time() - self.last_request_time
-            if time_since_last < self.min_request_interval:
-                time.sleep(self.min_request_interval - time_since_last)
+            self.rate_limiter.acquire()
 
             try:
                 logger.info(f"API call (attempt {attempt + 1}): {url}")
-                response = requests.get(url, headers=headers, timeout=30)
-                self.last_request_time = time.time()
+                response = self.session.get(url, headers=headers, params=params, timeout=30)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Request Error: {e}")
+                raise
 
+            if response.status_code in RETRY_STATUS_CODES and attempt < max_retries:
+                retry_after = _retry_after_seconds(response)
+                backoff = retry_after if retry_after is not None else 2 ** (attempt + 1)
+                backoff = min(backoff, MAX_BACKOFF_SECONDS)
                 if response.status_code == 429:
-                    if attempt < max_retries:
-                        backoff = 2 ** (attempt + 1)  # 2, 4, 8, 16, 32 seconds
-                        logger.warning(f"429 Too Many Requests - backing off {backoff}s (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(backoff)
-                        continue
-                    else:
-                        logger.error(f"429 persists after {max_retries} retries - quota likely exhausted")
-                        response.raise_for_status()
+                    self.rate_limiter.pause(backoff)
+                logger.warning(
+                    f"{response.status_code} from Sportradar - backing off {backoff:.1f}s "
+                    f"(attempt {attempt + 1}/{max_retries}, Retry-After={response.headers.get('Retry-After')})"
+                )
+                if response.status_code != 429:
+                    time.sleep(backoff)
+                continue
 
+            try:
                 response.raise_for_status()
-                logger.info(f"Success: {response.status_code}")
-                return response.json()
-
             except requests.exceptions.HTTPError:
-                if response.status_code != 429:
+                if response.status_code == 429:
+                    logger.error(f"429 persists after {max_retries} retries - quota likely exhausted")
+                else:
                     logger.error(f"HTTP Error: {response.status_code} - {response.text[:200]}")
                 raise
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request Error: {e}")
-                raise
+
+            logger.info(f"Success: {response.status_code}")
+            payload = response.json()
+            if self.cache:
+                self.cache.put(endpoint, params, payload, self.cache_scope)
+            return payload
 
 
 # Test the client
@@ -0,0 +1,502 @@
+"""
+SportradarFixtures - Offline record/replay transport for SportradarClient
+
+Lets PlayerImpactProcessor, BoxScoreCollector and PFFGameProcessor run end to
+end without Sportradar credentials or network (benchmarks, offline CI).
+
+Configuration (environment):
+    SPORTRADAR_MODE              live (default) | record | replay
+    SPORTRADAR_FIXTURES_DIR      fixture corpus (default ../fixtures/sportradar)
+    SPORTRADAR_SYNTHETIC         replay: generate payloads missing from the corpus
+                                 (default on; 'off' returns 404 instead)
+    SPORTRADAR_REPLAY_LATENCY    replay: seconds added per response (default 0)
+    SPORTRADAR_RECORD_ANONYMIZE  record: replace player names (default on)
+
+Corpus layout mirrors the API path, e.g.
+    fixtures/sportradar/seasons/2024/REG/1/schedule.json
+    fixtures/sportradar/games/<game_id>/statistics.json
+
+The synthetic generator builds full seasons (272 games, 18 weeks) with
+deterministic ids, teams, scores and box scores:
+    python SportradarFixtures.py generate --season 2024 --weeks 1 --out ../fixtures/sportradar
+    python SportradarFixtures.py anonymize ../fixtures/sportradar
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+LIVE, RECORD, REPLAY = 'live', 'record', 'replay'
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'fixtures', 'sportradar')
+
+# Stable namespace so synthetic ids are identical on every machine
+SYNTHETIC_NAMESPACE = uuid.UUID('6f1d3c1e-9a0b-4c55-8f3e-2b7d0e5a9c41')
+
+TEAMS = [
+    ('ARI', 'Arizona', 'Cardinals'), ('ATL', 'Atlanta', 'Falcons'), ('BAL', 'Baltimore', 'Ravens'),
+    ('BUF', 'Buffalo', 'Bills'), ('CAR', 'Carolina', 'Panthers'), ('CHI', 'Chicago', 'Bears'),
+    ('CIN', 'Cincinnati', 'Bengals'), ('CLE', 'Cleveland', 'Browns'), ('DAL', 'Dallas', 'Cowboys'),
+    ('DEN', 'Denver', 'Broncos'), ('DET', 'Detroit', 'Lions'), ('GB', 'Green Bay', 'Packers'),
+    ('HOU', 'Houston', 'Texans'), ('IND', 'Indianapolis', 'Colts'), ('JAC', 'Jacksonville', 'Jaguars'),
+    ('KC', 'Kansas City', 'Chiefs'), ('LA', 'Los Angeles', 'Rams'), ('LAC', 'Los Angeles', 'Chargers'),
+    ('LV', 'Las Vegas', 'Raiders'), ('MIA', 'Miami', 'Dolphins'), ('MIN', 'Minnesota', 'Vikings'),
+    ('NE', 'New England', 'Patriots'), ('NO', 'New Orleans', 'Saints'), ('NYG', 'New York', 'Giants'),
+    ('NYJ', 'New York', 'Jets'), ('PHI', 'Philadelphia', 'Eagles'), ('PIT', 'Pittsburgh', 'Steelers'),
+    ('SEA', 'Seattle', 'Seahawks'), ('SF', 'San Francisco', '49ers'), ('TB', 'Tampa Bay', 'Buccaneers'),
+    ('TEN', 'Tennessee', 'Titans'), ('WAS', 'Washington', 'Commanders'),
+]
+TEAM_INFO = {alias: (market, name) for alias, market, name in TEAMS}
+
+# Games per week: 16, with 1-2 bye pairs mid-season -> 272 games over 18 weeks
+GAMES_PER_WEEK = {w: 16 for w in range(1, 19)}
+GAMES_PER_WEEK.update({w: 15 for w in (5, 7, 9, 11, 13, 15)})
+GAMES_PER_WEEK.update({w: 14 for w in (6, 8, 10, 12, 14)})
+
+# Roster slots per team: (slot, position)
+ROSTER_SLOTS = (
+    [('QB1', 'QB'), ('RB1', 'RB'), ('RB2', 'RB'), ('WR1', 'WR'), ('WR2', 'WR'), ('WR3', 'WR'), ('TE1', 'TE')]
+    + [(f'OL{n}', pos) for n, pos in enumerate(('LT', 'LG', 'C', 'RG', 'RT'), 1)]
+    + [('DE1', 'DE'), ('DE2', 'DE'), ('DT1', 'DT'), ('DT2', 'DT'), ('LB1', 'LB'), ('LB2', 'LB'), ('LB3', 'LB')]
+    + [('CB1', 'CB'), ('CB2', 'CB'), ('SS1', 'SAF'), ('FS1', 'SAF'), ('K1', 'K')]
+)
+
+# Seasons indexed on first lookup of an unknown game id
+DEFAULT_SYNTHETIC_SEASONS = tuple(range(2018, 2027))
+
+PERSON_NAME_KEYS = ('name', 'full_name', 'first_name', 'last_name', 'preferred_name')
+
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+def transport_mode() -> str:
+    """SPORTRADAR_MODE, validated"""
+    mode = os.environ.get('SPORTRADAR_MODE', LIVE).strip().lower() or LIVE
+    if mode not in (LIVE, RECORD, REPLAY):
+        raise ValueError(f"SPORTRADAR_MODE must be live, record or replay, got {mode!r}")
+    return mode
+
+
+def fixtures_dir() -> str:
+    return os.environ.get('SPORTRADAR_FIXTURES_DIR', DEFAULT_FIXTURES_DIR).strip()
+
+
+def build_session(live_session: requests.Session) -> Any:
+    """
+    Session-like object for the configured mode:
+    the live session itself, a recorder wrapping it, or a replay session.
+    """
+    mode = transport_mode()
+    if mode == LIVE:
+        return live_session
+
+    store = FixtureStore(fixtures_dir())
+    if mode == RECORD:
+        anonymize = os.environ.get('SPORTRADAR_RECORD_ANONYMIZE', 'on').strip().lower() not in ('off', 'false', '0')
+        logger.info(f"Sportradar transport: recording to {store.root} (anonymize={anonymize})")
+        return RecordingSession(live_session, store, anonymize=anonymize)
+
+    synthetic = os.environ.get('SPORTRADAR_SYNTHETIC', 'on').strip().lower() not in ('off', 'false', '0')
+    latency = float(os.environ.get('SPORTRADAR_REPLAY_LATENCY', 0))
+    logger.info(f"Sportradar transport: replaying {store.root} (synthetic={synthetic}, latency={latency}s)")
+    return ReplaySession(store, synthetic=SyntheticSportradar() if synthetic else None, latency=latency)
+
+
+# ---------------------------------------------------------------------------
+# Fixture corpus on disk
+# ---------------------------------------------------------------------------
+
+class FixtureStore:
+    """JSON payloads stored under root/<api path>"""
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+
+    def path_for(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        relative = endpoint.lstrip('/')
+        if params:
+            digest = hashlib.sha256(json.dumps(sorted(params.items()), default=str).encode()).hexdigest()[:12]
+            base, ext = os.path.splitext(relative)
+            relative = f"{base}.{digest}{ext}"
+        return os.path.join(self.root, *relative.split('/'))
+
+    def load(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        path = self.path_for(endpoint, params)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def save(self, endpoint: str, params: Optional[Dict[str, Any]], payload: Dict[str, Any]):
+        path = self.path_for(endpoint, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=1, sort_keys=True)
+
+
+def _endpoint_from_url(url: str) -> str:
+    """'https://api.sportradar.com/nfl/official/trial/v7/en/games/x/statistics.json' -> '/games/x/statistics.json'"""
+    match = re.search(r'/(seasons|games|teams|players|league)/.*$', url.split('?', 1)[0])
+    return match.group(0) if match else '/' + url.rsplit('/', 1)[-1]
+
+
+def _make_response(url: str, status_code: int, payload: Optional[Dict[str, Any]]) -> requests.Response:
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+    response.encoding = 'utf-8'
+    response._content = json.dumps(payload if payload is not None else {'message': 'Not Found'}).encode('utf-8')
+    return response
+
+
+class ReplaySession:
+    """
+    Drop-in for requests.Session.get() that serves the fixture corpus,
+    falling back to the synthetic generator for anything not recorded.
+    """
+
+    def __init__(self, store: FixtureStore, synthetic: Optional['SyntheticSportradar'] = None, latency: float = 0.0):
+        self.store = store
+        self.synthetic = synthetic
+        self.latency = latency
+
+    def get(self, url: str, headers: Optional[Dict] = None, params: Optional[Dict] = None,
+            timeout: Optional[float] = None) -> requests.Response:
+        endpoint = _endpoint_from_url(url)
+        payload = self.store.load(endpoint, params)
+        if payload is None and self.synthetic is not None:
+            payload = self.synthetic.payload_for(endpoint)
+        if self.latency:
+            time.sleep(self.latency)
+        return _make_response(url, 200 if payload is not None else 404, payload)
+
+
+class RecordingSession:
+    """Passes requests through to a live session and saves every 200 response"""
+
+    def __init__(self, session: requests.Session, store: FixtureStore, anonymize: bool = True):
+        self.session = session
+        self.store = store
+        self.anonymize = anonymize
+
+    def get(self, url: str, headers: Optional[Dict] = None, params: Optional[Dict] = None,
+            timeout: Optional[float] = None) -> requests.Response:
+        response = self.session.get(url, headers=headers, params=params, timeout=timeout)
+        if response.status_code == 200:
+            payload = response.json()
+            if self.anonymize:
+                payload = anonymize_payload(payload)
+            self.store.save(_endpoint_from_url(url), params, payload)
+        return response
+
+
+def anonymize_payload(payload: Any) -> Any:
+    """
+    Replace person names with stable pseudonyms derived from the player id.
+    Objects that carry an 'id' plus 'position' or 'jersey' are treated as people;
+    team names and everything else are left alone.
+    """
+    if isinstance(payload, list):
+        return [anonymize_payload(item) for item in payload]
+    if not isinstance(payload, dict):
+        return payload
+
+    out = {key: anonymize_payload(value) for key, value in payload.items()}
+    if 'id' in out and ('position' in out or 'jersey' in out):
+        tag = hashlib.sha256(str(out['id']).encode()).hexdigest()[:6].upper()
+        position = out.get('position') or 'P'
+        for key in PERSON_NAME_KEYS:
+            if key in out:
+                out[key] = {'first_name': position, 'last_name': tag}.get(key, f"{position} {tag}")
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Synthetic payloads
+# ---------------------------------------------------------------------------
+
+def _uid(*parts: Any) -> str:
+    return str(uuid.uuid5(SYNTHETIC_NAMESPACE, '-'.join(str(p) for p in parts)))
+
+
+def _team_ref(alias: str) -> Dict[str, str]:
+    market, name = TEAM_INFO[alias]
+    return {'id': _uid('team', alias), 'alias': alias, 'market': market, 'name': name}
+
+
+def _player_ref(alias: str, slot: str, position: str) -> Dict[str, str]:
+    return {'id': _uid('player', alias, slot), 'name': f"{alias} {slot}", 'position': position,
+            'jersey': str(ROSTER_SLOTS.index((slot, position)) + 1)}
+
+
+class SyntheticSportradar:
+    """
+    Deterministic season/week/game payloads shaped like the v7 endpoints
+    the Lambdas use (schedules, game statistics, game roster, game summary).
+    """
+
+    ROUTES = [
+        (re.compile(r'^/seasons/(\d{4})/(REG|POST|PRE)/schedule\.json$'), 'season_schedule'),
+        (re.compile(r'^/seasons/(\d{4})/(REG|POST|PRE)/(\d+)/schedule\.json$'), 'weekly_schedule'),
+        (re.compile(r'^/games/([^/]+)/statistics\.json$'), 'game_statistics'),
+        (re.compile(r'^/games/([^/]+)/roster\.json$'), 'game_roster'),
+        (re.compile(r'^/games/([^/]+)/summary\.json$'), 'game_summary'),
+    ]
+
+    def __init__(self, seasons: Optional[List[int]] = None, status: str = 'closed'):
+        """
+        Args:
+            seasons: Seasons whose game ids are indexed (on first unknown id) so a
+                     statistics request for a scheduled game matches its schedule entry
+            status: Status given to every game
+        """
+        self.status = status
+        self.seasons = tuple(seasons) if seasons is not None else DEFAULT_SYNTHETIC_SEASONS
+        self._indexed = False
+        self._games: Dict[str, Dict[str, Any]] = {}
+
+    def payload_for(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        for pattern, handler in self.ROUTES:
+            match = pattern.match(endpoint)
+            if match:
+                return getattr(self, handler)(*match.groups())
+        return None
+
+    # ── Schedule ────────────────────────────────────────────────────────────
+
+    def season_games(self, season: int, season_type: str = 'REG') -> List[Dict[str, Any]]:
+        """Round-robin pairings, 272 games over 18 weeks (regular season)"""
+        season = int(season)
+        aliases = [alias for alias, _, _ in TEAMS]
+        random.Random(f"{season}-order").shuffle(aliases)
+        weeks = GAMES_PER_WEEK if season_type == 'REG' else {1: 6, 2: 4, 3: 2, 4: 1}
+
+        games = []
+        for week, n_games in weeks.items():
+            rotation = aliases[:1] + aliases[1:][-(week - 1):] + aliases[1:][:-(week - 1)] if week > 1 else aliases
+            pairs = [(rotation[i], rotation[-1 - i]) for i in range(16)][:n_games]
+            for home, away in pairs:
+                if week % 2:
+                    home, away = away, home
+                game = self._game(season, season_type, week, home, away)
+                games.append(game)
+        return games
+
+    def _game(self, season: int, season_type: str, week: int, home: str, away: str) -> Dict[str, Any]:
+        game_id = _uid('game', season, season_type, week, away, home)
+        rng = random.Random(game_id)
+        game = {
+            'id': game_id,
+            'status': self.status,
+            'scheduled': (datetime(season, 9, 8, 17) + timedelta(weeks=week - 1)).strftime('%Y-%m-%dT%H:%M:%S+00:00'),
+            'home': _team_ref(home),
+            'away': _team_ref(away),
+            'scoring': {'home_points': rng.randint(10, 38), 'away_points': rng.randint(10, 38)},
+            '_week': week,
+            '_season': season,
+            '_type': season_type,
+        }
+        self._games[game_id] = game
+        return game
+
+    @staticmethod
+    def _public(game: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in game.items() if not k.startswith('_')}
+
+    def season_schedule(self, season: str, season_type: str) -> Dict[str, Any]:
+        games = self.season_games(int(season), season_type)
+        weeks: Dict[int, List[Dict]] = {}
+        for game in games:
+            weeks.setdefault(game['_week'], []).append(self._public(game))
+        return {
+            'id': _uid('season', season, season_type), 'year': int(season), 'type': season_type,
+            'name': season_type,
+            'weeks': [{'id': _uid('week', season, season_type, w), 'sequence': w, 'title': str(w), 'games': g}
+                      for w, g in sorted(weeks.items())],
+        }
+
+    def weekly_schedule(self, season: str, season_type: str, week: str) -> Dict[str, Any]:
+        games = [self._public(g) for g in self.season_games(int(season), season_type) if g['_week'] == int(week)]
+        return {
+            'id': _uid('season', season, season_type), 'year': int(season), 'type': season_type,
+            'name': season_type,
+            'week': {'id': _uid('week', season, season_type, week), 'sequence': int(week),
+                     'title': str(week), 'games': games},
+        }
+
+    # ── Per game ────────────────────────────────────────────────────────────
+
+    def _lookup(self, game_id: str) -> Dict[str, Any]:
+        """Known game, or a stable made-up matchup for an id we never scheduled"""
+        if game_id not in self._games and not self._indexed:
+            self._indexed = True
+            for season in self.seasons:
+                self.season_games(season)
+        if game_id in self._games:
+            return self._games[game_id]
+
+        rng = random.Random(game_id)
+        home, away = rng.sample([alias for alias, _, _ in TEAMS], 2)
+        made_up = self._game(2024, 'REG', 1, home, away)
+        self._games.pop(made_up['id'])
+        self._games[game_id] = {**made_up, 'id': game_id}
+        return self._games[game_id]
+
+    def game_statistics(self, game_id: str) -> Dict[str, Any]:
+        game = self._lookup(game_id)
+        rng = random.Random(f"{game_id}-stats")
+        return {
+            'id': game_id,
+            'status': game['status'],
+            'scheduled': game['scheduled'],
+            'summary': {
+                'home': {**game['home'], 'points': game['scoring']['home_points']},
+                'away': {**game['away'], 'points': game['scoring']['away_points']},
+            },
+            'statistics': {
+                'home': self._team_statistics(game['home']['alias'], rng),
+                'away': self._team_statistics(game['away']['alias'], rng),
+            },
+        }
+
+    @staticmethod
+    def _team_statistics(alias: str, rng: random.Random) -> Dict[str, Any]:
+        def player(slot: str, position: str, **stats) -> Dict[str, Any]:
+            return {**_player_ref(alias, slot, position), **stats}
+
+        attempts = rng.randint(25, 45)
+        completions = int(attempts * rng.uniform(0.55, 0.75))
+        return {
+            **_team_ref(alias),
+            'passing': {'players': [player(
+                'QB1', 'QB', attempts=attempts, completions=completions, yards=rng.randint(150, 350),
+                touchdowns=rng.randint(0, 3), interceptions=rng.randint(0, 2), sacks=rng.randint(0, 4),
+                sack_yards=rng.randint(0, 25), air_yards=rng.randint(100, 250),
+                on_target_throws=int(attempts * 0.7), poor_throws=rng.randint(2, 8),
+                blitzes=rng.randint(3, 12), hurries=rng.randint(1, 8), avg_pocket_time=round(rng.uniform(2.1, 2.8), 2),
+            )]},
+            'rushing': {'players': [player(
+                slot, 'RB', attempts=rng.randint(5, 20), yards=rng.randint(10, 110),
+                touchdowns=rng.randint(0, 1), first_downs=rng.randint(0, 6),
+                yards_after_contact=rng.randint(5, 50), broken_tackles=rng.randint(0, 3), tlost=rng.randint(0, 3),
+            ) for slot in ('RB1', 'RB2')]},
+            'receiving': {'players': [player(
+                slot, position, targets=rng.randint(2, 10), receptions=rng.randint(1, 8),
+                yards=rng.randint(10, 120), touchdowns=rng.randint(0, 1),
+                yards_after_catch=rng.randint(0, 40), dropped_passes=rng.randint(0, 1),
+            ) for slot, position in (('WR1', 'WR'), ('WR2', 'WR'), ('WR3', 'WR'), ('TE1', 'TE'), ('RB1', 'RB'))]},
+            'defense': {'players': [player(
+                slot, position, tackles=rng.randint(0, 9), assists=rng.randint(0, 4),
+                missed_tackles=rng.randint(0, 2), sacks=rng.choice([0, 0, 0, 0.5, 1]),
+                qb_hits=rng.randint(0, 2), hurries=rng.randint(0, 3), passes_defended=rng.randint(0, 2),
+                interceptions=rng.choice([0, 0, 0, 1]), tloss=rng.randint(0, 2),
+                def_targets=rng.randint(0, 8) if position in ('CB', 'SAF') else 0,
+                def_comps=rng.randint(0, 5) if position in ('CB', 'SAF') else 0,
+            ) for slot, position in ROSTER_SLOTS if position in ('DE', 'DT', 'LB', 'CB', 'SAF')]},
+            'field_goals': {'players': [player('K1', 'K', attempts=2, made=rng.randint(0, 2),
+                                               longest=rng.randint(30, 55))]},
+        }
+
+    def game_roster(self, game_id: str) -> Dict[str, Any]:
+        game = self._lookup(game_id)
+        return {
+            'id': game_id,
+            'status': game['status'],
+            'home': {**game['home'], 'players': [_player_ref(game['home']['alias'], s, p) for s, p in ROSTER_SLOTS]},
+            'away': {**game['away'], 'players': [_player_ref(game['away']['alias'], s, p) for s, p in ROSTER_SLOTS]},
+        }
+
+    def game_summary(self, game_id: str) -> Dict[str, Any]:
+        game = self._lookup(game_id)
+        rng = random.Random(f"{game_id}-summary")
+        return {
+            'id': game_id,
+            'status': game['status'],
+            'scheduled': game['scheduled'],
+            'weather': {'condition': rng.choice(['Sunny', 'Cloudy', 'Rain', 'Indoor']),
+                        'temp': rng.randint(20, 90), 'wind': {'speed': rng.randint(0, 20)}},
+            'home': {**game['home'], 'points': game['scoring']['home_points']},
+            'away': {**game['away'], 'points': game['scoring']['away_points']},
+        }
+
+
+# ---------------------------------------------------------------------------
+# CLI: generate / anonymize a corpus
+# ---------------------------------------------------------------------------
+
+def generate_corpus(out_dir: str, season: int, weeks: Optional[List[int]] = None,
+                    games_per_week: Optional[int] = None) -> Tuple[int, int]:
+    """Write weekly schedules + game statistics for a synthetic season. Returns (files, bytes)."""
+    store = FixtureStore(out_dir)
+    synthetic = SyntheticSportradar()
+    season_games = synthetic.season_games(season)
+    weeks = weeks or sorted({g['_week'] for g in season_games})
+
+    files = size = 0
+    for week in weeks:
+        endpoints = [f"/seasons/{season}/REG/{week}/schedule.json"]
+        week_games = [g for g in season_games if g['_week'] == week][:games_per_week]
+        endpoints += [f"/games/{g['id']}/statistics.json" for g in week_games]
+        for endpoint in endpoints:
+            store.save(endpoint, None, synthetic.payload_for(endpoint))
+            files += 1
+            size += os.path.getsize(store.path_for(endpoint))
+    return files, size
+
+
+def anonymize_corpus(root: str) -> int:
+    """Anonymize every JSON file under root in place. Returns files rewritten."""
+    count = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if not filename.endswith('.json'):
+                continue
+            path = os.path.join(dirpath, filename)
+            with open(path, encoding='utf-8') as f:
+                payload = json.load(f)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(anonymize_payload(payload), f, indent=1, sort_keys=True)
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    gen = sub.add_parser('generate', help='write a synthetic season to a fixture directory')
+    gen.add_argument('--season', type=int, default=2024)
+    gen.add_argument('--weeks', type=int, nargs='+')
+    gen.add_argument('--games-per-week', type=int)
+    gen.add_argument('--out', default=DEFAULT_FIXTURES_DIR)
+
+    anon = sub.add_parser('anonymize', help='replace player names in a recorded corpus')
+    anon.add_argument('root', nargs='?', default=DEFAULT_FIXTURES_DIR)
+
+    args = parser.parse_args()
+    if args.command == 'generate':
+        files, size = generate_corpus(args.out, args.season, args.weeks, args.games_per_week)
+        print(f"Wrote {files} fixtures ({size / 1024:.0f} KB) to {os.path.abspath(args.out)}")
+    else:
+        print(f"Anonymized {anonymize_corpus(args.root)} files under {os.path.abspath(args.root)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+Benchmark + parity: per-row vs staged player_game_stats enriched upsert
+Needs a local Postgres (DB_HOST/DB_PORT/DB_NAME/DB_USER/DB_PASSWORD; SSL off
+with --no-ssl, --unix-sock for a socket-only server). Creates a scratch
+schema, builds player_game_stats from the BoxScoreCollector DDL plus the
+enriched columns, and writes N synthetic
+games (real BoxScoreParser + calc_team_impacts output over the replay
+transport) twice with each path:
+  - per-row: the previous 65-column INSERT ... ON CONFLICT per player
+  - staged:  DatabaseUtils.upsert_player_stats_enriched (COPY + one merge)
+The second pass changes every stat so the ON CONFLICT branch is exercised.
+Table contents (minus id/created_at/updated_at) must match after each pass.
+
+Without a Postgres install, the pgserver package (dev only - pip install
+pgserver, never part of the Lambda package) runs a throwaway local server:
+    python -c "import pgserver; pgserver.get_server('/tmp/pgdata', cleanup_mode=None)"
+    DB_HOST=localhost DB_NAME=postgres DB_USER=postgres DB_PASSWORD=x \
+        python benchmark_enriched_upsert.py --unix-sock /tmp/pgdata/.s.PGSQL.5432
+
+Usage:
+    DB_HOST=localhost DB_NAME=postgres DB_USER=postgres DB_PASSWORD=postgres \
+        python benchmark_enriched_upsert.py --games 16 --no-ssl
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from typing import Dict, List
+
+import pg8000
+
+import DatabaseUtils as database_utils
+from DatabaseUtils import ENRICHED_COLUMNS, _ENRICHED_INSERT_ONLY, _enriched_row
+from GameImpactCalculator import calc_team_impacts
+from SportradarClient import SportradarClient, TokenBucket
+from SportradarFixtures import FixtureStore, ReplaySession, SyntheticSportradar, fixtures_dir
+from BoxScoreParser import parse_game_statistics
+
+SCHEMA = 'bench_enriched_upsert'
+DDL_FILES = [
+    os.path.join(os.path.dirname(__file__), '..', 'BoxScoreCollector', 'create_player_game_stats.sql'),
+    os.path.join(os.path.dirname(__file__), '..', 'BoxScoreCollector', 'alter_player_game_stats.sql'),
+]
+ENRICHED_DDL = """
+ALTER TABLE player_game_stats
+    ADD COLUMN IF NOT EXISTS multiplier_components JSONB,
+    ADD COLUMN IF NOT EXISTS nflverse_enriched     BOOLEAN DEFAULT FALSE
+"""
+
+
+def synthetic_players(games: int) -> List[List[Dict]]:
+    """Enriched player dicts for the first `games` games of a synthetic season"""
+    synthetic = SyntheticSportradar(seasons=[2024])
+    session   = ReplaySession(FixtureStore(fixtures_dir()), synthetic=synthetic)
+    client    = SportradarClient(api_key='replay', rate_limiter=TokenBucket(1000, 1000), session=session,
+                                cache=False)
+
+    out = []
+    for g in synthetic.season_games(2024)[:games]:
+        home, away = g['home']['alias'], g['away']['alias']
+        gid = f"2024_{g['_week']:02d}_{away}_{home}"
+        players = parse_game_statistics(client.get_game_statistics(g['id']), gid, 2024, g['_week'])
+        for team in (home, away):
+            calc_team_impacts(players, team, {}, {}, [], {})
+        for p in players:
+            p['pff_grade'] = round(random.uniform(40, 90), 1)
+            p['nflverse_enriched'] = random.random() < 0.5
+            p['player_name'] = (p.get('player_name') or '') + random.choice(['', "'", '\\', '\t'])
+        out.append(players)
+    return out
+
+
+def bump(players: List[Dict]) -> List[Dict]:
+    """Second pass: every numeric stat and the JSON change"""
+    bumped = []
+    for p in players:
+        q = dict(p)
+        for col in ENRICHED_COLUMNS:
+            if col not in _ENRICHED_INSERT_ONLY and isinstance(q.get(col), int) and not isinstance(q.get(col), bool):
+                q[col] += 1
+        q['pass_poorly_thrown'] = (q.get('pass_poorly_thrown') or 0) + 5
+        q['multiplier_components'] = {**(q.get('multiplier_components') or {}), 'pass': 2}
+        bumped.append(q)
+    return bumped
+
+
+def per_row_upsert(conn, players: List[Dict]) -> int:
+    """The upsert as it was: one INSERT ... ON CONFLICT round trip per player"""
+    cols   = ', '.join(ENRICHED_COLUMNS)
+    values = ', '.join(['%s'] * len(ENRICHED_COLUMNS))
+    update = ', '.join(f"{c} = EXCLUDED.{c}" for c in ENRICHED_COLUMNS if c not in _ENRICHED_INSERT_ONLY)
+    sql = (f"INSERT INTO player_game_stats ({cols}) VALUES ({values}) "
+           f"ON CONFLICT (game_id, player_id) DO UPDATE SET {update}, updated_at = CURRENT_TIMESTAMP")
+    cursor = conn.cursor()
+    for p in players:
+        cursor.execute(sql, _enriched_row(p))
+    cursor.close()
+    return len(players)
+
+
+def snapshot(conn) -> List[tuple]:
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT {', '.join(ENRICHED_COLUMNS)} FROM player_game_stats ORDER BY game_id, player_id")
+    rows = [tuple(json.dumps(v, sort_keys=True) if isinstance(v, dict) else v for v in r) for r in cursor.fetchall()]
+    cursor.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=16)
+    parser.add_argument('--no-ssl', action='store_true')
+    parser.add_argument('--unix-sock', help='connect through this socket path instead of DB_HOST/DB_PORT')
+    args = parser.parse_args()
+    random.seed(11)
+    database_utils.logger.setLevel('WARNING')
+
+    db = database_utils.DatabaseUtils()
+    if args.unix_sock:
+        conn = pg8000.connect(unix_sock=args.unix_sock, database=db.database, user=db.user, password=db.password)
+    else:
+        conn = pg8000.connect(host=db.host, port=db.port, database=db.database, user=db.user,
+                              password=db.password, ssl_context=None if args.no_ssl else True)
+    conn.autocommit = True
+    db.connection = conn
+
+    cursor = conn.cursor()
+    cursor.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+    cursor.execute(f"CREATE SCHEMA {SCHEMA}")
+    cursor.execute(f"SET search_path TO {SCHEMA}")
+    for path in DDL_FILES:
+        cursor.execute(open(path).read())
+    cursor.execute(ENRICHED_DDL)
+
+    games = synthetic_players(args.games)
+    n_rows = sum(len(g) for g in games)
+    print(f"{args.games} games, {n_rows} player rows, {len(ENRICHED_COLUMNS)} columns")
+    print(f"{'path':>8} {'pass':>7} {'seconds':>8} {'rows/s':>9}")
+
+    snapshots = {}
+    for label, write in (('per-row', lambda players: per_row_upsert(conn, players)),
+                         ('staged', db.upsert_player_stats_enriched)):
+        cursor.execute("TRUNCATE player_game_stats")
+        for pass_name, batches in (('insert', games), ('update', [bump(g) for g in games])):
+            start = time.perf_counter()
+            for players in batches:
+                write(players)
+            elapsed = time.perf_counter() - start
+            print(f"{label:>8} {pass_name:>7} {elapsed:>8.2f} {n_rows / elapsed:>9.0f}")
+            snapshots[(label, pass_name)] = snapshot(conn)
+
+    cursor.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+    cursor.close()
+    conn.close()
+
+    for pass_name in ('insert', 'update'):
+        if snapshots[('per-row', pass_name)] != snapshots[('staged', pass_name)]:
+            raise SystemExit(f"PARITY FAILED after {pass_name} pass")
+    print("parity: identical player_game_stats contents after insert and update passes")
+
+
+if __name__ == '__main__':
+    main()
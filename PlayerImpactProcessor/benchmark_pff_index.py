@@ -0,0 +1,164 @@
+"""
+Benchmark + parity: per-game UNION ALL PFF lookup vs season PFFGradeIndex
+Runs a 272-game season through
+  - the old fetch_pff_grades_bulk (five-table UNION ALL + Python match per game)
+  - DatabaseUtils.fetch_pff_grades_bulk (one index load per season, dict hits)
+against a simulated pg8000 connection holding synthetic *_pff_ratings tables
+(name collisions across tables, NULL grades, traded players). Every query
+costs a round trip plus a per-row transfer time. Fails if any game's grades
+differ between the two paths.
+
+Usage:
+    python benchmark_pff_index.py
+    python benchmark_pff_index.py --games 272 --latency 0.03 --row-cost 0.00002
+"""
+
+import argparse
+import os
+import random
+import time
+from typing import Dict, List, Tuple
+
+from PFFGradeIndex import PFF_GRADE_SOURCES
+
+GROUP_SIZES = {'qb': 90, 'rb': 160, 'wr': 420, 'oline': 330, 'defense': 980}
+TEAMS = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB',
+         'HOU', 'IND', 'JAX', 'KC', 'LAC', 'LAR', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG',
+         'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS']
+
+
+# ---------------------------------------------------------------------------
+# Synthetic season
+# ---------------------------------------------------------------------------
+
+def synthetic_tables(rng: random.Random) -> Dict[str, List[Tuple]]:
+    """{group: [(player, team, position, grade, pff_id), ...]}"""
+    tables: Dict[str, List[Tuple]] = {}
+    shared = [f"Shared Name{i}" for i in range(40)]       # appear in several tables
+    for group, size in GROUP_SIZES.items():
+        rows = []
+        for i in range(size):
+            name = rng.choice(shared) if rng.random() < 0.03 else f"{group.title()} Player{i}"
+            grade = None if rng.random() < 0.05 else round(rng.uniform(30, 95), 1)
+            pff_id = str(rng.randint(1000, 99999))
+            rows.append((name, rng.choice(TEAMS), group.upper(), grade, pff_id))
+            if rng.random() < 0.02:                          # traded: second row, other team
+                rows.append((name, rng.choice(TEAMS), group.upper(), round(rng.uniform(30, 95), 1), pff_id))
+        tables[group] = rows
+    return tables
+
+
+def game_rosters(tables: Dict[str, List[Tuple]], games: int, rng: random.Random) -> List[List[str]]:
+    names = sorted({row[0] for rows in tables.values() for row in rows})
+    return [
+        rng.sample(names, 44) + [f"Unknown Player{rng.randint(0, 500)}" for _ in range(4)]
+        for _ in range(games)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Simulated pg8000 connection
+# ---------------------------------------------------------------------------
+
+class SimCursor:
+    def __init__(self, conn: 'SimConnection'):
+        self.conn = conn
+        self.rows: List[Tuple] = []
+
+    def execute(self, sql, params=None):
+        groups = [src[0] for src in PFF_GRADE_SOURCES]
+        if ' AS src' in sql:
+            self.rows = [(i, *row) for i, g in enumerate(groups) for row in self.conn.tables[g]]
+        else:
+            self.rows = [(row[0], row[3]) for g in groups for row in self.conn.tables[g]]
+        self.conn.queries += 1
+        time.sleep(self.conn.latency + len(self.rows) * self.conn.row_cost)
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class SimConnection:
+    def __init__(self, tables, latency: float, row_cost: float):
+        self.tables, self.latency, self.row_cost = tables, latency, row_cost
+        self.queries = 0
+
+    def cursor(self):
+        return SimCursor(self)
+
+    def close(self):
+        pass
+
+
+def legacy_fetch_pff_grades_bulk(conn: SimConnection, player_names: List[str], season: int) -> Dict[str, float]:
+    """The per-game lookup as it was before PFFGradeIndex"""
+    cursor   = conn.cursor()
+    name_set = set(player_names)
+    cursor.execute("""
+        SELECT player, grades_offense FROM qb_pff_ratings    WHERE season = %s
+        UNION ALL
+        SELECT player, grades_offense FROM rb_pff_ratings    WHERE season = %s
+        UNION ALL
+        SELECT player, grades_offense FROM wr_pff_ratings    WHERE season = %s
+        UNION ALL
+        SELECT player, grades_offense FROM oline_pff_ratings WHERE season = %s
+        UNION ALL
+        SELECT player, grades_defense FROM defense_pff_ratings WHERE season = %s
+    """, (season,) * 5)
+    result: Dict[str, float] = {}
+    for name, grade in cursor.fetchall():
+        if name in name_set and name not in result and grade is not None:
+            result[name] = float(grade)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=272)
+    parser.add_argument('--latency', type=float, default=0.03, help='seconds per query round trip')
+    parser.add_argument('--row-cost', type=float, default=0.00002, help='seconds per transferred row')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    for var in ('DB_HOST', 'DB_NAME', 'DB_USER', 'DB_PASSWORD'):
+        os.environ.setdefault(var, 'benchmark')
+    import DatabaseUtils as database_utils
+    database_utils.logger.setLevel('WARNING')
+
+    rng     = random.Random(args.seed)
+    tables  = synthetic_tables(rng)
+    rosters = game_rosters(tables, args.games, rng)
+    n_rows  = sum(len(rows) for rows in tables.values())
+    print(f"{args.games} games, {n_rows} PFF rows/season, "
+          f"{args.latency}s/query + {args.row_cost * 1e6:.0f}us/row")
+
+    legacy_conn = SimConnection(tables, args.latency, args.row_cost)
+    start = time.perf_counter()
+    legacy = [legacy_fetch_pff_grades_bulk(legacy_conn, names, 2024) for names in rosters]
+    legacy_s = time.perf_counter() - start
+
+    db = database_utils.DatabaseUtils()
+    index_conn = SimConnection(tables, args.latency, args.row_cost)
+    db.connect = lambda: index_conn
+    db._reset_connection = lambda: None
+    start = time.perf_counter()
+    indexed = [db.fetch_pff_grades_bulk(names, 2024) for names in rosters]
+    index_s = time.perf_counter() - start
+
+    mismatched = [i for i, (a, b) in enumerate(zip(legacy, indexed)) if a != b]
+    matched = sum(len(r) for r in legacy)
+
+    print(f"{'path':>10} {'queries':>8} {'seconds':>8} {'games/s':>8}")
+    print(f"{'union':>10} {legacy_conn.queries:>8} {legacy_s:>8.2f} {args.games / legacy_s:>8.1f}")
+    print(f"{'index':>10} {index_conn.queries:>8} {index_s:>8.2f} {args.games / index_s:>8.1f}")
+    print(f"speedup {legacy_s / index_s:.1f}x, {matched} player grades matched")
+    if mismatched:
+        raise SystemExit(f"PARITY FAILED for {len(mismatched)} games, first: game {mismatched[0]}")
+    print("parity: identical grades for every game")
+
+
+if __name__ == '__main__':
+    main()
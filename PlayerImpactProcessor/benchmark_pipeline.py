@@ -0,0 +1,148 @@
+"""
+Benchmark: sequential vs producer/consumer game processing
+Runs lambda_function._run_pipeline over the first N games of a synthetic
+season with the real SportradarClient (replay transport, see
+SportradarFixtures), parser and impact calculator - no credentials or
+network needed. Sportradar is paced by a real TokenBucket plus simulated
+response latency; every DB round trip sleeps for a simulated latency.
+Reports games/minute.
+
+Usage:
+    python benchmark_pipeline.py
+    python benchmark_pipeline.py --games 64 --qps 2 --db-latency 0.08 --workers 0 2 4 8
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+import lambda_function
+from SportradarClient import SportradarClient, TokenBucket
+from SportradarFixtures import FixtureStore, ReplaySession, SyntheticSportradar, fixtures_dir
+
+
+# ---------------------------------------------------------------------------
+# Fixture set: first N games of a synthetic season, served by the replay transport
+# ---------------------------------------------------------------------------
+
+def fixture_games(synthetic: SyntheticSportradar, n: int, season: int = 2024) -> List[Dict]:
+    return [
+        {'game_id': f"{season}_{g['_week']:02d}_{g['away']['alias']}_{g['home']['alias']}",
+         'sportradar_id': g['id'], 'season': season, 'week': g['_week'],
+         'home_team': g['home']['alias'], 'away_team': g['away']['alias']}
+        for g in synthetic.season_games(season)[:n]
+    ]
+
+
+def replay_client(synthetic: SyntheticSportradar, qps: float, latency: float) -> SportradarClient:
+    """Real SportradarClient (token bucket, retries) over the replay transport, no cache"""
+    session = ReplaySession(FixtureStore(fixtures_dir()), synthetic=synthetic, latency=latency)
+    return SportradarClient(api_key='replay', rate_limiter=TokenBucket(qps, 1), session=session, cache=False)
+
+
+# ---------------------------------------------------------------------------
+# Simulated DB
+# ---------------------------------------------------------------------------
+
+class LatencyDB:
+    """DatabaseUtils stand-in: each call costs one simulated round trip"""
+
+    host = port = database = user = password = None
+    pff_index = crosswalks = None
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def _round_trip(self, result):
+        time.sleep(self.latency)
+        return result
+
+    def resolve_player_ids(self, players, season):
+        return None   # crosswalk is loaded once per season; name matching below
+
+    def fetch_pff_grades_by_id(self, pff_ids, season):
+        return {}
+
+    def fetch_pff_grades_bulk(self, names, season):
+        return self._round_trip({})
+
+    def fetch_player_season_stats(self, player_ids, season):
+        return self._round_trip({})
+
+    def get_ol_starters(self, team, season):
+        return self._round_trip([])
+
+    def get_team_season_averages(self, team, season, before_week=None):
+        return self._round_trip({'avg_sack_rate': 0.065, 'avg_ypc': 4.3, 'avg_rush_epa_per_carry': 0.0})
+
+    def upsert_player_stats_enriched(self, players):
+        return self._round_trip(len(players))
+
+    def update_game_with_enriched_impact(self, *args):
+        return self._round_trip(None)
+
+    def close(self):
+        pass
+
+
+class LatencyNflverse:
+    """NflverseReader stand-in: two queries per week (memoized like the real reader)"""
+
+    def __init__(self, db: LatencyDB, week_cache=None):
+        self.db = db
+        self.week_cache = week_cache
+
+    def _memo(self, kind, season, week):
+        if self.week_cache is None:
+            return self.db._round_trip({})
+        return self.week_cache.get_or_load(kind, season, week, lambda: self.db._round_trip({}))
+
+    def fetch_game_nflverse(self, season, week):
+        return self._memo('game', season, week)
+
+    def fetch_nflverse_baselines(self, season, week):
+        return self._memo('baselines', season, week)
+
+
+def run(games: List[Dict], synthetic: SyntheticSportradar, workers: int, args) -> float:
+    sportradar = replay_client(synthetic, args.qps, args.api_latency)
+    start = time.perf_counter()
+    results = lambda_function._run_pipeline(
+        games,
+        fetch=lambda game: lambda_function._fetch_game_players(game, sportradar),
+        process=lambda_function._store_game,
+        main_db=LatencyDB(args.db_latency),
+        workers=workers,
+        make_db=lambda: LatencyDB(args.db_latency),
+    )
+    elapsed = time.perf_counter() - start
+    failed = [r for r in results if not r['success']]
+    if failed:
+        raise SystemExit(f"{len(failed)} games failed: {failed[0]}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=32)
+    parser.add_argument('--qps', type=float, default=2.0, help='Sportradar token-bucket rate')
+    parser.add_argument('--api-latency', type=float, default=0.15, help='seconds per API response')
+    parser.add_argument('--db-latency', type=float, default=0.05, help='seconds per DB round trip')
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 4])
+    args = parser.parse_args()
+
+    lambda_function.NflverseReader = LatencyNflverse
+    lambda_function.logger.setLevel('WARNING')
+
+    synthetic = SyntheticSportradar(seasons=[2024])
+    games = fixture_games(synthetic, args.games)
+    print(f"{args.games} games, {args.qps} req/s, api {args.api_latency}s, db {args.db_latency}s/query")
+    print(f"{'workers':>8} {'seconds':>8} {'games/min':>10}")
+    for workers in args.workers:
+        elapsed = run(games, synthetic, workers, args)
+        label = 'seq' if workers <= 0 else str(workers)
+        print(f"{label:>8} {elapsed:>8.1f} {len(games) / elapsed * 60:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
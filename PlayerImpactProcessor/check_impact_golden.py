@@ -0,0 +1,226 @@
+"""
+Golden parity check for GameImpactCalculator
+Recorded games (the bundled Sportradar fixture corpus, plus synthetic games
+for coverage) are parsed with BoxScoreParser and given deterministic
+enrichment inputs: PFF grades, player_season_stats baselines, nflverse
+game/baseline rows, OL starters and team season averages. Each case and
+the calculator's output were written once to fixtures/impact_golden/
+(--record). A check recomputes every case with calc_team_impacts and with
+calc_game_impacts_batch and fails on any difference, down to the last float
+bit. The comparison covers the 4-tuple per team and the per-player fields
+calc_team_impacts writes back.
+
+Usage:
+    python check_impact_golden.py                # verify
+    python check_impact_golden.py --record       # rewrite the golden files
+    python check_impact_golden.py --bench 2000   # also time both APIs
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+import GameImpactCalculator as calc
+from BoxScoreParser import parse_game_statistics
+from SportradarFixtures import SyntheticSportradar, fixtures_dir
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'fixtures', 'impact_golden')
+SYNTHETIC_GAMES = 12
+WRITTEN_FIELDS = ('performance_multiplier', 'actual_impact_score', 'multiplier_components', 'nflverse_enriched')
+
+BASELINE_KEYS = [
+    'avg_catch_rate', 'avg_comp_pct', 'avg_def_comp_allowed', 'avg_def_sacks', 'avg_def_targets',
+    'avg_drops', 'avg_fumbles_forced', 'avg_hurries', 'avg_interceptions', 'avg_pass_attempts',
+    'avg_pass_interceptions', 'avg_pass_touchdowns', 'avg_passes_defended', 'avg_qb_hits',
+    'avg_receiving_yards', 'avg_rush_attempts', 'avg_rush_broken_tackles', 'avg_rush_yac',
+    'avg_rush_yards', 'avg_rush_ypc', 'avg_sacks_taken', 'avg_tackles', 'avg_targets', 'avg_yac',
+    'avg_ypa', 'avg_ypr',
+]
+
+
+# ---------------------------------------------------------------------------
+# Case generation (only used with --record)
+# ---------------------------------------------------------------------------
+
+def _nflverse_rows(p: Dict, rng: random.Random) -> Dict[str, Dict]:
+    pos = (p.get('position') or '').upper()
+    r = lambda lo, hi: round(rng.uniform(lo, hi), 3)
+    if pos == 'QB':
+        game = {'attempts': rng.randint(20, 45), 'passing_air_yards': rng.randint(100, 350),
+                'passing_epa': r(-10, 15), 'sacks': rng.randint(0, 6), 'cpoe': r(-10, 10),
+                'carries': rng.randint(0, 8), 'rushing_yards': rng.randint(-5, 60), 'rushing_epa': r(-3, 3)}
+        base = {'cpoe': r(-5, 5), 'passing_air_yards': rng.randint(500, 2500), 'attempts': rng.randint(60, 400),
+                'passing_epa': r(-20, 60), 'sacks': rng.randint(2, 30)}
+    elif pos in ('RB', 'HB', 'FB'):
+        game = {'carries': rng.randint(3, 25), 'rushing_epa': r(-5, 5), 'receiving_yards': rng.randint(0, 60),
+                'receiving_tds': rng.randint(0, 1), 'rushing_first_downs': rng.randint(0, 8),
+                'rushing_fumbles_lost': rng.randint(0, 1), 'receiving_fumbles_lost': 0}
+        base = {'carries': rng.randint(20, 200), 'rushing_epa': r(-15, 15), 'rushing_first_downs': rng.randint(3, 40),
+                'avg_receiving_yards': r(0, 40), 'rushing_fumbles_lost': rng.randint(0, 3),
+                'receiving_fumbles_lost': rng.randint(0, 1)}
+    elif pos in ('WR', 'TE'):
+        game = {'targets': rng.randint(1, 13), 'receiving_epa': r(-4, 8), 'receiving_yards': rng.randint(0, 160),
+                'receiving_tds': rng.randint(0, 2), 'receiving_first_downs': rng.randint(0, 7),
+                'wopr': r(0, 0.8), 'target_share': r(0, 0.35), 'receiving_fumbles_lost': 0,
+                'receptions': rng.randint(0, 10)}
+        base = {'receiving_epa': r(-10, 30), 'targets': rng.randint(10, 120), 'receiving_yards': rng.randint(50, 1200),
+                'receiving_first_downs': rng.randint(2, 50), 'wopr': r(0.1, 0.7), 'target_share': r(0.05, 0.3),
+                'receptions': rng.randint(5, 90), 'receiving_fumbles_lost': rng.randint(0, 2)}
+    else:
+        return {}
+    out = {'nv_game': game}
+    if rng.random() < 0.85:
+        out['nv_base'] = base
+    return out
+
+
+def build_case(name: str, stats: Dict, game_id: str, season: int, week: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    players = parse_game_statistics(stats, game_id, season, week)
+    teams = sorted({p['team'] for p in players})
+    home, away = teams[0], teams[-1]
+
+    baselines, nflverse = {}, {}
+    for p in players:
+        p['pff_grade'] = round(rng.uniform(40, 92), 1) if rng.random() < 0.8 else None
+        if rng.random() < 0.6:
+            baselines[p['player_id']] = {
+                'player_id': p['player_id'], 'games_played': rng.randint(3, 17),
+                **{k: (round(rng.uniform(0.1, 60), 3) if rng.random() < 0.9 else None) for k in BASELINE_KEYS},
+            }
+        if rng.random() < 0.75:
+            rows = _nflverse_rows(p, rng)
+            if rows:
+                nflverse[p['player_id']] = rows
+
+    def ol_starters(team: str) -> List[Dict]:
+        if rng.random() < 0.15:
+            return []
+        return [{'player': f"{team} OL{n}", 'player_id': 9000 + n, 'position': rng.choice(['T', 'G', 'C', None]),
+                 'team_name': team, 'season': season,
+                 'grades_offense': round(rng.uniform(50, 90), 1) if rng.random() < 0.9 else None}
+                for n in range(5)]
+
+    def season_avgs() -> Dict:
+        if rng.random() < 0.2:
+            return {}
+        return {'avg_sack_rate': round(rng.uniform(0.03, 0.1), 6), 'avg_ypc': round(rng.uniform(3.5, 5.2), 4),
+                'avg_rush_epa_per_carry': round(rng.uniform(-0.15, 0.1), 6)}
+
+    return {
+        'name': name, 'home': home, 'away': away, 'players': players,
+        'player_baselines': baselines, 'nflverse_data': nflverse,
+        'ol_starters': {home: ol_starters(home), away: ol_starters(away)},
+        'team_season_avgs': {home: season_avgs(), away: season_avgs()},
+    }
+
+
+def recorded_cases() -> List[Dict[str, Any]]:
+    cases = []
+    corpus = fixtures_dir()
+    for n, path in enumerate(sorted(glob.glob(os.path.join(corpus, 'games', '*', 'statistics.json')))):
+        stats = json.load(open(path))
+        gid = os.path.basename(os.path.dirname(path))
+        cases.append(build_case(f"recorded_{gid}", stats, f"2024_01_{n:02d}", 2024, 1, seed=n))
+
+    synthetic = SyntheticSportradar(seasons=[2024])
+    for n, g in enumerate(synthetic.season_games(2024)[-SYNTHETIC_GAMES:]):
+        stats = synthetic.game_statistics(g['id'])
+        gid = f"2024_{g['_week']:02d}_{g['away']['alias']}_{g['home']['alias']}"
+        cases.append(build_case(f"synthetic_{gid}", stats, gid, 2024, g['_week'], seed=1000 + n))
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# Running a case
+# ---------------------------------------------------------------------------
+
+def _jsonable(value: Any) -> Any:
+    return json.loads(json.dumps(value))
+
+
+def run_single(case: Dict[str, Any]) -> Dict[str, Any]:
+    """Reference path: calc_team_impacts for home, then away"""
+    players = [dict(p) for p in case['players']]
+    out = {}
+    for team in (case['home'], case['away']):
+        out[team] = calc.calc_team_impacts(
+            players, team, case['player_baselines'], case['nflverse_data'],
+            case['ol_starters'][team], case['team_season_avgs'][team],
+        )
+    out['players'] = [{f: p.get(f) for f in WRITTEN_FIELDS} for p in players]
+    return _jsonable(out)
+
+
+def run_batch(cases: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """calc_game_impacts_batch over all cases at once"""
+    games = []
+    for case in cases:
+        games.append({
+            'players': [dict(p) for p in case['players']],
+            'home_team': case['home'], 'away_team': case['away'],
+            'player_baselines': case['player_baselines'], 'nflverse_data': case['nflverse_data'],
+            'home_ol_starters': case['ol_starters'][case['home']],
+            'away_ol_starters': case['ol_starters'][case['away']],
+            'home_season_avgs': case['team_season_avgs'][case['home']],
+            'away_season_avgs': case['team_season_avgs'][case['away']],
+        })
+    results = calc.calc_game_impacts_batch(games)
+    out = []
+    for case, game, result in zip(cases, games, results):
+        out.append(_jsonable({
+            case['home']: result['home'], case['away']: result['away'],
+            'players': [{f: p.get(f) for f in WRITTEN_FIELDS} for p in game['players']],
+        }))
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--record', action='store_true', help='rewrite fixtures/impact_golden from the current code')
+    parser.add_argument('--bench', type=int, default=0, metavar='GAMES', help='time both APIs over GAMES games')
+    args = parser.parse_args()
+    calc.logger.setLevel(logging.WARNING)
+
+    if args.record:
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        for case in recorded_cases():
+            with open(os.path.join(GOLDEN_DIR, f"{case['name']}.json"), 'w') as f:
+                json.dump({'case': case, 'expected': run_single(case)}, f, separators=(',', ':'))
+        print(f"recorded golden cases to {GOLDEN_DIR}")
+        return
+
+    golden = [json.load(open(path)) for path in sorted(glob.glob(os.path.join(GOLDEN_DIR, '*.json')))]
+    if not golden:
+        sys.exit(f"no golden cases in {GOLDEN_DIR} (run with --record)")
+    cases = [g['case'] for g in golden]
+
+    failures = [c['name'] for c, g in zip(cases, golden) if run_single(c) != g['expected']]
+    if hasattr(calc, 'calc_game_impacts_batch'):
+        failures += [f"{c['name']} (batch)" for c, g, got in zip(cases, golden, run_batch(cases))
+                     if got != g['expected']]
+    if failures:
+        sys.exit(f"GOLDEN MISMATCH in {len(failures)} cases: {failures[:5]}")
+    print(f"{len(cases)} golden games identical (calc_team_impacts and calc_game_impacts_batch)")
+
+    if args.bench:
+        many = [cases[i % len(cases)] for i in range(args.bench)]
+        start = time.perf_counter()
+        for case in many:
+            run_single(case)
+        single_s = time.perf_counter() - start
+        start = time.perf_counter()
+        run_batch(many)
+        batch_s = time.perf_counter() - start
+        print(f"{args.bench} games: calc_team_impacts x2 {args.bench / single_s:.0f} games/s, "
+              f"batch {args.bench / batch_s:.0f} games/s")
+
+
+if __name__ == '__main__':
+    main()
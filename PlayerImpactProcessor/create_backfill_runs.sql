@@ -0,0 +1,36 @@
+-- =============================================================================
+-- backfill_runs / backfill_run_games
+-- =============================================================================
+-- Progress ledger for PlayerImpactProcessor backfills (BackfillLedger.py).
+-- Every finished game is checkpointed as it completes, so a run cut short by
+-- the Lambda time limit or a transient error resumes where it stopped
+-- ({"mode": "backfill", "resume": "<run_id>"}) — directly, or by the run
+-- re-invoking itself.
+--
+-- backfill_runs.status: running | chained | paused | complete
+--   chained — out of time, next invocation already queued
+--   paused  — out of time, no chaining (resume manually)
+-- backfill_run_games holds one row per attempted game; success = FALSE rows
+-- are the run's error list and are retried on resume.
+-- Safe to run multiple times.
+-- =============================================================================
+CREATE TABLE IF NOT EXISTS backfill_runs (
+    run_id          VARCHAR(64)  PRIMARY KEY,
+    params          JSONB        NOT NULL,     -- seasons, week, workers, processes
+    status          VARCHAR(16)  NOT NULL,
+    total_games     INTEGER      NOT NULL,
+    completed_games INTEGER      NOT NULL DEFAULT 0,
+    cursor_game_id  VARCHAR(50),               -- last checkpointed game
+    invocations     INTEGER      NOT NULL DEFAULT 1,
+    created_at      TIMESTAMP    NOT NULL DEFAULT NOW(),
+    updated_at      TIMESTAMP    NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS backfill_run_games (
+    run_id          VARCHAR(64)  NOT NULL REFERENCES backfill_runs(run_id) ON DELETE CASCADE,
+    game_id         VARCHAR(50)  NOT NULL,
+    success         BOOLEAN      NOT NULL,
+    error           TEXT,
+    finished_at     TIMESTAMP    NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (run_id, game_id)
+);
@@ -0,0 +1,36 @@
+-- =============================================================================
+-- player_crosswalk
+-- =============================================================================
+-- One row per Sportradar player per team-season, with the matching nflverse
+-- (gsis) and PFF player ids. Built once per season by PlayerCrosswalk's bulk
+-- resolver and extended as unseen players appear, so processors join on ids
+-- instead of re-matching names every game.
+--
+-- gsis_method / pff_method record how the id was found:
+--   'name_team'    normalised name + team
+--   'name'         normalised name + position group, unique in the season
+--   'initial_team' first initial + last name + team + position group, unique
+--   NULL           no match (id is NULL; re-resolved by a rebuild)
+--
+-- team uses the nflverse/PFF abbreviations (JAX, LAR, BAL, ...).
+-- Safe to run multiple times.
+-- =============================================================================
+CREATE TABLE IF NOT EXISTS player_crosswalk (
+    sportradar_id   VARCHAR(100) NOT NULL,
+    season          INTEGER      NOT NULL,
+    team            VARCHAR(10)  NOT NULL,
+    player_name     VARCHAR(100),
+    norm_name       VARCHAR(100) NOT NULL,
+    position        VARCHAR(10),
+    gsis_id         VARCHAR(50),
+    pff_player_id   VARCHAR(50),
+    gsis_method     VARCHAR(20),
+    pff_method      VARCHAR(20),
+    created_at      TIMESTAMP    NOT NULL DEFAULT NOW(),
+    updated_at      TIMESTAMP    NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (sportradar_id, season, team)
+);
+
+CREATE INDEX IF NOT EXISTS idx_crosswalk_gsis      ON player_crosswalk(gsis_id, season);
+CREATE INDEX IF NOT EXISTS idx_crosswalk_pff       ON player_crosswalk(pff_player_id, season);
+CREATE INDEX IF NOT EXISTS idx_crosswalk_norm_name ON player_crosswalk(season, team, norm_name);
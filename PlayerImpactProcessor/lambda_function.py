@@ -8,8 +8,9 @@ For each game in game_id_mapping (filtered by season/week):
   2. Parse + enrich with PFF grades and player-season baselines
   3. Fetch nflverse game-week stats (QB/RB/WR/TE) from nflverse_*_stats tables
   4. Fetch nflverse rolling baselines (prior weeks, same season)
-  5. Build nflverse_data lookup keyed by Sportradar player_id (via name match)
-  6. calc_team_impacts (two-pass OL, position groups, multiplier_components)
+  5. Build nflverse_data lookup keyed by Sportradar player_id (player_crosswalk,
+     normalised-name match for players it could not resolve)
+  6. calc_game_impacts — calc_team_impacts per team (two-pass OL, position groups, multiplier_components)
   7. Upsert enriched player rows → player_game_stats
   8. Write position-group impacts + player_details JSONB → game_id_mapping
 
@@ -19,6 +20,7 @@ Event formats:
     {"season": 2024, "week": 10}                 -- one week (live)
     {"season": 2024, "limit": 5}                 -- limited batch (live)
     {"force": true, "season": 2024}              -- re-collect already processed (live)
+    {"season": 2024, "week": 10, "incremental": false} -- skip the status check below
     {                                            -- single game test (live)
         "game_id": "2024_10_BUF_KC",
         "sportradar_id": "uuid-here",
@@ -27,6 +29,39 @@ Event formats:
     }
     {"mode": "backfill", "seasons": [2022,2023,2024]} -- DB-only backfill (no API)
     {"mode": "backfill", "seasons": [2022], "week": 1} -- backfill single week
+    {"mode": "backfill", "seasons": [2022,2023,2024,2025], "processes": 4}
+                                                 -- backfill on a process pool
+    {"mode": "backfill", "resume": "backfill-20250101T000000-ab12cd"}
+                                                 -- continue a checkpointed run
+    {"mode": "crosswalk", "seasons": [2023,2024]} -- (re)build player_crosswalk
+
+Batch and backfill modes run as a producer/consumer pipeline: one thread
+fetches games in order (Sportradar, paced by the client's rate limiter, or
+player_game_stats in backfill) while "workers" threads (default
+PIPELINE_WORKERS or 4), each with its own DB connection, do enrichment,
+impact calculation and writes. {"workers": 0} runs strictly one game at a time.
+
+Backfill with "processes" > 1 (default BACKFILL_PROCESSES or off) instead
+spreads (season, week) partitions over a process pool, one DB connection per
+process, for the CPU-bound impact math. Results keep game order. Backfill
+makes no Sportradar calls, so worker processes need no shared rate limiter.
+Where process pools are unavailable (AWS Lambda has no /dev/shm) it falls
+back to the threaded pipeline.
+
+Backfills checkpoint every finished game to a ledger (backfill_runs, see
+BackfillLedger.py). Near the Lambda time limit a run stops starting games
+and re-invokes itself with {"resume": run_id}; finished games are skipped.
+
+With a season (and optional week) and no force, batch mode is incremental:
+one fresh schedule call gives each game's status, and only games that became
+closed/complete or whose marker changed are fetched (GameStatusTracker).
+
+Players are joined to nflverse rows and PFF grades through player_crosswalk
+(Sportradar id → gsis / PFF id, see PlayerCrosswalk.py). Players a game
+brings that the crosswalk has not seen are resolved and added on the fly,
+and rows still missing an id are retried once per run (so players first seen
+before their nflverse / PFF rows were loaded get them); players without an id
+fall back to name matching. "crosswalk" mode re-resolves whole seasons in bulk.
 
 SQS trigger format (Records wrapper parsed automatically):
     {"Records": [{"body": "{\"season\": 2023, \"week\": 1}"}]}
@@ -34,23 +69,37 @@ SQS trigger format (Records wrapper parsed automatically):
 import json
 import logging
 import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
 import re
 import sys
+import threading
 import time
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 sys.path.insert(0, '/var/task')
 
 from SportradarClient import SportradarClient
 from BoxScoreParser import parse_game_statistics
-from GameImpactCalculator import calc_team_impacts, calc_performance_surprise
+from GameImpactCalculator import calc_game_impacts, calc_performance_surprise
 from DatabaseUtils import DatabaseUtils
-from NflverseReader import NflverseReader, _norm
+from GameStatusTracker import GameStatusTracker
+from NflverseReader import NflverseReader, NflverseWeekCache, _norm
+from PlayerCrosswalk import PlayerCrosswalk
+from BackfillLedger import BackfillLedger, deferred_result, is_deferred, pending_games
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 logging.getLogger().setLevel(logging.INFO)
 
+DEFAULT_PIPELINE_WORKERS = int(os.environ.get('PIPELINE_WORKERS', 4))
+DEFAULT_BACKFILL_PROCESSES = int(os.environ.get('BACKFILL_PROCESSES', 0))
+# Seconds before the Lambda limit at which a backfill stops starting games
+DEFAULT_BACKFILL_TIME_MARGIN = int(os.environ.get('BACKFILL_TIME_MARGIN_S', 90))
+# Max self-invocations of one backfill run
+DEFAULT_BACKFILL_MAX_CHAIN = int(os.environ.get('BACKFILL_MAX_CHAIN', 25))
+
 
 def lambda_handler(event: Dict, context: Any) -> Dict:
     logger.info("=" * 60)
@@ -58,11 +107,8 @@ def lambda_handler(event: Dict, context: Any) -> Dict:
     logger.info("Event: %s", json.dumps(event))
 
     try:
-        api_key = os.environ.get('SPORTRADAR_API_KEY')
-        if not api_key:
-            raise ValueError("SPORTRADAR_API_KEY not set")
-
-        sportradar = SportradarClient(api_key)
+        # SPORTRADAR_API_KEY (not needed with SPORTRADAR_MODE=replay)
+        sportradar = SportradarClient(os.environ.get('SPORTRADAR_API_KEY'))
         db         = DatabaseUtils()
         nflverse   = NflverseReader(db)
 
@@ -91,9 +137,15 @@ def lambda_handler(event: Dict, context: Any) -> Dict:
                 'body': json.dumps({'success': True, 'result': result}, default=str),
             }
 
+        workers = int(event.get('workers', DEFAULT_PIPELINE_WORKERS))
+
         # ── Backfill mode (DB-only, no Sportradar) ───────────────────────────
         if event.get('mode') == 'backfill':
-            return _run_backfill(event, db, nflverse)
+            return _run_backfill(event, db, workers, context)
+
+        # ── Player crosswalk bulk build (DB-only) ────────────────────────────
+        if event.get('mode') == 'crosswalk':
+            return _run_crosswalk_build(event, db)
 
         # ── Batch mode ────────────────────────────────────────────────────────
         season = event.get('season')
@@ -101,29 +153,28 @@ def lambda_handler(event: Dict, context: Any) -> Dict:
         limit  = event.get('limit')
         force  = event.get('force', False)
 
-        games = db.fetch_games_to_process(season=season, week=week, limit=limit, force=force)
+        tracker = None
+        if season is not None and not force and event.get('incremental', True):
+            tracker = GameStatusTracker(db, consumer='player_impact')
+            games, markers, _ = tracker.plan(sportradar, season, week)
+            games = games[:limit] if limit else games
+        else:
+            games = db.fetch_games_to_process(season=season, week=week, limit=limit, force=force)
         if not games:
             logger.info("No games to process")
             return {'statusCode': 200, 'body': json.dumps({'success': True, 'games_processed': 0})}
 
-        logger.info("Processing %d games", len(games))
-        results       = []
-        success_count = 0
-
-        for i, game in enumerate(games, 1):
-            logger.info("[%d/%d] %s", i, len(games), game['game_id'])
-            try:
-                result = _process_game(game, sportradar, db, nflverse)
-                if result['success']:
-                    success_count += 1
-                results.append({'game_id': game['game_id'], **result})
-            except Exception as e:
-                logger.error("Failed %s: %s", game['game_id'], e, exc_info=True)
-                results.append({'game_id': game['game_id'], 'success': False, 'error': str(e)})
-
-            # Sportradar trial: 1 req/sec
-            if i < len(games):
-                time.sleep(1.1)
+        logger.info("Processing %d games (workers=%d)", len(games), workers)
+        results = _run_pipeline(
+            games,
+            fetch=lambda game: _fetch_game_players(game, sportradar),
+            process=_store_game,
+            main_db=db,
+            workers=workers,
+        )
+        success_count = sum(1 for r in results if r['success'])
+        if tracker:
+            tracker.save_processed(games, results, markers)
 
         logger.info("Done: %d/%d successful", success_count, len(games))
         return {
@@ -141,6 +192,122 @@ def lambda_handler(event: Dict, context: Any) -> Dict:
         return {'statusCode': 500, 'body': json.dumps({'success': False, 'error': str(e)})}
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Producer/consumer pipeline
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _run_pipeline(
+    games: List[Dict],
+    fetch: Callable[[Dict], Any],
+    process: Callable[[Dict, Any, DatabaseUtils, NflverseReader], Dict],
+    main_db: DatabaseUtils,
+    workers: int = DEFAULT_PIPELINE_WORKERS,
+    queue_depth: Optional[int] = None,
+    make_db: Callable[[], DatabaseUtils] = DatabaseUtils,
+    on_result: Optional[Callable[[Dict, Dict, DatabaseUtils], None]] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> List[Dict]:
+    """
+    Run fetch(game) on one producer thread, in game order, and
+    process(game, fetched, db, nflverse) on `workers` consumer threads.
+
+    The producer uses main_db (and the shared Sportradar rate limiter), so
+    rate-limit waits overlap with enrichment, impact calculation and writes.
+    Each worker gets its own DatabaseUtils/NflverseReader (pg8000 connections
+    are not shared between threads); the readers share one NflverseWeekCache
+    and the DBs share main_db's PFF grade index, so each (season, week) of
+    nflverse rows/baselines and each season of PFF grades is queried once.
+    The bounded queue (default workers * 2) keeps the fetcher from running far
+    ahead.
+
+    on_result(game, result, db) runs on the worker after each game (success
+    or failure) — the backfill ledger checkpoints there. Once should_stop()
+    is true no further game is started; those games get deferred results.
+
+    Returns one {'game_id', 'success', ...} dict per game, in game order.
+    workers <= 0 runs fetch + process inline, one game at a time.
+    """
+    total   = len(games)
+    results: List[Optional[Dict]] = [None] * total
+    week_cache = NflverseWeekCache()
+
+    def run_one(idx: int, game: Dict, fetched: Any, error: Optional[Exception],
+                db: DatabaseUtils, nflverse: NflverseReader):
+        gid = game['game_id']
+        logger.info("[%d/%d] %s", idx + 1, total, gid)
+        if error is None:
+            try:
+                results[idx] = {'game_id': gid, **process(game, fetched, db, nflverse)}
+            except Exception as exc:
+                error = exc
+        if error is not None:
+            logger.error("Failed %s: %s", gid, error, exc_info=error)
+            results[idx] = {'game_id': gid, 'success': False, 'error': str(error)}
+        if on_result:
+            on_result(game, results[idx], db)
+
+    def stopped(idx: int, game: Dict) -> bool:
+        if should_stop is None or not should_stop():
+            return False
+        results[idx] = deferred_result(game)
+        return True
+
+    def fetch_one(game: Dict) -> Tuple[Any, Optional[Exception]]:
+        try:
+            return fetch(game), None
+        except Exception as exc:
+            return None, exc
+
+    if workers <= 0:
+        nflverse = NflverseReader(main_db, week_cache)
+        for idx, game in enumerate(games):
+            if stopped(idx, game):
+                continue
+            fetched, error = fetch_one(game)
+            run_one(idx, game, fetched, error, main_db, nflverse)
+        logger.info("Nflverse week cache: %d loads, %d hits", week_cache.loads, week_cache.hits)
+        return results
+
+    work: queue.Queue = queue.Queue(maxsize=queue_depth or workers * 2)
+
+    def produce():
+        try:
+            for idx, game in enumerate(games):
+                if stopped(idx, game):
+                    continue
+                work.put((idx, game, *fetch_one(game)))
+        finally:
+            for _ in range(workers):
+                work.put(None)
+
+    def consume(db: DatabaseUtils):
+        nflverse = NflverseReader(db, week_cache)
+        try:
+            while True:
+                item = work.get()
+                if item is None:
+                    return
+                run_one(*item, db, nflverse)
+        finally:
+            db.close()
+
+    consumer_dbs = [make_db() for _ in range(workers)]
+    for consumer_db in consumer_dbs:
+        consumer_db.pff_index  = main_db.pff_index    # one PFF index load per season
+        consumer_db.crosswalks = main_db.crosswalks   # one crosswalk load per season
+    threads = [threading.Thread(target=produce, name='impact-fetcher', daemon=True)]
+    threads += [
+        threading.Thread(target=consume, args=(consumer_db,), name=f'impact-worker-{n}', daemon=True)
+        for n, consumer_db in enumerate(consumer_dbs)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    logger.info("Nflverse week cache: %d loads, %d hits", week_cache.loads, week_cache.hits)
+    return results
+
+
 def _process_game(
     game: Dict,
     sportradar: SportradarClient,
@@ -148,26 +315,36 @@ def _process_game(
     nflverse: NflverseReader,
 ) -> Dict:
     """Full pipeline for one game: fetch → parse → enrich → store → impact → surprise."""
+    players = _fetch_game_players(game, sportradar)
+    return _store_game(game, players, db, nflverse)
+
+
+def _fetch_game_players(game: Dict, sportradar: SportradarClient) -> List[Dict]:
+    """Step 1: fetch + parse Sportradar stats (the rate-limited part)."""
+    stats_resp = sportradar.get_game_statistics(game['sportradar_id'], fresh=game.get('fresh', False))
+    return parse_game_statistics(stats_resp, game['game_id'], game['season'], game['week'])
+
+
+def _store_game(
+    game: Dict,
+    players: List[Dict],
+    db: DatabaseUtils,
+    nflverse: NflverseReader,
+) -> Dict:
+    """Steps 2-8 for one game's parsed players: enrich → store → impact → surprise."""
     gid    = game['game_id']
-    sid    = game['sportradar_id']
     home   = game['home_team']
     away   = game['away_team']
     season = game['season']
     week   = game['week']
 
-    # 1. Fetch + parse Sportradar stats
-    stats_resp = sportradar.get_game_statistics(sid)
-    players    = parse_game_statistics(stats_resp, gid, season, week)
-
     if not players:
         logger.warning("No players parsed from %s", gid)
         return {'success': False, 'reason': 'no_players'}
 
-    # 2. Enrich with PFF grades
-    player_names = [p['player_name'] for p in players if p.get('player_name')]
-    pff_grades   = db.fetch_pff_grades_bulk(player_names, season)
-    for p in players:
-        p['pff_grade'] = pff_grades.get(p.get('player_name'))
+    # 2. Resolve player ids (player_crosswalk) and enrich with PFF grades
+    crosswalk = db.resolve_player_ids(players, season)
+    _attach_pff_grades(players, db, season, crosswalk)
 
     # 3. Fetch player-specific season baselines (player_season_stats)
     player_ids       = [p['player_id'] for p in players if p.get('player_id')]
@@ -183,17 +360,8 @@ def _process_game(
         nflverse_baselines = {}
 
     # 5. Build nflverse_data: {player_id → {nv_game, nv_base}}
-    #    Match Sportradar player_name to nflverse player_name via _norm()
-    nflverse_data: Dict[str, Dict] = {}
-    for p in players:
-        norm_name = _norm(p.get('player_name') or '')
-        nv_game   = nflverse_game.get(norm_name)
-        nv_base   = nflverse_baselines.get(norm_name)
-        if nv_game or nv_base:
-            nflverse_data[p.get('player_id', '')] = {
-                'nv_game': nv_game,
-                'nv_base': nv_base,
-            }
+    #    gsis id via player_crosswalk; normalised-name match for unresolved players
+    nflverse_data = _match_nflverse(players, crosswalk, nflverse_game, nflverse_baselines)
 
     logger.info(
         "%s: %d Sportradar players, %d nflverse matches",
@@ -207,12 +375,11 @@ def _process_game(
     away_season_avgs = db.get_team_season_averages(away, season, before_week=week)
 
     # 6b. Calculate enriched team impacts (two-pass OL + PFF injection + position groups)
-    home_actual, home_expected, home_groups, home_details = calc_team_impacts(
-        players, home, player_baselines, nflverse_data, home_ol, home_season_avgs
-    )
-    away_actual, away_expected, away_groups, away_details = calc_team_impacts(
-        players, away, player_baselines, nflverse_data, away_ol, away_season_avgs
-    )
+    (home_actual, home_expected, home_groups, home_details), \
+        (away_actual, away_expected, away_groups, away_details) = calc_game_impacts(
+            players, home, away, player_baselines, nflverse_data,
+            home_ol, away_ol, home_season_avgs, away_season_avgs,
+        )
 
     # 7. Upsert enriched player rows
     db.upsert_player_stats_enriched(players)
@@ -248,50 +415,164 @@ def _process_game(
 # Backfill mode — reads from DB, makes zero Sportradar API calls
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _run_backfill(event: Dict, db: DatabaseUtils, nflverse: NflverseReader) -> Dict:
+def _attach_pff_grades(players: List[Dict], db: DatabaseUtils, season: int,
+                       crosswalk: Optional[PlayerCrosswalk]):
+    """
+    p['pff_grade'] by crosswalk PFF id. Players without one (not in the
+    crosswalk, or no PFF id yet; all of them if it is unavailable) fall back
+    to the exact-name match.
+    """
+    resolved = {}
+    if crosswalk:
+        for p in players:
+            pff_id = crosswalk.pff_player_id(p.get('player_id'))
+            if pff_id:
+                resolved[p['player_id']] = pff_id
+    by_id    = db.fetch_pff_grades_by_id(list(resolved.values()), season)
+    by_name  = db.fetch_pff_grades_bulk(
+        [p['player_name'] for p in players if p.get('player_id') not in resolved and p.get('player_name')],
+        season,
+    )
+    for p in players:
+        if p.get('player_id') in resolved:
+            p['pff_grade'] = by_id.get(resolved[p['player_id']])
+        else:
+            p['pff_grade'] = by_name.get(p.get('player_name'))
+
+
+def _match_nflverse(
+    players: List[Dict],
+    crosswalk: Optional[PlayerCrosswalk],
+    nflverse_game: Dict[str, Dict],
+    nflverse_baselines: Dict[str, Dict],
+) -> Dict[str, Dict]:
+    """
+    {sportradar player_id: {'nv_game', 'nv_base'}} for players with nflverse
+    rows. Players with a crosswalk gsis id join on it; the rest (not in the
+    crosswalk, or no gsis id yet) fall back to the normalised-name match.
+    """
+    game_by_id = {r['_player_id']: r for r in nflverse_game.values() if r.get('_player_id')}
+    base_by_id = {r['_player_id']: r for r in nflverse_baselines.values() if r.get('_player_id')}
+
+    nflverse_data: Dict[str, Dict] = {}
+    for p in players:
+        gsis_id = crosswalk.gsis_id(p.get('player_id')) if crosswalk else None
+        if gsis_id:
+            nv_game = game_by_id.get(gsis_id)
+            nv_base = base_by_id.get(gsis_id)
+        else:
+            norm_name = _norm(p.get('player_name') or '')
+            nv_game   = nflverse_game.get(norm_name)
+            nv_base   = nflverse_baselines.get(norm_name)
+        if nv_game or nv_base:
+            nflverse_data[p.get('player_id', '')] = {
+                'nv_game': nv_game,
+                'nv_base': nv_base,
+            }
+    return nflverse_data
+
+
+def _run_backfill(event: Dict, db: DatabaseUtils, workers: int = DEFAULT_PIPELINE_WORKERS,
+                  context: Any = None) -> Dict:
     """
     Process one or more seasons from existing DB data.
     Event: {"mode": "backfill", "seasons": [2022, 2023, 2024], "week": <optional>}
+           {"mode": "backfill", "resume": "<run_id>"}
+
+    Player rows are read on the producer thread; the rest of each game runs on
+    the worker pool (see _run_pipeline).
 
     All data is read from Supabase tables:
       - player_game_stats    → box score / player stats
       - nflverse_*_stats     → EPA, CPOE, WOPR, etc.
       - oline_pff_ratings    → OL starters
     Impacts are written back to game_id_mapping. Zero Sportradar API calls.
+
+    Every run gets a BackfillLedger (unless "checkpoint": false) that
+    checkpoints each finished game. Within BACKFILL_TIME_MARGIN_S of the
+    Lambda time limit no new game is started; the run then re-invokes this
+    function with {"resume": run_id} ("chain": false to just stop) and the
+    next invocation continues with the games not yet finished.
     """
+    resume_id = event.get('resume')
+    ledger: Optional[BackfillLedger] = None
+    if resume_id:
+        ledger = BackfillLedger(resume_id)
+        overrides = {k: v for k, v in event.items() if k in ('workers', 'processes', 'chain', 'chain_depth')}
+        event     = {**ledger.resume(db), **overrides}
+        workers = int(event.get('workers', workers))
+
     seasons     = event.get('seasons', [2022, 2023, 2024])
     week_filter = event.get('week')
 
     if not isinstance(seasons, list):
         seasons = [seasons]
 
-    total_success = 0
-    total_games   = 0
-    all_results: List[Dict] = []
-
+    games: List[Dict] = []
     for season in seasons:
-        games = db.fetch_games_to_process(
+        season_games = db.fetch_games_to_process(
             season=season,
             week=week_filter,
             force=True,   # always reprocess in backfill — game already collected
         )
-        logger.info("Backfill season %d: %d games", season, len(games))
-
-        for i, game in enumerate(games, 1):
-            gid = game['game_id']
-            logger.info("[S%d %d/%d] %s", season, i, len(games), gid)
-            try:
-                result = _backfill_game(game, db, nflverse)
-                if result['success']:
-                    total_success += 1
-                all_results.append({'game_id': gid, **result})
-            except Exception as exc:
-                logger.error("Backfill failed %s: %s", gid, exc, exc_info=True)
-                all_results.append({'game_id': gid, 'success': False, 'error': str(exc)})
-
-            total_games += 1
+        logger.info("Backfill season %d: %d games", season, len(season_games))
+        games.extend(season_games)
+
+    # Keep each (season, week) contiguous so the nflverse week cache loads it once
+    games = _group_by_week(games)
+    processes = int(event.get('processes', DEFAULT_BACKFILL_PROCESSES))
+
+    if ledger is not None:
+        already_done = len(games)
+        games = pending_games(games, ledger.completed_ids(db))
+        logger.info("Backfill run %s: %d games already done, %d left",
+                    ledger.run_id, already_done - len(games), len(games))
+    elif event.get('checkpoint', True):
+        params = {'seasons': seasons, 'week': week_filter, 'workers': workers, 'processes': processes}
+        try:
+            ledger = BackfillLedger.start(db, params, len(games))
+        except Exception as e:
+            logger.warning("Backfill ledger unavailable (%s) — running without checkpoints", e)
+            db._reset_connection()
+
+    deadline  = _backfill_deadline(context)
+    run_id    = ledger.run_id if ledger else None
+    all_results = _run_backfill_processes(games, processes, run_id, deadline) if processes > 1 else None
+    if all_results is None:
+        processes   = 0
+        all_results = _run_pipeline(
+            games,
+            fetch=lambda game: db.fetch_players_from_game(game['game_id']),
+            process=_backfill_game,
+            main_db=db,
+            workers=workers,
+            on_result=(lambda game, result, worker_db: ledger.record(worker_db, game['game_id'], result))
+                      if ledger else None,
+            should_stop=(lambda: time.time() >= deadline) if deadline else None,
+        )
 
-    logger.info("Backfill done: %d/%d successful", total_success, total_games)
+    deferred = [r['game_id'] for r in all_results if is_deferred(r)]
+    finished = [r for r in all_results if not is_deferred(r)]
+    total_success = sum(1 for r in finished if r['success'])
+    total_games   = len(finished)
+
+    by_season: Dict[int, Dict[str, int]] = {}
+    for game, result in zip(games, all_results):
+        if is_deferred(result):
+            continue
+        counts = by_season.setdefault(game['season'], {'games': 0, 'success': 0})
+        counts['games']   += 1
+        counts['success'] += int(bool(result['success']))
+
+    run_summary: Dict[str, Any] = {}
+    chained = False
+    if ledger is not None:
+        if deferred and event.get('chain', True):
+            chained = _chain_backfill(ledger.run_id, event, context)
+        status = 'complete' if not deferred else ('chained' if chained else 'paused')
+        run_summary = {'run_id': ledger.run_id, 'run_status': status, 'run': ledger.finish(db, status)}
+
+    logger.info("Backfill done: %d/%d successful, %d deferred", total_success, total_games, len(deferred))
     return {
         'statusCode': 200,
         'body': json.dumps({
@@ -300,12 +581,145 @@ def _run_backfill(event: Dict, db: DatabaseUtils, nflverse: NflverseReader) -> D
             'games_processed': total_success,
             'total_games':     total_games,
             'seasons':         seasons,
+            'processes':       processes,
+            'by_season':       by_season,
+            'failed_games':    [r['game_id'] for r in finished if not r['success']],
+            'deferred_games':  len(deferred),
+            'chained':         chained,
+            **run_summary,
         }, default=str),
     }
 
 
+def _backfill_deadline(context: Any) -> Optional[float]:
+    """Epoch time after which no new backfill game starts (None outside Lambda)"""
+    if context is None or not hasattr(context, 'get_remaining_time_in_millis'):
+        return None
+    return time.time() + context.get_remaining_time_in_millis() / 1000.0 - DEFAULT_BACKFILL_TIME_MARGIN
+
+
+def _chain_backfill(run_id: str, event: Dict, context: Any) -> bool:
+    """Queue the next invocation of this function for the same run (async)"""
+    depth = int(event.get('chain_depth', 0)) + 1
+    if depth > DEFAULT_BACKFILL_MAX_CHAIN:
+        logger.warning("Backfill run %s: chain limit %d reached — resume manually",
+                       run_id, DEFAULT_BACKFILL_MAX_CHAIN)
+        return False
+    function = getattr(context, 'invoked_function_arn', None) or os.environ.get('AWS_LAMBDA_FUNCTION_NAME')
+    if not function:
+        return False
+
+    payload = {'mode': 'backfill', 'resume': run_id, 'chain_depth': depth}
+    payload.update({k: event[k] for k in ('workers', 'processes') if k in event})
+    try:
+        import boto3
+        boto3.client('lambda').invoke(
+            FunctionName=function,
+            InvocationType='Event',
+            Payload=json.dumps(payload),
+        )
+    except Exception as e:
+        logger.error("Backfill run %s: could not chain next invocation: %s", run_id, e)
+        return False
+    logger.info("Backfill run %s: chained invocation %d", run_id, depth)
+    return True
+
+
+def _run_crosswalk_build(event: Dict, db: DatabaseUtils) -> Dict:
+    """
+    Bulk-resolve player_crosswalk for whole seasons.
+    Event: {"mode": "crosswalk", "seasons": [2023, 2024]}
+    Re-running re-resolves existing rows (e.g. after new nflverse/PFF loads).
+    """
+    seasons = event.get('seasons', [event['season']] if 'season' in event else [])
+    if not isinstance(seasons, list):
+        seasons = [seasons]
+
+    rows: Dict[int, int] = {}
+    for season in seasons:
+        rows[season] = db.build_player_crosswalk(season)
+
+    logger.info("Player crosswalk built: %s", rows)
+    return {
+        'statusCode': 200,
+        'body': json.dumps({'success': True, 'mode': 'crosswalk', 'rows_by_season': rows}),
+    }
+
+# ── Process-pool backfill ─────────────────────────────────────────────────────
+
+_worker_context: Dict[str, Any] = {}
+
+
+def _backfill_worker_init():
+    """Per-process state: own DB connection, nflverse week cache"""
+    db = DatabaseUtils()
+    _worker_context['db']       = db
+    _worker_context['nflverse'] = NflverseReader(db, NflverseWeekCache())
+
+
+def _backfill_partition(games: List[Dict], run_id: Optional[str] = None,
+                        deadline: Optional[float] = None) -> List[Dict]:
+    """
+    Backfill one (season, week) partition inside a worker process.
+    Checkpoints each game to run_id's ledger; past `deadline` the remaining
+    games are deferred.
+    """
+    db       = _worker_context['db']
+    nflverse = _worker_context['nflverse']
+    ledger   = BackfillLedger(run_id) if run_id else None
+    results: List[Dict] = []
+    for game in games:
+        gid = game['game_id']
+        if deadline and time.time() >= deadline:
+            results.append(deferred_result(game))
+            continue
+        try:
+            players = db.fetch_players_from_game(gid)
+            results.append({'game_id': gid, **_backfill_game(game, players, db, nflverse)})
+        except Exception as e:
+            logger.error("Failed %s: %s", gid, e, exc_info=True)
+            db._reset_connection()
+            results.append({'game_id': gid, 'success': False, 'error': str(e)})
+        if ledger:
+            ledger.record(db, gid, results[-1])
+    return results
+
+
+def _run_backfill_processes(games: List[Dict], processes: int, run_id: Optional[str] = None,
+                            deadline: Optional[float] = None) -> Optional[List[Dict]]:
+    """
+    Backfill on a pool of `processes` worker processes, one task per
+    (season, week). Returns per-game results in input order, or None when a
+    process pool cannot be created here (caller falls back to threads).
+    """
+    partitions: Dict[Tuple[int, int], List[Dict]] = {}
+    for game in games:
+        partitions.setdefault((game['season'], game['week']), []).append(game)
+
+    logger.info("Backfill: %d games in %d week partitions on %d processes",
+                len(games), len(partitions), processes)
+    try:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_backfill_worker_init) as pool:
+            partition_results = list(pool.map(
+                partial(_backfill_partition, run_id=run_id, deadline=deadline), partitions.values(),
+            ))
+    except (OSError, NotImplementedError) as e:
+        logger.warning("Process pool unavailable (%s) — using the threaded pipeline", e)
+        return None
+    return [result for part in partition_results for result in part]
+
+
+def _group_by_week(games: List[Dict]) -> List[Dict]:
+    """Stable regroup of games by (season, week), weeks in first-seen order"""
+    groups: Dict[Tuple[int, int], List[Dict]] = {}
+    for game in games:
+        groups.setdefault((game['season'], game['week']), []).append(game)
+    return [game for group in groups.values() for game in group]
+
+
 def _backfill_game(
     game: Dict,
+    players: List[Dict],
     db: DatabaseUtils,
     nflverse: NflverseReader,
 ) -> Dict:
@@ -319,8 +733,7 @@ def _backfill_game(
     season = game['season']
     week   = game['week']
 
-    # 1. Read player stats from player_game_stats (no Sportradar)
-    players = db.fetch_players_from_game(gid)
+    # 1. Player stats were read from player_game_stats by the pipeline fetcher
     if not players:
         logger.warning("Backfill %s: no players in DB — skipping", gid)
         return {'success': False, 'reason': 'no_players_in_db'}
@@ -339,17 +752,9 @@ def _backfill_game(
         nflverse_game      = {}
         nflverse_baselines = {}
 
-    # 4. Build nflverse_data lookup keyed by player_id (matched by normalised name)
-    nflverse_data: Dict[str, Dict] = {}
-    for p in players:
-        norm_name = _norm(p.get('player_name') or '')
-        nv_game   = nflverse_game.get(norm_name)
-        nv_base   = nflverse_baselines.get(norm_name)
-        if nv_game or nv_base:
-            nflverse_data[p.get('player_id', '')] = {
-                'nv_game': nv_game,
-                'nv_base': nv_base,
-            }
+    # 4. Build nflverse_data lookup keyed by player_id (crosswalk gsis id, else normalised name)
+    crosswalk     = db.resolve_player_ids(players, season)
+    nflverse_data = _match_nflverse(players, crosswalk, nflverse_game, nflverse_baselines)
 
     logger.info(
         "Backfill %s: %d players from DB, %d nflverse matches",
@@ -363,12 +768,11 @@ def _backfill_game(
     away_season_avgs = db.get_team_season_averages(away, season, before_week=week)
 
     # 6. Recalculate enriched team impacts
-    home_actual, home_expected, home_groups, home_details = calc_team_impacts(
-        players, home, player_baselines, nflverse_data, home_ol, home_season_avgs,
-    )
-    away_actual, away_expected, away_groups, away_details = calc_team_impacts(
-        players, away, player_baselines, nflverse_data, away_ol, away_season_avgs,
-    )
+    (home_actual, home_expected, home_groups, home_details), \
+        (away_actual, away_expected, away_groups, away_details) = calc_game_impacts(
+            players, home, away, player_baselines, nflverse_data,
+            home_ol, away_ol, home_season_avgs, away_season_avgs,
+        )
 
     # 7. Write updated impacts to game_id_mapping (player_game_stats unchanged)
     home_surprise = calc_performance_surprise(home_actual, home_expected)
@@ -2,11 +2,12 @@
 DatabaseUtils.py — PlayerSeasonStatsAggregator
 
 Reads player_game_stats and upserts rolling season averages
-into player_season_stats.
+into player_season_stats (and, for the all_weeks / incremental modes, a
+point-in-time row per week into player_season_stats_weekly).
 """
 import logging
 import os
-from typing import Optional
+from typing import List, Optional
 
 import pg8000
 
@@ -18,6 +19,107 @@ logger.setLevel(logging.INFO)
 # to use them based on this same threshold.
 MIN_GAMES_FOR_BASELINE = 3
 
+# player_season_stats averages, in table order, as derived from player_game_stats:
+#   ('avg',   source)                 AVG(source)
+#   ('ratio', numerator, denominator, digits)
+#                                     ROUND(SUM(num)::NUMERIC / SUM(den), digits), SUM(den) > 0
+# The all_weeks / incremental modes rebuild these from running SUM/COUNT totals.
+SEASON_STAT_COLUMNS = [
+    ('avg_pass_attempts',       ('avg', 'pass_attempts')),
+    ('avg_pass_completions',    ('avg', 'pass_completions')),
+    ('avg_pass_yards',          ('avg', 'pass_yards')),
+    ('avg_pass_touchdowns',     ('avg', 'pass_touchdowns')),
+    ('avg_pass_interceptions',  ('avg', 'pass_interceptions')),
+    ('avg_comp_pct',            ('ratio', 'pass_completions', 'pass_attempts', 4)),
+    ('avg_ypa',                 ('ratio', 'pass_yards', 'pass_attempts', 2)),
+    ('avg_sacks_taken',         ('avg', 'sacks_taken')),
+    ('avg_rush_attempts',       ('avg', 'rush_attempts')),
+    ('avg_rush_yards',          ('avg', 'rush_yards')),
+    ('avg_rush_ypc',            ('ratio', 'rush_yards', 'rush_attempts', 2)),
+    ('avg_rush_yac',            ('avg', 'rush_yards_after_contact')),
+    ('avg_rush_broken_tackles', ('avg', 'rush_broken_tackles')),
+    ('avg_rush_tlost',          ('avg', 'rush_tlost')),
+    ('avg_scrambles',           ('avg', 'scrambles')),
+    ('avg_targets',             ('avg', 'targets')),
+    ('avg_receptions',          ('avg', 'receptions')),
+    ('avg_receiving_yards',     ('avg', 'receiving_yards')),
+    ('avg_receiving_tds',       ('avg', 'receiving_touchdowns')),
+    ('avg_catch_rate',          ('ratio', 'receptions', 'targets', 4)),
+    ('avg_ypr',                 ('ratio', 'receiving_yards', 'receptions', 2)),
+    ('avg_yac',                 ('avg', 'yards_after_catch')),
+    ('avg_drops',               ('avg', 'drops')),
+    ('avg_tackles',             ('avg', 'tackles')),
+    ('avg_ast_tackles',         ('avg', 'ast_tackles')),
+    ('avg_missed_tackles',      ('avg', 'missed_tackles')),
+    ('avg_def_sacks',           ('avg', 'def_sacks')),
+    ('avg_qb_hits',             ('avg', 'qb_hits')),
+    ('avg_hurries',             ('avg', 'hurries')),
+    ('avg_passes_defended',     ('avg', 'passes_defended')),
+    ('avg_interceptions',       ('avg', 'interceptions')),
+    ('avg_def_targets',         ('avg', 'def_targets')),
+    ('avg_def_comp_allowed',    ('avg', 'def_completions_allowed')),
+    ('avg_tackles_for_loss',    ('avg', 'tackles_for_loss')),
+]
+# Order of the (sum, count) pairs in player_season_stats_weekly.totals — append only.
+SOURCE_COLUMNS = list(dict.fromkeys(
+    src for _, (kind, *args) in SEASON_STAT_COLUMNS
+    for src in (args if kind == 'avg' else args[:2])
+))
+_ROW_COLUMNS = ['player_id', 'player_name', 'team', 'position', 'season', 'through_week',
+                'games_played'] + [col for col, _ in SEASON_STAT_COLUMNS]
+
+
+def _stat_exprs() -> List[str]:
+    """
+    SQL for each SEASON_STAT_COLUMNS entry over running totals s_<col> (SUM)
+    and n_<col> (non-NULL COUNT) — the same values AVG()/SUM() give over the
+    underlying rows.
+    """
+    def total(col: str) -> str:
+        return f"CASE WHEN n_{col} > 0 THEN s_{col} END"
+
+    exprs = []
+    for _, (kind, *args) in SEASON_STAT_COLUMNS:
+        if kind == 'avg':
+            exprs.append(f"CASE WHEN n_{args[0]} > 0 THEN s_{args[0]}::NUMERIC / n_{args[0]} END")
+        else:
+            num, den, digits = args
+            exprs.append(f"CASE WHEN {total(den)} > 0 "
+                         f"THEN ROUND(({total(num)})::NUMERIC / s_{den}, {digits}) END")
+    return exprs
+
+
+def _totals_array() -> str:
+    """totals value: [sum, count] per SOURCE_COLUMNS entry, flattened in that order"""
+    return "ARRAY[" + ", ".join(f"s_{c}, n_{c}" for c in SOURCE_COLUMNS) + "]::NUMERIC[]"
+
+
+def _week_sums(where: str) -> str:
+    """Per player (and week) SUM/COUNT of every source column from player_game_stats"""
+    sums = ",\n                   ".join(f"COALESCE(SUM({c}), 0) AS s_{c}, COUNT({c}) AS n_{c}" for c in SOURCE_COLUMNS)
+    return f"""
+            SELECT player_id, week,
+                   MAX(player_name) AS player_name, MAX(team) AS team, MAX(position) AS position,
+                   COUNT(*) AS games,
+                   {sums}
+            FROM player_game_stats
+            WHERE {where}
+            GROUP BY player_id, week"""
+
+
+def _upsert_weekly(select_sql: str) -> str:
+    """INSERT … ON CONFLICT for player_season_stats_weekly from rows shaped like _ROW_COLUMNS + totals"""
+    cols    = _ROW_COLUMNS + ['totals']
+    updates = ",\n                ".join(
+        f"{c} = EXCLUDED.{c}" for c in cols if c not in ('player_id', 'season', 'through_week')
+    )
+    return f"""
+            INSERT INTO player_season_stats_weekly ({', '.join(cols)}, updated_at)
+            {select_sql}
+            ON CONFLICT (player_id, season, through_week) DO UPDATE SET
+                {updates},
+                updated_at = CURRENT_TIMESTAMP"""
+
 
 class DatabaseUtils:
     def __init__(self):
@@ -207,6 +309,151 @@ class DatabaseUtils:
         finally:
             cursor.close()
 
+    # ── Point-in-time rows for every week ─────────────────────────────────────
+
+    def aggregate_all_weeks(self, season: int, through_week: Optional[int] = None) -> int:
+        """
+        Writes player_season_stats_weekly rows for every week 1..through_week
+        (default: latest week with data) in one cumulative pass: per player-week
+        sums, a player x week grid from each player's first game, and running
+        SUM() OVER (ORDER BY week) — instead of one full re-aggregation per
+        cut-off. Then publishes the last week to player_season_stats.
+        Returns the number of weekly rows upserted.
+        """
+        conn   = self.connect()
+        cursor = conn.cursor()
+        try:
+            if through_week is None:
+                through_week = self._latest_week(cursor, season)
+                if through_week == 0:
+                    logger.warning(f"No data found in player_game_stats for season {season}")
+                    return 0
+
+            running = ",\n                       ".join(
+                f"SUM(pw.s_{c}) OVER w AS s_{c}, SUM(pw.n_{c}) OVER w AS n_{c}" for c in SOURCE_COLUMNS
+            )
+            select_sql = f"""
+            WITH per_week AS ({_week_sums("season = %s AND week <= %s")}
+            ),
+            grid AS (
+                SELECT f.player_id, g.week
+                FROM (SELECT player_id, MIN(week) AS first_week FROM per_week GROUP BY player_id) f
+                CROSS JOIN LATERAL generate_series(f.first_week, %s::int) AS g(week)
+            ),
+            running AS (
+                SELECT g.player_id, g.week AS through_week,
+                       MAX(pw.player_name) OVER w AS player_name,
+                       MAX(pw.team)        OVER w AS team,
+                       MAX(pw.position)    OVER w AS position,
+                       SUM(pw.games)       OVER w AS games,
+                       {running}
+                FROM grid g
+                LEFT JOIN per_week pw ON pw.player_id = g.player_id AND pw.week = g.week
+                WINDOW w AS (PARTITION BY g.player_id ORDER BY g.week)
+            )
+            SELECT player_id, player_name, team, position, %s, through_week, games,
+                   {", ".join(_stat_exprs())},
+                   {_totals_array()},
+                   CURRENT_TIMESTAMP
+            FROM running"""
+
+            cursor.execute(_upsert_weekly(select_sql), (season, through_week, through_week, season))
+            count = cursor.rowcount
+            logger.info(f"All-weeks: {count} player-week rows for season {season} weeks 1-{through_week}")
+            self._publish_week(cursor, season, through_week)
+            return count
+        finally:
+            cursor.close()
+
+    def aggregate_week_incremental(self, season: int, week: int) -> int:
+        """
+        Writes player_season_stats_weekly rows for `week` from the stored
+        through_week = week - 1 rows plus week's games only (running totals
+        + new sums), then publishes `week` to player_season_stats. Players
+        without a game this week carry their totals forward.
+        Falls back to aggregate_all_weeks when week - 1 was never aggregated.
+        Returns the number of weekly rows upserted.
+        """
+        if week > 1 and not self._has_week(season, week - 1):
+            logger.info(f"No week {week - 1} totals for season {season} — running all-weeks pass")
+            return self.aggregate_all_weeks(season, week)
+
+        conn   = self.connect()
+        cursor = conn.cursor()
+        try:
+            combined = ",\n                       ".join(
+                f"COALESCE(p.totals[{2 * i + 1}], 0) + COALESCE(n.s_{c}, 0) AS s_{c}, "
+                f"COALESCE(p.totals[{2 * i + 2}], 0) + COALESCE(n.n_{c}, 0) AS n_{c}"
+                for i, c in enumerate(SOURCE_COLUMNS)
+            )
+            select_sql = f"""
+            WITH new_week AS ({_week_sums("season = %s AND week = %s")}
+            ),
+            prev AS (
+                SELECT player_id, player_name, team, position, games_played, totals
+                FROM player_season_stats_weekly
+                WHERE season = %s AND through_week = %s
+            ),
+            -- MATERIALIZED: evaluate each s_/n_ sum once, not per reference below
+            running AS MATERIALIZED (
+                SELECT COALESCE(n.player_id, p.player_id) AS player_id,
+                       GREATEST(p.player_name, n.player_name) AS player_name,
+                       GREATEST(p.team, n.team)               AS team,
+                       GREATEST(p.position, n.position)       AS position,
+                       COALESCE(p.games_played, 0) + COALESCE(n.games, 0) AS games,
+                       {combined}
+                FROM new_week n
+                FULL OUTER JOIN prev p ON p.player_id = n.player_id
+            )
+            SELECT player_id, player_name, team, position, %s, %s, games,
+                   {", ".join(_stat_exprs())},
+                   {_totals_array()},
+                   CURRENT_TIMESTAMP
+            FROM running"""
+
+            cursor.execute(_upsert_weekly(select_sql), (season, week, season, week - 1, season, week))
+            count = cursor.rowcount
+            logger.info(f"Incremental: {count} player rows for season {season} week {week}")
+            self._publish_week(cursor, season, week)
+            return count
+        finally:
+            cursor.close()
+
+    def _has_week(self, season: int, through_week: int) -> bool:
+        cursor = self.connect().cursor()
+        try:
+            cursor.execute(
+                "SELECT 1 FROM player_season_stats_weekly WHERE season = %s AND through_week = %s LIMIT 1",
+                (season, through_week),
+            )
+            return cursor.fetchone() is not None
+        finally:
+            cursor.close()
+
+    def _latest_week(self, cursor, season: int) -> int:
+        cursor.execute(
+            "SELECT COALESCE(MAX(week), 0) FROM player_game_stats WHERE season = %s",
+            (season,)
+        )
+        return cursor.fetchone()[0]
+
+    def _publish_week(self, cursor, season: int, through_week: int):
+        """Copy one week's point-in-time rows into player_season_stats (the current baselines)"""
+        cols    = ', '.join(_ROW_COLUMNS)
+        updates = ",\n                ".join(
+            f"{c} = EXCLUDED.{c}" for c in _ROW_COLUMNS if c not in ('player_id', 'season')
+        )
+        cursor.execute(f"""
+            INSERT INTO player_season_stats ({cols}, updated_at)
+            SELECT {cols}, CURRENT_TIMESTAMP
+            FROM player_season_stats_weekly
+            WHERE season = %s AND through_week = %s
+            ON CONFLICT (player_id, season) DO UPDATE SET
+                {updates},
+                updated_at = CURRENT_TIMESTAMP
+        """, (season, through_week))
+        logger.info(f"Published {cursor.rowcount} player rows for season {season} through week {through_week}")
+
     def close(self):
         if self.connection:
             try:
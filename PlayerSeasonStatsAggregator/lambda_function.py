@@ -15,6 +15,15 @@ Event formats:
     {"season": 2023}              -- aggregate all collected weeks for 2023
     {"season": 2023, "week": 10}  -- aggregate weeks 1-10 only
     {"seasons": [2023, 2024]}     -- aggregate multiple seasons sequentially
+
+    {"season": 2023, "mode": "all_weeks"}
+        -- one cumulative pass: point-in-time rows for EVERY week 1..max
+           (player_season_stats_weekly), latest week published to
+           player_season_stats. Replaces running week by week for backfills.
+    {"season": 2023, "week": 11, "mode": "incremental"}
+        -- weekly refresh: week 11 = stored week 10 totals + week 11 games only
+
+    "mode" defaults to "cutoff" (a full re-aggregation through "week").
 """
 import json
 import logging
@@ -31,6 +40,8 @@ logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 logging.getLogger().setLevel(logging.INFO)
 
+MODES = ('cutoff', 'all_weeks', 'incremental')
+
 
 def lambda_handler(event: Dict, context: Any) -> Dict:
     logger.info("=" * 60)
@@ -44,16 +55,26 @@ def lambda_handler(event: Dict, context: Any) -> Dict:
         season  = event.get('season')
         seasons = event.get('seasons')
         week    = event.get('week')
+        mode    = event.get('mode', 'cutoff')
 
         if not season and not seasons:
             raise ValueError("Must provide 'season' or 'seasons'")
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r} — expected one of {MODES}")
+        if mode == 'incremental' and not week:
+            raise ValueError("mode 'incremental' requires 'week'")
 
         seasons_to_process = [season] if season else seasons
         total_players = 0
 
         for i, s in enumerate(seasons_to_process):
-            logger.info(f"Aggregating season {s} (through_week={week or 'max'})")
-            count = db.aggregate_player_season_stats(season=s, through_week=week)
+            logger.info(f"Aggregating season {s} (mode={mode}, through_week={week or 'max'})")
+            if mode == 'all_weeks':
+                count = db.aggregate_all_weeks(season=s, through_week=week)
+            elif mode == 'incremental':
+                count = db.aggregate_week_incremental(season=s, week=week)
+            else:
+                count = db.aggregate_player_season_stats(season=s, through_week=week)
             total_players += count
             logger.info(f"Season {s}: {count} player rows upserted")
 
@@ -65,6 +86,7 @@ def lambda_handler(event: Dict, context: Any) -> Dict:
             'body': json.dumps({
                 'success': True,
                 'seasons_processed': seasons_to_process,
+                'mode': mode,
                 'through_week': week,
                 'total_players_upserted': total_players,
             }),
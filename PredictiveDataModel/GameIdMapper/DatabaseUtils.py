@@ -1,9 +1,41 @@
+import io
 import pg8000
 import os
 import logging
+from typing import Any
 
 logger = logging.getLogger()
 
+
+def copy_text_value(value: Any) -> str:
+    """
+    Format one value for COPY's text format: NULL is \\N, booleans are t/f,
+    and backslash, tab, newline and carriage return are backslash-escaped
+    
+    Each Lambda deploys alone, so this function is copied into
+    pff-etl-lambdas/base_pff_etl.py, PredictiveDataModel/GameIdMapper/DatabaseUtils.py
+    and PlayerImpactProcessor/DatabaseUtils.py.
+    PredictiveDataModel/PFFLambda/DatabaseUtils.py holds the one to copy;
+    change it there and paste it over the others byte-for-byte.
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, str):
+        return (value.replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return str(value)
+
+
+def rows_to_copy_text(rows):
+    """Serialize row tuples for COPY ... FROM STDIN (text format)"""
+    buffer = io.StringIO()
+    buffer.writelines('\t'.join(map(copy_text_value, row)) + '\n' for row in rows)
+    buffer.seek(0)
+    return buffer
+
+
 class DatabaseUtils:
     """
     Simple database utility class for Supabase/PostgreSQL operations.
@@ -101,6 +133,50 @@ class DatabaseUtils:
             raise
     
     
+    def insert_from_stage(self, table, stage_table, columns, rows, insert_query):
+        """
+        Stage rows in a temp table and write them with one set-based statement.
+        
+        In a single transaction:
+          1. CREATE TEMP TABLE stage_table (columns typed like `table`, dropped on commit)
+          2. COPY rows FROM STDIN
+          3. insert_query (an INSERT ... SELECT reading stage_table)
+        
+        Args:
+            table (str): Target table the staging columns are copied from
+            stage_table (str): Temp table name used by insert_query
+            columns (list[str]): Staged columns, in row-tuple order
+            rows (list[tuple]): Row tuples
+            insert_query (str): Statement that writes from stage_table
+        
+        Returns:
+            int: Number of rows affected by insert_query
+        """
+        col_list = ', '.join(columns)
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TEMP TABLE {stage_table} ON COMMIT DROP AS "
+                f"SELECT {col_list} FROM {table} WITH NO DATA"
+            )
+            cursor.execute(
+                f"COPY {stage_table} ({col_list}) FROM STDIN",
+                stream=rows_to_copy_text(rows)
+            )
+            cursor.execute(insert_query)
+            rows_affected = cursor.rowcount
+            self.connection.commit()
+            logger.info(f"Staged {len(rows)} rows, {rows_affected} written to {table}")
+            return rows_affected
+            
+        except Exception as e:
+            logger.error(f"Staged insert into {table} failed: {e}")
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+    
+    
     def close(self):
         """Close database connection."""
         try:
@@ -0,0 +1,172 @@
+"""
+Benchmark: sequential per-row GameIdMapper vs concurrent fetch + staged insert
+Maps --seasons seasons two ways:
+  - sequential   one schedule fetch per season with a 2s pause between
+                 seasons, then one INSERT ... WHERE NOT EXISTS round trip per
+                 game (the old executemany write)
+  - set-based    fetch_season_schedules (concurrent, paced by the shared
+                 token bucket) and insert_mappings (CREATE TEMP + COPY + one
+                 INSERT ... ON CONFLICT DO NOTHING)
+and prints wall time and DB round trips for each.
+
+Sportradar is simulated: each schedule request takes --fetch-cost seconds
+and requests are paced at SPORTRADAR_RATE_LIMIT_QPS (default 1/s). Every DB
+statement costs --latency seconds; no database is touched.
+
+Usage:
+    python benchmark_game_id_mapper.py
+    python benchmark_game_id_mapper.py --seasons 2021 2022 2023 2024 --fetch-cost 2.5 --latency 0.03
+"""
+
+import argparse
+import os
+import random
+import time
+import uuid
+
+os.environ.setdefault('SPORTRADAR_API_KEY', 'benchmark')
+
+import DatabaseUtils as database_utils
+import lambda_function as mapper
+
+TEAMS = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB',
+         'HOU', 'IND', 'JAC', 'KC', 'LAC', 'LA', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG',
+         'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS']
+
+
+def synthetic_schedule(season):
+    rng = random.Random(season)
+    weeks = []
+    for week in range(1, 19):
+        teams = rng.sample(TEAMS, len(TEAMS))
+        games = [{'id': str(uuid.UUID(int=rng.getrandbits(128))),
+                  'home': {'alias': teams[2 * i]}, 'away': {'alias': teams[2 * i + 1]},
+                  'scheduled': f"{season}-09-{week % 28 + 1:02d}T17:00:00+00:00"}
+                 for i in range(16)]
+        weeks.append({'sequence': week, 'games': games})
+    return {'weeks': weeks}
+
+
+class SimResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class SimSession:
+    """Stands in for requests / requests.Session: --fetch-cost seconds per request"""
+
+    def __init__(self, fetch_cost):
+        self.fetch_cost = fetch_cost
+
+    def get(self, url, **kwargs):
+        time.sleep(self.fetch_cost)
+        season = int(url.split('/games/')[1].split('/')[0])
+        return SimResponse(synthetic_schedule(season))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class SimCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+
+    def execute(self, query, params=None, stream=None):
+        self.conn.statements += 1
+        time.sleep(self.conn.latency)
+
+    def executemany(self, query, batch):
+        for params in batch:
+            self.execute(query, params)
+        self.rowcount = len(batch)
+
+    def close(self):
+        pass
+
+
+class SimConnection:
+    def __init__(self, latency):
+        self.latency = latency
+        self.statements = 0
+
+    def cursor(self):
+        return SimCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def run_sequential(seasons, session):
+    """The old flow: fetch, extract and insert one season at a time"""
+    total = 0
+    for idx, season in enumerate(seasons):
+        mappings = mapper.extract_mappings(mapper.fetch_season_schedule(season, session), season)
+        db = database_utils.DatabaseUtils()
+        db.execute_batch("INSERT ... WHERE NOT EXISTS ... ON CONFLICT (game_id) DO UPDATE",
+                         [tuple(m.values()) for m in mappings])
+        total += len(mappings)
+        if idx < len(seasons) - 1:
+            time.sleep(2)
+    return total
+
+
+def run_set_based(seasons, concurrency):
+    schedules, failures = mapper.fetch_season_schedules(seasons, concurrency)
+    if failures:
+        raise RuntimeError(f"fetch failed: {failures}")
+    mappings = [m for s in seasons for m in mapper.extract_mappings(schedules[s], s)]
+    mapper.insert_mappings(mappings)
+    return len(mappings)
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument('--seasons', nargs='+', type=int, default=[2021, 2022, 2023, 2024])
+    p.add_argument('--concurrency', type=int, default=4)
+    p.add_argument('--fetch-cost', type=float, default=2.5, help='seconds per schedule request')
+    p.add_argument('--latency', type=float, default=0.03, help='seconds per DB statement')
+    args = p.parse_args()
+
+    import logging
+    logging.getLogger().setLevel(logging.WARNING)
+
+    session = SimSession(args.fetch_cost)
+    mapper.requests.Session = lambda: session
+    conn = SimConnection(args.latency)
+    database_utils.pg8000.connect = lambda **kwargs: conn
+
+    print(f"{len(args.seasons)} seasons, {args.fetch_cost}s/schedule request, "
+          f"{mapper.RATE_LIMIT_QPS:g} req/s quota, {args.latency}s/DB statement")
+    print(f"{'mode':>12}  {'seconds':>8}  {'statements':>10}  {'games':>6}")
+    baseline = None
+    for name, run in (('sequential', lambda: run_sequential(args.seasons, session)),
+                      ('set-based', lambda: run_set_based(args.seasons, args.concurrency))):
+        conn.statements = 0
+        start = time.perf_counter()
+        games = run()
+        secs = time.perf_counter() - start
+        baseline = baseline or secs
+        print(f"{name:>12}  {secs:8.2f}  {conn.statements:10d}  {games:6d}   {baseline / secs:4.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,13 +3,21 @@ GameIDMapper Lambda
 Maps internal game IDs to Sportradar UUIDs for entire NFL seasons.
 
 Input: {"season": 2024} or {"seasons": [2022, 2023, 2024]}
+       optional "concurrency": schedule fetches in flight (default SCHEDULE_FETCH_CONCURRENCY)
+
+Every season's schedule is fetched concurrently (paced by a token bucket
+within the Sportradar quota), flattened into one schedule frame, staged with
+COPY and joined against the local games table in a single
+INSERT ... ON CONFLICT DO NOTHING.
 """
 
 import requests
 import json
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from DatabaseUtils import DatabaseUtils
 
@@ -21,6 +29,71 @@ logger.setLevel(logging.INFO)
 SPORTRADAR_API_KEY = os.environ.get('SPORTRADAR_API_KEY')
 SPORTRADAR_BASE_URL = "https://api.sportradar.com/nfl/official/trial/v7/en"
 
+# Schedule fetches in flight at once (the rate limiter still paces them)
+DEFAULT_CONCURRENCY = int(os.environ.get('SCHEDULE_FETCH_CONCURRENCY', 4))
+
+# Plan quota (trial: 1 request/second) - same variables as the other Sportradar Lambdas
+RATE_LIMIT_QPS = float(os.environ.get('SPORTRADAR_RATE_LIMIT_QPS', 1.0))
+RATE_LIMIT_BURST = float(os.environ.get('SPORTRADAR_RATE_LIMIT_BURST', 1))
+
+# Status codes retried with backoff (Retry-After honoured when present)
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+MAX_RETRIES = 5
+MAX_BACKOFF_SECONDS = 60
+
+# Abbreviations that name the same team in Sportradar and the games table
+TEAM_ALIASES = {'JAX': 'JAC', 'LAR': 'LA', 'BLT': 'BAL', 'CLV': 'CLE', 'ARZ': 'ARI', 'HST': 'HOU'}
+
+MAPPING_COLUMNS = ['game_id', 'sportradar_id', 'season', 'week', 'home_team', 'away_team', 'game_date']
+STAGE_TABLE = '_stage_game_id_mapping'
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter
+
+    Holds up to `capacity` tokens, refilled at `rate` tokens/second.
+    acquire() only sleeps when the bucket is empty.
+    """
+
+    def __init__(self, rate, capacity=1):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Block every caller for `seconds` (server asked us to back off)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens = 0
+            self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+# Shared by every fetch of a warm Lambda container
+RATE_LIMITER = TokenBucket(RATE_LIMIT_QPS, RATE_LIMIT_BURST)
+
 
 def lambda_handler(event, context):
     """
@@ -29,6 +102,7 @@ def lambda_handler(event, context):
     
     Input:
         {"season": 2024}  OR  {"seasons": [2022, 2023, 2024]}
+        optional "concurrency": 4
     
     Output:
         {
@@ -36,6 +110,7 @@ def lambda_handler(event, context):
             "body": {
                 "success": true,
                 "mappings_created": 272,
+                "new_mappings": 16,
                 "seasons_processed": [2024]
             }
         }
@@ -55,30 +130,36 @@ def lambda_handler(event, context):
         
         # Normalize to list
         seasons_to_process = [season] if season else seasons
+        concurrency = int(event.get('concurrency', DEFAULT_CONCURRENCY))
         logger.info(f"Will process {len(seasons_to_process)} seasons: {seasons_to_process}")
         
-        # Process each season with rate limiting
-        total_mappings = 0
-        for idx, s in enumerate(seasons_to_process):
-            logger.info(f"Starting processing for season {s} ({idx + 1}/{len(seasons_to_process)})")
-            
-            # Main work happens here
-            mappings_count = process_season(s)
-            total_mappings += mappings_count
-            
-            logger.info(f"Completed season {s}: {mappings_count} mappings created")
-            
-            # Rate limiting: Wait between seasons (except after last)
-            if idx < len(seasons_to_process) - 1:
-                logger.info("Waiting 2 seconds before next season...")
-                time.sleep(2)
+        # STEP 1: Fetch every season's schedule concurrently (rate limited)
+        schedules, failures = fetch_season_schedules(seasons_to_process, concurrency)
+        
+        # STEP 2: Flatten the schedules into one mapping frame
+        mappings = []
+        for s in seasons_to_process:
+            if s not in schedules:
+                continue
+            season_mappings = extract_mappings(schedules[s], s)
+            if not season_mappings:
+                logger.warning(f"No games found for season {s}")
+            mappings.extend(season_mappings)
+        
+        # STEP 3: One staged, set-based write for all seasons
+        inserted = insert_mappings(mappings)
+        
+        if failures:
+            return error_response(500, "Schedule fetch failed for seasons "
+                                       f"{sorted(failures)}: {failures}")
         
         # Return success
-        logger.info(f"All seasons processed successfully. Total mappings: {total_mappings}")
+        logger.info(f"All seasons processed successfully. Total mappings: {len(mappings)} ({inserted} new)")
         return success_response({
-            "mappings_created": total_mappings,
+            "mappings_created": len(mappings),
+            "new_mappings": inserted,
             "seasons_processed": seasons_to_process,
-            "message": f"Successfully created {total_mappings} game ID mappings"
+            "message": f"Successfully created {len(mappings)} game ID mappings"
         })
         
     except Exception as e:
@@ -87,62 +168,47 @@ def lambda_handler(event, context):
         return error_response(500, f"Internal error: {str(e)}")
 
 
-def process_season(season):
+def fetch_season_schedules(seasons, concurrency=DEFAULT_CONCURRENCY):
     """
-    Process a single season and create game ID mappings.
-    
-    Flow:
-        1. Fetch schedule from Sportradar API
-        2. Parse response and extract mappings
-        3. Write mappings to database
+    Fetch several seasons' schedules concurrently over one keep-alive session.
+    Every request still takes a token from RATE_LIMITER, so concurrency only
+    overlaps the in-flight requests - it never exceeds the quota.
     
     Args:
-        season (int): NFL season year (e.g., 2024)
+        seasons (list[int]): NFL season years
+        concurrency (int): Maximum fetches in flight
     
     Returns:
-        int: Number of mappings created
-    
-    Raises:
-        Exception: If any step fails (API call, parsing, or database write)
+        tuple: ({season: schedule_data}, {season: error message} for failed seasons)
     """
-    logger.info(f"=== Starting process_season({season}) ===")
+    schedules, failures = {}, {}
+    workers = max(1, min(concurrency, len(seasons)))
     
-    try:
-        # STEP 1: Fetch schedule from Sportradar API
-        logger.info(f"Step 1: Fetching schedule from Sportradar for {season}...")
-        schedule_data = fetch_season_schedule(season)
-        logger.info(f"Successfully fetched schedule data")
-        
-        # STEP 2: Extract mappings from API response
-        logger.info(f"Step 2: Extracting game mappings from schedule...")
-        mappings = extract_mappings(schedule_data, season)
-        logger.info(f"Extracted {len(mappings)} game mappings")
-        
-        # Validation: Make sure we got some games
-        if not mappings or len(mappings) == 0:
-            logger.warning(f"No games found for season {season}")
-            return 0
-        
-        # STEP 3: Write mappings to database
-        logger.info(f"Step 3: Writing {len(mappings)} mappings to database...")
-        insert_mappings(mappings)
-        logger.info(f"Successfully wrote {len(mappings)} mappings to database")
-        
-        logger.info(f"=== Completed process_season({season}): {len(mappings)} mappings ===")
-        return len(mappings)
-        
-    except Exception as e:
-        # If anything fails, log and re-raise
-        logger.error(f"Failed to process season {season}: {str(e)}", exc_info=True)
-        raise  # Re-raise so lambda_handler catches it
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fetch_season_schedule, s, session): s for s in seasons}
+        for future in as_completed(futures):
+            season = futures[future]
+            try:
+                schedules[season] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to fetch schedule for season {season}: {e}")
+                failures[season] = str(e)
+    
+    logger.info(f"Fetched {len(schedules)}/{len(seasons)} schedules ({workers} concurrent)")
+    return schedules, failures
 
 
-def fetch_season_schedule(season):
+def fetch_season_schedule(season, session=None):
     """
     Fetch full regular season schedule from Sportradar API.
     
+    Each attempt takes a token from RATE_LIMITER. 429/5xx responses are
+    retried after the server's Retry-After, or exponential backoff when the
+    header is missing; a 429 also pauses the limiter for every caller.
+    
     Args:
         season (int): NFL season year (2024)
+        session (requests.Session): Session to reuse (optional)
     
     Returns:
         dict: Schedule data with weeks and games
@@ -155,13 +221,28 @@ def fetch_season_schedule(season):
     url = f"{SPORTRADAR_BASE_URL}/games/{season}/REG/schedule.json"
     params = {'api_key': SPORTRADAR_API_KEY}
     headers = {'Accept': 'application/json'}
+    http = session or requests
     
     logger.info(f"Fetching schedule from Sportradar for season {season}")
     
     try:
-        # Call API
-        response = requests.get(url, params=params, headers=headers, timeout=30)
-        response.raise_for_status()
+        for attempt in range(MAX_RETRIES + 1):
+            RATE_LIMITER.acquire()
+            response = http.get(url, params=params, headers=headers, timeout=30)
+            
+            if response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                retry_after = response.headers.get('Retry-After')
+                backoff = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** (attempt + 1)
+                backoff = min(backoff, MAX_BACKOFF_SECONDS)
+                logger.warning(f"{response.status_code} for season {season} - backing off {backoff:.0f}s")
+                if response.status_code == 429:
+                    RATE_LIMITER.pause(backoff)
+                else:
+                    time.sleep(backoff)
+                continue
+            
+            response.raise_for_status()
+            break
         
         # Parse JSON
         schedule_data = response.json()
@@ -170,7 +251,7 @@ def fetch_season_schedule(season):
         if 'weeks' not in schedule_data:
             raise Exception("API response missing 'weeks' field")
         
-        logger.info(f"Fetched {len(schedule_data['weeks'])} weeks of data")
+        logger.info(f"Fetched {len(schedule_data['weeks'])} weeks of data for season {season}")
         return schedule_data
         
     except requests.exceptions.RequestException as e:
@@ -244,64 +325,69 @@ def extract_mappings(schedule_data, season):
     return mappings
 
 
+def _canonical_team(column):
+    """SQL mapping a team column onto one spelling per team (see TEAM_ALIASES)"""
+    cases = ' '.join(f"WHEN '{alias}' THEN '{team}'" for alias, team in TEAM_ALIASES.items())
+    return f"CASE {column} {cases} ELSE {column} END"
+
+
+def build_mapping_insert(stage_table=STAGE_TABLE):
+    """
+    INSERT ... SELECT joining the staged schedule frame with the local games
+    table. A schedule game that matches a local game (season, week, teams -
+    aliases folded) is mapped to that game's game_id; otherwise to the
+    {season}_{week}_{away}_{home} id built from the Sportradar aliases.
+    Sportradar ids that are already mapped are skipped (handles JAC/JAX
+    duplicate legacy data), and ON CONFLICT DO NOTHING leaves existing
+    game_ids untouched.
+    """
+    cols = ', '.join(MAPPING_COLUMNS)
+    return f"""
+        INSERT INTO game_id_mapping ({cols})
+        SELECT DISTINCT ON (s.sportradar_id)
+               COALESCE(g.game_id, s.game_id), s.sportradar_id, s.season, s.week,
+               s.home_team, s.away_team, s.game_date
+        FROM {stage_table} s
+        LEFT JOIN games g
+               ON g.season = s.season
+              AND g.week = s.week
+              AND g.game_type = 'REG'
+              AND {_canonical_team('g.home_team')} = {_canonical_team('s.home_team')}
+              AND {_canonical_team('g.away_team')} = {_canonical_team('s.away_team')}
+        WHERE NOT EXISTS (
+            SELECT 1 FROM game_id_mapping m
+            WHERE m.sportradar_id = s.sportradar_id
+        )
+        ORDER BY s.sportradar_id, g.game_id = s.game_id DESC, g.game_id
+        ON CONFLICT DO NOTHING
+    """
+
+
 def insert_mappings(mappings):
     """
-    Batch insert game ID mappings to database.
+    Write game ID mappings with one COPY into a staging table and one
+    set-based INSERT ... ON CONFLICT DO NOTHING (see build_mapping_insert).
     
     Args:
         mappings (list[dict]): List of mapping dictionaries
     
     Returns:
-        int: Number of mappings inserted/updated
+        int: Number of new mappings inserted
     """
     if not mappings:
         logger.warning("No mappings to insert")
         return 0
 
-    logger.info(f"Batch inserting {len(mappings)} mappings to database")
+    logger.info(f"Staging {len(mappings)} mappings")
     
     db = DatabaseUtils()
 
-    try: 
-        # UPSERT Query — skips rows where the sportradar_id is already owned
-        # by a different game_id (handles JAC/JAX duplicate legacy data).
-        query = """
-            INSERT INTO game_id_mapping
-                (game_id, sportradar_id, season, week, home_team, away_team, game_date)
-            SELECT %s, %s, %s, %s, %s, %s, %s
-            WHERE NOT EXISTS (
-                SELECT 1 FROM game_id_mapping
-                WHERE sportradar_id = %s
-            )
-            ON CONFLICT(game_id)
-            DO UPDATE SET 
-                sportradar_id = EXCLUDED.sportradar_id,
-                season = EXCLUDED.season,
-                week = EXCLUDED.week,
-                home_team = EXCLUDED.home_team,
-                away_team = EXCLUDED.away_team,
-                game_date = EXCLUDED.game_date,
-                updated_at = NOW()
-        """
-        
-        # Prepare batch data — sportradar_id repeated for the WHERE NOT EXISTS check
-        batch_data = [
-            (
-                m['game_id'],
-                m['sportradar_id'],
-                m['season'],
-                m['week'],
-                m['home_team'],
-                m['away_team'],
-                m['game_date'],
-                m['sportradar_id'],  # for WHERE NOT EXISTS subquery
-            )
-            for m in mappings
-        ]
-        
-        # Execute batch insert
-        rows_affected = db.execute_batch(query, batch_data)
-        logger.info(f"Successfully inserted/updated {rows_affected} mappings")
+    try:
+        rows = [tuple(m[c] for c in MAPPING_COLUMNS) for m in mappings]
+        rows_affected = db.insert_from_stage(
+            'game_id_mapping', STAGE_TABLE, MAPPING_COLUMNS, rows, build_mapping_insert()
+        )
+        logger.info(f"Successfully inserted {rows_affected} new mappings")
         return rows_affected
         
     except Exception as e:
@@ -0,0 +1,285 @@
+"""
+DatabaseUtils.py
+Handles PostgreSQL database connections and basic query operations
+"""
+
+import io
+import os
+import logging
+import pg8000
+from typing import Optional, List, Tuple, Any, Iterable, Sequence
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+def dedupe_rows(rows: Iterable[Sequence[Any]], key_indexes: Sequence[int]) -> List[Sequence[Any]]:
+    """
+    Keep the last row for each conflict key (same result as per-row upserts in order)
+    
+    INSERT ... ON CONFLICT DO UPDATE rejects a statement that touches the
+    same target row twice, so duplicates must be removed before the merge.
+    """
+    latest = {}
+    for row in rows:
+        key = tuple(row[i] for i in key_indexes)
+        latest.pop(key, None)
+        latest[key] = row
+    return list(latest.values())
+
+
+def copy_text_value(value: Any) -> str:
+    """
+    Format one value for COPY's text format: NULL is \\N, booleans are t/f,
+    and backslash, tab, newline and carriage return are backslash-escaped
+    
+    Each Lambda deploys alone, so this function is copied into
+    pff-etl-lambdas/base_pff_etl.py, PredictiveDataModel/GameIdMapper/DatabaseUtils.py
+    and PlayerImpactProcessor/DatabaseUtils.py.
+    PredictiveDataModel/PFFLambda/DatabaseUtils.py holds the one to copy;
+    change it there and paste it over the others byte-for-byte.
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, str):
+        return (value.replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return str(value)
+
+
+def rows_to_copy_text(rows: Iterable[Sequence[Any]]) -> io.StringIO:
+    """Serialize row tuples for COPY ... FROM STDIN (text format)"""
+    buffer = io.StringIO()
+    buffer.writelines('\t'.join(map(copy_text_value, row)) + '\n' for row in rows)
+    buffer.seek(0)
+    return buffer
+
+
+def build_merge_query(table: str, stage_table: str, columns: Sequence[str],
+                      conflict_keys: Sequence[str], timestamps: bool = True) -> str:
+    """
+    Build the INSERT ... SELECT ... ON CONFLICT DO UPDATE merge from a staging table
+    
+    Args:
+        table: Target table
+        stage_table: Temp table holding the staged rows
+        columns: Columns staged (and written)
+        conflict_keys: Unique constraint columns
+        timestamps: Also set created_at/updated_at like the row-by-row upserts
+    """
+    col_list = ', '.join(columns)
+    update_cols = [f"{c} = EXCLUDED.{c}" for c in columns if c not in conflict_keys]
+    
+    if timestamps:
+        insert_cols = f"{col_list}, created_at, updated_at"
+        select_cols = f"{col_list}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP"
+        update_cols.append("updated_at = CURRENT_TIMESTAMP")
+    else:
+        insert_cols = select_cols = col_list
+    
+    conflict_action = f"DO UPDATE SET {', '.join(update_cols)}" if update_cols else "DO NOTHING"
+    
+    return f"""
+        INSERT INTO {table} ({insert_cols})
+        SELECT {select_cols} FROM {stage_table}
+        ON CONFLICT ({', '.join(conflict_keys)})
+        {conflict_action}
+    """
+
+
+class DatabaseUtils:
+    """
+    PostgreSQL database connection and query utilities
+    Handles connection pooling, query execution, and error handling
+    """
+    
+    def __init__(self):
+        """Initialize database connection from environment variables"""
+        # Support both naming conventions: DB_* and SUPABASE_DB_*
+        # Strip whitespace to prevent authentication errors
+        self.host = (os.environ.get('SUPABASE_DB_HOST') or os.environ.get('DB_HOST', '')).strip()
+        self.port = int(os.environ.get('SUPABASE_DB_PORT') or os.environ.get('DB_PORT', 5432))
+        self.database = (os.environ.get('SUPABASE_DB_NAME') or os.environ.get('DB_NAME', '')).strip()
+        self.user = (os.environ.get('SUPABASE_DB_USER') or os.environ.get('DB_USER', '')).strip()
+        self.password = (os.environ.get('SUPABASE_DB_PASSWORD') or os.environ.get('DB_PASSWORD', '')).strip()
+        # SSL is required for Supabase; DB_SSL=false allows a local Postgres (benchmarks)
+        self.use_ssl = os.environ.get('DB_SSL', 'true').strip().lower() != 'false'
+        
+        # Validate environment variables
+        if not all([self.host, self.database, self.user, self.password]):
+            raise ValueError("Missing required database environment variables. Need either DB_HOST/DB_NAME/DB_USER/DB_PASSWORD or SUPABASE_DB_HOST/SUPABASE_DB_NAME/SUPABASE_DB_USER/SUPABASE_DB_PASSWORD")
+        
+        self.connection: Optional[pg8000.Connection] = None
+        logger.info("DatabaseUtils initialized")
+    
+    def connect(self) -> pg8000.Connection:
+        """
+        Establish database connection
+        
+        Returns:
+            pg8000.Connection: Active database connection
+        """
+        if self.connection is None:
+            try:
+                self.connection = pg8000.connect(
+                    host=self.host,
+                    port=self.port,
+                    database=self.database,
+                    user=self.user,
+                    password=self.password,
+                    ssl_context=True if self.use_ssl else None  # Required for Supabase
+                )
+                logger.info(f"✓ Connected to database: {self.database}")
+            except Exception as e:
+                logger.error(f"Failed to connect to database: {e}")
+                raise
+        
+        return self.connection
+    
+    def execute_query(self, query: str, params: Optional[Tuple] = None) -> pg8000.Cursor:
+        """
+        Execute a SQL query (SELECT, INSERT, UPDATE, DELETE)
+        
+        Args:
+            query: SQL query string
+            params: Optional tuple of parameters for parameterized queries
+        
+        Returns:
+            pg8000.Cursor: Cursor with query results
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            
+            return cursor
+        
+        except Exception as e:
+            logger.error(f"Query execution failed: {e}")
+            logger.error(f"Query: {query}")
+            raise
+    
+    def execute_batch(self, query: str, data_batch: List[Tuple]) -> int:
+        """
+        Execute a batch of INSERT/UPDATE queries efficiently
+        
+        Args:
+            query: Parameterized SQL query
+            data_batch: List of tuples, each representing one row of data
+        
+        Returns:
+            int: Number of rows affected
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        rows_affected = 0
+        
+        try:
+            for row_data in data_batch:
+                cursor.execute(query, row_data)
+                rows_affected += 1
+            
+            conn.commit()
+            logger.info(f"✓ Batch executed: {rows_affected} rows affected")
+            return rows_affected
+        
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Batch execution failed: {e}")
+            raise
+        finally:
+            cursor.close()
+    
+    def bulk_upsert(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+                    conflict_keys: Sequence[str], timestamps: bool = True) -> int:
+        """
+        Upsert many rows with COPY into a temp table and one set-based merge
+        
+        Replaces one INSERT ... ON CONFLICT round trip per row with:
+          1. CREATE TEMP TABLE (same column types as the target, dropped on commit)
+          2. COPY rows FROM STDIN (streamed CSV)
+          3. INSERT ... SELECT ... ON CONFLICT DO UPDATE
+        all in a single transaction.
+        
+        Args:
+            table: Target table name
+            columns: Column names, in the same order as each row tuple
+            rows: Row tuples
+            conflict_keys: Columns of the target's unique constraint
+            timestamps: Set created_at/updated_at (PFF tables have both)
+        
+        Returns:
+            int: Number of rows inserted or updated
+        """
+        key_indexes = [list(columns).index(k) for k in conflict_keys]
+        staged = dedupe_rows(rows, key_indexes)
+        if not staged:
+            return 0
+        
+        stage_table = f"_stage_{table}"
+        col_list = ', '.join(columns)
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(
+                f"CREATE TEMP TABLE {stage_table} ON COMMIT DROP AS "
+                f"SELECT {col_list} FROM {table} WITH NO DATA"
+            )
+            cursor.execute(
+                f"COPY {stage_table} ({col_list}) FROM STDIN",
+                stream=rows_to_copy_text(staged)
+            )
+            cursor.execute(build_merge_query(table, stage_table, columns, conflict_keys, timestamps))
+            rows_affected = cursor.rowcount
+            
+            conn.commit()
+            logger.info(f"✓ Bulk upsert into {table}: {len(staged)} rows staged, {rows_affected} rows affected")
+            return rows_affected
+        
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Bulk upsert into {table} failed: {e}")
+            raise
+        finally:
+            cursor.close()
+    
+    def commit(self):
+        """Commit current transaction"""
+        if self.connection:
+            self.connection.commit()
+            logger.info("Transaction committed")
+    
+    def rollback(self):
+        """Rollback current transaction"""
+        if self.connection:
+            self.connection.rollback()
+            logger.warning("Transaction rolled back")
+    
+    def close(self):
+        """Close database connection"""
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+            logger.info("Database connection closed")
+    
+    def __enter__(self):
+        """Context manager entry"""
+        self.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - auto-close connection"""
+        if exc_type:
+            self.rollback()
+        else:
+            self.commit()
+        self.close()
+
@@ -0,0 +1,325 @@
+"""
+PFFColumnSpecs.py
+Declarative column specs for every PFF position group.
+Each spec describes the target table, its conflict keys and the typed
+CSV -> DB column mapping consumed by PFFDataProcessor.
+"""
+
+# Column types understood by PFFDataProcessor
+STR = 'str'
+INT = 'int'
+DECIMAL = 'decimal'
+TEAM = 'team'        # normalized team abbreviation, read from the CSV 'team_name' column
+SEASON = 'season'    # injected from the Lambda event, not read from the CSV
+
+# CSV column that feeds TEAM columns
+TEAM_SOURCE_COLUMN = 'team_name'
+
+PFF_POSITION_SPECS = {
+    # Quarterbacks
+    'QB': {
+        'table': 'qb_pff_ratings',
+        'conflict_keys': ('player', 'team', 'season'),
+        'default_bucket': 'neal-nitya-qb-bucket',
+        'default_s3_prefix': 'QBs/',
+        'defaults': {'position': 'QB'},
+        'columns': [
+            ('player', STR),
+            ('player_id', STR),
+            ('position', STR),
+            ('team', TEAM),
+            ('franchise_id', INT),
+            ('season', SEASON),
+            ('player_game_count', INT),
+            ('accuracy_percent', DECIMAL),
+            ('aimed_passes', INT),
+            ('attempts', INT),
+            ('avg_depth_of_target', DECIMAL),
+            ('avg_time_to_throw', DECIMAL),
+            ('bats', INT),
+            ('big_time_throws', INT),
+            ('btt_rate', DECIMAL),
+            ('completion_percent', DECIMAL),
+            ('completions', INT),
+            ('declined_penalties', INT),
+            ('def_gen_pressures', INT),
+            ('drop_rate', DECIMAL),
+            ('dropbacks', INT),
+            ('drops', INT),
+            ('first_downs', INT),
+            ('grades_hands_fumble', DECIMAL),
+            ('grades_offense', DECIMAL),
+            ('grades_pass', DECIMAL),
+            ('grades_run', DECIMAL),
+            ('hit_as_threw', INT),
+            ('interceptions', INT),
+            ('passing_snaps', INT),
+            ('penalties', INT),
+            ('pressure_to_sack_rate', DECIMAL),
+            ('qb_rating', DECIMAL),
+            ('sack_percent', DECIMAL),
+            ('sacks', INT),
+            ('scrambles', INT),
+            ('spikes', INT),
+            ('thrown_aways', INT),
+            ('touchdowns', INT),
+            ('turnover_worthy_plays', INT),
+            ('twp_rate', DECIMAL),
+            ('yards', INT),
+            ('ypa', DECIMAL),
+        ],
+    },
+    # Running backs
+    'RB': {
+        'table': 'rb_pff_ratings',
+        'conflict_keys': ('player', 'team_name', 'season'),
+        'default_bucket': 'neal-nitya-rb-bucket',
+        'default_s3_prefix': 'RBs/',
+        'defaults': {},
+        'columns': [
+            ('player', STR),
+            ('player_id', STR),
+            ('position', STR),
+            ('team_name', TEAM),
+            ('season', SEASON),
+            ('player_game_count', INT),
+            ('attempts', INT),
+            ('avoided_tackles', INT),
+            ('breakaway_attempts', INT),
+            ('breakaway_percent', DECIMAL),
+            ('breakaway_yards', INT),
+            ('declined_penalties', INT),
+            ('designed_yards', INT),
+            ('drops', INT),
+            ('elu_recv_mtf', DECIMAL),
+            ('elu_rush_mtf', DECIMAL),
+            ('elu_yco', DECIMAL),
+            ('elusive_rating', DECIMAL),
+            ('explosive', INT),
+            ('first_downs', INT),
+            ('franchise_id', INT),
+            ('fumbles', INT),
+            ('gap_attempts', INT),
+            ('grades_hands_fumble', DECIMAL),
+            ('grades_offense', DECIMAL),
+            ('grades_offense_penalty', DECIMAL),
+            ('grades_pass', DECIMAL),
+            ('grades_pass_block', DECIMAL),
+            ('grades_pass_route', DECIMAL),
+            ('grades_run', DECIMAL),
+            ('grades_run_block', DECIMAL),
+            ('longest', INT),
+            ('penalties', INT),
+            ('rec_yards', INT),
+            ('receptions', INT),
+            ('routes', INT),
+            ('run_plays', INT),
+            ('scramble_yards', INT),
+            ('scrambles', INT),
+            ('targets', INT),
+            ('total_touches', INT),
+            ('touchdowns', INT),
+            ('yards', INT),
+            ('yards_after_contact', INT),
+            ('yco_attempt', DECIMAL),
+            ('ypa', DECIMAL),
+            ('yprr', DECIMAL),
+            ('zone_attempts', INT),
+        ],
+    },
+    # Wide receivers / tight ends
+    'WR': {
+        'table': 'wr_pff_ratings',
+        'conflict_keys': ('player', 'team_name', 'season'),
+        'default_bucket': 'neal-nitya-wr-bucket',
+        'default_s3_prefix': 'WRs/',
+        'defaults': {},
+        'columns': [
+            ('player', STR),
+            ('player_id', STR),
+            ('position', STR),
+            ('team_name', TEAM),
+            ('season', SEASON),
+            ('player_game_count', INT),
+            ('avg_depth_of_target', DECIMAL),
+            ('avoided_tackles', INT),
+            ('caught_percent', DECIMAL),
+            ('contested_catch_rate', DECIMAL),
+            ('contested_receptions', INT),
+            ('contested_targets', INT),
+            ('declined_penalties', INT),
+            ('drop_rate', DECIMAL),
+            ('drops', INT),
+            ('first_downs', INT),
+            ('franchise_id', INT),
+            ('fumbles', INT),
+            ('grades_hands_drop', DECIMAL),
+            ('grades_hands_fumble', DECIMAL),
+            ('grades_offense', DECIMAL),
+            ('grades_pass_block', DECIMAL),
+            ('grades_pass_route', DECIMAL),
+            ('inline_rate', DECIMAL),
+            ('inline_snaps', INT),
+            ('interceptions', INT),
+            ('longest', INT),
+            ('pass_block_rate', DECIMAL),
+            ('pass_blocks', INT),
+            ('pass_plays', INT),
+            ('penalties', INT),
+            ('receptions', INT),
+            ('route_rate', DECIMAL),
+            ('routes', INT),
+            ('slot_rate', DECIMAL),
+            ('slot_snaps', INT),
+            ('targeted_qb_rating', DECIMAL),
+            ('targets', INT),
+            ('touchdowns', INT),
+            ('wide_rate', DECIMAL),
+            ('wide_snaps', INT),
+            ('yards', INT),
+            ('yards_after_catch', INT),
+            ('yards_after_catch_per_reception', DECIMAL),
+            ('yards_per_reception', DECIMAL),
+            ('yprr', DECIMAL),
+        ],
+    },
+    # Offensive line
+    'OLINE': {
+        'table': 'oline_pff_ratings',
+        'conflict_keys': ('player', 'team_name', 'season'),
+        'default_bucket': 'neal-nitya-oline-bucket',
+        'default_s3_prefix': 'OLINE/',
+        'defaults': {},
+        'columns': [
+            ('player', STR),
+            ('player_id', STR),
+            ('position', STR),
+            ('team_name', TEAM),
+            ('season', SEASON),
+            ('player_game_count', INT),
+            ('block_percent', DECIMAL),
+            ('declined_penalties', INT),
+            ('franchise_id', INT),
+            ('grades_offense', DECIMAL),
+            ('grades_pass_block', DECIMAL),
+            ('grades_run_block', DECIMAL),
+            ('hits_allowed', INT),
+            ('hurries_allowed', INT),
+            ('non_spike_pass_block', INT),
+            ('non_spike_pass_block_percentage', DECIMAL),
+            ('pass_block_percent', DECIMAL),
+            ('pbe', INT),
+            ('penalties', INT),
+            ('pressures_allowed', INT),
+            ('sacks_allowed', INT),
+            ('snap_counts_block', INT),
+            ('snap_counts_ce', INT),
+            ('snap_counts_lg', INT),
+            ('snap_counts_lt', INT),
+            ('snap_counts_offense', INT),
+            ('snap_counts_pass_block', INT),
+            ('snap_counts_pass_play', INT),
+            ('snap_counts_rg', INT),
+            ('snap_counts_rt', INT),
+            ('snap_counts_run_block', INT),
+            ('snap_counts_te', INT),
+        ],
+    },
+    # Defense
+    'DEF': {
+        'table': 'defense_pff_ratings',
+        'conflict_keys': ('player', 'team_name', 'season'),
+        'default_bucket': 'neal-nitya-def-bucket',
+        'default_s3_prefix': 'DEF/',
+        'defaults': {},
+        'columns': [
+            ('player', STR),
+            ('player_id', STR),
+            ('position', STR),
+            ('team_name', TEAM),
+            ('season', SEASON),
+            ('player_game_count', INT),
+            ('assists', INT),
+            ('batted_passes', INT),
+            ('catch_rate', DECIMAL),
+            ('declined_penalties', INT),
+            ('forced_fumbles', INT),
+            ('franchise_id', INT),
+            ('fumble_recoveries', INT),
+            ('fumble_recovery_touchdowns', INT),
+            ('grades_coverage_defense', DECIMAL),
+            ('grades_defense', DECIMAL),
+            ('grades_defense_penalty', DECIMAL),
+            ('grades_pass_rush_defense', DECIMAL),
+            ('grades_run_defense', DECIMAL),
+            ('grades_tackle', DECIMAL),
+            ('hits', INT),
+            ('hurries', INT),
+            ('interception_touchdowns', INT),
+            ('interceptions', INT),
+            ('longest', INT),
+            ('missed_tackle_rate', DECIMAL),
+            ('missed_tackles', INT),
+            ('pass_break_ups', INT),
+            ('penalties', INT),
+            ('qb_rating_against', DECIMAL),
+            ('receptions', INT),
+            ('sacks', DECIMAL),
+            ('safeties', INT),
+            ('snap_counts_box', INT),
+            ('snap_counts_corner', INT),
+            ('snap_counts_coverage', INT),
+            ('snap_counts_defense', INT),
+            ('snap_counts_dl', INT),
+            ('snap_counts_dl_a_gap', INT),
+            ('snap_counts_dl_b_gap', INT),
+            ('snap_counts_dl_outside_t', INT),
+            ('snap_counts_dl_over_t', INT),
+            ('snap_counts_fs', INT),
+            ('snap_counts_offball', INT),
+            ('snap_counts_pass_rush', INT),
+            ('snap_counts_run_defense', INT),
+            ('snap_counts_slot', INT),
+            ('stops', INT),
+            ('tackles', INT),
+            ('tackles_for_loss', DECIMAL),
+            ('targets', INT),
+            ('total_pressures', INT),
+            ('touchdowns', INT),
+            ('yards', INT),
+            ('yards_after_catch', INT),
+            ('yards_per_reception', DECIMAL),
+        ],
+    },
+}
+
+# Aliases accepted in the Lambda event's 'position' field
+POSITION_ALIASES = {
+    'QBS': 'QB',
+    'RBS': 'RB',
+    'WRS': 'WR',
+    'TE': 'WR',
+    'OL': 'OLINE',
+    'DEFENSE': 'DEF',
+}
+
+
+def get_position_spec(position: str) -> dict:
+    """
+    Look up the column spec for a position group
+    
+    Args:
+        position: Position key or alias (e.g. 'QB', 'RBs', 'OL')
+    
+    Returns:
+        Spec dictionary from PFF_POSITION_SPECS
+    """
+    key = str(position or '').strip().upper()
+    key = POSITION_ALIASES.get(key, key)
+    
+    if key not in PFF_POSITION_SPECS:
+        raise ValueError(
+            f"Unknown PFF position '{position}'. Expected one of: {', '.join(PFF_POSITION_SPECS)}"
+        )
+    
+    return PFF_POSITION_SPECS[key]
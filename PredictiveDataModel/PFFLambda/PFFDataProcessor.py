@@ -0,0 +1,414 @@
+"""
+PFFDataProcessor.py
+Schema-driven PFF ETL engine shared by every position group.
+Parses a whole CSV column-by-column using the specs in PFFColumnSpecs
+and writes typed columnar batches to the database.
+"""
+
+import csv
+import logging
+import queue
+import threading
+from decimal import Decimal, InvalidOperation
+from itertools import compress
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from DatabaseUtils import DatabaseUtils
+from PFFColumnSpecs import STR, INT, DECIMAL, TEAM, SEASON, TEAM_SOURCE_COLUMN, get_position_spec
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Raw CSV values treated as missing (same rule the per-position processors used)
+NULL_TOKENS = frozenset(['', 'None'])
+
+# Streaming defaults: rows per transformed chunk, chunks buffered ahead of the DB writer
+STREAM_CHUNK_ROWS = 5000
+STREAM_QUEUE_DEPTH = 2
+
+# Map PFF team abbreviations to standard NFL abbreviations
+TEAM_MAPPING = {
+    'LA': 'LAR',      # Los Angeles Rams
+    'LAR': 'LAR',
+    'LAC': 'LAC',     # Los Angeles Chargers
+    'HST': 'HOU',     # Houston (sometimes abbreviated HST in PFF)
+    'BLT': 'BAL',     # Baltimore (sometimes BLT)
+    'CLV': 'CLE',     # Cleveland (sometimes CLV)
+    'ARZ': 'ARI',     # Arizona
+}
+
+
+def normalize_team_abbreviation(team: Optional[str]) -> str:
+    """
+    Normalize team abbreviations to standard format
+
+    Args:
+        team: Raw team abbreviation from CSV
+
+    Returns:
+        Standardized team abbreviation ('UNK' when missing)
+    """
+    if not team:
+        return 'UNK'
+
+    team = str(team).strip().upper()
+    return TEAM_MAPPING.get(team, team)
+
+
+def _parse_str(value: str) -> Optional[str]:
+    value = value.strip()
+    return value or None
+
+
+def _parse_int(value: str) -> Optional[int]:
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        # Handle values like "1.0" -> 1
+        return int(float(value))
+    except (ValueError, OverflowError):
+        logger.warning(f"Failed to convert value '{value}' to int")
+        return None
+
+
+def _parse_decimal(value: str) -> Optional[Decimal]:
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        logger.warning(f"Failed to convert value '{value}' to decimal")
+        return None
+
+
+def _parse_team(value: str) -> str:
+    return normalize_team_abbreviation(_parse_str(value))
+
+
+PARSERS: Dict[str, Callable[[str], Any]] = {
+    STR: _parse_str,
+    INT: _parse_int,
+    DECIMAL: _parse_decimal,
+    TEAM: _parse_team,
+}
+
+
+def parse_column(raw_values: Sequence[Optional[str]], data_type: str, default: Any = None) -> List[Any]:
+    """
+    Convert one raw CSV column to typed values in a single pass
+
+    Values are dictionary-encoded first, so each distinct raw string is
+    parsed once no matter how many rows repeat it (teams, positions,
+    small counting stats).
+
+    Args:
+        raw_values: Raw strings for every row of the column
+        data_type: Column type from PFFColumnSpecs
+        default: Value used when the raw value is missing
+
+    Returns:
+        List of typed values, same length as raw_values
+    """
+    parser = PARSERS[data_type]
+
+    lookup = {}
+    for raw in set(raw_values):
+        if raw is None or raw in NULL_TOKENS:
+            lookup[raw] = default
+        else:
+            lookup[raw] = parser(raw)
+
+    return [lookup[raw] for raw in raw_values]
+
+
+class PFFBatch:
+    """
+    Typed columnar batch for one PFF table
+    Holds one list per DB column, all of the same length
+    """
+
+    def __init__(self, table: str, columns: List[str], data: Dict[str, List[Any]]):
+        """
+        Args:
+            table: Target table name
+            columns: DB column names, in insert order
+            data: Column name -> list of typed values
+        """
+        self.table = table
+        self.columns = columns
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.data[self.columns[0]]) if self.columns else 0
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[tuple]:
+        """Yield row tuples in column order (for parameterized writes)"""
+        return zip(*(self.data[c][start:stop] for c in self.columns))
+
+    def filter(self, mask: Sequence[bool]) -> 'PFFBatch':
+        """Return a new batch keeping only rows where mask is True"""
+        return PFFBatch(
+            self.table,
+            self.columns,
+            {c: list(compress(values, mask)) for c, values in self.data.items()}
+        )
+
+
+class PFFDataProcessor:
+    """
+    Schema-driven data processing class
+    Transforms whole CSVs into typed columnar batches and writes them to the
+    position's table
+    """
+
+    def __init__(self, db_utils: DatabaseUtils, position: str):
+        """
+        Initialize processor
+
+        Args:
+            db_utils: DatabaseUtils instance for database operations
+            position: Position group key from PFFColumnSpecs (QB, RB, WR, OLINE, DEF)
+        """
+        self.db_utils = db_utils
+        self.spec = get_position_spec(position)
+        self.table = self.spec['table']
+        self.columns = [name for name, _ in self.spec['columns']]
+        logger.info(f"PFFDataProcessor initialized for {self.table}")
+
+    def transform_rows(self, header: Sequence[str], rows: List[List[str]], season: int) -> PFFBatch:
+        """
+        Transform parsed CSV records into a typed columnar batch
+
+        Args:
+            header: CSV header row
+            rows: CSV records (lists of raw strings, same order as header)
+            season: Year/season for this data
+
+        Returns:
+            PFFBatch containing only valid rows
+        """
+        header = [h.lstrip('\ufeff').strip() for h in header]
+        index = {name: i for i, name in enumerate(header)}
+        width = len(header)
+
+        # Pad ragged records so the transpose below stays aligned
+        if any(len(r) != width for r in rows):
+            rows = [(r + [''] * (width - len(r)))[:width] for r in rows]
+        raw_columns = list(zip(*rows)) if rows else [() for _ in header]
+
+        n_rows = len(rows)
+        defaults = self.spec.get('defaults', {})
+        data = {}
+
+        for name, data_type in self.spec['columns']:
+            if data_type == SEASON:
+                data[name] = [season] * n_rows
+                continue
+
+            if data_type == TEAM:
+                source, default = TEAM_SOURCE_COLUMN, normalize_team_abbreviation(None)
+            else:
+                source, default = name, defaults.get(name)
+
+            if source in index:
+                data[name] = parse_column(raw_columns[index[source]], data_type, default)
+            else:
+                data[name] = [default] * n_rows
+
+        batch = PFFBatch(self.table, self.columns, data)
+
+        # Validate required fields: player and season
+        if not season:
+            logger.warning(f"Season missing, dropping all {n_rows} rows")
+            return batch.filter([False] * n_rows)
+
+        mask = [bool(p) for p in data['player']]
+        invalid = n_rows - sum(mask)
+        if invalid:
+            logger.warning(f"Dropped {invalid} rows missing required field 'player'")
+            batch = batch.filter(mask)
+
+        return batch
+
+    def transform_csv(self, lines: Iterable[str], season: int) -> PFFBatch:
+        """
+        Parse and transform a whole CSV in one pass
+
+        Args:
+            lines: CSV text as an iterable of lines (file object, StringIO, ...)
+            season: Year/season for this data
+
+        Returns:
+            PFFBatch containing only valid rows
+        """
+        reader = csv.reader(lines)
+        header = next(reader, None)
+        if header is None:
+            return self.transform_rows([], [], season)
+
+        # Skip blank lines, as csv.DictReader does
+        rows = [row for row in reader if row]
+        return self.transform_rows(header, rows, season)
+
+    def transform_dict_rows(self, csv_rows: List[Dict[str, Any]], season: int) -> PFFBatch:
+        """
+        Transform rows already parsed by csv.DictReader
+
+        Args:
+            csv_rows: List of raw CSV row dictionaries
+            season: Year/season for this data
+
+        Returns:
+            PFFBatch containing only valid rows
+        """
+        header = list(csv_rows[0].keys()) if csv_rows else []
+        rows = [['' if row.get(h) is None else row.get(h) for h in header] for row in csv_rows]
+        return self.transform_rows(header, rows, season)
+
+    def store_batch(self, batch: PFFBatch) -> int:
+        """
+        Write a columnar batch to the database with one COPY + merge
+
+        Args:
+            batch: PFFBatch produced by one of the transform methods
+
+        Returns:
+            Total number of rows written
+        """
+        if not len(batch):
+            return 0
+
+        try:
+            total_inserted = self.db_utils.bulk_upsert(
+                self.table, self.columns, batch.rows(), self.spec['conflict_keys']
+            )
+        except Exception as e:
+            logger.error(f"Failed to process batch: {e}")
+            raise
+
+        logger.info(f"✓ COMPLETE: {total_inserted} rows upserted to {self.table}")
+        return total_inserted
+
+    def process_csv(self, lines: Iterable[str], season: int) -> int:
+        """
+        THE MAIN METHOD
+        Transform a whole CSV and store it in the database
+
+        Args:
+            lines: CSV text as an iterable of lines
+            season: Year/season for this data
+
+        Returns:
+            Total number of rows processed
+        """
+        batch = self.transform_csv(lines, season)
+        logger.info(f"✓ Transformed {len(batch)} valid rows for season {season}")
+        return self.store_batch(batch)
+
+    def iter_batches(self, lines: Iterable[str], season: int,
+                     chunk_rows: int = STREAM_CHUNK_ROWS) -> Iterator[PFFBatch]:
+        """
+        Parse a CSV stream and yield typed batches of at most chunk_rows rows
+
+        Args:
+            lines: CSV text as an iterable of lines (e.g. S3FileReader.iter_csv_lines)
+            season: Year/season for this data
+            chunk_rows: Maximum CSV records per batch
+
+        Returns:
+            Iterator of PFFBatch, each containing only valid rows
+        """
+        reader = csv.reader(lines)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        chunk = []
+        for row in reader:
+            # Skip blank lines, as csv.DictReader does
+            if not row:
+                continue
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                yield self.transform_rows(header, chunk, season)
+                chunk = []
+
+        if chunk:
+            yield self.transform_rows(header, chunk, season)
+
+    def process_stream(self, lines: Iterable[str], season: int,
+                       chunk_rows: int = STREAM_CHUNK_ROWS,
+                       queue_depth: int = STREAM_QUEUE_DEPTH) -> int:
+        """
+        Pipelined load: parse/transform chunks while a writer thread stores them
+
+        The calling thread pulls lines (downloading as it goes) and transforms
+        fixed-size chunks; a dedicated writer thread upserts finished chunks.
+        The bounded queue keeps at most queue_depth chunks in flight, so memory
+        stays flat regardless of file size.
+
+        Args:
+            lines: CSV text as an iterable of lines
+            season: Year/season for this data
+            chunk_rows: Maximum CSV records per chunk
+            queue_depth: Transformed chunks buffered ahead of the writer
+
+        Returns:
+            Total number of rows processed
+        """
+        batches = queue.Queue(maxsize=queue_depth)
+        state = {'rows': 0, 'chunks': 0, 'error': None}
+
+        def write_batches():
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    return
+                # After a failure keep draining so the producer never blocks
+                if state['error'] is not None:
+                    continue
+                try:
+                    state['rows'] += self.store_batch(batch)
+                    state['chunks'] += 1
+                except Exception as e:
+                    state['error'] = e
+
+        writer = threading.Thread(target=write_batches, name='pff-db-writer', daemon=True)
+        writer.start()
+
+        try:
+            for batch in self.iter_batches(lines, season, chunk_rows):
+                if state['error'] is not None:
+                    break
+                batches.put(batch)
+        finally:
+            batches.put(None)
+            writer.join()
+
+        if state['error'] is not None:
+            logger.error(f"Streaming load failed after {state['rows']} rows: {state['error']}")
+            raise state['error']
+
+        logger.info(f"✓ Streamed {state['rows']} rows in {state['chunks']} chunks for season {season}")
+        return state['rows']
+
+    def process_and_store(self, csv_rows: List[Dict[str, Any]], season: int) -> int:
+        """
+        Process rows already parsed into dictionaries and store them
+
+        Args:
+            csv_rows: List of raw CSV rows
+            season: Year/season for this data
+
+        Returns:
+            Total number of rows processed
+        """
+        logger.info(f"Processing {len(csv_rows)} rows for season {season}")
+        batch = self.transform_dict_rows(csv_rows, season)
+        logger.info(f"✓ Transformed {len(batch)} valid rows")
+        return self.store_batch(batch)
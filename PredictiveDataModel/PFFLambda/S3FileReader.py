@@ -0,0 +1,423 @@
+"""
+S3FileReader.py
+Reads CSV files from S3 and parses them into Python dictionaries
+"""
+
+import boto3
+import codecs
+import csv
+import io
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from botocore.config import Config
+from typing import List, Dict, Any, Iterable, Iterator, Callable, Optional, Tuple
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Streaming defaults: 1 MB network reads, up to 4 chunks buffered ahead of the parser
+STREAM_CHUNK_SIZE = 1024 * 1024
+STREAM_PREFETCH_CHUNKS = 4
+
+# Concurrent multi-file reads: worker threads per reader, in-flight GETs per worker
+DEFAULT_READ_WORKERS = 8
+READ_WINDOW_PER_WORKER = 2
+
+# One client config for every reader: enough pooled connections for the
+# read pool plus streaming prefetch, with adaptive retries for throttling
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    connect_timeout=10,
+    read_timeout=60,
+)
+
+_END_OF_STREAM = object()
+
+# Global client (for Lambda warm starts); boto3 clients are thread-safe
+_s3_client = None
+
+
+def get_s3_client():
+    """Get or create the shared S3 client (cached for warm starts)"""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client('s3', config=S3_CLIENT_CONFIG)
+        logger.info("✓ S3 client initialized")
+    return _s3_client
+
+
+def prefetch(iterable: Iterable[Any], depth: int) -> Iterator[Any]:
+    """
+    Consume an iterable in a background thread, buffering at most depth items
+    
+    Lets a slow producer (network download) run ahead of the consumer
+    (CSV parsing) without holding more than depth items in memory.
+    Exceptions raised by the producer are re-raised in the consumer.
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    
+    def produce():
+        try:
+            for item in iterable:
+                if stop.is_set():
+                    return
+                buffer.put(item)
+            buffer.put(_END_OF_STREAM)
+        except Exception as e:
+            buffer.put(e)
+    
+    thread = threading.Thread(target=produce, name='s3-prefetch', daemon=True)
+    thread.start()
+    
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # Unblock the producer if the consumer stops early
+        stop.set()
+        while thread.is_alive():
+            try:
+                buffer.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+def iter_text_lines(chunks: Iterable[bytes], encoding: str = 'utf-8') -> Iterator[str]:
+    """
+    Decode a stream of byte chunks into lines (line endings kept)
+    
+    Splits on '\n' only, so csv.reader still sees quoted fields with
+    embedded newlines intact and multi-byte characters split across
+    chunks decode correctly.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ''
+    
+    for chunk in chunks:
+        parts = (pending + decoder.decode(chunk)).split('\n')
+        pending = parts.pop()
+        for line in parts:
+            yield line + '\n'
+    
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
+
+class S3FileReader:
+    """
+    Reads CSV files from Amazon S3 and parses them
+    Handles S3 connection, file retrieval, and CSV parsing
+    """
+    
+    def __init__(self, bucket_name: str, max_workers: int = DEFAULT_READ_WORKERS):
+        """
+        Initialize S3 client
+        
+        Args:
+            bucket_name: Name of the S3 bucket (e.g., 'neal-nitya-qb-bucket')
+            max_workers: Concurrent GETs for multi-file reads
+        """
+        self.bucket_name = bucket_name
+        self.max_workers = max(1, int(max_workers))
+        self.s3_client = get_s3_client()
+        logger.info(f"S3FileReader initialized for bucket: {bucket_name} (max_workers={self.max_workers})")
+    
+    def list_objects_in_folder(self, prefix: str) -> List[Dict[str, Any]]:
+        """
+        List all objects in an S3 folder, following pagination
+        
+        list_objects_v2 returns at most 1,000 keys per call, so every page
+        is read until the listing is exhausted.
+        
+        Args:
+            prefix: S3 folder path (e.g., 'QBs/')
+        
+        Returns:
+            List of {'Key', 'Size', 'ETag'} dictionaries (folders excluded)
+        """
+        try:
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            objects = []
+            
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    # Filter out folders (keys ending with '/')
+                    if obj['Key'].endswith('/'):
+                        continue
+                    objects.append({
+                        'Key': obj['Key'],
+                        'Size': obj.get('Size', 0),
+                        'ETag': obj.get('ETag'),
+                    })
+            
+            if not objects:
+                logger.warning(f"No files found in s3://{self.bucket_name}/{prefix}")
+            else:
+                logger.info(f"Found {len(objects)} files in {prefix}")
+            return objects
+        
+        except Exception as e:
+            logger.error(f"Failed to list files in S3: {e}")
+            raise
+    
+    def list_files_in_folder(self, prefix: str) -> List[str]:
+        """
+        List all files in an S3 folder
+        
+        Args:
+            prefix: S3 folder path (e.g., 'QBs/')
+        
+        Returns:
+            List of S3 object keys
+        """
+        return [obj['Key'] for obj in self.list_objects_in_folder(prefix)]
+    
+    def read_csv_from_s3(self, s3_key: str) -> List[Dict[str, Any]]:
+        """
+        Read a CSV file from S3 and parse it into a list of dictionaries
+        
+        Args:
+            s3_key: Full S3 object key (e.g., 'QBs/passing_summary.csv')
+        
+        Returns:
+            List of dictionaries, one per CSV row
+        """
+        logger.info(f"Reading CSV from s3://{self.bucket_name}/{s3_key}")
+        
+        try:
+            # Get object from S3
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=s3_key
+            )
+            
+            # Read and decode content
+            content = response['Body'].read().decode('utf-8')
+            
+            # Parse CSV
+            csv_reader = csv.DictReader(io.StringIO(content))
+            rows = list(csv_reader)
+            
+            logger.info(f"✓ Parsed {len(rows)} rows from CSV")
+            logger.info(f"  CSV columns: {list(rows[0].keys()) if rows else 'N/A'}")
+            
+            return rows
+        
+        except Exception as e:
+            logger.error(f"Failed to read CSV from S3: {e}")
+            raise
+    
+    def read_csv_text_from_s3(self, s3_key: str) -> str:
+        """
+        Read a CSV file from S3 as raw text (no row parsing)
+        
+        Args:
+            s3_key: Full S3 object key (e.g., 'QBs/passing_summary.csv')
+        
+        Returns:
+            Decoded CSV content
+        """
+        logger.info(f"Reading CSV from s3://{self.bucket_name}/{s3_key}")
+        
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=s3_key
+            )
+            return response['Body'].read().decode('utf-8')
+        
+        except Exception as e:
+            logger.error(f"Failed to read CSV from S3: {e}")
+            raise
+    
+    def iter_csv_lines(self, s3_key: str, chunk_size: int = STREAM_CHUNK_SIZE,
+                       prefetch_chunks: int = STREAM_PREFETCH_CHUNKS) -> Iterator[str]:
+        """
+        Stream a CSV file from S3 line by line without reading it into memory
+        
+        The S3 body is downloaded in chunk_size pieces by a background thread
+        (up to prefetch_chunks ahead), so download overlaps with parsing.
+        
+        Args:
+            s3_key: Full S3 object key (e.g., 'QBs/passing_summary.csv')
+            chunk_size: Bytes per network read
+            prefetch_chunks: Chunks buffered ahead of the consumer
+        
+        Returns:
+            Iterator of CSV lines, suitable for csv.reader
+        """
+        logger.info(f"Streaming CSV from s3://{self.bucket_name}/{s3_key}")
+        
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=s3_key
+            )
+        except Exception as e:
+            logger.error(f"Failed to read CSV from S3: {e}")
+            raise
+        
+        body = response['Body']
+        try:
+            yield from iter_text_lines(prefetch(body.iter_chunks(chunk_size), prefetch_chunks))
+        finally:
+            body.close()
+    
+    def list_csv_files_in_folder(self, prefix: str) -> List[str]:
+        """
+        List only the CSV files in an S3 folder
+        
+        Args:
+            prefix: S3 folder path
+        
+        Returns:
+            List of CSV object keys
+        """
+        return [obj['Key'] for obj in self.list_csv_objects_in_folder(prefix)]
+    
+    def list_csv_objects_in_folder(self, prefix: str) -> List[Dict[str, Any]]:
+        """
+        List only the CSV objects in an S3 folder, with sizes and ETags
+        
+        Args:
+            prefix: S3 folder path
+        
+        Returns:
+            List of {'Key', 'Size', 'ETag'} dictionaries
+        """
+        objects = [obj for obj in self.list_objects_in_folder(prefix) if obj['Key'].endswith('.csv')]
+        logger.info(f"Found {len(objects)} CSV files to process")
+        return objects
+    
+    def map_concurrently(self, fn: Callable[[str], Any], s3_keys: Iterable[str],
+                         ordered: bool = True, max_workers: Optional[int] = None,
+                         size_of: Optional[Callable[[str], int]] = None,
+                         max_bytes: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Apply fn to many S3 keys on a bounded thread pool
+        
+        At most max_workers * READ_WINDOW_PER_WORKER calls are in flight, so
+        results never pile up in memory faster than the caller consumes them.
+        With max_bytes, calls in flight (running or finished but not yet
+        yielded) are also capped at max_bytes of size_of(key) in total; one
+        call is always allowed, so a single key larger than the budget still runs.
+        
+        Args:
+            fn: Function taking an S3 key (e.g. self.read_csv_text_from_s3)
+            s3_keys: Keys to process
+            ordered: True yields results in key order; False yields each as
+                it completes (lowest latency)
+            max_workers: Override the reader's worker count
+            size_of: Bytes fn(key) holds in memory (e.g. the object Size)
+            max_bytes: Byte budget for calls in flight (requires size_of)
+        
+        Returns:
+            Iterator of (s3_key, fn(s3_key)) tuples
+        """
+        workers = max(1, max_workers or self.max_workers)
+        window = workers * READ_WINDOW_PER_WORKER
+        keys = iter(s3_keys)
+        next_key = [next(keys, None)]
+        in_flight_bytes = [0]
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='s3-read') as pool:
+            in_flight = deque() if ordered else {}
+            
+            def submit_next() -> bool:
+                key = next_key[0]
+                if key is None or len(in_flight) >= window:
+                    return False
+                cost = size_of(key) if size_of else 0
+                if max_bytes is not None and in_flight and in_flight_bytes[0] + cost > max_bytes:
+                    return False
+                next_key[0] = next(keys, None)
+                in_flight_bytes[0] += cost
+                future = pool.submit(fn, key)
+                if ordered:
+                    in_flight.append((key, future, cost))
+                else:
+                    in_flight[future] = (key, cost)
+                return True
+            
+            while submit_next():
+                pass
+            
+            try:
+                while in_flight:
+                    if ordered:
+                        key, future, cost = in_flight.popleft()
+                        result = future.result()
+                        in_flight_bytes[0] -= cost
+                        while submit_next():
+                            pass
+                        yield key, result
+                    else:
+                        done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                        for future in done:
+                            key, cost = in_flight.pop(future)
+                            result = future.result()
+                            in_flight_bytes[0] -= cost
+                            while submit_next():
+                                pass
+                            yield key, result
+            finally:
+                # Caller stopped early or a read failed: drop queued work
+                pending = [f for _, f, _ in in_flight] if ordered else list(in_flight)
+                for future in pending:
+                    future.cancel()
+    
+    def read_csv_texts_concurrently(self, s3_keys: Iterable[str], ordered: bool = True,
+                                    max_workers: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Download many CSV files concurrently as raw text
+        
+        Returns:
+            Iterator of (s3_key, csv_text) tuples
+        """
+        return self.map_concurrently(self.read_csv_text_from_s3, s3_keys, ordered, max_workers)
+    
+    def read_csvs_concurrently(self, s3_keys: Iterable[str], ordered: bool = True,
+                               max_workers: Optional[int] = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Download and parse many CSV files concurrently
+        
+        Returns:
+            Iterator of (s3_key, rows) tuples
+        """
+        return self.map_concurrently(self.read_csv_from_s3, s3_keys, ordered, max_workers)
+    
+    def read_all_csvs_in_folder(self, prefix: str) -> List[Dict[str, Any]]:
+        """
+        Read all CSV files in an S3 folder and combine them
+        
+        Files are fetched concurrently but combined in listing order.
+        
+        Args:
+            prefix: S3 folder path
+        
+        Returns:
+            Combined list of all rows from all CSVs
+        """
+        all_rows = []
+        
+        # Get list of CSV files
+        csv_files = self.list_csv_files_in_folder(prefix)
+        
+        # Read CSVs concurrently, in order
+        for _, rows in self.read_csvs_concurrently(csv_files, ordered=True):
+            all_rows.extend(rows)
+        
+        logger.info(f"✓ Total rows loaded: {len(all_rows)}")
+        return all_rows
+
@@ -0,0 +1,102 @@
+"""
+Benchmark: COPY + merge bulk upsert vs row-by-row execute_batch
+Runs against a local Postgres and reports rows/sec for 1k / 10k / 100k rows.
+Each size is measured twice: a cold load (all inserts) and a reload of the
+same keys (all updates), since PFF files are re-uploaded often.
+
+Usage:
+    export DB_HOST=localhost DB_PORT=5432 DB_NAME=postgres DB_USER=postgres DB_PASSWORD=postgres DB_SSL=false
+    python benchmark_bulk_upsert.py
+    python benchmark_bulk_upsert.py --sizes 1000 10000 --skip-row-by-row-above 10000
+"""
+
+import argparse
+import io
+import time
+from DatabaseUtils import DatabaseUtils
+from PFFColumnSpecs import get_position_spec
+from PFFDataProcessor import PFFDataProcessor
+from benchmark_transform import generate_csv
+
+BENCH_TABLE = 'bench_qb_pff_ratings'
+
+
+def create_bench_table(db: DatabaseUtils):
+    """Scratch copy of qb_pff_ratings' shape (typed columns + unique key)"""
+    spec = get_position_spec('QB')
+    sql_types = {'str': 'VARCHAR(255)', 'team': 'VARCHAR(10)', 'season': 'INTEGER',
+                 'int': 'INTEGER', 'decimal': 'DECIMAL(10,2)'}
+    columns = ',\n'.join(f"{name} {sql_types[t]}" for name, t in spec['columns'])
+
+    db.execute_query(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+    db.execute_query(f"""
+        CREATE TABLE {BENCH_TABLE} (
+            id SERIAL PRIMARY KEY,
+            {columns},
+            created_at TIMESTAMP,
+            updated_at TIMESTAMP,
+            UNIQUE (player, team, season)
+        )
+    """)
+    db.commit()
+
+
+def row_by_row(db: DatabaseUtils, processor: PFFDataProcessor, rows: list) -> int:
+    columns = processor.columns
+    conflict_keys = processor.spec['conflict_keys']
+    update_cols = ', '.join(f"{c} = EXCLUDED.{c}" for c in columns if c not in conflict_keys)
+    query = f"""
+        INSERT INTO {BENCH_TABLE} ({', '.join(columns)}, created_at, updated_at)
+        VALUES ({', '.join(['%s'] * len(columns))}, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        ON CONFLICT ({', '.join(conflict_keys)})
+        DO UPDATE SET {update_cols}, updated_at = CURRENT_TIMESTAMP
+    """
+    total = 0
+    for i in range(0, len(rows), 50):
+        total += db.execute_batch(query, rows[i:i + 50])
+    return total
+
+
+def bulk(db: DatabaseUtils, processor: PFFDataProcessor, rows: list) -> int:
+    return db.bulk_upsert(BENCH_TABLE, processor.columns, rows, processor.spec['conflict_keys'])
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--skip-row-by-row-above', type=int, default=None,
+                        help='Skip the slow row-by-row path for larger sizes')
+    args = parser.parse_args()
+
+    db = DatabaseUtils()
+    processor = PFFDataProcessor(db_utils=db, position='QB')
+
+    print(f"{'rows':>8} {'path':<12} {'insert rows/s':>14} {'update rows/s':>14}")
+    try:
+        for n in args.sizes:
+            content = generate_csv(processor.spec, n)
+            rows = list(processor.transform_csv(io.StringIO(content, newline=''), 2024).rows())
+
+            paths = [('copy+merge', bulk)]
+            if args.skip_row_by_row_above is None or n <= args.skip_row_by_row_above:
+                paths.insert(0, ('row-by-row', row_by_row))
+
+            for name, fn in paths:
+                create_bench_table(db)
+                insert_secs = _timed(lambda: fn(db, processor, rows))
+                update_secs = _timed(lambda: fn(db, processor, rows))
+                print(f"{n:>8} {name:<12} {n / insert_secs:>14,.0f} {n / update_secs:>14,.0f}")
+    finally:
+        db.execute_query(f"DROP TABLE IF EXISTS {BENCH_TABLE}")
+        db.commit()
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+"""
+Benchmark: schema-driven columnar transform vs the old per-row path
+Compares rows/sec of PFFDataProcessor.transform_csv against the
+per-position PFFDataProcessor the old {QBs,RBs,WRs,OLINE,DEF}PFFLambda
+shipped (DictReader + transform_row/validate_row/row_to_tuple), and checks
+both produce identical rows. The old processors are loaded verbatim from
+git history, so this has to run inside a clone of the repo.
+
+Usage:
+    python benchmark_transform.py                      # synthetic 10k-row QB file
+    python benchmark_transform.py --position DEF --rows 10000
+    python benchmark_transform.py --position WR --csv receiving_summary.csv
+    python benchmark_transform.py --position RB --legacy-rev f20942b
+"""
+
+import argparse
+import csv
+import io
+import logging
+import os
+import random
+import re
+import subprocess
+import time
+import types
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from PFFColumnSpecs import INT, DECIMAL, TEAM, SEASON, TEAM_SOURCE_COLUMN, PFF_POSITION_SPECS, get_position_spec
+from PFFDataProcessor import PFFDataProcessor
+
+TEAMS = ['ARZ', 'ATL', 'BLT', 'BUF', 'CAR', 'CHI', 'CIN', 'CLV', 'DAL', 'DEN', 'DET', 'GB',
+         'HST', 'IND', 'JAX', 'KC', 'LA', 'LAC', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG',
+         'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS']
+
+
+# ---------------------------------------------------------------------------
+# Old per-row path: the deleted {QBs,RBs,WRs,OLINE,DEF}PFFLambda processors,
+# loaded verbatim from git history (the parent of the commit that removed them)
+# ---------------------------------------------------------------------------
+
+LEGACY_LAMBDA_DIRS = {
+    'QB': 'QBsPFFLambda',
+    'RB': 'RBsPFFLambda',
+    'WR': 'WRsPFFLambda',
+    'OLINE': 'OLINEPFFLambda',
+    'DEF': 'DEFPFFLambda',
+}
+
+
+def _git(*args: str) -> str:
+    result = subprocess.run(['git', *args], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def load_legacy_processor(position: str, rev: Optional[str] = None):
+    """
+    Import the old per-position PFFDataProcessor module straight from git
+
+    Args:
+        position: Canonical position key (QB, RB, WR, OLINE, DEF)
+        rev: Revision to read it from (default: just before it was deleted)
+
+    Returns:
+        The old module's PFFDataProcessor class
+    """
+    path = f"PredictiveDataModel/{LEGACY_LAMBDA_DIRS[position]}/PFFDataProcessor.py"
+    if rev is None:
+        removed_in = _git('log', '--diff-filter=D', '-1', '--format=%H', '--', f':/{path}').strip()
+        if not removed_in:
+            raise SystemExit(f"Could not find the commit that removed {path}; pass --legacy-rev")
+        rev = f"{removed_in}^"
+    source = _git('show', f"{rev}:{path}")
+
+    module = types.ModuleType(f"legacy_{LEGACY_LAMBDA_DIRS[position]}")
+    exec(compile(source, f"{rev}:{path}", 'exec'), module.__dict__)
+    return module.PFFDataProcessor
+
+
+def legacy_columns(processor) -> Tuple[str, List[str]]:
+    """Table and column order the old processor wrote, read off its own INSERT"""
+    match = re.search(r'INSERT INTO (\w+) \((.*?), created_at', processor.build_upsert_query())
+    return match.group(1), [c.strip() for c in match.group(2).split(',')]
+
+
+def legacy_transform(processor, columns: List[str], content: str, season: int) -> List[Dict[str, Any]]:
+    """The old process_and_store path up to execute_batch, keyed by column"""
+    csv_rows = list(csv.DictReader(io.StringIO(content)))
+    rows = []
+    for raw_row in csv_rows:
+        transformed = processor.transform_row(raw_row, season)
+        if processor.validate_row(transformed):
+            rows.append(dict(zip(columns, processor.row_to_tuple(transformed))))
+    return rows
+
+
+def compare(legacy_rows: List[Dict[str, Any]], engine_rows: List[Dict[str, Any]]) -> List[str]:
+    """Describe every difference between the two outputs (empty when identical)"""
+    problems = []
+    if len(legacy_rows) != len(engine_rows):
+        problems.append(f"row count: legacy {len(legacy_rows)}, engine {len(engine_rows)}")
+    if legacy_rows and engine_rows:
+        missing = [c for c in legacy_rows[0] if c not in engine_rows[0]]
+        extra = [c for c in engine_rows[0] if c not in legacy_rows[0]]
+        if missing:
+            problems.append(f"columns only in legacy: {', '.join(missing)}")
+        if extra:
+            problems.append(f"columns only in engine: {', '.join(extra)}")
+
+    mismatched = Counter()
+    examples = {}
+    for legacy, engine in zip(legacy_rows, engine_rows):
+        for column in legacy.keys() & engine.keys():
+            if legacy[column] != engine[column]:
+                mismatched[column] += 1
+                examples.setdefault(column, (legacy[column], engine[column]))
+    for column, count in mismatched.most_common():
+        old, new = examples[column]
+        problems.append(f"{column}: {count} rows differ (e.g. legacy {old!r}, engine {new!r})")
+    return problems
+
+
+# ---------------------------------------------------------------------------
+# Synthetic PFF file
+# ---------------------------------------------------------------------------
+
+def generate_csv(spec: dict, n_rows: int, seed: int = 42) -> str:
+    rng = random.Random(seed)
+    header = [TEAM_SOURCE_COLUMN if t == TEAM else name
+              for name, t in spec['columns'] if t != SEASON]
+
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(header)
+    for i in range(n_rows):
+        record = []
+        for name, data_type in spec['columns']:
+            if data_type == SEASON:
+                continue
+            if rng.random() < 0.03 and name != 'player':
+                record.append('')
+            elif name == 'player':
+                record.append(f"Player {i}")
+            elif name == 'player_id':
+                record.append(str(10000 + i))
+            elif name == 'position':
+                record.append(rng.choice(['QB', 'HB', 'WR', 'TE', 'T', 'G', 'C', 'ED', 'DI', 'LB', 'CB', 'S']))
+            elif data_type == TEAM:
+                record.append(rng.choice(TEAMS))
+            elif data_type == INT:
+                record.append(str(rng.randint(0, 600)) if rng.random() < 0.9 else f"{rng.randint(0, 600)}.0")
+            elif data_type == DECIMAL:
+                record.append(f"{rng.uniform(0, 100):.1f}")
+            else:
+                record.append(f"value_{rng.randint(0, 20)}")
+        writer.writerow(record)
+    return out.getvalue()
+
+
+def _time(fn, repeat: int):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--position', default='QB')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--csv', help='Real PFF CSV to benchmark instead of synthetic data')
+    parser.add_argument('--season', type=int, default=2024)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--legacy-rev', help='Git revision to load the old processors from '
+                                             '(default: the parent of the commit that removed them)')
+    args = parser.parse_args()
+
+    spec = get_position_spec(args.position)
+    position = next(key for key, value in PFF_POSITION_SPECS.items() if value is spec)
+    if args.csv:
+        with open(args.csv, encoding='utf-8') as f:
+            content = f.read()
+    else:
+        content = generate_csv(spec, args.rows)
+
+    # The old processors warn on every row they drop or fail to parse
+    logging.getLogger().setLevel(logging.ERROR)
+
+    legacy = load_legacy_processor(position, args.legacy_rev)(db_utils=None)
+    legacy_table, columns = legacy_columns(legacy)
+    processor = PFFDataProcessor(db_utils=None, position=position)
+
+    legacy_secs, legacy_rows = _time(lambda: legacy_transform(legacy, columns, content, args.season), args.repeat)
+    engine_secs, batch = _time(
+        lambda: processor.transform_csv(io.StringIO(content, newline=''), args.season), args.repeat
+    )
+    engine_rows = [dict(zip(batch.columns, row)) for row in batch.rows()]
+
+    problems = compare(legacy_rows, engine_rows)
+    if legacy_table != batch.table:
+        problems.insert(0, f"table: legacy {legacy_table}, engine {batch.table}")
+
+    n = len(legacy_rows)
+    print(f"Position: {position} ({spec['table']}), {n} rows, {len(spec['columns'])} columns")
+    print(f"  per-row path   : {legacy_secs * 1000:8.1f} ms  {n / legacy_secs:>12,.0f} rows/sec")
+    print(f"  columnar engine: {engine_secs * 1000:8.1f} ms  {n / engine_secs:>12,.0f} rows/sec")
+    print(f"  speedup        : {legacy_secs / engine_secs:.1f}x")
+    print(f"  parity         : {'OK' if not problems else 'MISMATCH'}")
+    for problem in problems:
+        print(f"    {problem}")
+
+    if problems:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+"""
+PFF Lambda Handler
+Orchestrates the ETL process for every PFF position group:
+Extract from S3 -> Transform (schema-driven) -> Load to Database
+"""
+
+import io
+import json
+import logging
+import os
+from S3FileReader import S3FileReader, DEFAULT_READ_WORKERS
+from PFFDataProcessor import PFFDataProcessor
+from PFFColumnSpecs import get_position_spec
+from DatabaseUtils import DatabaseUtils
+from FileManifest import FileManifest
+
+# Configure logging
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Files at least this large are streamed instead of downloaded whole
+STREAM_MIN_BYTES = 32 * 1024 * 1024
+# Cap on the raw bytes of small files downloaded ahead of processing
+PREFETCH_MAX_BYTES = int(os.environ.get('PFF_PREFETCH_MAX_BYTES', 128 * 1024 * 1024))
+
+
+def _normalize_seasons_to_process(event, default_s3_prefix):
+    """
+    Normalize event to list of {season, s3_prefix} configs.
+    Supports: season (int), season (list), or seasons (list of configs).
+    """
+    if 'seasons' in event:
+        return event['seasons']
+    if 'season' not in event:
+        raise ValueError("Event must contain 'season' or 'seasons'")
+    season_param = event['season']
+    s3_prefix = event.get('s3_prefix', default_s3_prefix)
+    s3_prefix_template = event.get('s3_prefix_template')
+    if isinstance(season_param, (list, tuple)):
+        seasons = [int(s) for s in season_param]
+        if s3_prefix_template:
+            return [{'season': s, 's3_prefix': s3_prefix_template.format(season=s)} for s in seasons]
+        return [{'season': s, 's3_prefix': s3_prefix} for s in seasons]
+    return [{'season': int(season_param), 's3_prefix': s3_prefix}]
+
+
+def lambda_handler(event, context):
+    """
+    AWS Lambda handler for PFF data ingestion (all position groups)
+
+    The position group comes from the event, or from the PFF_POSITION
+    environment variable when one deployed function serves one position.
+    Valid positions: QB, RB, WR, OLINE, DEF
+
+    Event format - single season:
+    {
+        "position": "QB",
+        "bucket": "neal-nitya-qb-bucket",
+        "season": 2024,
+        "s3_prefix": "QBs/"
+    }
+
+    Event format - multiple seasons (per-season S3 path):
+    {
+        "position": "RB",
+        "season": [2022, 2023, 2024],
+        "s3_prefix_template": "RBs/{season}/"
+    }
+
+    OR legacy format:
+    {
+        "position": "WR",
+        "seasons": [
+            {"season": 2022, "s3_prefix": "WRs/WRs-2022/"},
+            {"season": 2023, "s3_prefix": "WRs/WRs-2023/"}
+        ]
+    }
+
+    bucket and s3_prefix default to the position's values in PFFColumnSpecs.
+    Optional "max_workers" (default 8) sets how many CSVs are downloaded at once.
+    CSVs whose ETag matches etl_file_manifest are skipped; "force": true reloads them.
+
+    Returns:
+    {
+        "statusCode": 200,
+        "body": {
+            "success": true,
+            "message": "Processed X rows across Y seasons",
+            "details": [...]
+        }
+    }
+    """
+
+    logger.info("PFF Lambda triggered")
+    logger.info(f"Event: {json.dumps(event)}")
+
+    position = event.get('position') or os.environ.get('PFF_POSITION', '')
+
+    try:
+        # Extract parameters
+        spec = get_position_spec(position)
+        bucket = event.get('bucket') or os.environ.get('PLAYER_DATA_BUCKET', spec['default_bucket'])
+        seasons_to_process = _normalize_seasons_to_process(event, spec['default_s3_prefix'])
+
+        max_workers = int(event.get('max_workers', DEFAULT_READ_WORKERS))
+        force = bool(event.get('force', False))
+
+        # Initialize components
+        logger.info(f"Initializing ETL components for {position} ({spec['table']})...")
+        s3_reader = S3FileReader(bucket_name=bucket, max_workers=max_workers)
+        db_utils = DatabaseUtils()
+        processor = PFFDataProcessor(db_utils=db_utils, position=position)
+        manifest = FileManifest(db_utils)
+
+        # Step 1: List CSV files for every season up front (paginated)
+        logger.info("STEP 1: Listing CSV files in S3...")
+        results = []
+        files_by_season = {}
+
+        for season_config in seasons_to_process:
+            season = season_config['season']
+            s3_prefix = season_config['s3_prefix']
+            logger.info(f"Season {season}: s3://{bucket}/{s3_prefix}")
+
+            csv_objects = s3_reader.list_csv_objects_in_folder(s3_prefix)
+            if not csv_objects:
+                logger.warning(f"No data found for season {season}, skipping")
+                results.append({
+                    'season': season,
+                    'rows_processed': 0,
+                    'status': 'skipped',
+                    'message': 'No CSV files found'
+                })
+                continue
+
+            files_by_season.setdefault(season, []).extend(csv_objects)
+
+        # Skip files already loaded with the same ETag (one manifest query)
+        all_objects = [obj for objs in files_by_season.values() for obj in objs]
+        loaded = {} if force else manifest.fetch_etags(bucket, [obj['Key'] for obj in all_objects])
+        skipped_by_season = {season: 0 for season in files_by_season}
+        for season, objs in files_by_season.items():
+            changed = [obj for obj in objs if not manifest.is_unchanged(bucket, obj['Key'], obj['ETag'], loaded)]
+            skipped_by_season[season] = len(objs) - len(changed)
+            files_by_season[season] = changed
+        skipped = sum(skipped_by_season.values())
+        if skipped:
+            logger.info(f"Skipping {skipped} CSV files unchanged since last load")
+
+        # Small files are downloaded concurrently ahead of processing, at most
+        # PREFETCH_MAX_BYTES of them at a time; large files are streamed when
+        # their turn comes. Files are processed in listing order, so later
+        # files still win on conflicts.
+        jobs = [(season, obj) for season, objs in files_by_season.items() for obj in objs]
+        sizes = {obj['Key']: obj['Size'] for _, obj in jobs}
+        etags = {obj['Key']: obj['ETag'] for _, obj in jobs}
+        rows_by_season = {season: 0 for season in files_by_season}
+
+        def prefetch_small_file(csv_file):
+            if sizes[csv_file] >= STREAM_MIN_BYTES:
+                return None
+            return s3_reader.read_csv_text_from_s3(csv_file)
+
+        def prefetch_bytes(csv_file):
+            return sizes[csv_file] if sizes[csv_file] < STREAM_MIN_BYTES else 0
+
+        # Step 2: Transform and store
+        logger.info(f"STEP 2: Processing {len(jobs)} CSV files (max_workers={max_workers})...")
+        contents = s3_reader.map_concurrently(prefetch_small_file, [obj['Key'] for _, obj in jobs], ordered=True,
+                                              size_of=prefetch_bytes, max_bytes=PREFETCH_MAX_BYTES)
+
+        for (season, _), (csv_file, content) in zip(jobs, contents):
+            if content is None:
+                lines = s3_reader.iter_csv_lines(csv_file)
+            else:
+                lines = io.StringIO(content, newline='')
+            rows = processor.process_stream(lines, season)
+            manifest.record(bucket, csv_file, etags[csv_file], rows)
+            rows_by_season[season] += rows
+
+        total_rows = 0
+        for season, rows_inserted in rows_by_season.items():
+            total_rows += rows_inserted
+            unchanged = not files_by_season[season]
+            results.append({
+                'season': season,
+                'rows_processed': rows_inserted,
+                'files_skipped': skipped_by_season[season],
+                'status': 'unchanged' if unchanged else 'success'
+            })
+            logger.info(f"✓ Season {season} complete: {rows_inserted} rows processed")
+
+        # Close database connection
+        db_utils.close()
+
+        # Build success response
+        logger.info(f"\n{'='*60}")
+        logger.info(f"ETL COMPLETE")
+        logger.info(f"Total rows processed: {total_rows}")
+        logger.info(f"Seasons processed: {len(results)}")
+        logger.info(f"{'='*60}\n")
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps({
+                'success': True,
+                'message': f'Successfully processed {total_rows} {position} records across {len(results)} seasons',
+                'position': position,
+                'total_rows': total_rows,
+                'seasons_processed': len(results),
+                'details': results
+            })
+        }
+
+    except Exception as e:
+        logger.error(f"Lambda execution failed: {str(e)}", exc_info=True)
+
+        return {
+            'statusCode': 500,
+            'body': json.dumps({
+                'success': False,
+                'error': str(e),
+                'message': f'{position} PFF data ingestion failed'
+            })
+        }
+
+
+# For local testing
+if __name__ == '__main__':
+    # Single season
+    test_event = {"position": "QB", "bucket": "neal-nitya-qb-bucket", "season": 2024, "s3_prefix": "QBs/"}
+    # Or multiple seasons: test_event = {"position": "RB", "season": [2022, 2023, 2024], "s3_prefix_template": "RBs/{season}/"}
+
+    result = lambda_handler(test_event, None)
+    print(json.dumps(result, indent=2))
@@ -0,0 +1,10 @@
+-- S3 objects already loaded by the ETL Lambdas; a file whose ETag matches
+-- its row here is skipped unless the event sets "force": true
+CREATE TABLE IF NOT EXISTS etl_file_manifest (
+    bucket      VARCHAR(255) NOT NULL,
+    key         TEXT         NOT NULL,
+    etag        VARCHAR(255) NOT NULL,
+    rows        INTEGER      NOT NULL DEFAULT 0,
+    loaded_at   TIMESTAMP    NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (bucket, key)
+);
@@ -1,5 +1,5 @@
 """
-Local Testing Script for QB PFF Lambda
+Local Testing Script for the PFF Lambda
 Run this to test the Lambda function locally before deploying
 """
 
@@ -22,6 +22,7 @@ def test_single_season():
     print("=" * 60)
     
     event = {
+        "position": "QB",
         "bucket": "neal-nitya-qb-bucket",
         "season": 2022,
         "s3_prefix": "QBs/"
@@ -49,6 +50,7 @@ def test_multiple_seasons():
     print("=" * 60)
     
     event = {
+        "position": "QB",
         "bucket": "neal-nitya-qb-bucket",
         "seasons": [
             {"season": 2022, "s3_prefix": "QBs/"},
@@ -124,7 +126,7 @@ def test_database_connection():
 
 if __name__ == '__main__':
     print("\n" + "=" * 60)
-    print("QB PFF Lambda - Local Testing")
+    print("PFF Lambda - Local Testing")
     print("=" * 60)
     print("\n⚠ Make sure to update environment variables in this file!")
     print("⚠ Make sure AWS credentials are configured (for S3 access)")
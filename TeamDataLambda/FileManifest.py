@@ -0,0 +1,124 @@
+"""
+FileManifest.py
+Tracks which S3 objects have already been loaded (etl_file_manifest table)
+so re-uploads of identical files and replayed S3 events can be skipped
+"""
+
+import logging
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+MANIFEST_TABLE = 'etl_file_manifest'
+
+# Same definition as create_tables.sql; created on first use
+MANIFEST_DDL = f"""
+CREATE TABLE IF NOT EXISTS {MANIFEST_TABLE} (
+    bucket      VARCHAR(255) NOT NULL,
+    key         TEXT         NOT NULL,
+    etag        VARCHAR(255) NOT NULL,
+    rows        INTEGER      NOT NULL DEFAULT 0,
+    loaded_at   TIMESTAMP    NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (bucket, key)
+)
+"""
+
+
+def normalize_etag(etag: Optional[str]) -> Optional[str]:
+    """
+    S3 listings/HEAD return the ETag wrapped in quotes, S3 event records
+    don't. Strip them so both compare equal.
+    """
+    if not etag:
+        return None
+    return etag.strip().strip('"')
+
+
+class FileManifest:
+    """
+    Reads and writes etl_file_manifest rows: (bucket, key, etag, rows, loaded_at)
+    """
+
+    def __init__(self, db_utils):
+        """
+        Args:
+            db_utils: DatabaseUtils instance (shares the handler's connection)
+        """
+        self.db_utils = db_utils
+        self.available = self._ensure_table()
+
+    def _ensure_table(self) -> bool:
+        """
+        Create etl_file_manifest if it does not exist yet (first deploy).
+        If it cannot be read or created the manifest is disabled: every file
+        is processed, as with "force", and nothing is recorded.
+        """
+        try:
+            cursor = self.db_utils.execute_query("SELECT to_regclass(%s)", (MANIFEST_TABLE,))
+            try:
+                exists = cursor.fetchone()[0] is not None
+            finally:
+                cursor.close()
+            if not exists:
+                self.db_utils.execute_query(MANIFEST_DDL).close()
+                self.db_utils.commit()
+                logger.info(f"Created {MANIFEST_TABLE}")
+            return True
+        except Exception as e:
+            self.db_utils.rollback()
+            logger.warning(f"{MANIFEST_TABLE} unavailable ({e}) - processing every file, nothing recorded")
+            return False
+
+    def fetch_etags(self, bucket: str, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Return {key: etag} for the keys already loaded from this bucket (one query)
+        """
+        keys = list(keys)
+        if not keys or not self.available:
+            return {}
+
+        cursor = self.db_utils.execute_query(
+            f"SELECT key, etag FROM {MANIFEST_TABLE} WHERE bucket = %s AND key = ANY(%s)",
+            (bucket, keys)
+        )
+        try:
+            return {key: etag for key, etag in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+    def is_unchanged(self, bucket: str, key: str, etag: Optional[str],
+                     loaded: Optional[Dict[str, str]] = None) -> bool:
+        """
+        True when the object was already loaded with this exact ETag
+
+        Args:
+            loaded: Result of fetch_etags() to avoid a query per key
+        """
+        etag = normalize_etag(etag)
+        if etag is None:
+            return False
+        if loaded is None:
+            loaded = self.fetch_etags(bucket, [key])
+        return loaded.get(key) == etag
+
+    def record(self, bucket: str, key: str, etag: Optional[str], rows: int):
+        """Mark an object as loaded (upsert on bucket + key) and commit"""
+        if not self.available:
+            return
+        etag = normalize_etag(etag)
+        if etag is None:
+            logger.warning(f"No ETag for s3://{bucket}/{key}, not recorded in manifest")
+            return
+
+        cursor = self.db_utils.execute_query(
+            f"""
+            INSERT INTO {MANIFEST_TABLE} (bucket, key, etag, rows, loaded_at)
+            VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP)
+            ON CONFLICT (bucket, key)
+            DO UPDATE SET etag = EXCLUDED.etag, rows = EXCLUDED.rows, loaded_at = EXCLUDED.loaded_at
+            """,
+            (bucket, key, etag, rows)
+        )
+        cursor.close()
+        self.db_utils.commit()
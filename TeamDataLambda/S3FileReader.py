@@ -4,14 +4,22 @@ Reads CSV files from S3 and parses them into Python dictionaries
 """
 
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import csv
 import io
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Pooled connections and adaptive retries for S3 throttling
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+)
+
 
 class S3FileReader:
     """
@@ -27,7 +35,7 @@ class S3FileReader:
             bucket_name: Name of the S3 bucket (e.g., 'neal-nitya-qb-bucket')
         """
         self.bucket_name = bucket_name
-        self.s3_client = boto3.client('s3')
+        self.s3_client = boto3.client('s3', config=S3_CLIENT_CONFIG)
         logger.info(f"S3FileReader initialized for bucket: {bucket_name}")
     
     def list_files_in_folder(self, prefix: str) -> List[str]:
@@ -41,21 +49,21 @@ class S3FileReader:
             List of S3 object keys
         """
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
+            # list_objects_v2 returns at most 1,000 keys per call: read every page
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            files = []
+            
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                # Filter out folders (keys ending with '/')
+                files.extend(
+                    obj['Key'] for obj in page.get('Contents', [])
+                    if not obj['Key'].endswith('/')
+                )
             
-            if 'Contents' not in response:
+            if not files:
                 logger.warning(f"No files found in s3://{self.bucket_name}/{prefix}")
                 return []
             
-            # Filter out folders (keys ending with '/')
-            files = [
-                obj['Key'] for obj in response['Contents']
-                if not obj['Key'].endswith('/')
-            ]
-            
             logger.info(f"Found {len(files)} files in {prefix}")
             return files
         
@@ -63,24 +71,34 @@ class S3FileReader:
             logger.error(f"Failed to list files in S3: {e}")
             raise
     
-    def read_csv_from_s3(self, s3_key: str) -> List[Dict[str, Any]]:
+    def read_csv_with_etag(self, s3_key: str,
+                           if_none_match: Optional[str] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
         """
-        Read a CSV file from S3 and parse it into a list of dictionaries
+        Read and parse a CSV from S3, returning the ETag of the exact object read
         
         Args:
             s3_key: Full S3 object key (e.g., 'QBs/passing_summary.csv')
+            if_none_match: ETag already loaded; S3 answers 304 without a body
+                           when the object still has it
         
         Returns:
-            List of dictionaries, one per CSV row
+            (rows, etag), or (None, if_none_match) when the object is unchanged
         """
         logger.info(f"Reading CSV from s3://{self.bucket_name}/{s3_key}")
         
+        request = {'Bucket': self.bucket_name, 'Key': s3_key}
+        if if_none_match:
+            request['IfNoneMatch'] = f'"{if_none_match.strip(chr(34))}"'
+        
         try:
-            # Get object from S3
-            response = self.s3_client.get_object(
-                Bucket=self.bucket_name,
-                Key=s3_key
-            )
+            # Get object from S3 (conditional when we already hold an ETag)
+            try:
+                response = self.s3_client.get_object(**request)
+            except ClientError as e:
+                if e.response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 304:
+                    logger.info(f"s3://{self.bucket_name}/{s3_key} not modified")
+                    return None, if_none_match
+                raise
             
             # Read and decode content
             content = response['Body'].read().decode('utf-8')
@@ -92,12 +110,25 @@ class S3FileReader:
             logger.info(f"✓ Parsed {len(rows)} rows from CSV")
             logger.info(f"  CSV columns: {list(rows[0].keys()) if rows else 'N/A'}")
             
-            return rows
+            return rows, response.get('ETag')
         
         except Exception as e:
             logger.error(f"Failed to read CSV from S3: {e}")
             raise
     
+    def read_csv_from_s3(self, s3_key: str) -> List[Dict[str, Any]]:
+        """
+        Read a CSV file from S3 and parse it into a list of dictionaries
+        
+        Args:
+            s3_key: Full S3 object key (e.g., 'QBs/passing_summary.csv')
+        
+        Returns:
+            List of dictionaries, one per CSV row
+        """
+        rows, _ = self.read_csv_with_etag(s3_key)
+        return rows
+    
     def read_all_csvs_in_folder(self, prefix: str) -> List[Dict[str, Any]]:
         """
         Read all CSV files in an S3 folder and combine them
@@ -117,3 +117,17 @@ CREATE TRIGGER trg_pff_defense_updated_at
 CREATE TRIGGER trg_pff_st_updated_at
     BEFORE UPDATE ON pff_team_special_teams
     FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
+-- -----------------------------------------------------------
+-- ETL file manifest (shared with the PFF Lambdas)
+--    One row per loaded S3 object; a file whose ETag matches
+--    is skipped unless the event sets "force": true
+-- -----------------------------------------------------------
+CREATE TABLE IF NOT EXISTS etl_file_manifest (
+    bucket      VARCHAR(255) NOT NULL,
+    key         TEXT         NOT NULL,
+    etag        VARCHAR(255) NOT NULL,
+    rows        INTEGER      NOT NULL DEFAULT 0,
+    loaded_at   TIMESTAMP    NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (bucket, key)
+);
@@ -23,7 +23,12 @@ Invoke event formats:
     {"bucket": "teamdatalambda", "season": 2024, "s3_key": "data/pff_team_grades_2024.txt"}
 
   S3 trigger (automatic on file upload):
-    {"Records": [{"s3": {"bucket": {"name": "..."}, "object": {"key": "data/pff_team_grades_2024.csv"}}}]}
+    {"Records": [{"s3": {"bucket": {"name": "..."}, "object": {"key": "data/pff_team_grades_2024.csv", "eTag": "..."}}}]}
+
+Files whose ETag matches etl_file_manifest are skipped: S3 trigger events
+are checked against the manifest directly, everything else with a
+conditional GET (304, no download). The ETag recorded is the one returned
+with the body that was parsed. Add "force": true to reload anyway.
 """
 
 import json
@@ -32,6 +37,7 @@ import re
 
 from S3FileReader import S3FileReader
 from DatabaseUtils import DatabaseUtils
+from FileManifest import FileManifest
 from TeamDataProcessor import TeamDataProcessor
 
 logger = logging.getLogger()
@@ -47,7 +53,7 @@ DEFAULT_BUCKET = "teamdatalambda"
 def _parse_event(event: dict) -> list[dict]:
     """
     Returns a list of {"bucket": str, "season": int, "s3_key": str} dicts,
-    one per season to process.
+    one per season to process. S3 trigger jobs also carry the object's "etag".
     """
     jobs = []
 
@@ -56,9 +62,10 @@ def _parse_event(event: dict) -> list[dict]:
         for record in event["Records"]:
             bucket = record["s3"]["bucket"]["name"]
             key    = record["s3"]["object"]["key"]
+            etag   = record["s3"]["object"].get("eTag")
             season = _season_from_key(key)
             if season:
-                jobs.append({"bucket": bucket, "season": season, "s3_key": key})
+                jobs.append({"bucket": bucket, "season": season, "s3_key": key, "etag": etag})
             else:
                 logger.warning(f"Could not infer season from S3 key: {key}")
         return jobs
@@ -92,6 +99,13 @@ def _season_from_key(key: str) -> int | None:
     return int(match.group(1)) if match else None
 
 
+def _read_if_changed(reader: S3FileReader, manifest: FileManifest, bucket: str,
+                     s3_key: str, force: bool) -> tuple[list | None, str | None]:
+    """Rows and ETag of the object read, or (None, etag) if the manifest already has it"""
+    loaded = None if force else manifest.fetch_etags(bucket, [s3_key]).get(s3_key)
+    return reader.read_csv_with_etag(s3_key, if_none_match=loaded)
+
+
 # ---------------------------------------------------------------------------
 # Lambda handler
 # ---------------------------------------------------------------------------
@@ -106,11 +120,13 @@ def lambda_handler(event, context):
         logger.error(str(e))
         return {"statusCode": 400, "body": json.dumps({"error": str(e)})}
 
+    force = bool(event.get("force", False))
     db = DatabaseUtils()
     results = []
 
     try:
         processor = TeamDataProcessor(db_utils=db, batch_size=32)
+        manifest = FileManifest(db)
 
         for job in jobs:
             bucket  = job["bucket"]
@@ -120,20 +136,36 @@ def lambda_handler(event, context):
             logger.info(f"--- Season {season} | s3://{bucket}/{s3_key} ---")
 
             reader = S3FileReader(bucket_name=bucket)
-            # Try .csv first; fall back to .txt (PFF sometimes exports with wrong ext)
+            # S3 trigger events carry the ETag: skip replays without touching S3
+            if not force and manifest.is_unchanged(bucket, s3_key, job.get("etag")):
+                logger.info(f"Season {season}: s3://{bucket}/{s3_key} unchanged since last load, skipping")
+                results.append({"season": season, "status": "unchanged", "s3_key": s3_key})
+                continue
+
+            # Try .csv first; fall back to .txt (PFF sometimes exports with wrong ext).
+            # Conditional GET: S3 returns 304 if the loaded ETag is still current,
+            # otherwise the body and the ETag of exactly what is parsed
             try:
-                csv_rows = reader.read_csv_from_s3(s3_key)
+                csv_rows, etag = _read_if_changed(reader, manifest, bucket, s3_key, force)
             except Exception:
                 txt_key = s3_key.replace(".csv", ".txt")
                 logger.warning(f"CSV not found at {s3_key}, trying {txt_key}")
-                csv_rows = reader.read_csv_from_s3(txt_key)
+                s3_key = txt_key
+                csv_rows, etag = _read_if_changed(reader, manifest, bucket, s3_key, force)
+
+            if csv_rows is None:
+                logger.info(f"Season {season}: s3://{bucket}/{s3_key} unchanged since last load, skipping")
+                results.append({"season": season, "status": "unchanged", "s3_key": s3_key})
+                continue
 
             if not csv_rows:
                 logger.warning(f"No rows found for season {season}")
+                manifest.record(bucket, s3_key, etag, 0)
                 results.append({"season": season, "status": "empty"})
                 continue
 
             summary = processor.process_and_store(csv_rows, season)
+            manifest.record(bucket, s3_key, etag, summary["offense_rows"])
             logger.info(f"Season {season} complete: {summary}")
             results.append({"status": "ok", **summary})
 
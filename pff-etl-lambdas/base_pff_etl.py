@@ -8,14 +8,22 @@ import logging
 import os
 import io
 import csv
+import codecs
+import queue
+import threading
 import boto3
 import pg8000
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator
 from decimal import Decimal
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Streaming defaults: 1 MB S3 reads, 5000 rows per upsert chunk, chunks buffered ahead of the DB writer
+STREAM_CHUNK_SIZE = 1024 * 1024
+UPSERT_CHUNK_ROWS = 5000
+UPSERT_QUEUE_DEPTH = 2
+
 # Global connections (for Lambda warm starts)
 _s3_client = None
 _db_conn = None
@@ -89,6 +97,44 @@ def fetch_csv_from_s3(bucket: str, key: str) -> List[Dict[str, Any]]:
         raise
 
 
+def iter_csv_rows_from_s3(bucket: str, key: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Stream a CSV file from S3 as dictionaries without loading the whole file
+    
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key (e.g., 'pff-grades/WR/WR_2024.csv')
+        chunk_size: Bytes per network read
+    
+    Returns:
+        Iterator of dictionaries, one per CSV row
+    """
+    s3 = get_s3_client()
+    
+    logger.info(f"Streaming s3://{bucket}/{key}")
+    
+    response = s3.get_object(Bucket=bucket, Key=key)
+    body = response['Body']
+    
+    def lines():
+        # Split on '\n' only so quoted multi-line fields survive
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        pending = ''
+        for chunk in body.iter_chunks(chunk_size):
+            parts = (pending + decoder.decode(chunk)).split('\n')
+            pending = parts.pop()
+            for line in parts:
+                yield line + '\n'
+        pending += decoder.decode(b'', final=True)
+        if pending:
+            yield pending
+    
+    try:
+        yield from csv.DictReader(lines())
+    finally:
+        body.close()
+
+
 def clean_value(value: Any, data_type: str = 'str') -> Any:
     """
     Clean and convert CSV value to appropriate database type
@@ -147,13 +193,35 @@ def normalize_team_name(team: str) -> str:
     return team_mapping.get(team, team)
 
 
+def copy_text_value(value: Any) -> str:
+    """
+    Format one value for COPY's text format: NULL is \\N, booleans are t/f,
+    and backslash, tab, newline and carriage return are backslash-escaped
+    
+    Each Lambda deploys alone, so this function is copied into
+    pff-etl-lambdas/base_pff_etl.py, PredictiveDataModel/GameIdMapper/DatabaseUtils.py
+    and PlayerImpactProcessor/DatabaseUtils.py.
+    PredictiveDataModel/PFFLambda/DatabaseUtils.py holds the one to copy;
+    change it there and paste it over the others byte-for-byte.
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, str):
+        return (value.replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return str(value)
+
+
 def upsert_to_database(
     table_name: str,
     data: List[Dict[str, Any]],
     unique_keys: List[str]
 ) -> int:
     """
-    Upsert data into database table (INSERT ... ON CONFLICT UPDATE)
+    Upsert data into database table via COPY into a temp table and one
+    INSERT ... SELECT ... ON CONFLICT DO UPDATE (single transaction)
     
     Args:
         table_name: Target table name
@@ -172,35 +240,49 @@ def upsert_to_database(
     
     # Get column names from first row
     columns = list(data[0].keys())
-    
-    # Build INSERT query
-    placeholders = ', '.join(['%s'] * len(columns))
     columns_str = ', '.join(columns)
     
     # Build UPDATE clause for ON CONFLICT
     update_clauses = [f"{col} = EXCLUDED.{col}" for col in columns if col not in unique_keys and col != 'id']
-    update_str = ', '.join(update_clauses)
+    conflict_action = f"DO UPDATE SET {', '.join(update_clauses)}" if update_clauses else "DO NOTHING"
     
     # Build conflict target (unique keys)
     conflict_target = ', '.join(unique_keys)
     
-    query = f"""
-        INSERT INTO {table_name} ({columns_str})
-        VALUES ({placeholders})
-        ON CONFLICT ({conflict_target})
-        DO UPDATE SET {update_str}
-    """
+    # Last row wins for duplicate keys (ON CONFLICT can't touch a row twice)
+    latest = {}
+    for row in data:
+        key = tuple(row[k] for k in unique_keys)
+        latest.pop(key, None)
+        latest[key] = [row[col] for col in columns]
     
-    # Execute batch insert
-    rows_affected = 0
+    # COPY text format: tab-separated, NULL as \N
+    buffer = io.StringIO()
+    buffer.writelines('\t'.join(map(copy_text_value, row)) + '\n' for row in latest.values())
+    buffer.seek(0)
+    
+    stage_table = f"_stage_{table_name}"
+    
+    # Stage with COPY, then merge with one set-based statement
     try:
-        for row in data:
-            values = [row[col] for col in columns]
-            cursor.execute(query, values)
-            rows_affected += 1
+        cursor.execute(
+            f"CREATE TEMP TABLE {stage_table} ON COMMIT DROP AS "
+            f"SELECT {columns_str} FROM {table_name} WITH NO DATA"
+        )
+        cursor.execute(
+            f"COPY {stage_table} ({columns_str}) FROM STDIN",
+            stream=buffer
+        )
+        cursor.execute(f"""
+            INSERT INTO {table_name} ({columns_str})
+            SELECT {columns_str} FROM {stage_table}
+            ON CONFLICT ({conflict_target})
+            {conflict_action}
+        """)
+        rows_affected = cursor.rowcount
         
         conn.commit()
-        logger.info(f"✓ Upserted {rows_affected} rows into {table_name}")
+        logger.info(f"✓ Upserted {rows_affected} rows into {table_name} ({len(latest)} staged via COPY)")
         return rows_affected
     
     except Exception as e:
@@ -211,6 +293,74 @@ def upsert_to_database(
         cursor.close()
 
 
+def upsert_stream_to_database(
+    table_name: str,
+    rows: Iterable[Dict[str, Any]],
+    unique_keys: List[str],
+    chunk_rows: int = UPSERT_CHUNK_ROWS,
+    queue_depth: int = UPSERT_QUEUE_DEPTH
+) -> int:
+    """
+    Pipelined upsert: collect fixed-size chunks while a writer thread stores them
+    
+    Pair with iter_csv_rows_from_s3: the calling thread pulls rows (downloading
+    and parsing as it goes) and a dedicated writer thread upserts finished
+    chunks. The bounded queue keeps at most queue_depth chunks in flight, so
+    memory stays flat regardless of file size.
+    
+    Args:
+        table_name: Target table name
+        rows: Iterable of dictionaries to insert
+        unique_keys: Columns that uniquely identify a row (for conflict resolution)
+        chunk_rows: Rows per upsert call
+        queue_depth: Chunks buffered ahead of the writer
+    
+    Returns:
+        Number of rows inserted/updated
+    """
+    chunks = queue.Queue(maxsize=queue_depth)
+    state = {'rows': 0, 'chunks': 0, 'error': None}
+    
+    def write_chunks():
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            # After a failure keep draining so the producer never blocks
+            if state['error'] is not None:
+                continue
+            try:
+                state['rows'] += upsert_to_database(table_name, chunk, unique_keys)
+                state['chunks'] += 1
+            except Exception as e:
+                state['error'] = e
+    
+    writer = threading.Thread(target=write_chunks, name='pff-db-writer', daemon=True)
+    writer.start()
+    
+    try:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                if state['error'] is not None:
+                    break
+                chunks.put(chunk)
+                chunk = []
+        if chunk and state['error'] is None:
+            chunks.put(chunk)
+    finally:
+        chunks.put(None)
+        writer.join()
+    
+    if state['error'] is not None:
+        logger.error(f"Streaming upsert into {table_name} failed after {state['rows']} rows: {state['error']}")
+        raise state['error']
+    
+    logger.info(f"✓ Streamed {state['rows']} rows into {table_name} in {state['chunks']} chunks")
+    return state['rows']
+
+
 def lambda_response(success: bool, message: str, data: Optional[Dict] = None) -> Dict:
     """
     Standard Lambda response format